@@ -1,17 +1,19 @@
 """thothctl main cli."""
 
-import importlib.util
+import importlib
 import logging
 import os
 import sys
 from functools import wraps
-from importlib.metadata import version
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import click
+from click.shell_completion import CompletionItem
 
+from .core.command_manifest import load_help
 from .utils.banner import get_banner
+from .version import __version__
 
 
 def global_options(f):
@@ -34,6 +36,11 @@ def global_options(f):
 
 
 class ThothCLI(click.MultiCommand):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._loaded: Dict[str, Optional[click.Command]] = {}
+        self._help: Optional[Dict[str, Dict]] = None
+
     def list_commands(self, ctx: click.Context) -> list[str]:
         commands = []
         commands_path = Path(__file__).parent / "commands"
@@ -50,29 +57,53 @@ class ThothCLI(click.MultiCommand):
         return commands
 
     def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        # Support both hyphens and underscores (e.g. ai-review -> ai_review)
+        normalized = cmd_name.replace("-", "_")
+        if normalized in self._loaded:
+            return self._loaded[normalized]
         try:
-            # Support both hyphens and underscores (e.g. ai-review -> ai_review)
-            normalized = cmd_name.replace("-", "_")
             module_path = Path(__file__).parent / "commands" / normalized / "cli.py"
 
             if not module_path.exists():
                 return None
 
-            spec = importlib.util.spec_from_file_location(
-                f"thothctl.commands.{normalized}.cli", str(module_path)
-            )
-            if spec is None or spec.loader is None:
-                return None
-
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            return getattr(module, "cli", None)
+            # Regular import: the module lands in sys.modules and is loaded once
+            module = importlib.import_module(f"thothctl.commands.{normalized}.cli")
+            command = getattr(module, "cli", None)
 
         except Exception as e:
             click.echo(f"Error loading command {cmd_name}: {e}", err=True)
             return None
 
+        self._loaded[normalized] = command
+        return command
+
+    def _help_command(self, ctx: click.Context, name: str) -> Optional[click.Command]:
+        """Stand-in carrying the command's help from the manifest (no import)."""
+        if self._help is None:
+            self._help = load_help()
+        entry = self._help.get(name)
+        if entry is None:
+            return self.get_command(ctx, name)
+        return click.Command(
+            name,
+            help=entry["help"],
+            short_help=entry["short_help"],
+            hidden=entry["hidden"],
+        )
+
+    def shell_complete(self, ctx: click.Context, incomplete: str):
+        """Complete command names from the help manifest."""
+        results = []
+        for name in self.list_commands(ctx):
+            if not name.startswith(incomplete):
+                continue
+            cmd = self._help_command(ctx, name)
+            if cmd and not cmd.hidden:
+                results.append(CompletionItem(name, help=cmd.get_short_help_str()))
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
     COMMAND_CATEGORIES = {
         "DevSecOps Workflow": ["workflow", "scan", "check"],
         "Project Lifecycle": ["init", "generate", "inventory", "project"],
@@ -86,7 +117,7 @@ class ThothCLI(click.MultiCommand):
         """Override to show commands in categorized groups."""
         commands = {}
         for name in self.list_commands(ctx):
-            cmd = self.get_command(ctx, name)
+            cmd = self._help_command(ctx, name)
             if cmd and not cmd.hidden:
                 commands[name] = cmd
 
@@ -116,13 +147,32 @@ class ThothCLI(click.MultiCommand):
                 formatter.write_dl(uncategorized)
 
 
+def _startup_profile(ctx: click.Context, param: click.Parameter, value: bool):
+    """Re-run the command line with import timing and print the breakdown."""
+    if not value or ctx.resilient_parsing:
+        return
+    from .core.startup_profile import profile_startup
+
+    args = [a for a in sys.argv[1:] if a != "--startup-profile"]
+    click.echo(profile_startup(args or ["--help"]))
+    ctx.exit()
+
+
 @click.command(cls=ThothCLI)
 @click.version_option(
-    version=version("thothctl"),
+    version=__version__,
     prog_name="thothctl",
     message=get_banner() + "\n   Version: %(version)s\n",
     help="Show the version and exit.",
 )
+@click.option(
+    "--startup-profile",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_startup_profile,
+    help="Print an import-time breakdown of this command line's startup and exit.",
+)
 @global_options
 @click.pass_context
 def cli(ctx, debug, verbose, code_directory):
@@ -133,7 +183,7 @@ def cli(ctx, debug, verbose, code_directory):
     ctx.obj["VERBOSE"] = verbose
     ctx.obj["CODE_DIRECTORY"] = code_directory
 
-    # Check for newer version (non-blocking, cached)
+    # Check for newer version (reads the cache, refreshes in the background)
     _check_version_freshness()
 
     # Initialize telemetry for non-interactive use
@@ -160,69 +210,11 @@ if __name__ == "__main__":
 
 
 def _check_version_freshness():
-    """Check if a newer version is available (cached, non-blocking).
-
-    Uses a cache file (~/.thothcf/.version_check) to avoid hitting PyPI
-    on every invocation. Checks at most once every 24 hours.
-    """
-    import json
-    import time
-
-    cache_file = Path.home() / ".thothcf" / ".version_check"
-    cache_ttl = 86400  # 24 hours
-
+    """Show a cached upgrade hint; the PyPI lookup runs in a detached process."""
     try:
-        current = version("thothctl")
-
-        # Check cache first
-        if cache_file.exists():
-            cache = json.loads(cache_file.read_text(encoding="utf-8"))
-            if time.time() - cache.get("timestamp", 0) < cache_ttl:
-                latest = cache.get("latest")
-                if latest and latest != current and _is_newer(latest, current):
-                    _show_upgrade_hint(current, latest)
-                return
-
-        # Fetch latest from PyPI (with short timeout)
-        import requests
-
-        resp = requests.get(
-            "https://pypi.org/pypi/thothctl/json",
-            timeout=3,
-        )
-        if resp.status_code == 200:
-            latest = resp.json().get("info", {}).get("version", current)
-
-            # Cache the result
-            cache_file.parent.mkdir(parents=True, exist_ok=True)
-            cache_file.write_text(
-                json.dumps({"latest": latest, "timestamp": time.time()}),
-                encoding="utf-8",
-            )
-
-            if latest != current and _is_newer(latest, current):
-                _show_upgrade_hint(current, latest)
+        from .core.version_check import check_version_freshness
 
+        check_version_freshness()
     except Exception:
         # Never let version check break the CLI
         pass
-
-
-def _show_upgrade_hint(current: str, latest: str):
-    """Show a one-line upgrade hint in stderr."""
-    import sys
-
-    sys.stderr.write(
-        f"\033[33m⚠ ThothCTL {latest} available (you have {current}). "
-        f"Run: thothctl upgrade\033[0m\n"
-    )
-
-
-def _is_newer(latest: str, current: str) -> bool:
-    """Compare semantic versions."""
-    try:
-        latest_parts = tuple(int(x) for x in latest.split(".")[:3])
-        current_parts = tuple(int(x) for x in current.split(".")[:3])
-        return latest_parts > current_parts
-    except (ValueError, AttributeError):
-        return False
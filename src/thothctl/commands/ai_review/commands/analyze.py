@@ -39,6 +39,7 @@ class AnalyzeCommand(ClickCommand):
         provider=None,
         model=None,
         output="markdown",
+        no_cache=False,
         **kwargs,
     ):
         ctx = click.get_current_context()
@@ -51,7 +52,9 @@ class AnalyzeCommand(ClickCommand):
         )
 
         try:
-            agent = AIReviewAgent(provider=provider, model=model)
+            agent = AIReviewAgent(
+                provider=provider, model=model, use_cache=not no_cache
+            )
 
             if scan_results:
                 with self.ui.status_spinner("Analyzing scan results..."):
@@ -76,6 +79,11 @@ class AnalyzeCommand(ClickCommand):
                     f"↑{cost_report['total_input_tokens']:,} in / "
                     f"↓{cost_report['total_output_tokens']:,} out tokens)"
                 )
+            if cost_report.get("cache_hits"):
+                self.ui.print_info(
+                    f"♻️ {cost_report['cache_hits']} response(s) from the local "
+                    "cache today (use --no-cache to bypass)"
+                )
 
         except ImportError as e:
             self.ui.print_error(f"Missing dependency: {e}")
@@ -116,4 +124,9 @@ cli = AnalyzeCommand.as_click_command(name="analyze")(
         default="markdown",
         help="Output format",
     ),
+    click.option(
+        "--no-cache",
+        is_flag=True,
+        help="Bypass the local AI response cache and always call the provider",
+    ),
 )
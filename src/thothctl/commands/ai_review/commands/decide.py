@@ -41,6 +41,7 @@ class DecideCommand(ClickCommand):
         repository=None,
         platform=None,
         dry_run=False,
+        no_cache=False,
         **kwargs,
     ):
         ctx = click.get_current_context()
@@ -57,7 +58,7 @@ class DecideCommand(ClickCommand):
 
         # Run AI analysis
         self.ui.print_info(f"Analyzing {target}...")
-        agent = AIReviewAgent(provider=provider, model=model)
+        agent = AIReviewAgent(provider=provider, model=model, use_cache=not no_cache)
 
         with self.ui.status_spinner("Running AI analysis..."):
             if scan_results:
@@ -155,4 +156,9 @@ cli = DecideCommand.as_click_command(name="decide")(
     click.option(
         "--dry-run", is_flag=True, help="Preview decision without taking action"
     ),
+    click.option(
+        "--no-cache",
+        is_flag=True,
+        help="Bypass the local AI response cache and always call the provider",
+    ),
 )
@@ -28,6 +28,7 @@ class ImproveCommand(ClickCommand):
         severity=None,
         output=None,
         json_output=False,
+        no_cache=False,
         **kwargs,
     ):
         ctx = click.get_current_context()
@@ -35,7 +36,7 @@ class ImproveCommand(ClickCommand):
 
         self.ui.print_info(f"Generating fixes for {target}...")
 
-        agent = AIReviewAgent(provider=provider, model=model)
+        agent = AIReviewAgent(provider=provider, model=model, use_cache=not no_cache)
 
         with self.ui.status_spinner("Analyzing and generating fixes..."):
             if scan_results:
@@ -150,4 +151,9 @@ cli = ImproveCommand.as_click_command(name="improve")(
     ),
     click.option("-o", "--output", type=click.Path(), help="Save fixes to JSON file"),
     click.option("--json", "json_output", is_flag=True, help="Output as JSON"),
+    click.option(
+        "--no-cache",
+        is_flag=True,
+        help="Bypass the local AI response cache and always call the provider",
+    ),
 )
@@ -40,6 +40,9 @@ class OrchestrateCommand(ClickCommand):
         json_output=False,
         repository=None,
         run_id=None,
+        no_cache=False,
+        stream=False,
+        stream_timeout=None,
         **kwargs,
     ):
         ctx = click.get_current_context()
@@ -64,6 +67,12 @@ class OrchestrateCommand(ClickCommand):
             provider=provider,
             model=model,
             max_parallel=parallel,
+            use_cache=not no_cache,
+            streaming=stream,
+            stream_timeout=stream_timeout,
+            on_stream_item=self._print_stream_item
+            if stream and not json_output
+            else None,
         )
 
         with self.ui.status_spinner("Running AI agents..."):
@@ -131,6 +140,15 @@ class OrchestrateCommand(ClickCommand):
                 f"Model: {cost.get('model', 'unknown')}"
             )
 
+    def _print_stream_item(self, role, key, item):
+        """Show a finding or fix as soon as it arrives from a streaming agent."""
+        if not isinstance(item, dict):
+            return
+        severity = item.get("severity", "")
+        title = item.get("title") or item.get("description") or item.get("id", "")
+        label = f"[{severity}] " if severity else ""
+        self.ui.console.print(f"  ⋯ {role.value}/{key}: {label}{str(title)[:100]}")
+
     def _display_security(self, data):
         summary = data.get("summary", {})
         table = Table(title="🔒 Security Agent")
@@ -204,4 +222,19 @@ cli = OrchestrateCommand.as_click_command(name="orchestrate")(
     ),
     click.option("-o", "--output", type=click.Path(), help="Save results to JSON file"),
     click.option("--json", "json_output", is_flag=True, help="Output as JSON"),
+    click.option(
+        "--no-cache",
+        is_flag=True,
+        help="Bypass the local AI response cache and always call the provider",
+    ),
+    click.option(
+        "--stream",
+        is_flag=True,
+        help="Stream agent responses and show findings as they arrive",
+    ),
+    click.option(
+        "--stream-timeout",
+        type=float,
+        help="Seconds before a streaming agent is cancelled (partial results kept)",
+    ),
 )
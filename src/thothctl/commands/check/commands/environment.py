@@ -1,3 +1,4 @@
+import click
 from rich.console import Console
 
 from ....core.commands import ClickCommand
@@ -18,7 +19,9 @@ class CheckEnvironmentCommand(ClickCommand):
 
     def _execute(self, **kwargs) -> None:
         """Execute environment check"""
-        results = self.environment_checker.check_environment()
+        results = self.environment_checker.check_environment(
+            refresh=kwargs.get("refresh", False)
+        )
 
         # Exit with error code if tools are missing (for CI/CD integration)
         if results["missing"]:
@@ -28,4 +31,11 @@ class CheckEnvironmentCommand(ClickCommand):
 # Create the Click command
 cli = CheckEnvironmentCommand.as_click_command(
     help="Check if development environment tools are installed and available"
-)()
+)(
+    click.option(
+        "--refresh",
+        is_flag=True,
+        default=False,
+        help="Re-run every version probe instead of using cached results",
+    ),
+)
@@ -83,6 +83,7 @@ class DocumentIaCCommand(ClickCommand):
                 framework=framework,
                 graph_type=kwargs.get("graph_type", "dot"),
                 verbose=kwargs.get("verbose", False),
+                use_cache=not kwargs.get("no_cache", False),
             )
 
             self.logger.debug("Documentation generated successfully")
@@ -102,6 +103,7 @@ class DocumentIaCCommand(ClickCommand):
         framework: str = "terraform-terragrunt",
         graph_type: str = "dot",
         verbose: bool = False,
+        use_cache: bool = True,
     ) -> None:
         """Internal method to generate the documentation"""
         try:
@@ -115,6 +117,7 @@ class DocumentIaCCommand(ClickCommand):
                     framework=framework,
                     graph_type=graph_type,
                     verbose=verbose,
+                    use_cache=use_cache,
                 )
 
                 if success:
@@ -182,4 +185,10 @@ cli = DocumentIaCCommand.as_click_command(
         default=False,
         help="Include dependency inputs/outputs in mermaid diagrams (edge labels and node details)",
     ),
+    click.option(
+        "--no-cache",
+        is_flag=True,
+        default=False,
+        help="Run terraform-docs for every module, even if unchanged since the last run",
+    ),
 )
@@ -43,6 +43,8 @@ class GenerateIaCCommand(ClickCommand):
         plan_iam_role: Optional[str] = None,
         plan_profile: Optional[str] = None,
         plan_filter: Optional[str] = None,
+        parallel_validation: bool = False,
+        fail_fast: bool = False,
         **kwargs,
     ) -> None:
         """Execute IaC generation from intent."""
@@ -85,7 +87,11 @@ class GenerateIaCCommand(ClickCommand):
             from ....services.generate.intent.intent_service import IntentToIaCService
 
             service = IntentToIaCService(
-                provider=provider, model=model, plan_config=plan_config
+                provider=provider,
+                model=model,
+                plan_config=plan_config,
+                parallel_validation=parallel_validation,
+                fail_fast=fail_fast,
             )
         except Exception as e:
             self.ui.print_error(f"Failed to initialize AI provider: {e}")
@@ -193,6 +199,17 @@ class GenerateIaCCommand(ClickCommand):
                     self.ui.print_warning(
                         f"  ... and {result.validation.total_violations - 5} more"
                     )
+            if result.validation.timings:
+                timings = " · ".join(
+                    f"{step} {seconds:.1f}s"
+                    for step, seconds in result.validation.timings.items()
+                )
+                console.print(f"[dim]⏱️ Validation time: {timings}[/dim]")
+            if result.validation.skipped_steps:
+                self.ui.print_warning(
+                    "⚠️ Validation steps not completed (timeout or fail-fast): "
+                    + ", ".join(result.validation.skipped_steps)
+                )
 
         # Show generated files
         console.print(f"\n📁 Generated {len(result.files)} file(s):")
@@ -494,4 +511,22 @@ cli = GenerateIaCCommand.as_click_command(
         default=None,
         help="Terragrunt filter pattern for targeted plan validation",
     ),
+    click.option(
+        "--parallel-validation",
+        is_flag=True,
+        default=False,
+        help=(
+            "Run framework validation, Checkov, OPA and compiled rules "
+            "as parallel subprocesses with per-step timeouts"
+        ),
+    ),
+    click.option(
+        "--fail-fast",
+        is_flag=True,
+        default=False,
+        help=(
+            "With --parallel-validation, cancel the remaining steps at the "
+            "first CRITICAL/HIGH violation"
+        ),
+    ),
 )
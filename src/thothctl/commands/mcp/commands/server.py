@@ -5,6 +5,7 @@ import click
 from ....core.cli_ui import CliUI
 from ....core.commands import ClickCommand
 from ....services.mcp import run_server
+from ....services.mcp.jobs import DEFAULT_MAX_CONCURRENT
 
 
 class MCPServerCommand(ClickCommand):
@@ -14,7 +15,7 @@ class MCPServerCommand(ClickCommand):
         super().__init__()
         self.ui = CliUI()
 
-    def _execute(self, port, host, stdio):
+    def _execute(self, port, host, stdio, max_concurrent):
         """Execute the MCP server command."""
         if stdio:
             import asyncio
@@ -23,7 +24,7 @@ class MCPServerCommand(ClickCommand):
             from ....services.mcp.stdio_server import serve_amazon_q
 
             # Don't print anything in stdio mode - it breaks MCP protocol
-            asyncio.run(serve_amazon_q())
+            asyncio.run(serve_amazon_q(max_concurrent=max_concurrent))
         else:
             # Run in HTTP mode
             with self.ui.status_spinner(f"Starting MCP server on {host}:{port}..."):
@@ -37,7 +38,7 @@ class MCPServerCommand(ClickCommand):
                 self.ui.print_info(
                     f"To stop the server, use: thothctl mcp stop --port {port}"
                 )
-                run_server(host=host, port=port)
+                run_server(host=host, port=port, max_concurrent=max_concurrent)
 
 
 # Create the Click command
@@ -61,4 +62,11 @@ cli = MCPServerCommand.as_click_command(name="server")(
         is_flag=True,
         help="Run in stdio mode (default for Amazon Q compatibility)",
     ),
+    click.option(
+        "--max-concurrent",
+        type=click.IntRange(min=1),
+        default=DEFAULT_MAX_CONCURRENT,
+        show_default=True,
+        help="Maximum number of long-running thothctl operations executed at once",
+    ),
 )
@@ -17,14 +17,18 @@ class CleanUpProjectCommand(ClickCommand):
         return True
 
     def _execute(
-        self, clean_additional_files: str, clean_additional_folders: str, **kwargs
+        self,
+        clean_additional_files: str,
+        clean_additional_folders: str,
+        dry_run: bool = False,
+        **kwargs,
     ) -> None:
         """Execute Environment initialization"""
         ctx = click.get_current_context()
         ctx.obj.get("DEBUG")
         code_directory = ctx.obj.get("CODE_DIRECTORY")
         self._clean_up_project(
-            code_directory, clean_additional_files, clean_additional_folders
+            code_directory, clean_additional_files, clean_additional_folders, dry_run
         )
 
     def _clean_up_project(
@@ -32,12 +36,14 @@ class CleanUpProjectCommand(ClickCommand):
         code_directory: str,
         clean_additional_files: str,
         clean_additional_folders: str,
+        dry_run: bool = False,
     ) -> None:
         """Initialize the project using the create_project function"""
         cleanup_project(
             directory=code_directory,
             additional_files=clean_additional_files,
             additional_folders=clean_additional_folders,
+            dry_run=dry_run,
         )
 
     def pre_execute(self, **kwargs) -> None:
@@ -73,4 +79,10 @@ cli = CleanUpProjectCommand.as_click_command(
         help="Add folders file to clean specify:  -cfd folder_1,folder_2",
         default=None,
     ),
+    click.option(
+        "--dry-run",
+        is_flag=True,
+        default=False,
+        help="Show what would be removed and how much space it frees, without deleting",
+    ),
 )
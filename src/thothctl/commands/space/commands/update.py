@@ -7,6 +7,7 @@ import click
 import toml
 
 from ....common.common import list_spaces
+from ....common.registry import atomic_write_toml
 from ....core.cli_ui import CliUI
 from ....core.commands import ClickCommand
 
@@ -74,8 +75,7 @@ class UpdateSpaceCommand(ClickCommand):
 
         space["updated_at"] = datetime.now().isoformat()
 
-        with open(config_path, mode="wt", encoding="utf-8") as fp:
-            toml.dump(config, fp)
+        atomic_write_toml(config_path, config)
 
         self.ui.print_success(f"🔧 Space '{space_name}' updated successfully")
 
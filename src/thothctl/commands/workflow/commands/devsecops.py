@@ -12,7 +12,7 @@ from rich.table import Table
 from ....core.commands import ClickCommand
 from ....services.workflow.models import Phase, StepStatus
 from ....services.workflow.workflow_service import (
-    COMPOSITE_PHASES,
+    DEFAULT_MAX_WORKERS,
     WorkflowService,
 )
 
@@ -33,7 +33,14 @@ PHASE_ICONS = {
 class DevSecOpsWorkflowCommand(ClickCommand):
     """Execute DevSecOps SDLC phases."""
 
-    def _execute(self, phase: str, reports_dir: str, enforcement: str, **kwargs):
+    def _execute(
+        self,
+        phase: str,
+        reports_dir: str,
+        enforcement: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        **kwargs,
+    ):
         console = Console()
         service = WorkflowService()
 
@@ -91,6 +98,7 @@ class DevSecOpsWorkflowCommand(ClickCommand):
             options,
             enforcement,
             phases_to_run,
+            max_workers,
         )
         total_time = time.perf_counter() - start
 
@@ -111,13 +119,7 @@ class DevSecOpsWorkflowCommand(ClickCommand):
 
     def _resolve_phases(self, phase: Phase, service: WorkflowService) -> list:
         """Resolve composite phases into ordered list."""
-        if phase in COMPOSITE_PHASES:
-            resolved = COMPOSITE_PHASES[phase]
-        else:
-            resolved = [phase]
-
-        # Filter to only phases that have executors
-        return [p for p in resolved if p in service._executors]
+        return service.resolve_phases([phase])
 
     def _execute_with_progress(
         self,
@@ -129,59 +131,74 @@ class DevSecOpsWorkflowCommand(ClickCommand):
         options,
         enforcement,
         phases_to_run,
+        max_workers=DEFAULT_MAX_WORKERS,
     ):
-        """Execute workflow with live spinner showing current phase."""
-        from ....services.workflow.models import WorkflowResult
-
-        options = options or {}
-        options["enforcement"] = enforcement
-        result = WorkflowResult(enforcement=enforcement)
-
+        """Execute workflow with a live spinner listing the running phases."""
         total_phases = len(phases_to_run)
+        running = []
+        completed = []
 
-        for idx, phase in enumerate(phases_to_run, 1):
-            executor = service._executors.get(phase)
-            if not executor:
-                continue
-
-            icon = PHASE_ICONS.get(phase, "⚙️")
-            phase_name = phase.value.capitalize()
-
-            # Show spinner while phase runs
-            with console.status(
-                f"[bold blue]{icon} Running phase {idx}/{total_phases}: {phase_name}[/bold blue]  "
-                f"[dim]({executor.description})[/dim]",
-                spinner="dots",
-                spinner_style="cyan",
-            ):
-                phase_result = executor.execute(directory, reports_dir, options)
-
-            # Show immediate result after phase completes
-            if phase_result.total_findings > 0:
-                console.print(
-                    f"  {icon} [bold]{phase_name}[/bold] — "
-                    f"[red]{phase_result.total_findings} finding(s)[/red]"
-                )
-            elif any(s.status == StepStatus.SKIPPED for s in phase_result.steps):
-                console.print(
-                    f"  {icon} [bold]{phase_name}[/bold] — "
-                    f"[dim]skipped (prerequisites missing)[/dim]"
+        with console.status("", spinner="dots", spinner_style="cyan") as status:
+
+            def refresh():
+                names = ", ".join(
+                    f"{PHASE_ICONS.get(p, '⚙️')} {p.value.capitalize()}" for p in running
                 )
-            else:
-                console.print(
-                    f"  {icon} [bold]{phase_name}[/bold] — [green]passed[/green]"
+                status.update(
+                    f"[bold blue]Running phases ({len(completed)}/{total_phases} done):"
+                    f" {names}[/bold blue]"
                 )
 
-            result.phases.append(phase_result)
-
-            # Stop on hard enforcement failure
-            if enforcement == "hard" and phase_result.gate_blocked:
-                result.stopped_at = phase
-                break
+            def on_start(phase):
+                running.append(phase)
+                refresh()
+
+            def on_complete(phase_result):
+                phase = phase_result.phase
+                running.remove(phase)
+                completed.append(phase)
+                self._print_phase_line(console, phase_result)
+                refresh()
+
+            result = service.execute(
+                phases,
+                directory,
+                reports_dir,
+                options,
+                enforcement,
+                max_workers=max_workers,
+                on_phase_start=on_start,
+                on_phase_complete=on_complete,
+            )
 
         console.print()  # Blank line before results table
         return result
 
+    def _print_phase_line(self, console, phase_result):
+        """Show the immediate result of a completed phase."""
+        phase = phase_result.phase
+        icon = PHASE_ICONS.get(phase, "⚙️")
+        phase_name = phase.value.capitalize()
+        timing = (
+            f"[dim](+{phase_result.started_at:.1f}s → "
+            f"+{phase_result.finished_at:.1f}s)[/dim]"
+        )
+
+        if phase_result.total_findings > 0:
+            console.print(
+                f"  {icon} [bold]{phase_name}[/bold] — "
+                f"[red]{phase_result.total_findings} finding(s)[/red] {timing}"
+            )
+        elif any(s.status == StepStatus.SKIPPED for s in phase_result.steps):
+            console.print(
+                f"  {icon} [bold]{phase_name}[/bold] — "
+                f"[dim]skipped (prerequisites missing)[/dim] {timing}"
+            )
+        else:
+            console.print(
+                f"  {icon} [bold]{phase_name}[/bold] — [green]passed[/green] {timing}"
+            )
+
     def _display_results(self, console: Console, result, total_time: float):
         """Render workflow results."""
         table = Table(
@@ -194,6 +211,8 @@ class DevSecOpsWorkflowCommand(ClickCommand):
         table.add_column("Step", style="white")
         table.add_column("Status", justify="center")
         table.add_column("Findings", justify="center")
+        table.add_column("Start", justify="right", style="dim")
+        table.add_column("End", justify="right", style="dim")
         table.add_column("Duration", justify="right", style="dim")
         table.add_column("Summary")
 
@@ -206,12 +225,15 @@ class DevSecOpsWorkflowCommand(ClickCommand):
 
         for phase_result in result.phases:
             for i, step in enumerate(phase_result.steps):
-                phase_label = phase_result.phase.value if i == 0 else ""
+                first = i == 0
+                phase_label = phase_result.phase.value if first else ""
                 table.add_row(
                     phase_label,
                     step.name,
                     status_icons.get(step.status, "?"),
                     str(step.findings_count) if step.findings_count > 0 else "-",
+                    self._offset(phase_result.started_at) if first else "",
+                    self._offset(phase_result.finished_at) if first else "",
                     f"{step.duration_seconds:.1f}s",
                     step.summary,
                 )
@@ -221,6 +243,7 @@ class DevSecOpsWorkflowCommand(ClickCommand):
         console.print(table)
 
         # Summary
+        phase_seconds = sum(p.elapsed_seconds for p in result.phases)
         status_color = "green" if result.passed else "red"
         status_text = (
             "\u2705 All phases passed"
@@ -230,7 +253,8 @@ class DevSecOpsWorkflowCommand(ClickCommand):
         console.print(
             Panel(
                 f"[bold {status_color}]{status_text}[/bold {status_color}]\n\n"
-                f"\u23f1\ufe0f  Total time: [cyan]{total_time:.1f}s[/cyan]\n"
+                f"\u23f1\ufe0f  Total time: [cyan]{total_time:.1f}s[/cyan] "
+                f"[dim](phases total {phase_seconds:.1f}s)[/dim]\n"
                 f"Phases executed: [cyan]{len(result.phases)}[/cyan]",
                 title="[bold green]Workflow Complete[/bold green]"
                 if result.passed
@@ -239,6 +263,10 @@ class DevSecOpsWorkflowCommand(ClickCommand):
             )
         )
 
+    @staticmethod
+    def _offset(seconds):
+        return f"+{seconds:.1f}s" if seconds is not None else "—"
+
 
 # Click wiring
 cli = DevSecOpsWorkflowCommand.as_click_command(
@@ -275,6 +303,13 @@ cli = DevSecOpsWorkflowCommand.as_click_command(
         default=None,
         help="Override scan tools for secure phase (e.g., -t checkov -t trivy)",
     ),
+    click.option(
+        "--max-workers",
+        type=click.IntRange(min=1),
+        default=DEFAULT_MAX_WORKERS,
+        show_default=True,
+        help="Maximum number of independent phases running at once",
+    ),
     click.option(
         "--changed-only",
         is_flag=True,
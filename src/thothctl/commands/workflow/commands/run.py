@@ -20,9 +20,12 @@ class WorkflowRunCommand(ClickCommand):
         self.ui = CliUI()
         self.engine = CustomWorkflowEngine()
 
-    def _execute(self, file: str, dry_run: bool = False, **kwargs) -> None:
+    def _execute(
+        self, file: str, dry_run: bool = False, no_cache: bool = False, **kwargs
+    ) -> None:
         """Execute the workflow."""
         workflow_path = Path(file)
+        self.engine.use_cache = not no_cache
 
         try:
             workflow = self.engine.load(workflow_path)
@@ -56,4 +59,11 @@ cli = WorkflowRunCommand.as_click_command(
         default=False,
         help="Show execution plan without running",
     ),
+    click.option(
+        "--no-cache",
+        is_flag=True,
+        default=False,
+        help="Run every stage even if a cached result exists in "
+        ".thothctl/workflow-cache",
+    ),
 )
@@ -12,6 +12,7 @@ from rich.console import Console
 from rich.table import Table
 
 from ..utils.platform_utils import get_config_dir
+from .registry import atomic_write_toml, get_registry
 
 config_file_name = ".thothcf.toml"
 
@@ -63,6 +64,25 @@ def create_iac_conf(file_name=config_file_name):
     return config_path
 
 
+def _load_home_conf(file_name=config_file_name):
+    """
+    Load a config file from ~/.thothcf for modification.
+
+    The projects registry is served from the cached registry.
+
+    :param file_name:
+    :return: Config dict or None if the file does not exist
+    """
+    if file_name == config_file_name:
+        return get_registry().projects_config()
+
+    config_path = PurePath(f"{Path.home()}/.thothcf/", file_name)
+    if not os.path.exists(config_path):
+        return None
+    with open(config_path, mode="rt", encoding="utf-8") as fp:
+        return toml.load(fp)
+
+
 # dump content in toml file .thothcf.toml
 def dump_iac_conf(file_name=config_file_name, content=None):
     """
@@ -74,10 +94,11 @@ def dump_iac_conf(file_name=config_file_name, content=None):
     """
     if content is None:
         content = {}
-    config_path = PurePath(f"{Path.home()}/.thothcf/", file_name)
-
-    with open(config_path, mode="wt", encoding="utf-8") as fp:
-        toml.dump(content, fp)
+    if file_name == config_file_name:
+        config_path = get_registry().save_projects(content)
+    else:
+        config_path = PurePath(f"{Path.home()}/.thothcf/", file_name)
+        atomic_write_toml(Path(config_path), content)
 
     logging.debug(f"{Fore.GREEN}Config file updated. {config_path} {Fore.RESET}")
 
@@ -98,6 +119,9 @@ def check_info_project(
 
     :return:
     """
+    if file_name == config_file_name:
+        return get_registry().get_project(project_name)
+
     config_path = PurePath(f"{Path.home()}/.thothcf/", file_name)
 
     if os.path.exists(config_path):
@@ -138,12 +162,9 @@ def create_info_project(
     if space:
         content["thothcf"]["space"] = space
 
-    config_path = PurePath(f"{Path.home()}/.thothcf/", file_name)
-
-    if os.path.exists(config_path):
-        with open(config_path, mode="rt", encoding="utf-8") as fp:
-            config = toml.load(fp)
+    config = _load_home_conf(file_name)
 
+    if config is not None:
         if project_name in config:
             # Check if project has space information
             space_info = ""
@@ -189,12 +210,9 @@ def update_info_project(
     """
     logging.info(f"Updating project info {project_name}")
 
-    config_path = PurePath(f"{Path.home()}/.thothcf/", file_name)
-
-    if os.path.exists(config_path):
-        with open(config_path, mode="rt", encoding="utf-8") as fp:
-            config = toml.load(fp)
+    config = _load_home_conf(file_name)
 
+    if config is not None:
         if project_name in config:
             entry = {
                 "source": file_path.parent.as_posix(),
@@ -277,6 +295,9 @@ def list_projects(file_name=config_file_name):
     :return project_list:
 
     """
+    if file_name == config_file_name:
+        return get_registry().list_projects()
+
     config_path = PurePath(f"{Path.home()}/.thothcf/", file_name)
 
     if os.path.exists(config_path):
@@ -294,16 +315,7 @@ def list_spaces():
 
     :return: List of space names
     """
-    config_path = PurePath(f"{Path.home()}/.thothcf/spaces.toml")
-
-    if os.path.exists(config_path):
-        with open(config_path, mode="rt", encoding="utf-8") as fp:
-            config = toml.load(fp)
-
-        if "spaces" in config:
-            return list(config["spaces"].keys())
-
-    return []
+    return get_registry().list_spaces()
 
 
 def get_project_space(project_name):
@@ -313,16 +325,7 @@ def get_project_space(project_name):
     :param project_name: Name of the project
     :return: Space name or None if not associated with a space
     """
-    config_path = PurePath(f"{Path.home()}/.thothcf/", config_file_name)
-
-    if os.path.exists(config_path):
-        with open(config_path, mode="rt", encoding="utf-8") as fp:
-            config = toml.load(fp)
-
-        if project_name in config and "thothcf" in config[project_name]:
-            return config[project_name]["thothcf"].get("space")
-
-    return None
+    return get_registry().get_project_space(project_name)
 
 
 def get_space_details():
@@ -331,18 +334,7 @@ def get_space_details():
 
     :return: Dictionary with space details
     """
-    config_path = PurePath(f"{Path.home()}/.thothcf/spaces.toml")
-    space_details = {}
-
-    if os.path.exists(config_path):
-        with open(config_path, mode="rt", encoding="utf-8") as fp:
-            config = toml.load(fp)
-
-        if "spaces" in config:
-            for space_name, space_data in config["spaces"].items():
-                space_details[space_name] = space_data
-
-    return space_details
+    return get_registry().get_space_details()
 
 
 def get_active_space() -> Optional[str]:
@@ -386,30 +378,7 @@ def get_projects_in_space(space_name):
     :param space_name: Name of the space
     :return: List of project names in the space
     """
-    # Primary: check spaces.toml namespaced projects
-    spaces_path = PurePath(f"{Path.home()}/.thothcf/spaces.toml")
-    if os.path.exists(spaces_path):
-        with open(spaces_path, mode="rt", encoding="utf-8") as fp:
-            spaces_config = toml.load(fp)
-        space_data = spaces_config.get("spaces", {}).get(space_name, {})
-        namespaced_projects = list(space_data.get("projects", {}).keys())
-        if namespaced_projects:
-            return namespaced_projects
-
-    # Fallback: scan flat .thothcf.toml (legacy)
-    projects = []
-    config_path = PurePath(f"{Path.home()}/.thothcf/", config_file_name)
-
-    if os.path.exists(config_path):
-        with open(config_path, mode="rt", encoding="utf-8") as fp:
-            config = toml.load(fp)
-
-        for project_name, project_data in config.items():
-            if isinstance(project_data, dict) and "thothcf" in project_data:
-                if project_data["thothcf"].get("space") == space_name:
-                    projects.append(project_name)
-
-    return projects
+    return get_registry().get_projects_in_space(space_name)
 
 
 def register_project_in_space(project_name: str, space_name: str) -> None:
@@ -424,17 +393,15 @@ def register_project_in_space(project_name: str, space_name: str) -> None:
     """
     from datetime import datetime
 
-    spaces_path = Path.home() / ".thothcf" / "spaces.toml"
-    if not spaces_path.exists():
+    registry = get_registry()
+    config = registry.spaces_config()
+    if config is None:
         logging.warning(
             "Cannot register project in space: spaces.toml not found. "
             "Run 'thothctl init space' first."
         )
         return
 
-    with open(spaces_path, mode="rt", encoding="utf-8") as fp:
-        config = toml.load(fp)
-
     if "spaces" not in config or space_name not in config["spaces"]:
         logging.warning(f"Space '{space_name}' not found in spaces.toml")
         return
@@ -447,8 +414,7 @@ def register_project_in_space(project_name: str, space_name: str) -> None:
         "registered_at": datetime.now().isoformat(),
     }
 
-    with open(spaces_path, mode="wt", encoding="utf-8") as fp:
-        toml.dump(config, fp)
+    registry.save_spaces(config)
 
     logging.debug(f"Registered project '{project_name}' in space '{space_name}'")
 
@@ -460,19 +426,16 @@ def unregister_project_from_space(project_name: str, space_name: str) -> None:
     :param project_name: Name of the project
     :param space_name: Name of the space
     """
-    spaces_path = Path.home() / ".thothcf" / "spaces.toml"
-    if not spaces_path.exists():
+    registry = get_registry()
+    config = registry.spaces_config()
+    if config is None:
         return
 
-    with open(spaces_path, mode="rt", encoding="utf-8") as fp:
-        config = toml.load(fp)
-
     space = config.get("spaces", {}).get(space_name, {})
     projects = space.get("projects", {})
     if project_name in projects:
         del projects[project_name]
-        with open(spaces_path, mode="wt", encoding="utf-8") as fp:
-            toml.dump(config, fp)
+        registry.save_spaces(config)
         logging.debug(
             f"Unregistered project '{project_name}' from space '{space_name}'"
         )
@@ -497,9 +460,10 @@ def print_list_projects(show_space=True):
         console.print("[yellow]No projects found[/yellow]")
         return
 
+    project_spaces = get_registry().project_spaces() if show_space else {}
     for p in projects:
         if show_space:
-            space = get_project_space(p)
+            space = project_spaces.get(p)
             space_display = space if space else "-"
             table.add_row(f"☑️  {p}", space_display)
         else:
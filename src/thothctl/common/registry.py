@@ -0,0 +1,241 @@
+"""Cached, change-aware registry of projects and spaces in ``~/.thothcf``.
+
+``.thothcf.toml`` (projects) and ``spaces.toml`` (spaces) are parsed once and
+kept in memory together with lookup indexes (project -> space,
+space -> projects). Every access revalidates the files with a single
+``os.stat``; a file is only re-parsed when its mtime, size or inode changed.
+Writes go through a temporary file and ``os.replace`` so readers never see a
+half-written config.
+"""
+
+import copy
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import toml
+
+PROJECTS_FILE_NAME = ".thothcf.toml"
+SPACES_FILE_NAME = "spaces.toml"
+
+_FileSignature = Tuple[int, int, int]
+
+
+def _signature(path: Path) -> Optional[_FileSignature]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def atomic_write_toml(path: Path, content: Dict[str, Any]) -> None:
+    """Write a TOML file atomically (temporary file + rename).
+
+    :param path: Destination file
+    :param content: Data to serialize
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, mode="wt", encoding="utf-8") as fp:
+            toml.dump(content, fp)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+class _CachedToml:
+    """A TOML file parsed once and re-parsed only when it changes on disk."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.signature: Optional[_FileSignature] = None
+        self.data: Optional[Dict[str, Any]] = None
+        self.parse_count = 0
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the parsed file, or ``None`` if it does not exist."""
+        signature = _signature(self.path)
+        if signature is None:
+            self.signature, self.data = None, None
+            return None
+        if signature != self.signature:
+            with open(self.path, mode="rt", encoding="utf-8") as fp:
+                self.data = toml.load(fp)
+            self.signature = signature
+            self.parse_count += 1
+            logging.debug(f"Parsed {self.path}")
+        return self.data
+
+    def store(self, content: Dict[str, Any]) -> None:
+        atomic_write_toml(self.path, content)
+        self.data = copy.deepcopy(content)
+        self.signature = _signature(self.path)
+
+
+class ThothRegistry:
+    """In-memory view of the projects and spaces registered in a config dir."""
+
+    def __init__(self, config_dir: Path):
+        self.config_dir = Path(config_dir)
+        self._projects = _CachedToml(self.config_dir / PROJECTS_FILE_NAME)
+        self._spaces = _CachedToml(self.config_dir / SPACES_FILE_NAME)
+        self._lock = threading.RLock()
+        self._index_key: Optional[Tuple[Any, Any]] = None
+        self._project_space: Dict[str, Optional[str]] = {}
+        self._space_projects: Dict[str, List[str]] = {}
+        self._legacy_space_projects: Dict[str, List[str]] = {}
+
+    # -- raw configs -------------------------------------------------------
+
+    @property
+    def projects_path(self) -> Path:
+        return self._projects.path
+
+    @property
+    def spaces_path(self) -> Path:
+        return self._spaces.path
+
+    @property
+    def parse_count(self) -> int:
+        """Number of TOML parses performed so far (both files)."""
+        return self._projects.parse_count + self._spaces.parse_count
+
+    def projects_config(self) -> Optional[Dict[str, Any]]:
+        """Copy of ``.thothcf.toml``, safe to modify and pass to ``save_projects``."""
+        with self._lock:
+            data = self._projects.load()
+            return copy.deepcopy(data) if data is not None else None
+
+    def spaces_config(self) -> Optional[Dict[str, Any]]:
+        """Copy of ``spaces.toml``, safe to modify and pass to ``save_spaces``."""
+        with self._lock:
+            data = self._spaces.load()
+            return copy.deepcopy(data) if data is not None else None
+
+    def save_projects(self, content: Dict[str, Any]) -> Path:
+        """Atomically replace ``.thothcf.toml``."""
+        with self._lock:
+            self._projects.store(content)
+            self._index_key = None
+            return self._projects.path
+
+    def save_spaces(self, content: Dict[str, Any]) -> Path:
+        """Atomically replace ``spaces.toml``."""
+        with self._lock:
+            self._spaces.store(content)
+            self._index_key = None
+            return self._spaces.path
+
+    # -- indexes -----------------------------------------------------------
+
+    def _refresh(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        projects = self._projects.load() or {}
+        spaces = self._spaces.load() or {}
+        key = (self._projects.signature, self._spaces.signature)
+        if key == self._index_key:
+            return projects, spaces
+
+        project_space: Dict[str, Optional[str]] = {}
+        legacy: Dict[str, List[str]] = {}
+        for project_name, project_data in projects.items():
+            space = None
+            if isinstance(project_data, dict) and "thothcf" in project_data:
+                space = project_data["thothcf"].get("space")
+                if space:
+                    legacy.setdefault(space, []).append(project_name)
+            project_space[project_name] = space
+
+        space_projects: Dict[str, List[str]] = {}
+        for space_name, space_data in spaces.get("spaces", {}).items():
+            registered = (
+                space_data.get("projects", {}) if isinstance(space_data, dict) else {}
+            )
+            space_projects[space_name] = list(registered.keys())
+
+        self._project_space = project_space
+        self._legacy_space_projects = legacy
+        self._space_projects = space_projects
+        self._index_key = key
+        return projects, spaces
+
+    def list_projects(self) -> Optional[List[str]]:
+        """Project names, or ``None`` if ``.thothcf.toml`` does not exist."""
+        with self._lock:
+            self._refresh()
+            if self._projects.data is None:
+                return None
+            return list(self._project_space.keys())
+
+    def get_project(self, project_name: str) -> Optional[Dict[str, Any]]:
+        """Copy of a project's entry, or ``None`` if it is not registered."""
+        with self._lock:
+            projects, _ = self._refresh()
+            if project_name not in projects:
+                return None
+            return copy.deepcopy(projects[project_name])
+
+    def get_project_space(self, project_name: str) -> Optional[str]:
+        with self._lock:
+            self._refresh()
+            return self._project_space.get(project_name)
+
+    def project_spaces(self) -> Dict[str, Optional[str]]:
+        """Mapping of every project to its space (``None`` when unscoped)."""
+        with self._lock:
+            self._refresh()
+            return dict(self._project_space)
+
+    def list_spaces(self) -> List[str]:
+        with self._lock:
+            self._refresh()
+            return list(self._space_projects.keys())
+
+    def get_space_details(self) -> Dict[str, Any]:
+        with self._lock:
+            _, spaces = self._refresh()
+            return copy.deepcopy(spaces.get("spaces", {}))
+
+    def get_projects_in_space(self, space_name: str) -> List[str]:
+        """Projects registered under a space.
+
+        Namespaced registrations in ``spaces.toml`` win; projects whose flat
+        ``.thothcf.toml`` entry names the space are the legacy fallback.
+        """
+        with self._lock:
+            self._refresh()
+            namespaced = self._space_projects.get(space_name)
+            if namespaced:
+                return list(namespaced)
+            return list(self._legacy_space_projects.get(space_name, []))
+
+
+_registries: Dict[str, ThothRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(config_dir: Optional[Path] = None) -> ThothRegistry:
+    """Return the shared registry for ``config_dir`` (default ``~/.thothcf``).
+
+    :param config_dir: ThothCTL config directory
+    :return: Registry instance, created on first use
+    """
+    if config_dir is None:
+        config_dir = Path.home() / ".thothcf"
+    key = str(config_dir)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = ThothRegistry(Path(config_dir))
+        return registry
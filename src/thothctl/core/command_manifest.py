@@ -0,0 +1,159 @@
+"""Help manifest for the top-level commands.
+
+``thothctl --help`` and shell completion only need each command's name and
+help text, but importing a command module pulls in its whole service stack.
+The text is read from ``commands/_help_manifest.json`` instead, which is
+regenerated with::
+
+    python -m thothctl.core.command_manifest
+
+Each entry records a hash of the command's ``cli.py``. Entries that no longer
+match (or commands missing from the manifest) are read from the source with
+:mod:`ast`, which is still far cheaper than importing the module.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+COMMANDS_DIR = Path(__file__).resolve().parent.parent / "commands"
+MANIFEST_PATH = COMMANDS_DIR / "_help_manifest.json"
+MANIFEST_VERSION = 1
+
+_HELP_KEYWORDS = ("help", "short_help", "hidden")
+_COMMAND_FACTORIES = ("command", "group", "as_click_command")
+
+
+def command_names(commands_dir: Path = COMMANDS_DIR) -> List[str]:
+    """CLI names of the command packages (``ai_review`` -> ``ai-review``)."""
+    return sorted(
+        item.name.replace("_", "-")
+        for item in commands_dir.iterdir()
+        if item.is_dir() and not item.name.startswith("_")
+    )
+
+
+def _module_path(commands_dir: Path, name: str) -> Path:
+    return commands_dir / name.replace("-", "_") / "cli.py"
+
+
+def _source_hash(source: bytes) -> str:
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def extract_help(source: str) -> Optional[Dict[str, Any]]:
+    """Help text of the module-level ``cli`` command, read without importing.
+
+    Handles ``@click.group(...)``/``@click.command(...)`` decorated functions
+    (docstring or ``help=``) and ``cli = SomeCommand.as_click_command(help=...)``.
+    """
+    # Only needed when the manifest is stale; keep it off the startup path
+    import ast
+
+    def literal_keywords(call: ast.Call) -> Dict[str, Any]:
+        func = call.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", "")
+        values: Dict[str, Any] = {}
+        # Options and arguments take help= too; only the command's own counts
+        if name not in _COMMAND_FACTORIES:
+            return values
+        for keyword in call.keywords:
+            if keyword.arg in _HELP_KEYWORDS:
+                try:
+                    values[keyword.arg] = ast.literal_eval(keyword.value)
+                except ValueError:
+                    continue
+        return values
+
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.FunctionDef) and node.name == "cli":
+            entry: Dict[str, Any] = {"help": ast.get_docstring(node)}
+            for decorator in node.decorator_list:
+                if isinstance(decorator, ast.Call):
+                    entry.update(literal_keywords(decorator))
+            return _entry(entry)
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "cli" for t in node.targets
+        ):
+            entry = {}
+            for call in ast.walk(node.value):
+                if isinstance(call, ast.Call):
+                    entry.update(literal_keywords(call))
+            return _entry(entry)
+    return None
+
+
+def _entry(values: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "help": values.get("help"),
+        "short_help": values.get("short_help"),
+        "hidden": bool(values.get("hidden", False)),
+    }
+
+
+def _read_entry(module_path: Path, source: bytes) -> Optional[Dict[str, Any]]:
+    try:
+        entry = extract_help(source.decode("utf-8"))
+    except (SyntaxError, UnicodeDecodeError) as e:
+        logger.debug(f"Could not read help from {module_path}: {e}")
+        return None
+    if entry is not None:
+        entry["hash"] = _source_hash(source)
+    return entry
+
+
+def build_manifest(commands_dir: Path = COMMANDS_DIR) -> Dict[str, Any]:
+    commands = {}
+    for name in command_names(commands_dir):
+        module_path = _module_path(commands_dir, name)
+        if module_path.exists():
+            entry = _read_entry(module_path, module_path.read_bytes())
+            if entry is not None:
+                commands[name] = entry
+    return {"version": MANIFEST_VERSION, "commands": commands}
+
+
+def write_manifest(
+    commands_dir: Path = COMMANDS_DIR, manifest_path: Path = MANIFEST_PATH
+) -> Dict[str, Any]:
+    manifest = build_manifest(commands_dir)
+    manifest_path.write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    return manifest
+
+
+def load_help(
+    commands_dir: Path = COMMANDS_DIR, manifest_path: Path = MANIFEST_PATH
+) -> Dict[str, Dict[str, Any]]:
+    """Help entries for every command, from the manifest where still current."""
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("version") != MANIFEST_VERSION:
+            manifest = {}
+    except (OSError, ValueError):
+        manifest = {}
+    cached = manifest.get("commands", {})
+
+    entries = {}
+    for name in command_names(commands_dir):
+        module_path = _module_path(commands_dir, name)
+        try:
+            source = module_path.read_bytes()
+        except OSError:
+            continue
+        entry = cached.get(name)
+        if entry is None or entry.get("hash") != _source_hash(source):
+            entry = _read_entry(module_path, source)
+        if entry is not None:
+            entries[name] = entry
+    return entries
+
+
+if __name__ == "__main__":
+    written = write_manifest()
+    print(f"Wrote {len(written['commands'])} command(s) to {MANIFEST_PATH}")
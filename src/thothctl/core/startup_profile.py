@@ -0,0 +1,84 @@
+"""Import-time breakdown of a thothctl invocation (``--startup-profile``).
+
+The command line is re-run in a child interpreter with ``-X importtime`` and
+the per-module timings are grouped by package, so the dependencies that make
+a command slow to start stand out.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+_RUN_CLI = (
+    "import sys; from thothctl.cli import cli; "
+    "cli(args=sys.argv[1:], prog_name='thothctl')"
+)
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int]]:
+    """(module, self time in µs) for each ``import time:`` line."""
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        timings.append((fields[2].strip(), int(fields[0])))
+    return timings
+
+
+def package_of(module: str) -> str:
+    """Grouping key: top-level package, or three levels deep for thothctl."""
+    parts = module.split(".")
+    depth = 3 if parts[0] == "thothctl" else 1
+    return ".".join(parts[:depth])
+
+
+def summarize(timings: List[Tuple[str, int]]) -> List[Tuple[str, int, int]]:
+    """(package, self µs, module count), slowest first."""
+    totals: Dict[str, List[int]] = {}
+    for module, micros in timings:
+        entry = totals.setdefault(package_of(module), [0, 0])
+        entry[0] += micros
+        entry[1] += 1
+    return sorted(
+        ((name, t[0], t[1]) for name, t in totals.items()),
+        key=lambda row: (-row[1], row[0]),
+    )
+
+
+def profile_startup(args: List[str], top: int = 15) -> str:
+    """Run ``thothctl <args>`` with ``-X importtime`` and format the breakdown."""
+    env = dict(os.environ)
+    env.pop("PYTHONIMPORTTIME", None)
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _RUN_CLI, *args],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    timings = parse_importtime(proc.stderr)
+    rows = summarize(timings)
+    import_ms = sum(micros for _, micros in timings) / 1000
+    lines = [
+        f"Startup profile: thothctl {' '.join(args)}",
+        f"  wall time  {wall_ms:9.1f} ms (exit code {proc.returncode})",
+        f"  imports    {import_ms:9.1f} ms ({len(timings)} modules)",
+        "",
+        f"  {'self ms':>9}  {'modules':>7}  package",
+    ]
+    for name, micros, count in rows[:top]:
+        lines.append(f"  {micros / 1000:9.1f}  {count:7d}  {name}")
+    if len(rows) > top:
+        rest = rows[top:]
+        lines.append(
+            f"  {sum(r[1] for r in rest) / 1000:9.1f}  "
+            f"{sum(r[2] for r in rest):7d}  ({len(rest)} more packages)"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,161 @@
+"""Check for newer thothctl releases without delaying the command.
+
+The CLI only reads the cache at ``~/.thothcf/.version_check``. When that cache
+has expired, a detached ``python -m thothctl.core.version_check`` process
+queries PyPI and rewrites it, so the answer shows up on the next run. Failed
+lookups are cached too, for a shorter time, so an offline machine does not
+retry on every invocation. CI runs skip the check entirely, and it can be
+turned off with ``THOTHCTL_NO_VERSION_CHECK=1``.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from ..version import __version__
+
+CACHE_FILE = Path.home() / ".thothcf" / ".version_check"
+CACHE_TTL = 86400  # 24 hours
+NEGATIVE_CACHE_TTL = 6 * 3600  # retry failed lookups after 6 hours
+REFRESH_GRACE = 300  # don't start another refresher while one may be running
+PYPI_URL = "https://pypi.org/pypi/thothctl/json"
+PYPI_TIMEOUT = 3
+
+DISABLE_ENV = "THOTHCTL_NO_VERSION_CHECK"
+CI_ENV_VARS = (
+    "CI",
+    "CONTINUOUS_INTEGRATION",
+    "GITHUB_ACTIONS",
+    "GITLAB_CI",
+    "BUILDKITE",
+    "CIRCLECI",
+    "TRAVIS",
+    "JENKINS_URL",
+    "TF_BUILD",
+    "CODEBUILD_BUILD_ID",
+    "BITBUCKET_BUILD_NUMBER",
+    "TEAMCITY_VERSION",
+)
+
+
+def is_ci(environ: Optional[Mapping[str, str]] = None) -> bool:
+    """True when running under a CI system (or a CI-like ``CI=true``)."""
+    environ = os.environ if environ is None else environ
+    for name in CI_ENV_VARS:
+        value = environ.get(name, "")
+        if value and value.lower() not in ("0", "false", "no"):
+            return True
+    return False
+
+
+def read_cache(cache_file: Path = CACHE_FILE) -> Dict[str, Any]:
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_cache(data: Dict[str, Any], cache_file: Path = CACHE_FILE) -> None:
+    """Replace the cache atomically; the refresher may race a running CLI."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp, cache_file)
+
+
+def is_newer(latest: str, current: str) -> bool:
+    """Compare semantic versions."""
+    try:
+        latest_parts = tuple(int(x) for x in latest.split(".")[:3])
+        current_parts = tuple(int(x) for x in current.split(".")[:3])
+        return latest_parts > current_parts
+    except (ValueError, AttributeError):
+        return False
+
+
+def show_upgrade_hint(current: str, latest: str) -> None:
+    """Show a one-line upgrade hint in stderr."""
+    sys.stderr.write(
+        f"\033[33m⚠ ThothCTL {latest} available (you have {current}). "
+        f"Run: thothctl upgrade\033[0m\n"
+    )
+
+
+def needs_refresh(cache: Dict[str, Any], now: float) -> bool:
+    ttl = CACHE_TTL if cache.get("latest") else NEGATIVE_CACHE_TTL
+    if now - cache.get("timestamp", 0) < ttl:
+        return False
+    return now - cache.get("refresh_started", 0) >= REFRESH_GRACE
+
+
+def check_version_freshness(cache_file: Path = CACHE_FILE) -> None:
+    """Show the upgrade hint from the cache and refresh it in the background.
+
+    Never touches the network in the calling process.
+    """
+    if os.environ.get(DISABLE_ENV) or is_ci():
+        return
+
+    cache = read_cache(cache_file)
+    latest = cache.get("latest")
+    if latest and is_newer(latest, __version__):
+        show_upgrade_hint(__version__, latest)
+
+    now = time.time()
+    if needs_refresh(cache, now):
+        cache["refresh_started"] = now
+        write_cache(cache, cache_file)
+        spawn_refresher()
+
+
+def spawn_refresher() -> None:
+    """Start ``refresh_cache`` in a process that outlives this one."""
+    import subprocess
+
+    kwargs: Dict[str, Any] = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = (
+            subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+    else:
+        kwargs["start_new_session"] = True
+    subprocess.Popen(
+        [sys.executable, "-m", "thothctl.core.version_check"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        **kwargs,
+    )
+
+
+def fetch_latest() -> Optional[str]:
+    import requests
+
+    resp = requests.get(PYPI_URL, timeout=PYPI_TIMEOUT)
+    if resp.status_code != 200:
+        return None
+    return resp.json().get("info", {}).get("version") or None
+
+
+def refresh_cache(cache_file: Path = CACHE_FILE) -> Optional[str]:
+    """Look up the latest release and cache it; failures are cached as ``None``."""
+    try:
+        latest = fetch_latest()
+    except Exception:
+        latest = None
+    entry: Dict[str, Any] = {"latest": latest, "timestamp": time.time()}
+    write_cache(entry, cache_file)
+    return latest
+
+
+if __name__ == "__main__":
+    try:
+        refresh_cache()
+    except Exception:
+        # Detached with no terminal; nothing useful to report
+        pass
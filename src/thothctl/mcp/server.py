@@ -3,16 +3,17 @@
 import json
 import logging
 import subprocess
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Dict, List
 
 from ..common.common import (
-    get_project_space,
     get_projects_in_space,
     get_space_details,
     list_projects,
     list_spaces,
 )
+from ..common.registry import get_registry
 from ..core.cli_ui import CliUI
 from ..version import __version__
 
@@ -30,6 +31,28 @@ logger = logging.getLogger("thothctl-mcp")
 # Default port for the MCP server
 DEFAULT_PORT = 8080
 
+# Default number of thothctl commands executed at the same time
+DEFAULT_MAX_CONCURRENT = 4
+
+
+class ThothCTLMCPServer(ThreadingHTTPServer):
+    """Threaded HTTP server that bounds concurrent command executions.
+
+    Every request is handled in its own thread so quick calls such as
+    ``thothctl_version`` are never stuck behind a long scan; only tool
+    executions that spawn ``thothctl`` wait for one of ``max_concurrent``
+    slots.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, server_address, handler_class, max_concurrent=DEFAULT_MAX_CONCURRENT
+    ):
+        super().__init__(server_address, handler_class)
+        self.max_concurrent = max(1, max_concurrent)
+        self.operation_slots = threading.BoundedSemaphore(self.max_concurrent)
+
 
 class ThothCTLMCPHandler(BaseHTTPRequestHandler):
     """HTTP request handler for ThothCTL MCP server."""
@@ -663,8 +686,12 @@ class ThothCTLMCPHandler(BaseHTTPRequestHandler):
             logger.info(f"Executing command: {' '.join(cmd)}")
             ui.print_info(f"Executing command: {' '.join(cmd)}")
 
-            with ui.status_spinner("Executing command..."):
+            slots = getattr(self.server, "operation_slots", None)
+            if slots is None:
                 result = subprocess.run(cmd, capture_output=True, text=True)
+            else:
+                with slots:
+                    result = subprocess.run(cmd, capture_output=True, text=True)
 
             if result.returncode == 0:
                 ui.print_success("Command executed successfully")
@@ -689,16 +716,16 @@ class ThothCTLMCPHandler(BaseHTTPRequestHandler):
     def _handle_get_projects(self) -> None:
         """Handle request to get list of projects."""
         try:
-            with ui.status_spinner("Getting projects..."):
-                projects = list_projects()
+            projects = list_projects()
 
-                # Add space information to each project
-                project_data = []
-                if projects:
-                    for project_name in projects:
-                        space = get_project_space(project_name)
-                        project_info = {"name": project_name, "space": space}
-                        project_data.append(project_info)
+            # Add space information to each project from one registry index
+            project_data = []
+            if projects:
+                project_spaces = get_registry().project_spaces()
+                for project_name in projects:
+                    space = project_spaces.get(project_name)
+                    project_info = {"name": project_name, "space": space}
+                    project_data.append(project_info)
 
             ui.print_success(f"Found {len(project_data)} projects")
 
@@ -715,19 +742,18 @@ class ThothCTLMCPHandler(BaseHTTPRequestHandler):
     def _handle_get_spaces(self) -> None:
         """Handle request to get list of spaces."""
         try:
-            with ui.status_spinner("Getting spaces..."):
-                spaces = list_spaces()
-                space_details = get_space_details()
-
-                # Prepare space data with additional information
-                space_data = []
-                for space_name in spaces:
-                    space_info = {
-                        "name": space_name,
-                        "projects": get_projects_in_space(space_name),
-                        "details": space_details.get(space_name, {}),
-                    }
-                    space_data.append(space_info)
+            spaces = list_spaces()
+            space_details = get_space_details()
+
+            # Prepare space data with additional information
+            space_data = []
+            for space_name in spaces:
+                space_info = {
+                    "name": space_name,
+                    "projects": get_projects_in_space(space_name),
+                    "details": space_details.get(space_name, {}),
+                }
+                space_data.append(space_info)
 
             ui.print_success(f"Found {len(space_data)} spaces")
 
@@ -755,8 +781,7 @@ class ThothCTLMCPHandler(BaseHTTPRequestHandler):
             return
 
         try:
-            with ui.status_spinner(f"Getting projects in space {space_name}..."):
-                projects = get_projects_in_space(space_name)
+            projects = get_projects_in_space(space_name)
 
             ui.print_success(f"Found {len(projects)} projects in space {space_name}")
 
@@ -786,14 +811,19 @@ class ThothCTLMCPHandler(BaseHTTPRequestHandler):
             self.wfile.write(json.dumps({"error": str(e)}).encode())
 
 
-def run_server(port: int = DEFAULT_PORT) -> None:
+def run_server(
+    port: int = DEFAULT_PORT, max_concurrent: int = DEFAULT_MAX_CONCURRENT
+) -> None:
     """Run the MCP server.
 
     Args:
         port: Port to listen on
+        max_concurrent: Maximum number of thothctl commands running at once
     """
     server_address = ("", port)
-    httpd = HTTPServer(server_address, ThothCTLMCPHandler)
+    httpd = ThothCTLMCPServer(
+        server_address, ThothCTLMCPHandler, max_concurrent=max_concurrent
+    )
     ui.print_info(f"Starting ThothCTL MCP server on port {port}")
     ui.print_info(f"ThothCTL version: {__version__}")
     try:
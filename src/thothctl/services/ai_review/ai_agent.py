@@ -4,8 +4,9 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from .analyzers.code_reviewer import CodeReviewer
+from .analyzers.code_reviewer import CodeReviewer, git_changed_files
 from .analyzers.context_builder import ContextBuilder
+from .analyzers.context_packer import context_budget
 from .analyzers.report_analyzer import ReportAnalyzer
 from .analyzers.risk_assessor import RiskAssessor
 from .config.ai_settings import AISettings
@@ -23,6 +24,7 @@ from .utils.prompts import (
     SYSTEM_FULL_ANALYSIS,
     SYSTEM_SECURITY_ANALYST,
 )
+from .utils.response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +45,7 @@ class AIReviewAgent:
         provider: Optional[str] = None,
         model: Optional[str] = None,
         config_path: Optional[str] = None,
+        use_cache: bool = True,
     ):
         self.settings = AISettings.load(config_path)
         self.cost_tracker = CostTracker(
@@ -50,6 +53,10 @@ class AIReviewAgent:
             monthly_budget=self.settings.cost_controls.monthly_budget,
         )
         self.cost_tracker.load_records()
+        self.response_cache = ResponseCache(
+            ttl_hours=self.settings.cache.ttl_hours,
+            enabled=use_cache and self.settings.cache.enabled,
+        )
         self.report_analyzer = ReportAnalyzer()
         self.code_reviewer = CodeReviewer()
         self.risk_assessor = RiskAssessor()
@@ -67,6 +74,8 @@ class AIReviewAgent:
         config = self.settings.get_provider_config(provider_name)
         if model:
             config.model = model
+        # Prompt context is packed to fit the model
+        self.context_budget = context_budget(config)
         return cls(config)
 
     def analyze_scan_results(self, scan_dir: str) -> Dict[str, Any]:
@@ -117,7 +126,7 @@ class AIReviewAgent:
                 return self._empty_result()
 
             self._emit_status("🤖 Sending context to LLM for security analysis...")
-            formatted = self.context_builder.format_for_ai(ctx)
+            formatted = self.context_builder.format_for_ai(ctx, self.context_budget)
 
             # Use compact prompt for local models (Ollama) to fit VRAM constraints
             if self._provider.name == "ollama":
@@ -142,7 +151,9 @@ class AIReviewAgent:
                         else self._empty_result()
                     )
                     try:
-                        ai_response = self._provider.analyze(SYSTEM_COMPACT, formatted)
+                        ai_response = self.response_cache.analyze(
+                            self._provider, SYSTEM_COMPACT, formatted
+                        )
                         if isinstance(ai_response, dict) and ai_response.get(
                             "recommendations"
                         ):
@@ -180,6 +191,7 @@ class AIReviewAgent:
                 "blast_radius_components": ctx.blast_radius.get("total_components", 0),
                 "code_files": len(ctx.code_files),
                 "collection_notes": ctx.errors,
+                "context_tokens": _packing_report(self.context_builder.last_packing),
             }
             s.set_attribute("findings", ctx.scan_results.get("total_findings", 0))
             s.set_attribute("code_files", len(ctx.code_files))
@@ -202,7 +214,11 @@ class AIReviewAgent:
                 "overall_assessment": "Budget limit reached. Cannot perform AI review.",
             }
 
-        formatted = self.code_reviewer.format_for_ai(code_files)
+        formatted = self.code_reviewer.format_for_ai(
+            code_files,
+            budget_tokens=self.context_budget,
+            priority_files=git_changed_files(directory),
+        )
         return self._call_ai(
             SYSTEM_CODE_REVIEWER,
             formatted,
@@ -444,7 +460,9 @@ class AIReviewAgent:
     ) -> Dict[str, Any]:
         """Send to AI provider, track cost, fall back on error."""
         try:
-            ai_result = self._provider.analyze(system_prompt, user_content)
+            ai_result = self.response_cache.analyze(
+                self._provider, system_prompt, user_content
+            )
             usage = ai_result.pop("_usage", {})
             self.cost_tracker.record_usage(
                 provider=self._provider.name,
@@ -452,6 +470,7 @@ class AIReviewAgent:
                 input_tokens=usage.get("input_tokens", 0),
                 output_tokens=usage.get("output_tokens", 0),
                 operation=operation,
+                cached=usage.get("cached", False),
             )
             return ai_result
         except Exception as e:
@@ -514,3 +533,15 @@ class AIReviewAgent:
             ],
             "_note": "Basic analysis (AI unavailable or budget exceeded)",
         }
+
+
+def _packing_report(packing) -> Dict[str, Any]:
+    """Budget use of a packed prompt: total and tokens per section."""
+    if packing is None:
+        return {}
+    return {
+        "budget": packing.budget_tokens,
+        "used": packing.used_tokens,
+        "sections": {name: u.tokens for name, u in packing.sections.items()},
+        "dropped": packing.dropped,
+    }
@@ -1,8 +1,17 @@
 """Code reviewer - analyzes IaC code changes."""
 
 import logging
+import subprocess
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, List, Optional
+
+from .context_packer import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_CHANGED,
+    ContextPacker,
+    PackedContext,
+    content_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -10,9 +19,39 @@ logger = logging.getLogger(__name__)
 IAC_EXTENSIONS = {".tf", ".hcl", ".tfvars"}
 
 
+def git_changed_files(directory: str) -> List[str]:
+    """Modified and untracked files under ``directory``, relative to it.
+
+    Returns an empty list outside a git work tree or when git is unavailable.
+    """
+    changed: List[str] = []
+    for args in (
+        ["diff", "--name-only", "--relative", "HEAD"],
+        ["ls-files", "--others", "--exclude-standard"],
+    ):
+        try:
+            proc = subprocess.run(
+                ["git", *args],
+                cwd=directory,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(f"git {args[0]} failed: {e}")
+            return []
+        if proc.returncode != 0:
+            return []
+        changed.extend(line for line in proc.stdout.splitlines() if line)
+    return sorted(set(changed))
+
+
 class CodeReviewer:
     """Analyzes IaC code files for AI-powered review."""
 
+    def __init__(self):
+        self.last_packing: Optional[PackedContext] = None
+
     def collect_code_for_review(
         self, directory: str, extensions: set = None
     ) -> Dict[str, str]:
@@ -52,20 +91,39 @@ class CodeReviewer:
 
         return files
 
-    def format_for_ai(self, code_files: Dict[str, str], max_chars: int = 50000) -> str:
-        """Format collected code files into a string for AI review."""
-        lines = [f"Total files to review: {len(code_files)}\n"]
-        total = 0
-
-        for path, content in sorted(code_files.items()):
-            header = f"\n--- File: {path} ---\n"
-            if total + len(header) + len(content) > max_chars:
-                lines.append(
-                    f"\n[Truncated: {len(code_files) - len(lines) + 1} files omitted due to size]"
-                )
-                break
-            lines.append(header)
-            lines.append(content)
-            total += len(header) + len(content)
-
-        return "\n".join(lines)
+    def format_for_ai(
+        self,
+        code_files: Dict[str, str],
+        max_chars: int = 50000,
+        budget_tokens: Optional[int] = None,
+        priority_files: Iterable[str] = (),
+    ) -> str:
+        """Format collected code files into a string for AI review.
+
+        Files are packed into ``budget_tokens`` (``max_chars`` / 4 when not
+        given): ``priority_files`` (e.g. changed files) first, then smaller
+        files before larger ones. Identical files are included once.
+        """
+        packer = ContextPacker(budget_tokens or max_chars // 4)
+        packer.preamble(f"Total files to review: {len(code_files)}\n")
+        packer.section(
+            "code", epilogue="\n[Truncated: {dropped} files omitted due to size]"
+        )
+
+        priority_files = set(priority_files)
+        for path, content in sorted(
+            code_files.items(), key=lambda item: (len(item[1]), item[0])
+        ):
+            changed = path in priority_files
+            packer.add(
+                "code",
+                f"\n--- File: {path} ---\n{content}",
+                PRIORITY_CHANGED if changed else PRIORITY_BACKGROUND,
+                key=content_key(content),
+                label=path,
+                truncatable=changed,
+            )
+
+        self.last_packing = packer.pack()
+        logger.info(self.last_packing.summary())
+        return self.last_packing.text
@@ -1,13 +1,58 @@
-"""Context builder - gathers rich IaC context from thothctl internal services."""
+"""Context builder - gathers rich IaC context from thothctl internal services.
+
+Collectors run concurrently, each on its own partial ``IaCContext`` that is
+merged back in a fixed order, and each has a time budget: a collector that
+exceeds it is abandoned and noted in ``errors``. Collectors run in daemon
+threads, so an abandoned one cannot keep the process alive at exit. Inventory reports already in
+``Reports/`` are reused when they are newer than the IaC sources, which
+avoids a full inventory (with registry version checks) on every review.
+"""
 
 import asyncio
+import json
 import logging
-from dataclasses import dataclass, field
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+from .code_reviewer import IAC_EXTENSIONS, git_changed_files
+from .context_packer import (
+    DEFAULT_BUDGET_TOKENS,
+    PRIORITY_BACKGROUND,
+    PRIORITY_CHANGED,
+    PRIORITY_CRITICAL,
+    PRIORITY_INVENTORY,
+    PRIORITY_LOW,
+    PRIORITY_MEDIUM,
+    PRIORITY_REFERENCED,
+    SEVERITY_PRIORITY,
+    ContextPacker,
+    PackedContext,
+    content_key,
+)
 
 logger = logging.getLogger(__name__)
 
+# Seconds each collector may run before its result is dropped
+DEFAULT_COLLECTOR_BUDGETS = {
+    "inventory": 120.0,
+    "scan_results": 30.0,
+    "plan_files": 30.0,
+    "blast_radius": 60.0,
+    "code": 30.0,
+    "changed_files": 10.0,
+}
+
+DEFAULT_MAX_WORKERS = len(DEFAULT_COLLECTOR_BUDGETS)
+
+# Files whose changes make Reports/ artifacts stale
+SOURCE_EXTENSIONS = IAC_EXTENSIONS | {".yaml", ".yml"}
+SKIP_DIRS = {"Reports", "node_modules", "cdk.out", "__pycache__"}
+
 
 @dataclass
 class IaCContext:
@@ -25,150 +70,266 @@ class IaCContext:
     blast_radius: Dict[str, Any] = field(default_factory=dict)
     # Raw code (supplementary)
     code_files: Dict[str, str] = field(default_factory=dict)
+    # Files changed in the working tree (relative to directory)
+    changed_files: List[str] = field(default_factory=list)
     # Metadata
     errors: List[str] = field(default_factory=list)
+    # Seconds spent per collector
+    timings: Dict[str, float] = field(default_factory=dict)
+    # Reports/ artifacts used instead of recomputing ("inventory", ...)
+    reused_artifacts: List[str] = field(default_factory=list)
 
 
 class ContextBuilder:
     """Builds rich IaC context by calling thothctl's internal services."""
 
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        budgets: Optional[Dict[str, float]] = None,
+        reuse_reports: bool = True,
+    ):
+        """Initialize the builder.
+
+        Args:
+            max_workers: Collectors running at the same time.
+            budgets: Seconds per collector, overriding DEFAULT_COLLECTOR_BUDGETS.
+            reuse_reports: Use fresh reports from Reports/ instead of recomputing.
+        """
+        self.max_workers = max(1, max_workers)
+        self.budgets = {**DEFAULT_COLLECTOR_BUDGETS, **(budgets or {})}
+        self.reuse_reports = reuse_reports
+        self.last_packing: Optional[PackedContext] = None
+
     def build_context(self, directory: str) -> IaCContext:
         """Gather all available context from a directory."""
         ctx = IaCContext(directory=directory)
+        sources_mtime = _newest_source_mtime(directory)
+        collectors = {
+            "inventory": lambda part: self._collect_inventory(part, sources_mtime),
+            "scan_results": lambda part: self._collect_scan_results(
+                part, sources_mtime
+            ),
+            "plan_files": lambda part: self._collect_plan_files(part, sources_mtime),
+            "blast_radius": self._collect_blast_radius,
+            "code": self._collect_code,
+            "changed_files": self._collect_changed_files,
+        }
 
         # Run each collector independently — failures don't block others
-        self._collect_inventory(ctx)
-        self._collect_scan_results(ctx)
-        self._collect_plan_files(ctx)
-        self._collect_blast_radius(ctx)
-        self._collect_code(ctx)
-
+        partials = {name: IaCContext(directory=directory) for name in collectors}
+        started: Dict[str, float] = {}
+        finished: Dict[str, float] = {}
+        completed: "queue.Queue[str]" = queue.Queue()
+
+        def run(name: str) -> None:
+            try:
+                collectors[name](partials[name])
+            except Exception as e:
+                logger.debug(f"Context collector {name} failed: {e}")
+            finally:
+                finished[name] = time.perf_counter()
+                completed.put(name)
+
+        waiting = list(collectors)
+        active = set()
+        done_names = set()
+        while waiting or active:
+            # An abandoned collector gives its slot to the next one
+            while waiting and len(active) < self.max_workers:
+                name = waiting.pop(0)
+                started[name] = time.perf_counter()
+                threading.Thread(
+                    target=run, args=(name,), name=f"ai-context-{name}", daemon=True
+                ).start()
+                active.add(name)
+
+            deadline = min(started[n] + self.budgets[n] for n in active)
+            try:
+                name = completed.get(timeout=max(0.0, deadline - time.perf_counter()))
+                if name in active:
+                    active.discard(name)
+                    done_names.add(name)
+                continue
+            except queue.Empty:
+                pass
+
+            now = time.perf_counter()
+            for name in list(active):
+                if now - started[name] > self.budgets[name]:
+                    active.discard(name)
+                    ctx.timings[name] = now - started[name]
+                    ctx.errors.append(
+                        f"{name} skipped: exceeded its {self.budgets[name]:.0f}s budget"
+                    )
+                    logger.warning(f"Context collector {name} exceeded its budget")
+
+        for name in collectors:
+            if name in done_names:
+                ctx.timings[name] = finished[name] - started[name]
+                _merge(ctx, partials[name])
+        ctx.timings = {
+            name: ctx.timings[name] for name in collectors if name in ctx.timings
+        }
+
+        logger.info(
+            "Context collected: "
+            + ", ".join(f"{k}={v:.2f}s" for k, v in ctx.timings.items())
+        )
         return ctx
 
-    def format_for_ai(self, ctx: IaCContext) -> str:
-        """Format the full context into a single string for the LLM."""
-        sections = [f"# IaC Analysis Context for: {ctx.directory}\n"]
-        sections.append(f"Project type: {ctx.project_type}\n")
-
-        # Inventory section
-        if ctx.modules or ctx.providers:
-            sections.append("## Infrastructure Inventory")
-            if ctx.modules:
-                sections.append(f"Modules ({len(ctx.modules)}):")
-                for m in ctx.modules[:30]:
-                    status = f" [{m.get('status', '')}]" if m.get("status") else ""
-                    version = m.get("version", "N/A")
-                    latest = m.get("latest_version", "")
-                    ver_info = f"v{version}"
-                    if latest and latest != version:
-                        ver_info += f" → v{latest} available"
-                    sections.append(
-                        f"  - {m.get('name', 'unknown')} ({ver_info}){status}"
-                    )
-            if ctx.providers:
-                sections.append(f"\nProviders ({len(ctx.providers)}):")
-                for p in ctx.providers[:20]:
-                    sections.append(
-                        f"  - {p.get('name', 'unknown')} v{p.get('version', 'N/A')} "
-                        f"({p.get('source', '')})"
-                    )
-            sections.append("")
-
-        # Scan results section
-        if ctx.scan_results.get("total_findings", 0) > 0:
-            sections.append("## Security Scan Findings")
-            for tool, data in ctx.scan_results.get("tools", {}).items():
-                sections.append(f"### {tool.upper()}")
-                sections.append(
-                    f"Passed: {data.get('passed', 0)}, Failed: {data.get('failed', 0)}"
+    def format_for_ai(
+        self, ctx: IaCContext, budget_tokens: Optional[int] = None
+    ) -> str:
+        """Format the context into a single string for the LLM.
+
+        Content is packed into ``budget_tokens`` (see ``context_budget``) by
+        value: critical findings, planned changes and changed code first,
+        inventory last. Per-section usage is kept in ``last_packing``.
+        """
+        packer = ContextPacker(budget_tokens or DEFAULT_BUDGET_TOKENS)
+        packer.preamble(f"# IaC Analysis Context for: {ctx.directory}\n")
+        packer.preamble(f"Project type: {ctx.project_type}\n")
+        packer.section("findings", "## Security Scan Findings")
+        packer.section("plans", "## Planned Changes")
+        packer.section("blast_radius", "## Blast Radius / Dependency Analysis")
+        packer.section(
+            "code", "## Key IaC Files", "[Truncated: {dropped} file(s) omitted]"
+        )
+        packer.section("inventory", "## Infrastructure Inventory")
+        packer.section("notes", "## Context Collection Notes")
+
+        # Scan results: per-tool totals, then findings by severity
+        referenced_files = set()
+        for tool, data in ctx.scan_results.get("tools", {}).items():
+            if not data.get("findings") and not data.get("failed"):
+                continue
+            packer.add(
+                "findings",
+                f"{tool.upper()}: Passed: {data.get('passed', 0)}, "
+                f"Failed: {data.get('failed', 0)}",
+                PRIORITY_CRITICAL,
+            )
+            for f in data.get("findings", []):
+                severity = str(f.get("severity", "?")).upper()
+                if f.get("file"):
+                    referenced_files.add(f["file"])
+                packer.add(
+                    "findings",
+                    f"  - [{severity}] {tool} {f.get('check_id', '')}: "
+                    f"{f.get('check_name', '')} → {f.get('resource', '')} "
+                    f"({f.get('file', '')})",
+                    SEVERITY_PRIORITY.get(severity, PRIORITY_LOW),
+                    key=f"finding:{f.get('check_id')}:{f.get('resource')}:{f.get('file')}",
+                    label=tool,
                 )
-                for f in data.get("findings", [])[:30]:
-                    sections.append(
-                        f"  - [{f.get('severity', '?')}] {f.get('check_id', '')}: "
-                        f"{f.get('check_name', '')} → {f.get('resource', '')} "
-                        f"({f.get('file', '')})"
-                    )
-            sections.append("")
 
-        # Blast radius section
+        # Blast radius: changed components first, riskiest first
         if ctx.blast_radius:
-            sections.append("## Blast Radius / Dependency Analysis")
-            sections.append(
-                f"Total components: {ctx.blast_radius.get('total_components', 0)}"
+            packer.add(
+                "blast_radius",
+                f"Total components: {ctx.blast_radius.get('total_components', 0)}\n"
+                f"Risk level: {ctx.blast_radius.get('risk_level', 'N/A')}",
+                PRIORITY_MEDIUM,
             )
-            sections.append(f"Risk level: {ctx.blast_radius.get('risk_level', 'N/A')}")
-            for comp in ctx.blast_radius.get("affected_components", [])[:15]:
-                sections.append(
+            components = sorted(
+                ctx.blast_radius.get("affected_components", []),
+                key=lambda c: -(c.get("risk_score") or 0),
+            )
+            for comp in components:
+                changed = comp.get("change_type") not in (None, "", "none", "no-op")
+                packer.add(
+                    "blast_radius",
                     f"  - {comp.get('name', '?')} ({comp.get('change_type', '?')}) "
                     f"risk={comp.get('risk_score', 0):.1f} "
-                    f"deps={comp.get('dependencies', [])}"
+                    f"deps={comp.get('dependencies', [])}",
+                    PRIORITY_MEDIUM if changed else PRIORITY_INVENTORY,
                 )
-            sections.append("")
-
-        # Code section — only include files referenced in findings + plan summaries
-        if ctx.code_files:
-            sections.append("## Key IaC Files")
-            char_budget = 12000  # ~3K tokens for code context
-
-            # Prioritize: plans first, then files mentioned in scan findings
-            referenced_files = set()
-            for tool_data in ctx.scan_results.get("tools", {}).values():
-                for f in tool_data.get("findings", []):
-                    ref = f.get("file", "")
-                    if ref:
-                        referenced_files.add(ref)
-
-            # Sort: plans first, then referenced files, then others
-            def priority(item):
-                path, _ = item
-                if "[PLAN]" in path:
-                    return 0
-                if any(ref in path for ref in referenced_files):
-                    return 1
-                return 2
-
-            used = 0
-            for path, content in sorted(ctx.code_files.items(), key=priority):
-                header = f"\n--- {path} ---\n"
-                if used + len(header) + len(content) > char_budget:
-                    len(ctx.code_files) - len(
-                        [s for s in sections if s.startswith("--- ")]
-                    )
-                    sections.append("\n[Truncated: additional files omitted]")
-                    break
-                sections.append(header)
-                sections.append(content)
-                used += len(header) + len(content)
 
-        if ctx.errors:
-            sections.append("\n## Context Collection Notes")
-            for e in ctx.errors:
-                sections.append(f"  - {e}")
+        # Plans and code: changed files, then files referenced by findings
+        changed = set(ctx.changed_files)
+        for path, content in ctx.code_files.items():
+            if "[PLAN]" in path:
+                packer.add("plans", f"\n--- {path} ---\n{content}", PRIORITY_CHANGED)
+                continue
+            if path in changed:
+                priority = PRIORITY_CHANGED
+            elif any(ref in path or path in ref for ref in referenced_files):
+                priority = PRIORITY_REFERENCED
+            else:
+                priority = PRIORITY_BACKGROUND
+            packer.add(
+                "code",
+                f"\n--- {path} ---\n{content}",
+                priority,
+                key=content_key(content),
+                label=path,
+                truncatable=priority < PRIORITY_BACKGROUND,
+            )
 
-        return "\n".join(sections)
+        # Inventory: outdated modules before the rest
+        for m in ctx.modules:
+            version = m.get("version", "N/A")
+            latest = m.get("latest_version", "")
+            ver_info = f"v{version}"
+            if latest and latest != version:
+                ver_info += f" → v{latest} available"
+            status = f" [{m.get('status', '')}]" if m.get("status") else ""
+            packer.add(
+                "inventory",
+                f"  - module {m.get('name', 'unknown')} ({ver_info}){status}",
+                PRIORITY_LOW if latest and latest != version else PRIORITY_INVENTORY,
+            )
+        for p in ctx.providers:
+            packer.add(
+                "inventory",
+                f"  - provider {p.get('name', 'unknown')} v{p.get('version', 'N/A')} "
+                f"({p.get('source', '')})",
+                PRIORITY_INVENTORY,
+            )
+
+        for e in ctx.errors:
+            packer.add("notes", f"  - {e}", PRIORITY_MEDIUM)
+
+        self.last_packing = packer.pack()
+        logger.info(self.last_packing.summary())
+        return self.last_packing.text
 
     # -- Private collectors --
 
-    def _collect_inventory(self, ctx: IaCContext) -> None:
-        """Run InventoryService to get modules, providers, versions."""
+    def _collect_inventory(self, ctx: IaCContext, sources_mtime: float = 0.0) -> None:
+        """Run InventoryService to get modules, providers, versions.
+
+        A JSON inventory report in ``<directory>/Reports/inventory`` newer than
+        every IaC source is used instead of a new inventory run.
+        """
         try:
-            from ...inventory.inventory_service import InventoryService
-
-            svc = InventoryService()
-            inventory = asyncio.get_event_loop().run_until_complete(
-                svc.create_inventory(
-                    source_directory=ctx.directory,
-                    check_versions=True,
-                    report_type="json",
-                    print_console=False,
+            inventory = None
+            if self.reuse_reports:
+                inventory = self._load_fresh_inventory(ctx.directory, sources_mtime)
+            if inventory is not None:
+                ctx.reused_artifacts.append("inventory")
+            else:
+                from ...inventory.inventory_service import InventoryService
+
+                svc = InventoryService()
+                inventory = asyncio.run(
+                    svc.create_inventory(
+                        source_directory=ctx.directory,
+                        check_versions=True,
+                        report_type="json",
+                        print_console=False,
+                    )
                 )
-            )
 
             ctx.inventory = inventory
-            ctx.project_type = inventory.get("project_type", "unknown")
+            ctx.project_type = inventory.get(
+                "projectType", inventory.get("project_type", "unknown")
+            )
 
             # Extract modules
-            for group in inventory.get("component_groups", []):
+            groups = inventory.get("components", inventory.get("component_groups", []))
+            for group in groups:
                 for comp in group.get("components", []):
                     ctx.modules.append(
                         {
@@ -193,12 +354,39 @@ class ContextBuilder:
 
             logger.info(
                 f"Inventory: {len(ctx.modules)} modules, {len(ctx.providers)} providers"
+                + (" (from existing report)" if ctx.reused_artifacts else "")
             )
         except Exception as e:
             logger.debug(f"Inventory collection failed: {e}")
             ctx.errors.append(f"Inventory unavailable: {e}")
 
-    def _collect_scan_results(self, ctx: IaCContext) -> None:
+    @staticmethod
+    def _load_fresh_inventory(
+        directory: str, sources_mtime: float
+    ) -> Optional[Dict[str, Any]]:
+        """Newest InventoryIaC JSON report, if newer than the IaC sources."""
+        reports = Path(directory) / "Reports" / "inventory"
+        candidates = [
+            p for p in reports.glob("InventoryIaC_*.json") if "cyclonedx" not in p.name
+        ]
+        if not candidates:
+            return None
+        newest = max(candidates, key=lambda p: p.stat().st_mtime)
+        if newest.stat().st_mtime <= sources_mtime:
+            logger.debug(f"Inventory report {newest} is older than the sources")
+            return None
+        try:
+            with open(newest, encoding="utf-8") as f:
+                inventory = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read inventory report {newest}: {e}")
+            return None
+        logger.info(f"Reusing inventory report: {newest}")
+        return inventory if isinstance(inventory, dict) else None
+
+    def _collect_scan_results(
+        self, ctx: IaCContext, sources_mtime: float = 0.0
+    ) -> None:
         """Check for existing scan reports at project root."""
         try:
             from .report_analyzer import ReportAnalyzer
@@ -222,6 +410,13 @@ class ContextBuilder:
                     logger.info(
                         f"Found existing scan results: {ctx.scan_results['total_findings']} findings"
                     )
+                    if _newest_report_mtime(reports_dir) > sources_mtime:
+                        ctx.reused_artifacts.append("scan_results")
+                    else:
+                        ctx.errors.append(
+                            "Scan reports are older than the IaC sources. "
+                            "Re-run 'thothctl scan iac' for current findings."
+                        )
                     return
 
             ctx.errors.append(
@@ -232,11 +427,9 @@ class ContextBuilder:
             logger.debug(f"Scan results collection failed: {e}")
             ctx.errors.append(f"Scan results unavailable: {e}")
 
-    def _collect_plan_files(self, ctx: IaCContext) -> None:
+    def _collect_plan_files(self, ctx: IaCContext, sources_mtime: float = 0.0) -> None:
         """Collect tfplan.json summaries for change analysis."""
         try:
-            import json as _json
-
             target = Path(ctx.directory)
 
             # Find tfplan.json in target and project-level stacks/tfplan/
@@ -251,7 +444,7 @@ class ContextBuilder:
             for pf in plan_files[:5]:
                 try:
                     with open(pf) as f:
-                        plan = _json.load(f)
+                        plan = json.load(f)
                     changes = plan.get("resource_changes", [])
                     creates = sum(
                         1
@@ -281,6 +474,15 @@ class ContextBuilder:
                     pass
             if plan_files:
                 logger.info(f"Found {len(plan_files)} tfplan.json files")
+                stale = sum(
+                    1 for pf in plan_files if pf.stat().st_mtime <= sources_mtime
+                )
+                if stale:
+                    ctx.errors.append(
+                        f"{stale} plan file(s) are older than the IaC sources"
+                    )
+                else:
+                    ctx.reused_artifacts.append("plan_files")
         except Exception as e:
             logger.debug(f"Plan file collection failed: {e}")
 
@@ -318,6 +520,10 @@ class ContextBuilder:
             logger.debug(f"Blast radius collection failed: {e}")
             ctx.errors.append(f"Blast radius unavailable: {e}")
 
+    def _collect_changed_files(self, ctx: IaCContext) -> None:
+        """Files changed in git, used to rank code in the prompt."""
+        ctx.changed_files = git_changed_files(ctx.directory)
+
     def _collect_code(self, ctx: IaCContext) -> None:
         """Collect raw IaC files as supplementary context."""
         try:
@@ -329,3 +535,41 @@ class ContextBuilder:
         except Exception as e:
             logger.debug(f"Code collection failed: {e}")
             ctx.errors.append(f"Code collection failed: {e}")
+
+
+def _newest_source_mtime(directory: str) -> float:
+    """Newest modification time of the IaC sources under ``directory``."""
+    newest = 0.0
+    for root, dirs, names in os.walk(directory):
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d not in SKIP_DIRS]
+        for name in names:
+            if os.path.splitext(name)[1] in SOURCE_EXTENSIONS:
+                try:
+                    newest = max(newest, os.stat(os.path.join(root, name)).st_mtime)
+                except OSError:
+                    pass
+    return newest
+
+
+def _newest_report_mtime(reports_dir: Path) -> float:
+    """Newest modification time of the files under a Reports/ directory."""
+    newest = 0.0
+    for path in reports_dir.rglob("*"):
+        if path.is_file():
+            newest = max(newest, path.stat().st_mtime)
+    return newest
+
+
+def _merge(ctx: IaCContext, part: IaCContext) -> None:
+    """Merge what one collector gathered into the shared context."""
+    default = IaCContext()
+    for f in fields(IaCContext):
+        if f.name in ("directory", "timings"):
+            continue
+        value = getattr(part, f.name)
+        if isinstance(value, dict):
+            getattr(ctx, f.name).update(value)
+        elif isinstance(value, list):
+            getattr(ctx, f.name).extend(value)
+        elif value != getattr(default, f.name):
+            setattr(ctx, f.name, value)
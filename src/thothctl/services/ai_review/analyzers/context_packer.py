@@ -0,0 +1,251 @@
+"""Context packer - fills a token budget with the most valuable context first.
+
+Prompt sections (findings, plan changes, inventory, code) are added as items
+with a priority. Duplicates are folded into one item, then items are taken in
+priority order until the budget is used, so critical findings and changed
+code are never cut off by low-value inventory. The packed result reports the
+tokens each section used.
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+
+# Priorities: lower is packed first
+PRIORITY_CRITICAL = 0
+PRIORITY_HIGH = 1
+PRIORITY_CHANGED = 2
+PRIORITY_MEDIUM = 3
+PRIORITY_REFERENCED = 4
+PRIORITY_LOW = 5
+PRIORITY_INVENTORY = 6
+PRIORITY_BACKGROUND = 8
+
+SEVERITY_PRIORITY = {
+    "CRITICAL": PRIORITY_CRITICAL,
+    "HIGH": PRIORITY_HIGH,
+    "MEDIUM": PRIORITY_MEDIUM,
+    "LOW": PRIORITY_LOW,
+}
+
+# Context windows (tokens) by model name prefix; the longest match wins
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4": 8192,
+    "gpt-3.5": 16385,
+    "anthropic.claude": 200000,
+    "us.anthropic.claude": 200000,
+    "llama3": 8192,
+    "qwen": 32768,
+    "mistral": 32768,
+    "gemma": 8192,
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+
+# Upper bound on packed context, whatever the window: keeps prompts bounded
+MAX_CONTEXT_TOKENS = 24000
+# Room left for the system prompt
+SYSTEM_PROMPT_RESERVE = 2000
+MIN_CONTEXT_TOKENS = 1000
+
+# Budget when the caller has no provider config
+DEFAULT_BUDGET_TOKENS = 8000
+
+# Below this many free tokens a truncated item is not worth adding
+MIN_TRUNCATED_TOKENS = 200
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate tokens from characters (~4 chars per token)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def content_key(text: str) -> str:
+    """Key identifying text up to whitespace differences."""
+    normalized = " ".join(text.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def context_budget(config) -> int:
+    """Token budget for packed context given a ``ProviderConfig``.
+
+    An explicit ``context_tokens`` wins; otherwise the model's context window,
+    minus the response and system prompt, capped at MAX_CONTEXT_TOKENS.
+    """
+    explicit = getattr(config, "context_tokens", 0)
+    if explicit:
+        return explicit
+    model = (getattr(config, "model", "") or "").lower()
+    matches = [p for p in MODEL_CONTEXT_WINDOWS if model.startswith(p)]
+    window = (
+        MODEL_CONTEXT_WINDOWS[max(matches, key=len)]
+        if matches
+        else DEFAULT_CONTEXT_WINDOW
+    )
+    available = window - getattr(config, "max_tokens", 0) - SYSTEM_PROMPT_RESERVE
+    return max(MIN_CONTEXT_TOKENS, min(MAX_CONTEXT_TOKENS, available))
+
+
+@dataclass
+class ContextItem:
+    section: str
+    text: str
+    priority: int
+    key: str
+    label: str = ""
+    truncatable: bool = False
+    duplicates: List[str] = field(default_factory=list)
+    order: int = 0
+
+    def render(self) -> str:
+        if not self.duplicates:
+            return self.text
+        return f"{self.text}\n  (identical: {', '.join(self.duplicates)})"
+
+
+@dataclass
+class SectionUsage:
+    tokens: int = 0
+    items: int = 0
+    dropped: int = 0
+    duplicates: int = 0
+
+
+@dataclass
+class PackedContext:
+    text: str
+    budget_tokens: int
+    used_tokens: int
+    sections: Dict[str, SectionUsage]
+
+    @property
+    def dropped(self) -> int:
+        return sum(s.dropped for s in self.sections.values())
+
+    def summary(self) -> str:
+        """One line per section: tokens used and items kept/dropped."""
+        lines = [f"Context budget: {self.used_tokens:,}/{self.budget_tokens:,} tokens"]
+        for name, usage in self.sections.items():
+            line = f"  {name}: {usage.tokens:,} tokens, {usage.items} item(s)"
+            if usage.dropped:
+                line += f", {usage.dropped} dropped"
+            if usage.duplicates:
+                line += f", {usage.duplicates} duplicate(s) folded"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+class ContextPacker:
+    """Collects prioritized context items and packs them into a token budget.
+
+    Sections render in the order they are declared; within a section, items
+    render by priority, then in the order they were added.
+    """
+
+    def __init__(self, budget_tokens: int):
+        self.budget_tokens = budget_tokens
+        self._sections: Dict[str, str] = {}
+        self._items: Dict[str, ContextItem] = {}
+        self._usage: Dict[str, SectionUsage] = {}
+        self._preamble: List[str] = []
+        self._epilogue: Dict[str, str] = {}
+
+    def preamble(self, text: str) -> None:
+        """Text always included at the top (counted against the budget)."""
+        self._preamble.append(text)
+
+    def section(self, name: str, heading: str = "", epilogue: str = "") -> None:
+        """Declare a section; ``epilogue`` is appended when items were dropped."""
+        self._sections.setdefault(name, heading)
+        self._usage.setdefault(name, SectionUsage())
+        if epilogue:
+            self._epilogue[name] = epilogue
+
+    def add(
+        self,
+        section: str,
+        text: str,
+        priority: int,
+        key: Optional[str] = None,
+        label: str = "",
+        truncatable: bool = False,
+    ) -> None:
+        """Add an item; an item with the same ``key`` is folded into the first.
+
+        ``key`` defaults to the normalized text. Folded duplicates are listed
+        by ``label`` and the kept item takes the better priority.
+        """
+        self.section(section)
+        key = key or content_key(text)
+        existing = self._items.get(key)
+        if existing:
+            if label:
+                existing.duplicates.append(label)
+            existing.priority = min(existing.priority, priority)
+            self._usage[existing.section].duplicates += 1
+            return
+        self._items[key] = ContextItem(
+            section=section,
+            text=text,
+            priority=priority,
+            key=key,
+            label=label,
+            truncatable=truncatable,
+            order=len(self._items),
+        )
+
+    def pack(self) -> PackedContext:
+        used = sum(estimate_tokens(p) + 1 for p in self._preamble)
+        # Reserve room for "n dropped" notes so the total stays within budget
+        used += sum(estimate_tokens(e) + 2 for e in self._epilogue.values())
+        kept: Dict[str, List[ContextItem]] = {name: [] for name in self._sections}
+
+        for item in sorted(self._items.values(), key=lambda i: (i.priority, i.order)):
+            usage = self._usage[item.section]
+            heading = self._sections[item.section]
+            cost = estimate_tokens(item.render()) + 1
+            if heading and not kept[item.section]:
+                cost += estimate_tokens(heading) + 1
+            remaining = self.budget_tokens - used
+            if cost > remaining:
+                if not item.truncatable or remaining < MIN_TRUNCATED_TOKENS:
+                    usage.dropped += 1
+                    continue
+                keep_chars = (remaining - (cost - estimate_tokens(item.text))) * (
+                    CHARS_PER_TOKEN
+                )
+                item.text = item.text[: max(0, keep_chars - 40)] + "\n[... truncated]"
+                cost = remaining
+            kept[item.section].append(item)
+            usage.items += 1
+            usage.tokens += cost
+            used += cost
+
+        parts = list(self._preamble)
+        for name, heading in self._sections.items():
+            items = sorted(kept[name], key=lambda i: (i.priority, i.order))
+            if not items:
+                continue
+            if heading:
+                parts.append(heading)
+            parts.extend(i.render() for i in items)
+            if self._usage[name].dropped and name in self._epilogue:
+                parts.append(
+                    self._epilogue[name].format(dropped=self._usage[name].dropped)
+                )
+            parts.append("")
+
+        packed = PackedContext(
+            text="\n".join(parts).rstrip() + "\n",
+            budget_tokens=self.budget_tokens,
+            used_tokens=used,
+            sections=dict(self._usage),
+        )
+        logger.debug(packed.summary())
+        return packed
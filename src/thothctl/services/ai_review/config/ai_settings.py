@@ -26,6 +26,8 @@ class ProviderConfig:
     agent_id: str = ""
     agent_alias_id: str = ""
     endpoint: str = ""
+    # Token budget for packed review context; 0 = derive from the model
+    context_tokens: int = 0
 
 
 @dataclass
@@ -37,6 +39,14 @@ class CostControlConfig:
     auto_fallback: bool = True
 
 
+@dataclass
+class CacheConfig:
+    """Local cache of provider responses."""
+
+    enabled: bool = True
+    ttl_hours: float = 24
+
+
 @dataclass
 class AnalysisConfig:
     """Analysis behavior settings."""
@@ -64,6 +74,7 @@ class AISettings:
     )
     cost_controls: CostControlConfig = field(default_factory=CostControlConfig)
     analysis: AnalysisConfig = field(default_factory=AnalysisConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
 
     @classmethod
     def load(cls, config_path: Optional[str] = None) -> "AISettings":
@@ -95,6 +106,10 @@ class AISettings:
                 ac = ai_data.get("analysis", {})
                 if ac:
                     settings.analysis = AnalysisConfig(**ac)
+
+                cache = ai_data.get("cache", {})
+                if cache:
+                    settings.cache = CacheConfig(**cache)
             except Exception as e:
                 logger.warning(f"Error loading AI config from {path}: {e}")
 
@@ -104,6 +119,8 @@ class AISettings:
         )
         if os.environ.get("THOTH_AI_DAILY_LIMIT"):
             settings.cost_controls.daily_limit = int(os.environ["THOTH_AI_DAILY_LIMIT"])
+        if os.environ.get("THOTH_AI_NO_CACHE", "").lower() in ("1", "true", "yes"):
+            settings.cache.enabled = False
 
         # Provider-specific env vars
         if os.environ.get("OPENAI_API_KEY"):
@@ -154,6 +171,7 @@ class AISettings:
                 },
                 "cost_controls": vars(self.cost_controls),
                 "analysis": vars(self.analysis),
+                "cache": vars(self.cache),
             }
         }
 
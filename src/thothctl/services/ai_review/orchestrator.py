@@ -25,8 +25,10 @@ from typing import Any, Callable, Dict, List, Optional
 from .analyzers.context_builder import ContextBuilder, IaCContext
 from .config.ai_settings import AISettings
 from .memory import AgentMemory, MemoryConfig
+from .providers.streaming import StreamCancelled, stream_analyze
 from .tracing import span
 from .utils.cost_tracker import CostTracker
+from .utils.response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -77,15 +79,34 @@ class AgentOrchestrator:
         config_path: str = None,
         max_parallel: int = 2,
         memory_config: MemoryConfig = None,
+        use_cache: bool = True,
+        streaming: bool = False,
+        stream_timeout: Optional[float] = None,
+        on_stream_item: Optional[Callable[[AgentRole, str, Any], None]] = None,
     ):
+        """
+        Args:
+            streaming: Stream provider responses and parse them incrementally.
+            stream_timeout: Seconds before a stream is cancelled; the items
+                parsed so far are kept as a partial result.
+            on_stream_item: Called with (role, array key, item) for every
+                finding/fix completed while a response is streaming.
+        """
         self.settings = AISettings.load(config_path)
         self.cost_tracker = CostTracker(
             daily_limit=self.settings.cost_controls.daily_limit,
             monthly_budget=self.settings.cost_controls.monthly_budget,
         )
         self.cost_tracker.load_records()
+        self.response_cache = ResponseCache(
+            ttl_hours=self.settings.cache.ttl_hours,
+            enabled=use_cache and self.settings.cache.enabled,
+        )
         self.context_builder = ContextBuilder()
         self.max_parallel = max_parallel
+        self.streaming = streaming
+        self.stream_timeout = stream_timeout
+        self.on_stream_item = on_stream_item
         self.memory = AgentMemory.create(memory_config)
 
         provider_name = provider or self.settings.default_provider
@@ -281,25 +302,32 @@ class AgentOrchestrator:
                 for task in tasks:
                     self._run_task(task, result)
             else:
+                # Streams end at stream_timeout, so the pool never waits on a
+                # hung request and the decision step starts right after it
                 with ThreadPoolExecutor(
                     max_workers=min(self.max_parallel, len(tasks))
                 ) as pool:
                     futures = {pool.submit(self._call_ai, task): task for task in tasks}
                     for future in as_completed(futures):
-                        task = futures[future]
-                        try:
-                            ai_result = future.result()
-                            if task.post_process:
-                                ai_result = task.post_process(ai_result)
-                            setattr(result, task.role.value, ai_result)
-                        except Exception as e:
-                            logger.error(f"Agent {task.role.value} failed: {e}")
-                            result.errors.append(f"{task.role.value}: {e}")
+                        self._finish_task(futures[future], future.result, result)
 
     def _run_task(self, task: AgentTask, result: OrchestratorResult):
         """Run a single task synchronously."""
+        self._finish_task(task, lambda: self._call_ai(task), result)
+
+    def _finish_task(
+        self,
+        task: AgentTask,
+        get_result: Callable[[], Dict[str, Any]],
+        result: OrchestratorResult,
+    ):
+        """Store a task's result; a cancelled stream keeps its partial result."""
         try:
-            ai_result = self._call_ai(task)
+            try:
+                ai_result = get_result()
+            except StreamCancelled as e:
+                ai_result = dict(e.partial, _partial=True)
+                result.errors.append(f"{task.role.value}: {e} (partial result kept)")
             if task.post_process:
                 ai_result = task.post_process(ai_result)
             setattr(result, task.role.value, ai_result)
@@ -317,21 +345,46 @@ class AgentOrchestrator:
                 "model": self._provider.model,
             },
         ) as s:
-            ai_result = self._provider.analyze(task.system_prompt, task.context)
+            ai_result = self.response_cache.analyze(
+                self._provider,
+                task.system_prompt,
+                task.context,
+                call=self._stream_call(task) if self.streaming else None,
+            )
             usage = ai_result.pop("_usage", {})
             input_tokens = usage.get("input_tokens", 0)
             output_tokens = usage.get("output_tokens", 0)
             s.set_attribute("tokens.input", input_tokens)
             s.set_attribute("tokens.output", output_tokens)
+            s.set_attribute("cache.hit", usage.get("cached", False))
             self.cost_tracker.record_usage(
                 provider=self._provider.name,
                 model=self._provider.model,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
                 operation=f"agent_{task.role.value}",
+                cached=usage.get("cached", False),
             )
             return ai_result
 
+    def _stream_call(self, task: AgentTask) -> Callable[[str, str], Dict[str, Any]]:
+        """Provider call that streams the response for ``task``."""
+
+        def on_item(key: str, item: Any) -> None:
+            if self.on_stream_item:
+                self.on_stream_item(task.role, key, item)
+
+        def call(system_prompt: str, user_content: str) -> Dict[str, Any]:
+            return stream_analyze(
+                self._provider,
+                system_prompt,
+                user_content,
+                on_item=on_item,
+                timeout=self.stream_timeout,
+            )
+
+        return call
+
     def _run_decision(self, result: OrchestratorResult, ctx: IaCContext):
         """Run decision agent using merged results from other agents."""
         from .decision_engine import DecisionEngine
@@ -2,10 +2,11 @@
 
 import json
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 from ..config.ai_settings import ProviderConfig
 from ..tracing import span
+from .streaming import StreamChunk
 
 logger = logging.getLogger(__name__)
 
@@ -144,6 +145,38 @@ class BedrockProvider:
         repaired = re.sub(r",\s*([}\]])", r"\1", repaired)
         return repaired
 
+    def stream(self, system_prompt: str, user_content: str) -> Iterator[StreamChunk]:
+        """Stream the response from Bedrock: text chunks, then ``{"_usage": ...}``."""
+        body = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "system": system_prompt,
+            "messages": [{"role": "user", "content": user_content}],
+        }
+        response = self.client.invoke_model_with_response_stream(
+            modelId=self.model,
+            contentType="application/json",
+            accept="application/json",
+            body=json.dumps(body),
+        )
+        usage = {"input_tokens": 0, "output_tokens": 0}
+        for event in response["body"]:
+            chunk = event.get("chunk")
+            if not chunk:
+                continue
+            data = json.loads(chunk["bytes"])
+            if data.get("type") == "content_block_delta":
+                text = data.get("delta", {}).get("text")
+                if text:
+                    yield text
+            elif data.get("type") == "message_start":
+                message_usage = data.get("message", {}).get("usage", {})
+                usage["input_tokens"] = message_usage.get("input_tokens", 0)
+            elif data.get("type") == "message_delta":
+                usage["output_tokens"] = data.get("usage", {}).get("output_tokens", 0)
+        yield {"_usage": usage}
+
     @property
     def name(self) -> str:
         return "bedrock"
@@ -4,16 +4,22 @@ import json
 import logging
 import os
 import uuid
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 from ..config.ai_settings import ProviderConfig
 from ..tracing import span
+from .streaming import StreamChunk, openai_chat_stream
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_OLLAMA_BASE_URL = "http://localhost:11434/v1"
 DEFAULT_OLLAMA_MODEL = "llama3"
 
+JSON_HINT = (
+    "\n\nIMPORTANT: Respond ONLY with valid JSON. "
+    "No markdown, no explanation outside the JSON."
+)
+
 # Session ID for grouping related traces in Langfuse
 _session_id = None
 
@@ -72,9 +78,8 @@ class OllamaProvider:
     def analyze(self, system_prompt: str, user_content: str) -> Dict[str, Any]:
         """Send analysis request to Ollama and return parsed JSON response."""
         with span("provider.ollama.analyze", {"model": self.model}) as s:
-            json_hint = "\n\nIMPORTANT: Respond ONLY with valid JSON. No markdown, no explanation outside the JSON."
             messages = [
-                {"role": "system", "content": system_prompt + json_hint},
+                {"role": "system", "content": system_prompt + JSON_HINT},
                 {"role": "user", "content": user_content},
             ]
 
@@ -146,6 +151,19 @@ class OllamaProvider:
             s.set_attribute("tokens.output", output_tokens)
             return result
 
+    def stream(self, system_prompt: str, user_content: str) -> Iterator[StreamChunk]:
+        """Stream the response from Ollama: text chunks, then ``{"_usage": ...}``."""
+        yield from openai_chat_stream(
+            self.client,
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt + JSON_HINT},
+                {"role": "user", "content": user_content},
+            ],
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+        )
+
     @property
     def name(self) -> str:
         return "ollama"
@@ -2,10 +2,11 @@
 
 import json
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 from ..config.ai_settings import ProviderConfig
 from ..tracing import span
+from .streaming import StreamChunk, openai_chat_stream
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +61,20 @@ class OpenAIProvider:
             s.set_attribute("tokens.output", output_tokens)
             return result
 
+    def stream(self, system_prompt: str, user_content: str) -> Iterator[StreamChunk]:
+        """Stream the response from OpenAI: text chunks, then ``{"_usage": ...}``."""
+        yield from openai_chat_stream(
+            self.client,
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content},
+            ],
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            response_format={"type": "json_object"},
+        )
+
     @property
     def name(self) -> str:
         return "openai"
@@ -0,0 +1,252 @@
+"""Streaming responses for AI review providers.
+
+Providers that implement ``stream(system_prompt, user_content)`` yield text
+chunks as the model produces them, and a final ``{"_usage": {...}}`` dict.
+``stream_analyze`` consumes such a stream with:
+
+- ``on_token`` called for every text chunk (progress display);
+- ``on_item`` called for every complete element of a top-level JSON array
+  (``findings``, ``fixes``, ...) as soon as it is closed, so partial results
+  can be shown and persisted before the response ends;
+- a deadline: the stream is read on a background thread and abandoned when
+  the timeout expires, raising ``StreamCancelled`` with what was parsed so far.
+
+Providers without ``stream`` fall back to ``analyze``.
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+StreamChunk = Union[str, Dict[str, Any]]
+
+_DONE = object()
+
+
+class StreamCancelled(TimeoutError):
+    """The stream was cancelled; ``partial`` holds the items parsed so far."""
+
+    def __init__(self, message: str, partial: Dict[str, Any]):
+        super().__init__(message)
+        self.partial = partial
+
+
+class IncrementalJSONParser:
+    """Extracts completed elements of top-level JSON arrays from a text stream.
+
+    Text before the first ``{`` (prose, markdown fences) is skipped. Only
+    elements of arrays that are direct values of the top-level object are
+    reported; everything else is left to the final ``json.loads``.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.items: Dict[str, List[Any]] = {}
+        self._pos = 0
+        self._start: Optional[int] = None
+        self._end: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key: Optional[str] = None
+        self._string_start = 0
+        self._last_string = ""
+        self._array_key: Optional[str] = None
+        self._element_start: Optional[int] = None
+
+    @property
+    def complete(self) -> bool:
+        """True once the top-level object has been closed."""
+        return self._end is not None
+
+    def document(self) -> Optional[str]:
+        """Text of the top-level object, once complete."""
+        if self._start is None or self._end is None:
+            return None
+        return self.text[self._start : self._end]
+
+    def feed(self, chunk: str) -> List[tuple]:
+        """Consume a chunk; return ``(array_key, element)`` pairs completed by it."""
+        self.text += chunk
+        completed = []
+        text = self.text
+        while self._pos < len(text) and self._end is None:
+            i, c = self._pos, text[self._pos]
+            self._pos += 1
+
+            if self._start is None:
+                if c == "{":
+                    self._start = i
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    self._last_string = text[self._string_start : i]
+                continue
+
+            if c == '"':
+                self._in_string = True
+                self._string_start = i + 1
+            elif c == ":" and self._depth == 1:
+                self._key = self._last_string
+            elif c in "{[":
+                if self._depth == 1 and c == "[":
+                    self._array_key = self._key
+                elif self._depth == 2 and self._array_key is not None:
+                    self._element_start = i
+                self._depth += 1
+            elif c in "}]":
+                self._depth -= 1
+                if self._depth == 2 and self._element_start is not None:
+                    element = self._parse(text[self._element_start : i + 1])
+                    if element is not None:
+                        self.items.setdefault(self._array_key, []).append(element)
+                        completed.append((self._array_key, element))
+                    self._element_start = None
+                elif self._depth == 1:
+                    self._array_key = None
+                elif self._depth == 0:
+                    self._end = i + 1
+        return completed
+
+    @staticmethod
+    def _parse(text: str) -> Any:
+        try:
+            return json.loads(text)
+        except ValueError:
+            return None
+
+
+def parse_streamed_json(parser: IncrementalJSONParser) -> Dict[str, Any]:
+    """Final result of a stream: the full JSON object, or the parsed items.
+
+    When the model's output is not valid JSON, the completed array elements
+    are returned with the raw text so nothing already parsed is lost.
+    """
+    document = parser.document()
+    if document is not None:
+        try:
+            result = json.loads(document)
+            if isinstance(result, dict):
+                return result
+        except ValueError:
+            pass
+    return {
+        **{key: list(items) for key, items in parser.items.items()},
+        "_raw_text": parser.text[:2000],
+        "_partial": True,
+    }
+
+
+def openai_chat_stream(client, **kwargs) -> Iterator[StreamChunk]:
+    """Stream a chat completion from an OpenAI-compatible API."""
+    kwargs["stream"] = True
+    kwargs.setdefault("stream_options", {"include_usage": True})
+    stream = client.chat.completions.create(**kwargs)
+    try:
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+            usage = getattr(chunk, "usage", None)
+            if usage:
+                yield {
+                    "_usage": {
+                        "input_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+                        "output_tokens": getattr(usage, "completion_tokens", 0) or 0,
+                    }
+                }
+    finally:
+        close = getattr(stream, "close", None)
+        if close:
+            close()
+
+
+def stream_analyze(
+    provider,
+    system_prompt: str,
+    user_content: str,
+    on_token: Optional[Callable[[str], None]] = None,
+    on_item: Optional[Callable[[str, Any], None]] = None,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Run ``provider.stream`` and return the parsed result with ``_usage``.
+
+    Raises:
+        StreamCancelled: ``timeout`` seconds passed before the stream ended.
+    """
+    if not hasattr(provider, "stream"):
+        return provider.analyze(system_prompt, user_content)
+
+    chunks: "queue.Queue" = queue.Queue()
+    cancelled = threading.Event()
+
+    def read() -> None:
+        generator = provider.stream(system_prompt, user_content)
+        try:
+            for chunk in generator:
+                if cancelled.is_set():
+                    break
+                chunks.put(chunk)
+        except Exception as e:
+            chunks.put(e)
+        finally:
+            generator.close()
+            chunks.put(_DONE)
+
+    reader = threading.Thread(target=read, name=f"stream-{provider.name}", daemon=True)
+    reader.start()
+
+    parser = IncrementalJSONParser()
+    usage: Dict[str, int] = {}
+    deadline = time.monotonic() + timeout if timeout else None
+    while True:
+        remaining = deadline - time.monotonic() if deadline else None
+        try:
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            chunk = chunks.get(timeout=remaining)
+        except queue.Empty:
+            cancelled.set()
+            partial = parse_streamed_json(parser)
+            logger.warning(
+                f"Stream from {provider.name} cancelled after {timeout}s "
+                f"({sum(len(v) for v in parser.items.values())} item(s) received)"
+            )
+            raise StreamCancelled(
+                f"{provider.name} response timed out after {timeout}s", partial
+            )
+
+        if chunk is _DONE:
+            break
+        if isinstance(chunk, Exception):
+            raise chunk
+        if isinstance(chunk, dict):
+            usage.update(chunk.get("_usage", {}))
+            continue
+        if on_token:
+            on_token(chunk)
+        for key, element in parser.feed(chunk):
+            if on_item:
+                on_item(key, element)
+
+    if not parser.text:
+        raise ValueError("Empty response from model")
+    result = parse_streamed_json(parser)
+    result["_usage"] = {
+        "input_tokens": usage.get("input_tokens", 0),
+        "output_tokens": usage.get("output_tokens", 0),
+    }
+    return result
@@ -1,15 +1,22 @@
-"""Cost tracking for AI provider usage."""
+"""Cost tracking for AI provider usage.
+
+Usage is recorded in a SQLite ledger (see ``usage_ledger``) that keeps
+per-day, per-model rollups, so budget checks and reports do not grow with
+the number of recorded calls.
+"""
 
-import json
 import logging
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Optional
+
+from .usage_ledger import UsageLedger
 
 logger = logging.getLogger(__name__)
 
 COST_LOG_DIR = ".thothctl/ai_costs"
+LEDGER_PATH = Path(COST_LOG_DIR) / "usage.db"
 
 # Approximate cost per 1K tokens (input/output)
 TOKEN_COSTS = {
@@ -38,6 +45,8 @@ class UsageRecord:
     output_tokens: int
     cost: float
     operation: str = ""
+    # Served from the response cache: no tokens were spent
+    cached: bool = False
 
 
 @dataclass
@@ -46,7 +55,11 @@ class CostTracker:
 
     daily_limit: float = 100.0
     monthly_budget: float = 200.0
-    _records: List[UsageRecord] = field(default_factory=list)
+    ledger: Optional[UsageLedger] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if self.ledger is None:
+            self.ledger = UsageLedger(LEDGER_PATH)
 
     def record_usage(
         self,
@@ -55,9 +68,17 @@ class CostTracker:
         input_tokens: int,
         output_tokens: int,
         operation: str = "",
+        cached: bool = False,
     ) -> float:
-        """Record a usage event and return the cost."""
-        cost = self._calculate_cost(model, input_tokens, output_tokens, provider)
+        """Record a usage event and return the cost.
+
+        Cached responses are recorded with zero cost.
+        """
+        cost = (
+            0.0
+            if cached
+            else self._calculate_cost(model, input_tokens, output_tokens, provider)
+        )
         record = UsageRecord(
             timestamp=datetime.utcnow().isoformat(),
             provider=provider,
@@ -66,22 +87,18 @@ class CostTracker:
             output_tokens=output_tokens,
             cost=cost,
             operation=operation,
+            cached=cached,
         )
-        self._records.append(record)
         self._persist_record(record)
         return cost
 
     def get_daily_spend(self) -> float:
         """Get total spend for today."""
-        today = date.today().isoformat()
-        return sum(r.cost for r in self._records if r.timestamp.startswith(today))
+        return self.ledger.spend(date.today().isoformat())
 
     def get_monthly_spend(self) -> float:
         """Get total spend for current month."""
-        month_prefix = date.today().strftime("%Y-%m")
-        return sum(
-            r.cost for r in self._records if r.timestamp.startswith(month_prefix)
-        )
+        return self.ledger.spend(date.today().replace(day=1).isoformat())
 
     def check_budget(self) -> bool:
         """Return True if within budget limits."""
@@ -97,29 +114,12 @@ class CostTracker:
         """Generate a cost report for the given period."""
         today = date.today()
         if period == "daily":
-            prefix = today.isoformat()
+            since = today
         elif period == "weekly":
-            today.isoformat()  # simplified
-            prefix = today.strftime("%Y-%m")
+            since = today - timedelta(days=6)
         else:
-            prefix = today.strftime("%Y-%m")
-
-        filtered = [r for r in self._records if r.timestamp.startswith(prefix)]
-        by_provider: Dict[str, float] = {}
-        by_model: Dict[str, float] = {}
-        for r in filtered:
-            by_provider[r.provider] = by_provider.get(r.provider, 0) + r.cost
-            by_model[r.model] = by_model.get(r.model, 0) + r.cost
-
-        return {
-            "period": period,
-            "total_cost": sum(r.cost for r in filtered),
-            "total_requests": len(filtered),
-            "total_input_tokens": sum(r.input_tokens for r in filtered),
-            "total_output_tokens": sum(r.output_tokens for r in filtered),
-            "by_provider": by_provider,
-            "by_model": by_model,
-        }
+            since = today.replace(day=1)
+        return {"period": period, **self.ledger.totals(since.isoformat())}
 
     @staticmethod
     def _calculate_cost(
@@ -133,27 +133,23 @@ class CostTracker:
         )
 
     def _persist_record(self, record: UsageRecord) -> None:
-        """Append record to daily log file."""
+        """Queue record in the usage ledger (written in batches)."""
         try:
-            log_dir = Path(COST_LOG_DIR)
-            log_dir.mkdir(parents=True, exist_ok=True)
-            log_file = log_dir / f"{date.today().isoformat()}.jsonl"
-            with open(log_file, "a") as f:
-                f.write(json.dumps(vars(record)) + "\n")
+            self.ledger.add(vars(record))
         except Exception as e:
             logger.debug(f"Failed to persist cost record: {e}")
 
+    def flush(self) -> None:
+        """Write queued records to the ledger now."""
+        self.ledger.flush()
+
     def load_records(self) -> None:
-        """Load records from disk for current month."""
-        log_dir = Path(COST_LOG_DIR)
-        if not log_dir.exists():
-            return
-        month_prefix = date.today().strftime("%Y-%m")
-        for log_file in log_dir.glob(f"{month_prefix}*.jsonl"):
-            try:
-                with open(log_file) as f:
-                    for line in f:
-                        data = json.loads(line.strip())
-                        self._records.append(UsageRecord(**data))
-            except Exception as e:
-                logger.debug(f"Failed to load cost records from {log_file}: {e}")
+        """Import legacy daily JSONL cost logs into the ledger (once).
+
+        Spend and reports are read from the ledger's rollups, so nothing is
+        loaded into memory.
+        """
+        try:
+            self.ledger.import_jsonl(Path(COST_LOG_DIR))
+        except Exception as e:
+            logger.debug(f"Failed to import cost records: {e}")
@@ -0,0 +1,173 @@
+"""Response cache — SQLite-based local storage for AI provider responses.
+
+Re-running a review on unchanged code sends the same system prompt and context
+to the same model. Responses are cached under a hash of everything that
+determines them (provider, model, temperature, system prompt, user content)
+and reused until they expire, so the second run costs no tokens and no
+latency.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DB_PATH = Path.home() / ".thothctl" / "ai_response_cache.db"
+
+DEFAULT_TTL_HOURS = 24
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    response TEXT NOT NULL
+);
+"""
+
+
+def make_key(
+    provider: str,
+    model: str,
+    temperature: Optional[float],
+    system_prompt: str,
+    user_content: str,
+) -> str:
+    """Hash of the request fields that determine a response."""
+    payload = json.dumps(
+        [provider, model, temperature, system_prompt, user_content],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cacheable(result: Any) -> bool:
+    """True for a complete, parsed reply (any schema, including empty ones)."""
+    return (
+        isinstance(result, dict)
+        and not result.get("_partial")
+        and not result.get("_raw_text")
+    )
+
+
+class ResponseCache:
+    """Caches ``provider.analyze`` results with a time-to-live."""
+
+    def __init__(
+        self,
+        db_path: Path = DB_PATH,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        enabled: bool = True,
+    ):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_hours * 3600
+        self.enabled = enabled and ttl_hours > 0
+
+    def _get_conn(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached response for ``key``, or ``None`` if missing or expired."""
+        conn = self._get_conn()
+        try:
+            row = conn.execute(
+                "SELECT created_at, response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                return None
+            if time.time() - row[0] > self.ttl_seconds:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+                return None
+            return json.loads(row[1])
+        finally:
+            conn.close()
+
+    def put(self, key: str, provider: str, model: str, response: Dict) -> None:
+        conn = self._get_conn()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, provider, model, created_at, response) VALUES (?, ?, ?, ?, ?)",
+                (key, provider, model, time.time(), json.dumps(response, default=str)),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def purge_expired(self) -> int:
+        """Delete expired responses. Returns the number removed."""
+        conn = self._get_conn()
+        try:
+            cur = conn.execute(
+                "DELETE FROM responses WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            conn.commit()
+            return cur.rowcount
+        finally:
+            conn.close()
+
+    def clear(self) -> None:
+        conn = self._get_conn()
+        try:
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def analyze(
+        self,
+        provider,
+        system_prompt: str,
+        user_content: str,
+        call: Optional[Callable[[str, str], Dict]] = None,
+    ) -> Dict:
+        """``provider.analyze`` through the cache.
+
+        A hit returns the stored response with ``_usage["cached"] = True`` and
+        the token counts of the original call, so callers can record it as a
+        zero-cost request. ``call`` replaces ``provider.analyze`` on a miss
+        (e.g. a streaming call). Partial responses and raw-text fallbacks
+        (replies that were not JSON) are not stored, so a bad generation is
+        retried instead of served for the whole TTL. Cache errors never
+        fail the call.
+        """
+        call = call or provider.analyze
+        if not self.enabled:
+            return call(system_prompt, user_content)
+
+        key, cached = None, None
+        try:
+            key = make_key(
+                provider.name,
+                provider.model,
+                getattr(provider, "temperature", None),
+                system_prompt,
+                user_content,
+            )
+            cached = self.get(key)
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            logger.debug(f"Response cache lookup failed: {e}")
+        if cached is not None:
+            logger.info(f"AI response cache hit ({provider.name}/{provider.model})")
+            cached.setdefault("_usage", {})["cached"] = True
+            return cached
+
+        result = call(system_prompt, user_content)
+        if key is None or not _cacheable(result):
+            return result
+        try:
+            self.put(key, provider.name, provider.model, result)
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            logger.debug(f"Failed to cache AI response: {e}")
+        return result
@@ -0,0 +1,287 @@
+"""Usage ledger — SQLite-backed storage for AI usage records with rollups.
+
+Every record is kept in ``usage`` for auditing, and folded into a per-day,
+per-provider, per-model row of ``daily_rollup`` in the same transaction.
+Spend and report queries read the rollup, so budget checks cost the same
+whatever the number of recorded calls. Records are written in batches; the
+pending batch is included in every query and flushed at exit.
+"""
+
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 20
+# Pending records are flushed at the next write after this many seconds
+DEFAULT_FLUSH_SECONDS = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cost REAL NOT NULL,
+    operation TEXT NOT NULL DEFAULT '',
+    cached INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    day TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    requests INTEGER NOT NULL DEFAULT 0,
+    cache_hits INTEGER NOT NULL DEFAULT 0,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, provider, model)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_ROLLUP_UPSERT = """
+INSERT INTO daily_rollup
+    (day, provider, model, requests, cache_hits, input_tokens, output_tokens, cost)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (day, provider, model) DO UPDATE SET
+    requests = requests + excluded.requests,
+    cache_hits = cache_hits + excluded.cache_hits,
+    input_tokens = input_tokens + excluded.input_tokens,
+    output_tokens = output_tokens + excluded.output_tokens,
+    cost = cost + excluded.cost
+"""
+
+_FIELDS = (
+    "timestamp",
+    "provider",
+    "model",
+    "input_tokens",
+    "output_tokens",
+    "cost",
+    "operation",
+    "cached",
+)
+
+
+def _normalize(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Record with every field set (legacy JSONL records may lack some)."""
+    return {
+        "timestamp": record["timestamp"],
+        "provider": record.get("provider") or "",
+        "model": record.get("model") or "",
+        "input_tokens": record.get("input_tokens") or 0,
+        "output_tokens": record.get("output_tokens") or 0,
+        "cost": record.get("cost") or 0.0,
+        "operation": record.get("operation") or "",
+        "cached": bool(record.get("cached")),
+    }
+
+
+def _rollup_row(record: Dict[str, Any]) -> tuple:
+    """(day, provider, model, requests, hits, in, out, cost) for one record."""
+    cached = record["cached"]
+    return (
+        record["timestamp"][:10],
+        record["provider"],
+        record["model"],
+        0 if cached else 1,
+        1 if cached else 0,
+        0 if cached else record["input_tokens"],
+        0 if cached else record["output_tokens"],
+        0.0 if cached else record["cost"],
+    )
+
+
+# Live ledgers, flushed by one exit hook; weak so discarded ledgers are freed
+_LEDGERS: "weakref.WeakSet[UsageLedger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all() -> None:
+    for ledger in list(_LEDGERS):
+        ledger.flush()
+
+
+class UsageLedger:
+    """Batched usage records with per-day, per-model rollups."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_seconds: float = DEFAULT_FLUSH_SECONDS,
+    ):
+        self.db_path = Path(db_path)
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self._pending: List[Dict[str, Any]] = []
+        self._first_pending = 0.0
+        self._lock = threading.Lock()
+        _LEDGERS.add(self)
+
+    def __del__(self):
+        # A ledger dropped before exit still persists its pending batch
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+    def _get_conn(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    # -- Writes --
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Queue a usage record; the batch is written when full or old enough."""
+        with self._lock:
+            if not self._pending:
+                self._first_pending = time.monotonic()
+            self._pending.append(_normalize(record))
+            due = (
+                len(self._pending) >= self.batch_size
+                or time.monotonic() - self._first_pending >= self.flush_seconds
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending records and their rollups in one transaction."""
+        # Held while writing, so queries never miss a batch in flight
+        with self._lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            try:
+                conn = self._get_conn()
+                try:
+                    with conn:
+                        self._write(conn, batch)
+                finally:
+                    conn.close()
+            except (sqlite3.Error, OSError) as e:
+                logger.debug(f"Failed to persist {len(batch)} usage record(s): {e}")
+
+    @staticmethod
+    def _write(conn: sqlite3.Connection, records: List[Dict[str, Any]]) -> None:
+        conn.executemany(
+            f"INSERT INTO usage ({', '.join(_FIELDS)}) VALUES "
+            f"({', '.join('?' for _ in _FIELDS)})",
+            [tuple(r[f] for f in _FIELDS) for r in records],
+        )
+        conn.executemany(_ROLLUP_UPSERT, [_rollup_row(r) for r in records])
+
+    def import_jsonl(self, log_dir: Path) -> int:
+        """One-time import of legacy ``<date>.jsonl`` cost logs.
+
+        Returns the number of records imported; 0 once already done.
+        """
+        log_dir = Path(log_dir)
+        if not log_dir.exists():
+            return 0
+        records = []
+        conn = self._get_conn()
+        try:
+            done = conn.execute(
+                "SELECT value FROM meta WHERE key = 'jsonl_imported'"
+            ).fetchone()
+            if done:
+                return 0
+            for log_file in sorted(log_dir.glob("*.jsonl")):
+                try:
+                    with open(log_file) as f:
+                        records.extend(json.loads(line) for line in f if line.strip())
+                except (OSError, ValueError) as e:
+                    logger.debug(f"Failed to import cost records from {log_file}: {e}")
+            with conn:
+                self._write(conn, [_normalize(r) for r in records])
+                conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('jsonl_imported', ?)",
+                    (str(len(records)),),
+                )
+        finally:
+            conn.close()
+        if records:
+            logger.info(f"Imported {len(records)} AI usage record(s) from {log_dir}")
+        return len(records)
+
+    # -- Queries --
+
+    def totals(self, since: str, until: str = "9999-12-31") -> Dict[str, Any]:
+        """Aggregates for days in [since, until] (ISO dates), pending included."""
+        report = {
+            "total_cost": 0.0,
+            "total_requests": 0,
+            "total_input_tokens": 0,
+            "total_output_tokens": 0,
+            "cache_hits": 0,
+            "by_provider": {},
+            "by_model": {},
+        }
+        with self._lock:
+            rows = self._rollup_rows(since, until)
+            pending = [_rollup_row(r) for r in self._pending]
+        rows += [r for r in pending if since <= r[0] <= until]
+
+        for _day, provider, model, requests, hits, tokens_in, tokens_out, cost in rows:
+            report["total_cost"] += cost
+            report["total_requests"] += requests
+            report["total_input_tokens"] += tokens_in
+            report["total_output_tokens"] += tokens_out
+            report["cache_hits"] += hits
+            if requests:
+                by_provider, by_model = report["by_provider"], report["by_model"]
+                by_provider[provider] = by_provider.get(provider, 0) + cost
+                by_model[model] = by_model.get(model, 0) + cost
+        return report
+
+    def spend(self, since: str, until: str = "9999-12-31") -> float:
+        return self.totals(since, until)["total_cost"]
+
+    def recent(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """The last ``limit`` records, oldest first."""
+        self.flush()
+        if not self.db_path.exists():
+            return []
+        conn = self._get_conn()
+        try:
+            rows = conn.execute(
+                f"SELECT {', '.join(_FIELDS)} FROM usage ORDER BY id DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [dict(zip(_FIELDS, row), cached=bool(row[-1])) for row in reversed(rows)]
+
+    def _rollup_rows(self, since: str, until: str) -> List[tuple]:
+        if not self.db_path.exists():
+            return []
+        try:
+            conn = self._get_conn()
+            try:
+                return conn.execute(
+                    "SELECT day, provider, model, requests, cache_hits, "
+                    "input_tokens, output_tokens, cost FROM daily_rollup "
+                    "WHERE day BETWEEN ? AND ?",
+                    (since, until),
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to read usage ledger: {e}")
+            return []
@@ -1,8 +1,12 @@
 """Check environment tools."""
 
 import json
+import os
+import shutil
 import subprocess
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from rich import box
 from rich.console import Console
@@ -12,13 +16,43 @@ from rich.text import Text
 
 from ....core.version_tools import version_tools
 
+# Probe results, keyed by the resolved binary and its mtime/size
+TOOL_CACHE_FILE = Path.home() / ".thothcf" / "tool_versions.json"
+DEFAULT_PROBE_WORKERS = 8
+PROBE_TIMEOUT = 10
+
+
+def _binary_fingerprint(command: str) -> Optional[Dict]:
+    """Resolved path, mtime and size of the command's executable, if on PATH."""
+    parts = command.split()
+    found = shutil.which(parts[0]) if parts else None
+    if not found:
+        return None
+    path = os.path.realpath(found)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return {
+        "command": command,
+        "path": path,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+
 
 class EnvironmentChecker:
     """Service class for checking development environment tools."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_file: Optional[Path] = TOOL_CACHE_FILE,
+        max_workers: int = DEFAULT_PROBE_WORKERS,
+    ):
         self.console = Console()
         self.tools = self._load_tools()
+        self.cache_file = cache_file
+        self.max_workers = max_workers
 
     def _load_tools(self, mode: str = "generic") -> List[Dict]:
         """Load tools configuration."""
@@ -54,7 +88,7 @@ class EnvironmentChecker:
 
         try:
             result = subprocess.run(
-                command.split(), capture_output=True, text=True, timeout=10
+                command.split(), capture_output=True, text=True, timeout=PROBE_TIMEOUT
             )
             if result.returncode == 0:
                 # Extract version from output (first line, remove extra text)
@@ -65,8 +99,81 @@ class EnvironmentChecker:
         except (subprocess.TimeoutExpired, FileNotFoundError, PermissionError, OSError):
             return False, ""
 
-    def check_environment(self) -> Dict:
-        """Check all environment tools and return results."""
+    def _load_cache(self) -> Dict[str, Dict]:
+        if self.cache_file is None:
+            return {}
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save_cache(self, entries: Dict[str, Dict]) -> None:
+        if self.cache_file is None:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            tmp.write_text(
+                json.dumps(entries, indent=2, sort_keys=True), encoding="utf-8"
+            )
+            os.replace(tmp, self.cache_file)
+        except OSError:
+            # The cache is only an optimization
+            pass
+
+    def _probe(
+        self, tool: Dict, cached: Optional[Dict]
+    ) -> Tuple[bool, str, Optional[Dict]]:
+        """(installed, version, cache entry) for one tool.
+
+        Binaries that are not on PATH are reported missing without spawning
+        anything; unchanged binaries reuse their last successful result.
+        """
+        command = tool.get("command", f"{tool['name']} --version")
+        fingerprint = _binary_fingerprint(command)
+        if fingerprint is None:
+            return False, "", None
+        if cached is not None and all(
+            cached.get(key) == value for key, value in fingerprint.items()
+        ):
+            return cached["installed"], cached["version"], cached
+
+        is_installed, version = self._check_tool_installed(tool)
+        if not is_installed:
+            # Failures (timeouts included) may be transient; probe again next time
+            return False, "", None
+        return True, version, dict(fingerprint, installed=True, version=version)
+
+    def probe_tools(self, refresh: bool = False) -> List[Tuple[bool, str]]:
+        """Probe every tool concurrently, in ``self.tools`` order.
+
+        With ``refresh`` the cache is ignored (and rewritten).
+        """
+        cache = {} if refresh else self._load_cache()
+        workers = max(1, min(self.max_workers, len(self.tools)))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="tool-probe"
+        ) as pool:
+            probes = list(
+                pool.map(lambda t: self._probe(t, cache.get(t["name"])), self.tools)
+            )
+
+        entries = {
+            tool["name"]: entry
+            for tool, (_, _, entry) in zip(self.tools, probes)
+            if entry is not None
+        }
+        if entries != cache:
+            self._save_cache(entries)
+        return [(installed, version) for installed, version, _ in probes]
+
+    def check_environment(self, refresh: bool = False) -> Dict:
+        """Check all environment tools and return results.
+
+        Args:
+            refresh: Re-run every version probe instead of using cached results
+        """
         results = {"installed": [], "missing": [], "total": len(self.tools)}
 
         # Create summary table
@@ -81,9 +188,9 @@ class EnvironmentChecker:
         table.add_column("Current", style="blue", width=15)
         table.add_column("Recommended", style="yellow", width=15)
 
-        for tool in self.tools:
-            is_installed, version_output = self._check_tool_installed(tool)
-
+        for tool, (is_installed, version_output) in zip(
+            self.tools, self.probe_tools(refresh=refresh)
+        ):
             if is_installed:
                 results["installed"].append(tool["name"])
                 status = Text("✅ Installed", style="green")
@@ -153,7 +260,7 @@ def get_tool_version(tools):
     return {tool["name"]: tool["version"] for tool in tools}
 
 
-def check_environment():
+def check_environment(refresh: bool = False):
     """Check environment tools."""
     checker = EnvironmentChecker()
-    return checker.check_environment()
+    return checker.check_environment(refresh=refresh)
@@ -7,11 +7,19 @@ that are evaluated by the existing OPA/conftest scanner infrastructure.
 Flow:
     .thothcf.toml [rules] → RulesCompiler → .rego files → conftest test
 
+Compiled output is keyed by a hash of the [rules] section and reused while
+the key matches, alongside an OPA bundle tarball of the same policies.
+
 Phase 2.2 of the Policy Engine roadmap.
 """
 
+import gzip
+import hashlib
+import io
+import json
 import logging
 import os
+import tarfile
 import textwrap
 from typing import Any, Dict, List, Optional
 
@@ -22,6 +30,30 @@ logger = logging.getLogger(__name__)
 # Default output directory for compiled Rego policies
 DEFAULT_OUTPUT_DIR = ".thothctl/compiled_policies"
 
+# Bundle bookkeeping inside the output directory. The manifest must not end
+# in .json: the OPA scanner passes *.json files of a policy dir as --data.
+MANIFEST_FILE = ".compiled.manifest"
+BUNDLE_FILE = "bundle.tar.gz"
+
+# Bump whenever the generated Rego changes for the same [rules] input, so
+# bundles compiled by an older version are rebuilt
+BUNDLE_FORMAT_VERSION = 1
+
+
+def _file_sha256(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def rules_key(rules_config: Dict[str, Any]) -> str:
+    """Content hash of a ``[rules]`` section."""
+    canonical = json.dumps(
+        {"version": BUNDLE_FORMAT_VERSION, "rules": rules_config},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
 
 class RulesCompiler:
     """Compiles .thothcf.toml rules into Rego policies for conftest/OPA.
@@ -44,6 +76,11 @@ class RulesCompiler:
     def compile(self, project_dir: str) -> Optional[str]:
         """Compile rules from .thothcf.toml into Rego policies.
 
+        The output directory is a content-addressed bundle: when the
+        ``[rules]`` section hashes to the key recorded in its manifest and the
+        compiled files are intact, it is returned as is. Otherwise only the
+        ``.rego`` files whose content changed are rewritten.
+
         Args:
             project_dir: Path to the project root containing .thothcf.toml.
 
@@ -56,6 +93,18 @@ class RulesCompiler:
             logger.info("No .thothcf.toml found, skipping rules compilation")
             return None
 
+        # Determine output directory
+        output_dir = self._output_dir or os.path.join(project_dir, DEFAULT_OUTPUT_DIR)
+        manifest = self._read_manifest(output_dir)
+
+        # Unchanged file: reuse the bundle without parsing the TOML again
+        source_hash = _file_sha256(config_path)
+        if manifest.get("source_hash") == source_hash and self._is_intact(
+            output_dir, manifest
+        ):
+            logger.debug(f"Compiled rules up to date in {output_dir}")
+            return output_dir if manifest["files"] else None
+
         config = self._load_toml(config_path)
         rules_config = config.get("rules", {})
 
@@ -63,8 +112,14 @@ class RulesCompiler:
             logger.info("No [rules] section in .thothcf.toml")
             return None
 
-        # Determine output directory
-        output_dir = self._output_dir or os.path.join(project_dir, DEFAULT_OUTPUT_DIR)
+        # Other sections changed: the [rules] key still matches the bundle
+        key = rules_key(rules_config)
+        if manifest.get("key") == key and self._is_intact(output_dir, manifest):
+            manifest["source_hash"] = source_hash
+            self._write_manifest(output_dir, manifest)
+            logger.debug(f"Compiled rules up to date in {output_dir}")
+            return output_dir if manifest["files"] else None
+
         os.makedirs(output_dir, exist_ok=True)
 
         generated_files = []
@@ -92,6 +147,21 @@ class RulesCompiler:
             if path:
                 generated_files.append(path)
 
+        # Rule types removed from the config must not linger in the bundle
+        names = sorted(os.path.basename(p) for p in generated_files)
+        for stale in set(manifest.get("files", {})) - set(names):
+            try:
+                os.remove(os.path.join(output_dir, stale))
+            except OSError:
+                pass
+
+        files = {name: _file_sha256(os.path.join(output_dir, name)) for name in names}
+        if files:
+            self._write_bundle(output_dir, files, key)
+        self._write_manifest(
+            output_dir, {"key": key, "source_hash": source_hash, "files": files}
+        )
+
         if generated_files:
             logger.info(
                 f"Compiled {len(generated_files)} Rego policy file(s) to {output_dir}"
@@ -386,12 +456,80 @@ class RulesCompiler:
 
         content = header + "\n".join(rules)
 
+        # Leave unchanged files alone so their mtime (and any cache keyed on
+        # the policy files) stays valid
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                if f.read() == content:
+                    return file_path
+        except OSError:
+            pass
+
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(content)
 
         logger.debug(f"Wrote compiled policy: {file_path}")
         return file_path
 
+    # --- Bundle ---
+
+    @staticmethod
+    def _read_manifest(output_dir: str) -> Dict[str, Any]:
+        try:
+            with open(os.path.join(output_dir, MANIFEST_FILE), encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("version") != BUNDLE_FORMAT_VERSION:
+            return {}
+        return manifest
+
+    @staticmethod
+    def _write_manifest(output_dir: str, manifest: Dict[str, Any]) -> None:
+        os.makedirs(output_dir, exist_ok=True)
+        manifest = dict(manifest, version=BUNDLE_FORMAT_VERSION)
+        with open(os.path.join(output_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+    @staticmethod
+    def _is_intact(output_dir: str, manifest: Dict[str, Any]) -> bool:
+        """True if every compiled file (and the bundle) is as recorded."""
+        files = manifest.get("files")
+        if files is None:
+            return False
+        if files and not os.path.exists(os.path.join(output_dir, BUNDLE_FILE)):
+            return False
+        for name, digest in files.items():
+            path = os.path.join(output_dir, name)
+            if not os.path.exists(path) or _file_sha256(path) != digest:
+                return False
+        return True
+
+    @staticmethod
+    def _write_bundle(output_dir: str, files: Dict[str, str], key: str) -> str:
+        """Write an OPA bundle tarball (``opa run --bundle`` / ``opa eval -b``).
+
+        The archive is byte-for-byte reproducible for the same policies.
+        """
+        bundle_path = os.path.join(output_dir, BUNDLE_FILE)
+        entries = [(".manifest", json.dumps({"revision": key}).encode("utf-8"))]
+        for name in sorted(files):
+            with open(os.path.join(output_dir, name), "rb") as f:
+                entries.append((name, f.read()))
+
+        tmp_path = f"{bundle_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as gz:
+                with tarfile.open(fileobj=gz, mode="w") as tar:
+                    for name, data in entries:
+                        info = tarfile.TarInfo(name)
+                        info.size = len(data)
+                        info.mode = 0o644
+                        tar.addfile(info, io.BytesIO(data))
+        os.replace(tmp_path, bundle_path)
+        logger.debug(f"Wrote policy bundle: {bundle_path}")
+        return bundle_path
+
     def _load_toml(self, path: str) -> Dict[str, Any]:
         """Load a TOML file safely."""
         try:
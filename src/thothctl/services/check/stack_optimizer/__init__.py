@@ -7,15 +7,24 @@ processing.
 Key principle: Never remove an explicit user stack. Only remove stacks whose
 resolved units are entirely contained within another stack's resolved units
 (including its transitive dependencies via the '...' suffix).
+
+Unit sets are bitsets over a ``UnitIndex``: globs are resolved through a path
+trie and dependency closures are precomputed once per unit, so large repos
+with many filters stay fast.
 """
 
-import fnmatch
 import logging
+import re
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
+
+from .unit_index import UnitIndex, popcount, positions
 
 logger = logging.getLogger(__name__)
 
+_RESOURCES_PATH_RE = re.compile(r'/resources/([^\s"\'}\)]+)')
+_RELATIVE_CONFIG_PATH_RE = re.compile(r'config_path\s*=\s*"(\.\.[^"]+)"')
+
 
 class StackOptimizer:
     """Optimizes a list of terragrunt stack filters by resolving the DAG
@@ -26,6 +35,7 @@ class StackOptimizer:
         self.stacks_base = stacks_base
         self._units: Dict[str, Set[str]] = {}  # unit_path -> set of dependency paths
         self._all_unit_paths: List[str] = []
+        self._index: Optional[UnitIndex] = None
 
     def optimize(self, target_stacks: List[str]) -> dict:
         """Compute the minimal filter set for the given target stacks.
@@ -42,30 +52,22 @@ class StackOptimizer:
         """
         self._discover_units()
         self._build_dependency_graph()
+        self._index = UnitIndex(self._units)
 
-        # Resolve each stack pattern to its set of units (with transitive deps)
-        resolved: Dict[str, Set[str]] = {}
+        # Resolve each stack pattern to its units (direct, and with transitive deps)
+        resolved: Dict[str, Tuple[int, int]] = {}
+        for stack in target_stacks:
+            if stack not in resolved:
+                direct = self._resolve_mask(stack)
+                resolved[stack] = (direct, self._index.closure(direct))
+
+        redundant = self._find_redundant(
+            {stack: masks[1] for stack, masks in resolved.items()}
+        )
+        kept = 0
         for stack in target_stacks:
-            units = self._resolve_stack_with_deps(stack)
-            resolved[stack] = units
-
-        # Find redundant stacks: A is redundant if its units ⊆ another stack's units
-        redundant = set()
-        stacks_list = list(resolved.keys())
-
-        for i, stack_a in enumerate(stacks_list):
-            for j, stack_b in enumerate(stacks_list):
-                if i == j:
-                    continue
-                if stack_a in redundant:
-                    break
-                # stack_a is redundant only if ALL its units are covered by stack_b
-                if (
-                    resolved[stack_a] <= resolved[stack_b]
-                    and resolved[stack_a] != resolved[stack_b]
-                ):
-                    redundant.add(stack_a)
-                    break
+            if stack not in redundant:
+                kept |= resolved[stack][1]
 
         optimized = [
             self._normalize_filter(s) for s in target_stacks if s not in redundant
@@ -73,21 +75,49 @@ class StackOptimizer:
 
         return {
             "optimized_filters": optimized,
-            "removed_redundant": list(redundant),
-            "total_units_before": sum(len(v) for v in resolved.values()),
-            "total_units_after": len(
-                set().union(*(resolved[s] for s in target_stacks if s not in redundant))
-            ),
+            "removed_redundant": [s for s in resolved if s in redundant],
+            "total_units_before": sum(popcount(resolved[s][1]) for s in target_stacks),
+            "total_units_after": popcount(kept),
             "details": {
                 stack: {
-                    "direct_units": len(self._resolve_stack_direct(stack)),
-                    "with_deps": len(units),
+                    "direct_units": popcount(direct),
+                    "with_deps": popcount(with_deps),
                     "redundant": stack in redundant,
                 }
-                for stack, units in resolved.items()
+                for stack, (direct, with_deps) in resolved.items()
             },
         }
 
+    @staticmethod
+    def _find_redundant(resolved: Dict[str, int]) -> Set[str]:
+        """Stacks whose units are a strict subset of another stack's units.
+
+        Instead of comparing every pair, each distinct unit set is only
+        checked against the larger sets that contain its rarest unit.
+        """
+        masks = set(resolved.values())
+        sizes = {mask: popcount(mask) for mask in masks}
+        containing: Dict[int, List[int]] = {}  # unit position -> masks containing it
+        for mask in masks:
+            for unit in positions(mask):
+                containing.setdefault(unit, []).append(mask)
+
+        covered = set()
+        for mask in masks:
+            if not mask:
+                # An empty stack is covered by any non-empty one
+                if any(masks):
+                    covered.add(mask)
+                continue
+            rarest = min(positions(mask), key=lambda unit: len(containing[unit]))
+            if any(
+                sizes[other] > sizes[mask] and mask & ~other == 0
+                for other in containing[rarest]
+            ):
+                covered.add(mask)
+
+        return {stack for stack, mask in resolved.items() if mask in covered}
+
     def _discover_units(self):
         """Find all terragrunt units (directories with terragrunt.hcl)."""
         resources_path = self.base_path / self.stacks_base
@@ -95,11 +125,12 @@ class StackOptimizer:
             logger.warning(f"Stacks base path not found: {resources_path}")
             return
 
+        self._units = {}
         for hcl_file in resources_path.rglob("terragrunt.hcl"):
             unit_dir = hcl_file.parent
             rel_path = str(unit_dir.relative_to(resources_path))
-            self._all_unit_paths.append(rel_path)
             self._units[rel_path] = set()
+        self._all_unit_paths = sorted(self._units)
 
     def _build_dependency_graph(self):
         """Parse terragrunt.hcl files to extract dependency edges."""
@@ -119,16 +150,14 @@ class StackOptimizer:
 
             # Primary strategy: extract /resources/<path> directly from config_path lines
             # This handles all interpolation patterns (get_parent_terragrunt_dir, etc.)
-            import re
-
-            for match in re.finditer(r'/resources/([^\s"\'}\)]+)', content):
+            for match in _RESOURCES_PATH_RE.finditer(content):
                 dep_path = match.group(1).rstrip('/"')
-                if dep_path in self._all_unit_paths:
+                if dep_path in self._units:
                     deps.add(dep_path)
 
             # Fallback: handle relative paths (../)
             if not deps:
-                for match in re.finditer(r'config_path\s*=\s*"(\.\.[^"]+)"', content):
+                for match in _RELATIVE_CONFIG_PATH_RE.finditer(content):
                     resolved = self._resolve_config_path(
                         match.group(1), hcl_file.parent, resources_path
                     )
@@ -154,8 +183,6 @@ class StackOptimizer:
             rel = config_path.split("/resources/", 1)[1]
             # Remove trailing quotes or interpolation artifacts
             rel = rel.strip('"').strip("'").rstrip("/")
-            if rel in self._all_unit_paths:
-                return rel
             return rel
 
         # Handle relative paths like "../../../Network/VPC"
@@ -180,44 +207,30 @@ class StackOptimizer:
 
         bare = stack_pattern[:-3]
         # Check if it's a leaf unit (exists as a unit AND has no sub-units)
-        if bare in self._units:
-            has_children = any(
-                u.startswith(bare + "/") for u in self._all_unit_paths if u != bare
-            )
-            if not has_children:
-                return bare
+        if bare in self._units and not self._get_index().has_children(bare):
+            return bare
 
         return stack_pattern
 
-    def _resolve_stack_direct(self, stack_pattern: str) -> Set[str]:
-        """Resolve a glob pattern to matching unit paths (no dependency expansion)."""
-        matched = set()
+    def _get_index(self) -> UnitIndex:
+        if self._index is None:
+            self._index = UnitIndex(self._units)
+        return self._index
+
+    def _resolve_mask(self, stack_pattern: str) -> int:
+        """Bitset of units matching a glob pattern (no dependency expansion)."""
+        index = self._get_index()
+        mask = index.match(stack_pattern)
         # Handle trailing /** — also match the directory itself
-        patterns = [stack_pattern]
         if stack_pattern.endswith("/**"):
-            patterns.append(stack_pattern[:-3])  # match base without /**
-        for unit_path in self._all_unit_paths:
-            for pat in patterns:
-                if fnmatch.fnmatch(unit_path, pat):
-                    matched.add(unit_path)
-                    break
-        return matched
+            mask |= index.match(stack_pattern[:-3])
+        return mask
+
+    def _resolve_stack_direct(self, stack_pattern: str) -> Set[str]:
+        """Resolve a glob pattern to matching unit paths (no dependency expansion)."""
+        return self._get_index().paths_of(self._resolve_mask(stack_pattern))
 
     def _resolve_stack_with_deps(self, stack_pattern: str) -> Set[str]:
         """Resolve a glob pattern to matching unit paths + all transitive dependencies."""
-        direct = self._resolve_stack_direct(stack_pattern)
-        all_units = set(direct)
-
-        # BFS to collect transitive dependencies
-        queue = list(direct)
-        visited = set(direct)
-
-        while queue:
-            current = queue.pop(0)
-            for dep in self._units.get(current, set()):
-                if dep not in visited and dep in self._units:
-                    visited.add(dep)
-                    all_units.add(dep)
-                    queue.append(dep)
-
-        return all_units
+        index = self._get_index()
+        return index.paths_of(index.closure(self._resolve_mask(stack_pattern)))
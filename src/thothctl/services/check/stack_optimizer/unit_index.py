@@ -0,0 +1,174 @@
+"""Indexed view of the terragrunt unit graph used by the stack optimizer.
+
+Units are numbered once, so a set of units is an ``int`` bitset. The index
+provides:
+
+- a path trie, so a glob only scans the units under its literal prefix
+  (``Network/SecurityGroups/**`` never looks at ``Compute/...``);
+- the transitive dependency closure of every unit, computed once over the
+  strongly connected components in reverse topological order (dependencies
+  before dependents, cycles collapsed) and stored as bitsets.
+"""
+
+import fnmatch
+import re
+from typing import Dict, Iterator, List, Pattern, Set
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+def popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def positions(mask: int) -> Iterator[int]:
+    """Indexes of the set bits of ``mask``."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class _TrieNode:
+    __slots__ = ("children", "mask")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # Units at or below this node
+        self.mask = 0
+
+
+class UnitIndex:
+    """Bitset index over unit paths and their dependency edges."""
+
+    def __init__(self, units: Dict[str, Set[str]]):
+        self.paths: List[str] = sorted(units)
+        self.position: Dict[str, int] = {p: i for i, p in enumerate(self.paths)}
+        self._root = _TrieNode()
+        for path in self.paths:
+            self._insert(path)
+        self._closures = self._compute_closures(units)
+        self._patterns: Dict[str, Pattern] = {}
+
+    # -- Paths --
+
+    def _insert(self, path: str) -> None:
+        bit = 1 << self.position[path]
+        node = self._root
+        node.mask |= bit
+        for segment in path.split("/"):
+            node = node.children.setdefault(segment, _TrieNode())
+            node.mask |= bit
+
+    def _node(self, path: str):
+        node = self._root
+        for segment in path.split("/") if path else ():
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def has_children(self, path: str) -> bool:
+        """True if any unit lives below ``path``."""
+        node = self._node(path)
+        if node is None:
+            return False
+        own = 1 << self.position[path] if path in self.position else 0
+        return node.mask & ~own != 0
+
+    def paths_of(self, mask: int) -> Set[str]:
+        return {self.paths[i] for i in positions(mask)}
+
+    # -- Globs --
+
+    def match(self, pattern: str) -> int:
+        """Units matching ``pattern`` (``fnmatch`` semantics) as a bitset.
+
+        Only units under the pattern's literal path prefix are tested.
+        """
+        literal = []
+        for segment in pattern.split("/"):
+            if _GLOB_CHARS.search(segment):
+                break
+            literal.append(segment)
+        if len(literal) == pattern.count("/") + 1:
+            # No wildcards at all: exact lookup
+            return 1 << self.position[pattern] if pattern in self.position else 0
+
+        node = self._node("/".join(literal))
+        if node is None:
+            return 0
+        regex = self._patterns.get(pattern)
+        if regex is None:
+            regex = re.compile(fnmatch.translate(pattern))
+            self._patterns[pattern] = regex
+        mask = 0
+        for i in positions(node.mask):
+            if regex.match(self.paths[i]):
+                mask |= 1 << i
+        return mask
+
+    # -- Closures --
+
+    def closure(self, mask: int) -> int:
+        """``mask`` plus every unit reachable through dependencies."""
+        result = mask
+        for i in positions(mask):
+            result |= self._closures[i]
+        return result
+
+    def _compute_closures(self, units: Dict[str, Set[str]]) -> List[int]:
+        """Closure bitset per unit, via Tarjan's SCCs (emitted deps-first)."""
+        count = len(self.paths)
+        edges = [
+            [self.position[d] for d in units[p] if d in self.position]
+            for p in self.paths
+        ]
+        closures = [0] * count
+        index = [-1] * count
+        low = [0] * count
+        on_stack = [False] * count
+        stack: List[int] = []
+        counter = 0
+
+        for root in range(count):
+            if index[root] != -1:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, edge = work[-1]
+                if edge == 0:
+                    index[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                if edge < len(edges[node]):
+                    work[-1] = (node, edge + 1)
+                    dep = edges[node][edge]
+                    if index[dep] == -1:
+                        work.append((dep, 0))
+                    elif on_stack[dep]:
+                        low[node] = min(low[node], index[dep])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] != index[node]:
+                    continue
+                # node is the root of an SCC; its dependencies are all done
+                members = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    members.append(member)
+                    if member == node:
+                        break
+                mask = 0
+                for member in members:
+                    mask |= 1 << member
+                    for dep in edges[member]:
+                        mask |= closures[dep]
+                for member in members:
+                    closures[member] = mask
+        return closures
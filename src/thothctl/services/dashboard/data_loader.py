@@ -649,7 +649,9 @@ class DashboardDataLoader:
         try:
             from datetime import date as date_mod
 
-            cost_dir = Path(".thothctl/ai_costs")
+            from ..ai_review.utils.cost_tracker import LEDGER_PATH, CostTracker
+
+            cost_dir = LEDGER_PATH.parent
             if not cost_dir.exists():
                 return {
                     "message": "No AI usage data.",
@@ -657,27 +659,20 @@ class DashboardDataLoader:
                     "command": "thothctl ai-review analyze -d .",
                 }
 
-            records = []
-            month_prefix = date_mod.today().strftime("%Y-%m")
-            for log_file in sorted(cost_dir.glob(f"{month_prefix}*.jsonl")):
-                with open(log_file) as f:
-                    for line in f:
-                        if line.strip():
-                            records.append(json.loads(line.strip()))
-
-            if not records:
+            tracker = CostTracker()
+            tracker.load_records()
+            month = tracker.ledger.totals(date_mod.today().replace(day=1).isoformat())
+            if not month["total_requests"] and not month["cache_hits"]:
                 return {"message": "No AI usage this month.", "records": []}
 
-            total_cost = sum(r.get("cost", 0) for r in records)
-            total_input = sum(r.get("input_tokens", 0) for r in records)
-            total_output = sum(r.get("output_tokens", 0) for r in records)
-
             data = {
-                "total_cost": total_cost,
-                "total_requests": len(records),
-                "total_input_tokens": total_input,
-                "total_output_tokens": total_output,
-                "records": records[-20:],  # Last 20 records
+                "total_cost": month["total_cost"],
+                "total_requests": month["total_requests"],
+                "total_input_tokens": month["total_input_tokens"],
+                "total_output_tokens": month["total_output_tokens"],
+                "cache_hits": month["cache_hits"],
+                "by_model": month["by_model"],
+                "records": tracker.ledger.recent(20),  # Last 20 records
             }
             self._cache_data(cache_key, data)
             return data
@@ -1,10 +1,14 @@
+import hashlib
+import json
 import logging
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Protocol
+from typing import Dict, List, Optional, Protocol, Tuple
 
+import yaml
 from colorama import Fore
 
 from .files_content import (
@@ -15,6 +19,21 @@ from .files_scan import FileScanner
 from .iac_grunt_graph import graph_dependencies, graph_dependencies_recursive
 from .iac_grunt_info import TerragruntInfoGenerator
 
+DEFAULT_DOCS_WORKERS = 4
+DOCS_CACHE_FILE = Path(".thothctl") / "terraform-docs-cache.json"
+DOCS_CACHE_VERSION = 1
+
+# Files terraform-docs reads besides the config: the module's own ``.tf``
+# files, the lock file (provider versions) and the examples pulled in with
+# ``include`` by the modules template.
+MODULE_INPUT_GLOBS = ("*.tf", ".terraform.lock.hcl", "examples/**/*.tf")
+
+README_MARKERS = "<!-- BEGIN_TF_DOCS -->\n<!-- END_TF_DOCS -->"
+
+GENERATED = "generated"
+UNCHANGED = "unchanged"
+FAILED = "failed"
+
 
 @dataclass
 class TerraformDocsConfig:
@@ -28,6 +47,8 @@ class TerraformDocsConfig:
         default_factory=lambda: [".terraform", ".git", ".terragrunt-cache"]
     )
     framework: str = "terraform-terragrunt"
+    workers: int = DEFAULT_DOCS_WORKERS
+    use_cache: bool = True
 
     def __post_init__(self):
         """Ensure exclude_patterns is always a list."""
@@ -47,6 +68,7 @@ class DocsResult:
     processed_dirs: List[Path] = None
     skipped_dirs: List[Path] = None
     error: Optional[str] = None
+    unchanged_dirs: List[Path] = None
 
 
 class CommandExecutor(Protocol):
@@ -80,6 +102,93 @@ class SubprocessExecutor:
             return "", str(e), 1
 
 
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _read_bytes(path: Path) -> Optional[bytes]:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def module_docs_key(directory: Path, config_digest: str) -> str:
+    """Hash of everything terraform-docs reads for ``directory``.
+
+    ``config_digest`` covers the terraform-docs config and version, so a
+    change to either invalidates every module.
+    """
+    digest = hashlib.sha256(config_digest.encode())
+    inputs = {
+        path
+        for pattern in MODULE_INPUT_GLOBS
+        for path in directory.glob(pattern)
+        if path.is_file()
+    }
+    for path in sorted(inputs):
+        digest.update(path.relative_to(directory).as_posix().encode() + b"\0")
+        digest.update(path.read_bytes() + b"\0")
+    return digest.hexdigest()
+
+
+class DocsCache:
+    """Key and output hash of each module's last successful terraform-docs run.
+
+    Stored as JSON under ``.thothctl/`` in the documented root, keyed by the
+    module path relative to that root.
+    """
+
+    def __init__(self, root: Path, enabled: bool = True):
+        self.root = Path(root)
+        self.path = self.root / DOCS_CACHE_FILE
+        self.enabled = enabled
+        self.entries: Dict[str, Dict[str, str]] = self._load() if enabled else {}
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != DOCS_CACHE_VERSION:
+            return {}
+        return data.get("modules", {})
+
+    def _name(self, directory: Path) -> str:
+        try:
+            return Path(directory).relative_to(self.root).as_posix()
+        except ValueError:
+            return str(directory)
+
+    def is_current(self, directory: Path, key: str, output: Path) -> bool:
+        """True if ``key`` matches the last run and its output is untouched."""
+        entry = self.entries.get(self._name(directory))
+        if not self.enabled or not entry or entry.get("key") != key:
+            return False
+        content = _read_bytes(output)
+        return content is not None and _sha256(content) == entry.get("output")
+
+    def record(self, directory: Path, key: str, output_digest: str) -> None:
+        self.entries[self._name(directory)] = {"key": key, "output": output_digest}
+
+    def save(self) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(
+                json.dumps(
+                    {"version": DOCS_CACHE_VERSION, "modules": self.entries},
+                    indent=2,
+                    sort_keys=True,
+                )
+            )
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logging.getLogger(__name__).debug(f"Could not save docs cache: {e}")
+
+
 class TerraformDocsGenerator:
     """Handles generation of Terraform documentation."""
 
@@ -128,6 +237,7 @@ class TerraformDocsGenerator:
 
             processed_dirs = []
             skipped_dirs = []
+            unchanged_dirs = []
 
             if config.recursive:
                 self.logger.debug("Starting recursive documentation generation")
@@ -140,10 +250,8 @@ class TerraformDocsGenerator:
                     else config.exclude_patterns or []
                 )
 
-                self._generate_recursive(
+                directories = self._collect_directories(
                     directory=config.directory,
-                    config_file=config_file,
-                    processed_dirs=processed_dirs,
                     skipped_dirs=skipped_dirs,
                     exclude_patterns=exclude_patterns,
                 )
@@ -151,14 +259,20 @@ class TerraformDocsGenerator:
                 self.logger.debug(
                     f"Generating documentation for single directory: {config.directory}"
                 )
-                success = self._generate_for_directory(config.directory, config_file)
-                if success:
-                    processed_dirs.append(config.directory)
-                else:
-                    self.logger.debug(
-                        f"Failed to generate documentation for: {config.directory}"
-                    )
-                    skipped_dirs.append(config.directory)
+                directories = [config.directory]
+
+            cache = DocsCache(config.directory, enabled=config.use_cache)
+            for directory, status in self._generate_many(
+                directories, config_file, cache, config.workers
+            ):
+                if status == FAILED:
+                    self.logger.warning(f"Failed to process: {directory}")
+                    skipped_dirs.append(directory)
+                    continue
+                processed_dirs.append(directory)
+                if status == UNCHANGED:
+                    unchanged_dirs.append(directory)
+            cache.save()
 
             # Log results
             self.logger.debug(f"Processed directories: {processed_dirs}")
@@ -168,6 +282,7 @@ class TerraformDocsGenerator:
                 success=len(processed_dirs) > 0,
                 processed_dirs=processed_dirs,
                 skipped_dirs=skipped_dirs,
+                unchanged_dirs=unchanged_dirs,
                 error="No directories were processed for documentation generation"
                 if len(processed_dirs) == 0
                 else None,
@@ -195,15 +310,14 @@ class TerraformDocsGenerator:
                 return True
         return False
 
-    def _generate_recursive(
+    def _collect_directories(
         self,
         directory: Path,
-        config_file: Path,
-        processed_dirs: List[Path],
         skipped_dirs: List[Path],
         exclude_patterns: List[str],
-    ) -> None:
-        """Recursively generate documentation for all Terraform directories."""
+    ) -> List[Path]:
+        """Recursively collect every Terraform directory to document."""
+        directories = []
         try:
             self.logger.debug(f"Starting recursive generation in {directory}")
             self.logger.debug(f"Exclude patterns: {exclude_patterns}")
@@ -257,14 +371,7 @@ class TerraformDocsGenerator:
                         break
 
                 if has_terraform:
-                    self.logger.debug(f"Generating documentation for: {current_path}")
-                    success = self._generate_for_directory(current_path, config_file)
-                    if success:
-                        processed_dirs.append(current_path)
-                        self.logger.debug(f"Successfully processed: {current_path}")
-                    else:
-                        skipped_dirs.append(current_path)
-                        self.logger.warning(f"Failed to process: {current_path}")
+                    directories.append(current_path)
                 else:
                     self.logger.debug(f"No Terraform files found in: {current_path}")
 
@@ -272,41 +379,126 @@ class TerraformDocsGenerator:
             self.logger.error(f"Error processing directory {directory}: {e}")
             skipped_dirs.append(directory)
 
-    def _generate_for_directory(self, directory: Path, config_file: Path) -> bool:
-        """Generate documentation for a single directory."""
+        return directories
+
+    def _generate_many(
+        self,
+        directories: List[Path],
+        config_file: Path,
+        cache: DocsCache,
+        workers: int = DEFAULT_DOCS_WORKERS,
+    ) -> List[Tuple[Path, str]]:
+        """Run terraform-docs for ``directories`` in a bounded worker pool.
+
+        Returns ``(directory, status)`` pairs in input order and records the
+        key of every successful run in ``cache``.
+        """
+        if not directories:
+            return []
+        config_digest = self._config_digest(config_file)
+        output_name = self._output_file_name(config_file)
+
+        def run(directory: Path) -> Tuple[str, Optional[str], Optional[str]]:
+            return self._generate_for_directory(
+                directory, config_file, cache, config_digest, output_name
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(directories))),
+            thread_name_prefix="terraform-docs",
+        ) as pool:
+            outcomes = list(pool.map(run, directories))
+
+        results = []
+        for directory, (status, key, output_digest) in zip(directories, outcomes):
+            if key and output_digest:
+                cache.record(directory, key, output_digest)
+            results.append((directory, status))
+        return results
+
+    def _config_digest(self, config_file: Path) -> str:
+        """Hash of the terraform-docs config and the terraform-docs version."""
+        stdout, _, return_code = self.executor.execute(
+            ["terraform-docs", "--version"], config_file.parent
+        )
+        version = stdout.strip() if return_code == 0 else ""
+        return _sha256(config_file.read_bytes() + b"\0" + version.encode())
+
+    def _output_file_name(self, config_file: Path) -> str:
+        """The file terraform-docs writes to, as set in ``output.file``."""
+        try:
+            data = yaml.safe_load(config_file.read_text()) or {}
+            return (data.get("output") or {}).get("file") or "README.md"
+        except (OSError, yaml.YAMLError, AttributeError):
+            return "README.md"
+
+    def _generate_for_directory(
+        self,
+        directory: Path,
+        config_file: Path,
+        cache: Optional[DocsCache] = None,
+        config_digest: str = "",
+        output_name: str = "README.md",
+    ) -> Tuple[str, Optional[str], Optional[str]]:
+        """Generate documentation for a single directory.
+
+        terraform-docs renders into a temporary copy of the output file, which
+        replaces the original only if its content changed. Returns the status
+        and, for a completed run, the module key and the output's hash.
+        """
         try:
             # First validate if directory contains Terraform files
             if not self._validate_directory(directory):
                 self.logger.debug(
                     f"Skipping {directory} - no Terraform/Terragrunt files found"
                 )
-                return False
-
-            readme_path = directory / "README.md"
-            # Check if README.md exists and contains the required markers
-            if not self._ensure_readme_markers(readme_path):
-                self.logger.error(
-                    f"README.md in {directory} doesn't have required terraform-docs markers"
-                )
-                return False
+                return FAILED, None, None
+
+            output = directory / output_name
+            key = module_docs_key(directory, config_digest)
+            if cache is not None and cache.is_current(directory, key, output):
+                self.logger.debug(f"Documentation is up to date for: {directory}")
+                return UNCHANGED, None, None
+
+            original = _read_bytes(output)
+            tmp = output.with_name(f".{output.name}.thothctl-tmp")
+            try:
+                tmp.write_bytes(self._with_readme_markers(original))
+                command = [
+                    "terraform-docs",
+                    "markdown",
+                    ".",
+                    "--config",
+                    str(config_file),
+                    "--output-file",
+                    os.path.relpath(tmp, directory),
+                ]
 
-            command = ["terraform-docs", "markdown", ".", "--config", str(config_file)]
+                self.logger.debug(f"Generating documentation for: {directory}")
+                stdout, stderr, return_code = self.executor.execute(command, directory)
+                if return_code != 0:
+                    self.logger.error(
+                        f"terraform-docs failed for {directory}: {stderr}"
+                    )
+                    return FAILED, None, None
 
-            self.logger.debug(f"Generating documentation for: {directory}")
-            stdout, stderr, return_code = self.executor.execute(command, directory)
+                rendered = tmp.read_bytes()
+                if rendered == original:
+                    self.logger.debug(f"Documentation unchanged for: {directory}")
+                    return UNCHANGED, key, _sha256(rendered)
 
-            if return_code == 0:
+                os.replace(tmp, output)
                 print(
                     f"{Fore.GREEN}❇️  Generated documentation for {directory.name}{Fore.RESET}"
                 )
-                return True
-            else:
-                self.logger.error(f"terraform-docs failed for {directory}: {stderr}")
-                return False
+                return GENERATED, key, _sha256(rendered)
+            finally:
+                if tmp.exists():
+                    tmp.unlink()
 
         except Exception as e:
             self.logger.error(f"Error generating docs for {directory}: {e}")
-            return False
+            return FAILED, None, None
 
     def _validate_directory(self, directory: Path) -> bool:
         """
@@ -345,33 +537,15 @@ class TerraformDocsGenerator:
             self.logger.error(f"Error validating directory {directory}: {e}")
             return False
 
-    def _ensure_readme_markers(self, readme_path: Path) -> bool:
-        """
-        Ensure README.md exists and has the required terraform-docs markers.
-        Creates the file with markers if it doesn't exist.
-        """
-        markers = "<!-- BEGIN_TF_DOCS -->\n<!-- END_TF_DOCS -->"
-
-        try:
-            if not readme_path.exists():
-                # Create new README.md with markers
-                readme_path.write_text(markers)
-                return True
-
-            content = readme_path.read_text()
-            if (
-                "<!-- BEGIN_TF_DOCS -->" not in content
-                or "<!-- END_TF_DOCS -->" not in content
-            ):
-                # Append markers to existing README if they don't exist
-                with readme_path.open("a") as f:
-                    f.write(f"\n\n{markers}")
-
-            return True
-
-        except Exception as e:
-            self.logger.error(f"Failed to prepare README.md: {e}")
-            return False
+    @staticmethod
+    def _with_readme_markers(content: Optional[bytes]) -> bytes:
+        """``content`` with the terraform-docs markers, appended if missing."""
+        markers = README_MARKERS.encode()
+        if content is None:
+            return markers
+        if b"<!-- BEGIN_TF_DOCS -->" in content and b"<!-- END_TF_DOCS -->" in content:
+            return content
+        return content + b"\n\n" + markers
 
     def _prepare_config_file(self, config: TerraformDocsConfig) -> Optional[Path]:
         """Prepare terraform-docs configuration file."""
@@ -420,6 +594,7 @@ def create_terraform_docs(
     framework: str = "terraform-terragrunt",
     graph_type: str = "dot",
     verbose: bool = False,
+    use_cache: bool = True,
 ) -> bool:
     """Backward-compatible function for generating Terraform documentation."""
     logger = logging.getLogger("TerraformDocs")
@@ -507,6 +682,7 @@ def create_terraform_docs(
         recursive=recursive,
         exclude_patterns=exclude or [],
         framework=framework,
+        use_cache=use_cache,
     )
 
     result_docs = generator.generate(config)
@@ -515,6 +691,10 @@ def create_terraform_docs(
         print(
             f"{Fore.GREEN}✨  Processed directories: {len(result_docs.processed_dirs)} {Fore.RESET}"
         )
+        if result_docs.unchanged_dirs:
+            print(
+                f"{Fore.GREEN}✨  Unchanged directories: {len(result_docs.unchanged_dirs)} {Fore.RESET}"
+            )
         if result_docs.skipped_dirs:
             print(
                 f"{Fore.YELLOW} ✨ Skipped directories: {len(result_docs.skipped_dirs)}"
@@ -10,6 +10,8 @@ from typing import Generator, List, Optional, Protocol, Tuple, Union
 
 from colorama import Fore, init
 
+from .terragrunt_dag import TerragruntDagBuilder
+
 # Initialize colorama for cross-platform color support
 init(autoreset=True)
 
@@ -95,9 +97,15 @@ class GraphResult:
 class DependencyGraphGenerator:
     """Handles generation of dependency graphs."""
 
-    def __init__(self, executor: CommandExecutor, logger: logging.Logger):
+    def __init__(
+        self,
+        executor: CommandExecutor,
+        logger: logging.Logger,
+        dag_builder: Optional[TerragruntDagBuilder] = None,
+    ):
         self.executor = executor
         self.logger = logger
+        self.dag_builder = dag_builder or TerragruntDagBuilder()
 
     def generate(self, config: GraphConfig) -> GraphResult:
         """Generate dependency graph."""
@@ -129,9 +137,8 @@ class DependencyGraphGenerator:
             # Resolve the best directory to run terragrunt dag graph from
             graph_dir = self._resolve_graph_directory(directory)
 
-            # Run terragrunt dag graph to get dependencies
-            command = ["terragrunt", "dag", "graph", "--non-interactive"]
-            stdout, stderr, return_code = self.executor.execute(command, graph_dir)
+            # Build the dependency graph (terragrunt dag graph format)
+            stdout, stderr, return_code = self._dag_graph(graph_dir)
 
             if return_code != 0:
                 self.logger.error("Terragrunt command failed: %s", stderr)
@@ -438,9 +445,7 @@ class DependencyGraphGenerator:
         """
         graph_dir = self._resolve_graph_directory(directory)
 
-        command = ["terragrunt", "dag", "graph", "--non-interactive"]
-
-        stdout, stderr, return_code = self.executor.execute(command, graph_dir)
+        stdout, stderr, return_code = self._dag_graph(graph_dir)
 
         if return_code != 0:
             self.logger.error("Terragrunt command failed: %s", stderr)
@@ -471,6 +476,21 @@ class DependencyGraphGenerator:
 
         return enhanced_content
 
+    def _dag_graph(self, graph_dir: Path) -> Tuple[str, str, int]:
+        """Output of `terragrunt dag graph` for graph_dir.
+
+        Built in-process from the terragrunt.hcl files; Terragrunt itself only
+        runs when a unit's dependencies use functions the builder can't evaluate.
+        """
+        dot = self.dag_builder.dot(graph_dir)
+        if dot is not None:
+            return dot, "", 0
+        self.logger.debug(
+            "Dynamic dependencies under %s, running terragrunt dag graph", graph_dir
+        )
+        command = ["terragrunt", "dag", "graph", "--non-interactive"]
+        return self.executor.execute(command, graph_dir)
+
     def _resolve_graph_directory(self, directory: Path) -> Path:
         """Determine the best directory to run `terragrunt dag graph` from.
 
@@ -730,10 +750,15 @@ class DependencyGraphGenerator:
         return content
 
 
-def setup_graph_generator() -> DependencyGraphGenerator:
+def setup_graph_generator(
+    dag_builder: Optional[TerragruntDagBuilder] = None,
+) -> DependencyGraphGenerator:
     """
     Set up the graph generator with dependencies and configured logging.
 
+    Args:
+        dag_builder: Shared dependency graph builder (one is created if omitted)
+
     Returns:
         DependencyGraphGenerator: Configured generator instance
     """
@@ -753,7 +778,9 @@ def setup_graph_generator() -> DependencyGraphGenerator:
     logger.addHandler(handler)
 
     # Create and return generator with configured executor
-    return DependencyGraphGenerator(executor=SubprocessExecutor(), logger=logger)
+    return DependencyGraphGenerator(
+        executor=SubprocessExecutor(), logger=logger, dag_builder=dag_builder
+    )
 
 
 def graph_dependencies(
@@ -763,6 +790,7 @@ def graph_dependencies(
     replace_path: Optional[Path] = None,
     graph_type: str = "dot",
     verbose: bool = False,
+    dag_builder: Optional[TerragruntDagBuilder] = None,
 ) -> Optional[GraphResult]:
     """
     Generate dependency graph for the specified directory.
@@ -774,6 +802,7 @@ def graph_dependencies(
         replace_path: Optional path to replace in the graph
         graph_type: Graph format: "dot" (SVG) or "mermaid"
         verbose: Include dependency inputs in mermaid diagrams
+        dag_builder: Shared dependency graph builder, reused across directories
 
     Returns:
         Optional[GraphResult]: Graph generation result or None if failed
@@ -788,7 +817,7 @@ def graph_dependencies(
             raise ValueError(f"Directory does not exist: {dir_path}")
 
         # Set up generator
-        generator = setup_graph_generator()
+        generator = setup_graph_generator(dag_builder)
 
         # Create configuration
         config = GraphConfig(
@@ -867,6 +896,7 @@ def process_single_directory(
     replace_path: Optional[Path] = None,
     graph_type: str = "dot",
     verbose: bool = False,
+    dag_builder: Optional[TerragruntDagBuilder] = None,
 ) -> RecursiveGraphResult:
     """
     Process a single directory for graph generation.
@@ -878,6 +908,7 @@ def process_single_directory(
         replace_path: Optional path to replace
         graph_type: Graph format
         verbose: Include dependency inputs in mermaid diagrams
+        dag_builder: Shared dependency graph builder
 
     Returns:
         RecursiveGraphResult containing the results or error
@@ -890,6 +921,7 @@ def process_single_directory(
             replace_path=replace_path,
             graph_type=graph_type,
             verbose=verbose,
+            dag_builder=dag_builder,
         )
         return RecursiveGraphResult(directory=directory, result=result)
     except Exception as e:
@@ -942,6 +974,10 @@ def graph_dependencies_recursive(
         f"{Fore.GREEN}Found {len(terragrunt_dirs)} terragrunt directories to process{Fore.RESET}"
     )
 
+    # Parse every unit once; each directory's graph is then a subgraph of it
+    dag_builder = TerragruntDagBuilder(exclude_patterns)
+    dag_builder.scan(start_path)
+
     results: List[RecursiveGraphResult] = []
 
     # Process directories in parallel
@@ -955,6 +991,7 @@ def graph_dependencies_recursive(
                 replace_path=replace_path,
                 graph_type=graph_type,
                 verbose=verbose,
+                dag_builder=dag_builder,
             ): d
             for d in terragrunt_dirs
         }
@@ -0,0 +1,430 @@
+"""In-process Terragrunt dependency graph builder.
+
+Builds the graph ``terragrunt dag graph`` prints without running Terragrunt:
+every ``terragrunt.hcl`` is read once, its ``dependency``, ``dependencies``
+and ``include`` blocks are extracted, and ``config_path`` values are resolved
+relative to each unit. The common path functions (``get_terragrunt_dir``,
+``get_parent_terragrunt_dir``, ``find_in_parent_folders``, ``get_repo_root``,
+``get_path_to_repo_root``) are evaluated; a unit whose dependencies use
+anything else (locals, other functions) is reported as dynamic so callers can
+fall back to the Terragrunt subprocess.
+"""
+
+import bisect
+import logging
+import os
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TERRAGRUNT_FILE = "terragrunt.hcl"
+DEFAULT_EXCLUDE_PATTERNS = [".terraform", ".git", ".terragrunt-cache"]
+
+_BLOCK_RE = re.compile(
+    r"^[ \t]*(dependency|dependencies|include)\b([^{\n]*)\{", re.MULTILINE
+)
+_ATTRIBUTE_RE = re.compile(r"^[ \t]*(config_path|paths|path)[ \t]*=", re.MULTILINE)
+_HEREDOC_RE = re.compile(r"<<-?([A-Za-z_][A-Za-z0-9_]*)[ \t]*\n")
+_INTERPOLATION_RE = re.compile(r"\$\{([^{}]*)\}")
+_CALL_RE = re.compile(r'^([a-z_]+)\(\s*(?:"([^"]*)")?\s*\)$')
+
+
+@dataclass
+class ParsedConfig:
+    """Raw expressions of the blocks that define a unit's dependencies."""
+
+    includes: Dict[str, str] = field(default_factory=dict)  # label -> path expr
+    dependency_paths: List[str] = field(default_factory=list)
+
+
+def _mask(text: str) -> str:
+    """``text`` with comments, heredocs and string contents blanked out.
+
+    Offsets are preserved (and the outer quotes of strings kept), so block
+    structure can be found on the masked text and values read from ``text``.
+    """
+    out = list(text)
+    n = len(text)
+
+    def blank(start: int, end: int) -> None:
+        for k in range(start, min(end, n)):
+            if out[k] != "\n":
+                out[k] = " "
+
+    stack: List[str] = []  # "str", "interp" or "brace" while inside a string
+    i = 0
+    while i < n:
+        c = text[i]
+        if not stack:
+            if c == "#" or text.startswith("//", i):
+                end = text.find("\n", i)
+                end = n if end < 0 else end
+                blank(i, end)
+                i = end
+            elif text.startswith("/*", i):
+                end = text.find("*/", i + 2)
+                end = n if end < 0 else end + 2
+                blank(i, end)
+                i = end
+            elif text.startswith("<<", i) and _HEREDOC_RE.match(text, i):
+                heredoc = _HEREDOC_RE.match(text, i)
+                # The heredoc ends at a line holding only its identifier
+                close = re.compile(
+                    rf"^[ \t]*{heredoc.group(1)}[ \t]*$", re.MULTILINE
+                ).search(text, heredoc.end())
+                end = close.end() if close else n
+                blank(i, end)
+                i = end
+            else:
+                if c == '"':
+                    stack.append("str")
+                i += 1
+            continue
+
+        top = stack[-1]
+        if top == "str":
+            if c == "\\":
+                blank(i, i + 2)
+                i += 2
+                continue
+            if c == '"':
+                stack.pop()
+                if not stack:
+                    i += 1
+                    continue
+            elif text.startswith("${", i) or text.startswith("%{", i):
+                stack.append("interp")
+                blank(i, i + 2)
+                i += 2
+                continue
+        elif c == "{":
+            stack.append("brace")
+        elif c == "}":
+            stack.pop()
+        elif c == '"':
+            stack.append("str")
+        blank(i, i + 1)
+        i += 1
+    return "".join(out)
+
+
+def _closing(masked: str, start: int, open_char: str, close_char: str) -> int:
+    """Index of the bracket closing the one at ``start`` (or len on EOF)."""
+    depth = 0
+    for i in range(start, len(masked)):
+        if masked[i] == open_char:
+            depth += 1
+        elif masked[i] == close_char:
+            depth -= 1
+            if depth == 0:
+                return i
+    return len(masked)
+
+
+def _attribute(text: str, masked: str, name: str) -> Optional[str]:
+    """Expression of a top-level attribute of a block body."""
+    for match in _ATTRIBUTE_RE.finditer(masked):
+        if match.group(1) != name:
+            continue
+        prefix = masked[: match.start()]
+        if prefix.count("{") != prefix.count("}"):
+            continue  # inside a nested map/block
+        start = match.end()
+        while start < len(masked) and masked[start] in " \t":
+            start += 1
+        if masked.startswith("[", start):
+            end = _closing(masked, start, "[", "]") + 1
+        else:
+            end = masked.find("\n", start)
+            end = len(masked) if end < 0 else end
+            # Drop a trailing comment (blank in the masked text)
+            end = start + len(masked[start:end].rstrip())
+        return text[start:end].strip()
+    return None
+
+
+def parse_config(text: str) -> ParsedConfig:
+    """Extract ``include`` paths and dependency paths from HCL text."""
+    masked = _mask(text)
+    parsed = ParsedConfig()
+    for block in _BLOCK_RE.finditer(masked):
+        open_at = block.end() - 1
+        close_at = _closing(masked, open_at, "{", "}")
+        body, masked_body = text[open_at + 1 : close_at], masked[open_at + 1 : close_at]
+        kind = block.group(1)
+        labels = re.findall(r'"([^"]*)"', text[block.start(2) : block.end(2)])
+
+        if kind == "include":
+            expr = _attribute(body, masked_body, "path")
+            if expr is not None:
+                parsed.includes[labels[0] if labels else ""] = expr
+        elif kind == "dependency":
+            expr = _attribute(body, masked_body, "config_path")
+            if expr is not None:
+                parsed.dependency_paths.append(expr)
+        else:
+            expr = _attribute(body, masked_body, "paths")
+            if expr is not None:
+                parsed.dependency_paths.extend(_list_items(expr))
+    return parsed
+
+
+def _list_items(expr: str) -> List[str]:
+    """Items of a list expression; a non-list expression is a single item."""
+    expr = expr.strip()
+    if not expr.startswith("["):
+        return [expr]
+    masked = _mask(expr)
+    items, start = [], 1
+    depth = 0
+    for i, c in enumerate(masked[1:-1], start=1):
+        if c in "([{":
+            depth += 1
+        elif c in ")]}":
+            depth -= 1
+        elif c == "," and depth == 0:
+            items.append(expr[start:i])
+            start = i + 1
+    items.append(expr[start : len(expr) - 1])
+    return [item.strip() for item in items if item.strip()]
+
+
+class TerragruntDagBuilder:
+    """Resolves unit dependencies and renders ``terragrunt dag graph`` output.
+
+    Parsed files are cached, so configs included by many units (``root.hcl``)
+    are read once. The builder is safe to share between threads.
+    """
+
+    def __init__(self, exclude_patterns: Optional[List[str]] = None):
+        self.exclude_patterns = exclude_patterns or DEFAULT_EXCLUDE_PATTERNS
+        self._parsed: Dict[Path, Optional[ParsedConfig]] = {}
+        self._dependencies: Dict[Path, Optional[List[Path]]] = {}
+        self._scanned: List[Tuple[str, List[str]]] = []  # (root, sorted units)
+        self._lock = threading.Lock()
+
+    # -- Discovery --
+
+    def _excluded(self, path: str) -> bool:
+        return any(pattern in path for pattern in self.exclude_patterns)
+
+    def _walk(self, root: Path) -> List[str]:
+        units = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not self._excluded(d)]
+            if TERRAGRUNT_FILE in filenames and not self._excluded(dirpath):
+                units.append(dirpath)
+        return sorted(units)
+
+    def scan(self, root: Path) -> List[Path]:
+        """Find and parse every unit under ``root`` in one walk."""
+        root = Path(root).resolve()
+        units = self._walk(root)
+        with self._lock:
+            self._scanned.append((str(root), units))
+        for unit in units:
+            self.dependencies(Path(unit))
+        return [Path(u) for u in units]
+
+    def units_under(self, directory: Path) -> List[Path]:
+        """Units at or below ``directory`` (from a previous scan if it covers it)."""
+        directory = Path(directory).resolve()
+        prefix = str(directory)
+        for root, units in self._scanned:
+            if prefix == root or prefix.startswith(root + os.sep):
+                found = []
+                for unit in units[bisect.bisect_left(units, prefix) :]:
+                    if not unit.startswith(prefix):
+                        break
+                    if unit == prefix or unit.startswith(prefix + os.sep):
+                        found.append(Path(unit))
+                return found
+        return [Path(u) for u in self._walk(directory)]
+
+    # -- Parsing --
+
+    def _parse(self, hcl_file: Path) -> Optional[ParsedConfig]:
+        with self._lock:
+            if hcl_file in self._parsed:
+                return self._parsed[hcl_file]
+        try:
+            parsed = parse_config(hcl_file.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError) as e:
+            logger.debug(f"Could not read {hcl_file}: {e}")
+            parsed = None
+        with self._lock:
+            self._parsed[hcl_file] = parsed
+        return parsed
+
+    def dependencies(self, unit: Path) -> Optional[List[Path]]:
+        """Resolved dependency directories of ``unit``; None if dynamic."""
+        unit = Path(unit).resolve()
+        with self._lock:
+            if unit in self._dependencies:
+                return self._dependencies[unit]
+        resolved = self._resolve(unit)
+        with self._lock:
+            self._dependencies[unit] = resolved
+        return resolved
+
+    def _resolve(self, unit: Path) -> Optional[List[Path]]:
+        config = self._parse(unit / TERRAGRUNT_FILE)
+        if config is None:
+            return None
+
+        # Included configs contribute their dependency blocks, evaluated for
+        # this unit with get_parent_terragrunt_dir() pointing at their folder
+        includes: Dict[str, Path] = {}
+        sources = [(config, None)]
+        for label, expr in config.includes.items():
+            path = self._evaluate(expr, unit, {})
+            if path is None:
+                logger.debug(f"Dynamic include in {unit}: {expr}")
+                return None
+            path = path if path.is_absolute() else unit / path
+            includes[label] = path
+            included = self._parse(path)
+            if included is None:
+                return None
+            sources.append((included, path))
+
+        deps: List[Path] = []
+        for source, _ in sources:
+            for expr in source.dependency_paths:
+                path = self._evaluate(expr, unit, includes)
+                if path is None:
+                    logger.debug(f"Dynamic dependency in {unit}: {expr}")
+                    return None
+                path = path if path.is_absolute() else unit / path
+                path = Path(os.path.normpath(path))
+                if path not in deps:
+                    deps.append(path)
+        return deps
+
+    def _evaluate(
+        self, expr: str, unit: Path, includes: Dict[str, Path]
+    ) -> Optional[Path]:
+        """Value of a path expression, or None if it cannot be evaluated."""
+        expr = expr.strip()
+        if expr.startswith('"') and expr.endswith('"') and len(expr) >= 2:
+            failed = []
+
+            def interpolate(match):
+                value = self._call(match.group(1).strip(), unit, includes)
+                if value is None:
+                    failed.append(match.group(1))
+                    return ""
+                return value
+
+            value = _INTERPOLATION_RE.sub(interpolate, expr[1:-1])
+            if failed or "${" in value or "%{" in value:
+                return None
+            return Path(value)
+        value = self._call(expr, unit, includes)
+        return Path(value) if value is not None else None
+
+    def _call(self, expr: str, unit: Path, includes: Dict[str, Path]) -> Optional[str]:
+        match = _CALL_RE.match(expr)
+        if not match:
+            return None
+        name, arg = match.group(1), match.group(2)
+        if name in ("get_terragrunt_dir", "get_original_terragrunt_dir"):
+            return str(unit)
+        if name == "get_parent_terragrunt_dir":
+            include = includes.get(arg) if arg else next(iter(includes.values()), None)
+            return str(include.parent) if include else None
+        if name == "find_in_parent_folders":
+            target = arg or TERRAGRUNT_FILE
+            for parent in unit.parents:
+                if (parent / target).exists():
+                    return str(parent / target)
+            return None
+        if name in ("get_repo_root", "get_path_to_repo_root"):
+            for parent in (unit, *unit.parents):
+                if (parent / ".git").exists():
+                    if name == "get_repo_root":
+                        return str(parent)
+                    return os.path.relpath(parent, unit)
+            return None
+        return None
+
+    # -- Graph output --
+
+    def graph(self, directory: Path) -> Optional[Tuple[List[Path], List[Tuple]]]:
+        """Units under ``directory`` plus their transitive dependencies.
+
+        Returns (nodes, edges) with edges as (unit, dependency), or None when
+        a unit's dependencies could not be evaluated.
+        """
+        nodes = self.units_under(directory)
+        seen = set(nodes)
+        edges = []
+        queue = deque(nodes)
+        while queue:
+            unit = queue.popleft()
+            deps = self.dependencies(unit)
+            if deps is None:
+                return None
+            for dep in deps:
+                edges.append((unit, dep))
+                if dep not in seen:
+                    seen.add(dep)
+                    nodes.append(dep)
+                    queue.append(dep)
+        return nodes, edges
+
+    def dot(self, directory: Path) -> Optional[str]:
+        """DOT graph in the format of ``terragrunt dag graph`` run in ``directory``.
+
+        Node names are relative to ``directory`` ("." for itself). Returns
+        None if the graph needs Terragrunt to evaluate.
+        """
+        directory = Path(directory).resolve()
+        graph = self.graph(directory)
+        if graph is None:
+            return None
+        nodes, edges = graph
+
+        def name(path: Path) -> str:
+            return os.path.relpath(path, directory)
+
+        deps: Dict[Path, List[Path]] = {}
+        for unit, dep in edges:
+            deps.setdefault(unit, []).append(dep)
+        lines = ["digraph {"]
+        for node in sorted(nodes, key=name):
+            lines.append(f'\t"{name(node)}" ;')
+            for dep in sorted(deps.get(node, []), key=name):
+                lines.append(f'\t"{name(node)}" -> "{name(dep)}";')
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def dot_json(self, directory: Path) -> Optional[Dict]:
+        """The graph in Graphviz ``-Tdot_json`` shape (objects/edges by _gvid)."""
+        directory = Path(directory).resolve()
+        graph = self.graph(directory)
+        if graph is None:
+            return None
+        nodes, edges = graph
+        names = sorted({os.path.relpath(n, directory) for n in nodes})
+        gvid = {n: i for i, n in enumerate(names)}
+        result: Dict = {
+            "name": "%3",
+            "directed": True,
+            "objects": [{"_gvid": i, "name": n} for i, n in enumerate(names)],
+        }
+        if edges:
+            result["edges"] = [
+                {
+                    "_gvid": i,
+                    "tail": gvid[os.path.relpath(unit, directory)],
+                    "head": gvid[os.path.relpath(dep, directory)],
+                }
+                for i, (unit, dep) in enumerate(edges)
+            ]
+        return result
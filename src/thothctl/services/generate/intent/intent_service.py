@@ -29,6 +29,8 @@ class IntentToIaCService:
         provider: str = "ollama",
         model: str = None,
         plan_config: Optional[dict] = None,
+        parallel_validation: bool = False,
+        fail_fast: bool = False,
     ):
         """Initialize the service with an AI provider.
 
@@ -37,13 +39,19 @@ class IntentToIaCService:
             model: Optional model override
             plan_config: Optional plan validation config from .thothcf.toml [generation.plan].
                          Enables terraform plan validation when plan_validation != "disabled".
+            parallel_validation: Run the validation steps as parallel subprocesses.
+            fail_fast: Stop parallel validation at the first CRITICAL/HIGH violation.
         """
         self.provider = provider
         self.model = model
         self.plan_config = plan_config
         self.context_builder = ContextBuilder()
         self.code_generator = CodeGenerator(provider=provider, model=model)
-        self.validator = GenerationValidator(plan_config=plan_config)
+        self.validator = GenerationValidator(
+            plan_config=plan_config,
+            concurrent=parallel_validation,
+            fail_fast=fail_fast,
+        )
 
     def generate(
         self,
@@ -125,6 +133,7 @@ class IntentToIaCService:
             org_policy_dir = self._resolve_org_policy_dir(directory)
             previous_violation_count = float("inf")
             stagnation_counter = 0
+            total_timings: dict = {}
 
             for i in range(max_iterations if self_correct else 1):
                 iterations = i + 1
@@ -134,6 +143,10 @@ class IntentToIaCService:
                     project_dir=directory,
                     org_policy_dir=org_policy_dir,
                 )
+                for step, seconds in validation.timings.items():
+                    total_timings[step] = total_timings.get(step, 0.0) + seconds
+                # Report time across all self-correction iterations
+                validation.timings = dict(total_timings)
 
                 if validation.passed:
                     logger.info(f"Validation passed (iteration {iterations})")
@@ -67,6 +67,12 @@ class ValidationResult:
     checkov_failed: int = 0
     opa_passed: int = 0
     opa_failed: int = 0
+    # Seconds spent per step: "init", "validate", "plan", "policy"
+    timings: Dict[str, float] = field(default_factory=dict)
+    # True when an initialized workspace from a previous iteration was reused
+    workspace_reused: bool = False
+    # Concurrent steps that timed out or were cancelled by fail-fast
+    skipped_steps: List[str] = field(default_factory=list)
 
     @property
     def total_violations(self) -> int:
@@ -0,0 +1,259 @@
+"""Concurrent execution of independent validation steps.
+
+Framework validation, Checkov, OPA and the compiled ``.thothcf.toml`` rules
+only read the generated files, so ``GenerationValidator`` can run them at the
+same time. Each step runs in its own subprocess (this module is also the
+worker entry point) in a new process group, which makes per-step timeouts
+and fail-fast cancellation real: the step and every scanner it started are
+killed, instead of being left running in a background thread.
+
+Worker usage::
+
+    python -m thothctl.services.generate.intent.validation_steps \\
+        <step> --directory DIR [--project-type T] [--policy-dir P] \\
+        [--project-dir D] [--initialized] --output FILE
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .models import Violation
+
+logger = logging.getLogger(__name__)
+
+WORKER_MODULE = "thothctl.services.generate.intent.validation_steps"
+
+# Steps in merge order; violations are always reported in this order
+STEP_FRAMEWORK = "framework"
+STEP_PLAN = "plan"
+STEP_CHECKOV = "checkov"
+STEP_OPA = "opa"
+STEP_RULES = "rules"
+STEP_ORDER = [STEP_FRAMEWORK, STEP_PLAN, STEP_CHECKOV, STEP_OPA, STEP_RULES]
+
+# Seconds before a step is killed
+DEFAULT_STEP_TIMEOUTS = {
+    STEP_FRAMEWORK: 180,
+    STEP_CHECKOV: 600,
+    STEP_OPA: 300,
+    STEP_RULES: 300,
+}
+
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+STATUS_TIMED_OUT = "timed_out"
+STATUS_CANCELLED = "cancelled"
+
+
+@dataclass
+class ValidationStep:
+    """A validation step run as a subprocess.
+
+    ``command`` is completed with ``--output <file>``; the process writes a
+    JSON object with a ``violations`` list (plus any extra payload) there.
+    """
+
+    name: str
+    command: List[str]
+    timeout: float
+
+
+@dataclass
+class StepOutcome:
+    name: str
+    status: str
+    violations: List[Violation] = field(default_factory=list)
+    duration_seconds: float = 0.0
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+def worker_command(step: str, **options: Any) -> List[str]:
+    """Command line running ``step`` in a worker process."""
+    command = [sys.executable, "-m", WORKER_MODULE, step]
+    for key, value in options.items():
+        flag = f"--{key.replace('_', '-')}"
+        if value is True:
+            command.append(flag)
+        elif value not in (None, False):
+            command.extend([flag, str(value)])
+    return command
+
+
+def _kill(process: subprocess.Popen) -> None:
+    """Kill a step and every process it started."""
+    if process.poll() is not None:
+        return
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+    process.wait()
+
+
+def _read_outcome(name: str, output: str, log: str, returncode: int) -> StepOutcome:
+    try:
+        with open(output, encoding="utf-8") as fp:
+            data = json.load(fp)
+        violations = [Violation(**v) for v in data.pop("violations", [])]
+        return StepOutcome(name, STATUS_OK, violations=violations, payload=data)
+    except (OSError, ValueError, TypeError) as e:
+        try:
+            with open(log, encoding="utf-8", errors="replace") as fp:
+                tail = fp.read()[-500:]
+        except OSError:
+            tail = ""
+        logger.warning(
+            f"Validation step {name} failed (exit {returncode}): {tail or e}"
+        )
+        return StepOutcome(name, STATUS_FAILED)
+
+
+def run_steps(
+    steps: List[ValidationStep],
+    fail_fast: bool = False,
+    is_blocking: Optional[Callable[[Violation], bool]] = None,
+    poll_interval: float = 0.05,
+) -> Dict[str, StepOutcome]:
+    """Run steps concurrently and collect their outcomes by name.
+
+    Args:
+        steps: Steps to start, all at once.
+        fail_fast: Kill the remaining steps as soon as one reports a
+            violation for which ``is_blocking`` is true.
+        is_blocking: Predicate deciding which violations stop the run.
+        poll_interval: Seconds between checks of the running processes.
+    """
+    outcomes: Dict[str, StepOutcome] = {}
+    running: Dict[str, Any] = {}
+
+    with tempfile.TemporaryDirectory(prefix="thothctl_steps_") as scratch:
+        for step in steps:
+            output = os.path.join(scratch, f"{step.name}.json")
+            log = os.path.join(scratch, f"{step.name}.log")
+            log_fp = open(log, "wb")
+            process = subprocess.Popen(
+                step.command + ["--output", output],
+                stdout=log_fp,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                start_new_session=os.name == "posix",
+            )
+            running[step.name] = (step, process, time.perf_counter(), output, log)
+            log_fp.close()
+
+        blocked = False
+        while running:
+            for name, (step, process, started, output, log) in list(running.items()):
+                elapsed = time.perf_counter() - started
+                if process.poll() is None:
+                    if elapsed <= step.timeout:
+                        continue
+                    _kill(process)
+                    logger.warning(
+                        f"Validation step {name} timed out after {step.timeout}s"
+                    )
+                    outcome = StepOutcome(name, STATUS_TIMED_OUT)
+                else:
+                    outcome = _read_outcome(name, output, log, process.returncode)
+                outcome.duration_seconds = elapsed
+                outcomes[name] = outcome
+                del running[name]
+
+                if (
+                    fail_fast
+                    and is_blocking
+                    and any(is_blocking(v) for v in outcome.violations)
+                ):
+                    blocked = True
+                    break
+
+            if blocked:
+                for name, (_, process, started, _, _) in running.items():
+                    _kill(process)
+                    logger.info(f"Cancelled validation step {name} (fail-fast)")
+                    outcomes[name] = StepOutcome(
+                        name,
+                        STATUS_CANCELLED,
+                        duration_seconds=time.perf_counter() - started,
+                    )
+                running.clear()
+            elif running:
+                time.sleep(poll_interval)
+
+    return outcomes
+
+
+def merge_violations(outcomes: Dict[str, StepOutcome]) -> List[Violation]:
+    """Violations of all steps in ``STEP_ORDER``, whatever order they finished in."""
+    ordered = sorted(
+        outcomes.values(),
+        key=lambda o: STEP_ORDER.index(o.name) if o.name in STEP_ORDER else 99,
+    )
+    return [v for outcome in ordered for v in outcome.violations]
+
+
+# ----------------------------------------------------------------------
+# Worker entry point
+# ----------------------------------------------------------------------
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "step", choices=[STEP_FRAMEWORK, STEP_CHECKOV, STEP_OPA, STEP_RULES]
+    )
+    parser.add_argument("--directory", required=True)
+    parser.add_argument("--project-type", default="terraform")
+    parser.add_argument("--policy-dir")
+    parser.add_argument("--project-dir")
+    parser.add_argument("--initialized", action="store_true")
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args(argv)
+
+    from .validator import GenerationValidator
+    from .workspace_pool import ValidationWorkspace
+
+    validator = GenerationValidator()
+    payload: Dict[str, Any] = {}
+
+    if args.step == STEP_FRAMEWORK:
+        workspace = ValidationWorkspace(
+            path=args.directory,
+            signature="",
+            initialized=args.initialized,
+            reused=args.initialized,
+        )
+        timings: Dict[str, float] = {}
+        violations = validator._run_framework_validate(
+            args.directory, args.project_type, workspace=workspace, timings=timings
+        )
+        payload = {"timings": timings, "initialized": workspace.initialized}
+    elif args.step == STEP_CHECKOV:
+        violations = validator._run_checkov(args.directory)
+    elif args.step == STEP_OPA:
+        violations = validator._run_opa(args.directory, args.policy_dir)
+    else:
+        violations = validator._run_compiled_rules(args.directory, args.project_dir)
+
+    payload["violations"] = [asdict(v) for v in violations]
+    tmp_output = f"{args.output}.tmp"
+    with open(tmp_output, "w", encoding="utf-8") as fp:
+        json.dump(payload, fp)
+    os.replace(tmp_output, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,37 +7,88 @@ Supports multi-framework validation:
 - CDK: cdk synth (if cdk.json present)
 - All frameworks: Checkov + OPA for security/policy
 
-Writes generated files to a temp directory, runs validators, parses results
-into Violation objects for the self-correction loop.
+Writes generated files to a pooled temp workspace (see workspace_pool), runs
+validators, parses results into Violation objects for the self-correction loop.
+In concurrent mode the independent steps run as parallel subprocesses (see
+validation_steps).
 """
 
 import json
 import logging
 import os
+import re
 import shutil
 import subprocess
 import tempfile
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from .models import GeneratedFile, ValidationResult, Violation
+from .validation_steps import (
+    DEFAULT_STEP_TIMEOUTS,
+    STATUS_CANCELLED,
+    STATUS_OK,
+    STATUS_TIMED_OUT,
+    STEP_CHECKOV,
+    STEP_FRAMEWORK,
+    STEP_OPA,
+    STEP_PLAN,
+    STEP_RULES,
+    StepOutcome,
+    ValidationStep,
+    merge_violations,
+    run_steps,
+    worker_command,
+)
+from .workspace_pool import (
+    ValidationWorkspace,
+    ValidationWorkspacePool,
+    plugin_cache_env,
+)
 
 logger = logging.getLogger(__name__)
 
+# `validate` output meaning a reused workspace needs a fresh `init`
+_NEEDS_INIT = re.compile(
+    r"not installed|Missing required provider|Inconsistent dependency lock file"
+    r"|(?:terraform|tofu) init",
+    re.IGNORECASE,
+)
+
+# Severities that fail validation (and stop a fail-fast run)
+BLOCKING_SEVERITIES = ("CRITICAL", "HIGH")
+
 
 class GenerationValidator:
     """Validates AI-generated IaC code using framework-native + security tools."""
 
-    def __init__(self, plan_config: Optional[dict] = None):
+    def __init__(
+        self,
+        plan_config: Optional[dict] = None,
+        concurrent: bool = False,
+        fail_fast: bool = False,
+        step_timeouts: Optional[Dict[str, float]] = None,
+    ):
         """Initialize the validator.
 
         Args:
             plan_config: Configuration from .thothcf.toml [generation.plan].
                          If provided and plan_validation != "disabled",
                          enables terraform plan validation in the pipeline.
+            concurrent: Run framework validation, Checkov, OPA and compiled
+                        rules as parallel subprocesses.
+            fail_fast: In concurrent mode, cancel the remaining steps once a
+                       CRITICAL/HIGH violation is found.
+            step_timeouts: Seconds per concurrent step, overriding
+                           DEFAULT_STEP_TIMEOUTS.
         """
+        self.concurrent = concurrent
+        self.fail_fast = fail_fast
+        self.step_timeouts = {**DEFAULT_STEP_TIMEOUTS, **(step_timeouts or {})}
         self._temp_dir: Optional[str] = None
         self._plan_validator = None
+        self._workspace_pool = ValidationWorkspacePool()
 
         if plan_config and plan_config.get("plan_validation", "disabled") != "disabled":
             try:
@@ -68,6 +119,8 @@ class GenerationValidator:
         skip_framework_validate: bool = False,
         skip_plan: bool = False,
         stack_path: str = "",
+        concurrent: Optional[bool] = None,
+        fail_fast: Optional[bool] = None,
     ) -> ValidationResult:
         """Validate generated files using framework-native tools + scanners.
 
@@ -81,37 +134,63 @@ class GenerationValidator:
             skip_framework_validate: Skip framework-native validation
             skip_plan: Skip terraform plan validation
             stack_path: Stack path for per-stack plan validation (terragrunt)
+            concurrent: Override the validator's concurrent mode for this call
+            fail_fast: Override the validator's fail-fast setting for this call
 
         Returns:
-            ValidationResult with pass/fail status and violations list
+            ValidationResult with pass/fail status, violations list and the
+            seconds spent in init / validate / plan / policy checks
         """
         if not files:
             return ValidationResult(passed=True)
 
-        # Create temp workspace
-        temp_dir = self._create_temp_workspace(files)
+        # Warm workspace: reused when providers/modules are unchanged
+        workspace = self._workspace_pool.acquire(files)
+        temp_dir = workspace.path
+        timings: Dict[str, float] = {}
 
         try:
+            if self.concurrent if concurrent is None else concurrent:
+                return self._validate_concurrently(
+                    files,
+                    workspace,
+                    project_type=project_type,
+                    project_dir=project_dir,
+                    org_policy_dir=org_policy_dir,
+                    skip_checkov=skip_checkov,
+                    skip_opa=skip_opa,
+                    skip_framework_validate=skip_framework_validate,
+                    skip_plan=skip_plan,
+                    stack_path=stack_path,
+                    fail_fast=self.fail_fast if fail_fast is None else fail_fast,
+                )
+
             violations: List[Violation] = []
 
             # Step 1: Framework-native validation (highest priority — catches
             # schema errors that Checkov won't find)
             if not skip_framework_validate:
-                fw_violations = self._run_framework_validate(temp_dir, project_type)
+                fw_violations = self._run_framework_validate(
+                    temp_dir, project_type, workspace=workspace, timings=timings
+                )
                 violations.extend(fw_violations)
 
             # Step 2: Plan validation (deployability — catches errors that
             # terraform validate misses: invalid attribute combos, provider
             # constraints, cross-resource reference issues)
             if not skip_plan and self._plan_validator:
+                plan_start = time.perf_counter()
                 plan_violations = self._plan_validator.validate_per_stack(
                     files=files,
                     project_dir=project_dir or ".",
                     stack_path=stack_path,
                     temp_dir=temp_dir,
                 )
+                timings["plan"] = time.perf_counter() - plan_start
                 violations.extend(plan_violations)
 
+            policy_start = time.perf_counter()
+
             # Step 3: Run Checkov (security best practices)
             if not skip_checkov:
                 checkov_violations = self._run_checkov(temp_dir)
@@ -127,33 +206,150 @@ class GenerationValidator:
                 rules_violations = self._run_compiled_rules(temp_dir, project_dir)
                 violations.extend(rules_violations)
 
-            passed = not any(
-                v.severity in ("CRITICAL", "HIGH")
-                for v in violations
+            timings["policy"] = time.perf_counter() - policy_start
+            return self._build_result(violations, timings, workspace)
+
+        finally:
+            self._workspace_pool.release(workspace)
+
+    def _validate_concurrently(
+        self,
+        files: List[GeneratedFile],
+        workspace: ValidationWorkspace,
+        project_type: str,
+        project_dir: Optional[str],
+        org_policy_dir: Optional[str],
+        skip_checkov: bool,
+        skip_opa: bool,
+        skip_framework_validate: bool,
+        skip_plan: bool,
+        stack_path: str,
+        fail_fast: bool,
+    ) -> ValidationResult:
+        """Run the independent steps as parallel subprocesses.
+
+        Framework validation, Checkov, OPA and compiled rules only read the
+        workspace, so they overlap. Plan validation shares the terraform
+        working directory with the framework step and runs afterwards.
+        """
+        temp_dir = workspace.path
+        steps = []
+        if not skip_framework_validate:
+            steps.append(
+                self._step(
+                    STEP_FRAMEWORK,
+                    directory=temp_dir,
+                    project_type=project_type,
+                    initialized=workspace.initialized,
+                )
+            )
+        if not skip_checkov:
+            steps.append(self._step(STEP_CHECKOV, directory=temp_dir))
+        if not skip_opa and org_policy_dir:
+            steps.append(
+                self._step(STEP_OPA, directory=temp_dir, policy_dir=org_policy_dir)
+            )
+        if not skip_opa and project_dir:
+            steps.append(
+                self._step(STEP_RULES, directory=temp_dir, project_dir=project_dir)
             )
 
-            # Count per tool
-            checkov_failed = sum(1 for v in violations if v.tool == "checkov")
-            opa_failed = sum(1 for v in violations if v.tool == "opa")
-
-            return ValidationResult(
-                passed=passed,
-                violations=violations,
-                checkov_passed=0,
-                checkov_failed=checkov_failed,
-                opa_passed=0,
-                opa_failed=opa_failed,
+        outcomes = run_steps(
+            steps,
+            fail_fast=fail_fast,
+            is_blocking=lambda v: v.severity in BLOCKING_SEVERITIES,
+        )
+
+        timings: Dict[str, float] = {}
+        framework = outcomes.get(STEP_FRAMEWORK)
+        if framework:
+            timings.update(framework.payload.get("timings", {}))
+            workspace.initialized = framework.payload.get(
+                "initialized", workspace.initialized
             )
+        # Policy steps overlap: their longest one is the time they took.
+        # The framework step is already reported as init/validate.
+        timings["policy"] = max(
+            (
+                outcome.duration_seconds
+                for name, outcome in outcomes.items()
+                if name != STEP_FRAMEWORK
+            ),
+            default=0.0,
+        )
 
-        finally:
-            self._cleanup_temp(temp_dir)
+        cancelled = any(o.status == STATUS_CANCELLED for o in outcomes.values())
+        if not skip_plan and self._plan_validator and not cancelled:
+            plan_start = time.perf_counter()
+            plan_violations = self._plan_validator.validate_per_stack(
+                files=files,
+                project_dir=project_dir or ".",
+                stack_path=stack_path,
+                temp_dir=temp_dir,
+            )
+            timings["plan"] = time.perf_counter() - plan_start
+            outcomes[STEP_PLAN] = StepOutcome(
+                STEP_PLAN, STATUS_OK, plan_violations, timings["plan"]
+            )
+
+        result = self._build_result(merge_violations(outcomes), timings, workspace)
+        result.skipped_steps = [
+            name
+            for name, outcome in outcomes.items()
+            if outcome.status in (STATUS_CANCELLED, STATUS_TIMED_OUT)
+        ]
+        return result
+
+    def _step(self, name: str, **options) -> ValidationStep:
+        return ValidationStep(
+            name=name,
+            command=worker_command(name, **options),
+            timeout=self.step_timeouts[name],
+        )
+
+    @staticmethod
+    def _build_result(
+        violations: List[Violation],
+        timings: Dict[str, float],
+        workspace: ValidationWorkspace,
+    ) -> ValidationResult:
+        logger.info(
+            "Validation timings: "
+            + ", ".join(f"{k}={v:.2f}s" for k, v in timings.items())
+            + (" (warm workspace)" if workspace.reused else "")
+        )
+
+        passed = not any(v.severity in BLOCKING_SEVERITIES for v in violations)
+
+        # Count per tool
+        checkov_failed = sum(1 for v in violations if v.tool == "checkov")
+        opa_failed = sum(1 for v in violations if v.tool == "opa")
+
+        return ValidationResult(
+            passed=passed,
+            violations=violations,
+            checkov_passed=0,
+            checkov_failed=checkov_failed,
+            opa_passed=0,
+            opa_failed=opa_failed,
+            timings=timings,
+            workspace_reused=workspace.reused,
+        )
+
+    def close(self) -> None:
+        """Remove the pooled validation workspaces."""
+        self._workspace_pool.close()
 
     # ------------------------------------------------------------------
     # Framework-native validation
     # ------------------------------------------------------------------
 
     def _run_framework_validate(
-        self, directory: str, project_type: str
+        self,
+        directory: str,
+        project_type: str,
+        workspace: Optional[ValidationWorkspace] = None,
+        timings: Optional[Dict[str, float]] = None,
     ) -> List[Violation]:
         """Run framework-specific validation based on project type.
 
@@ -163,24 +359,39 @@ class GenerationValidator:
         - cdkv2: cdk synth --no-staging
         """
         dispatch = {
-            "terraform": self._validate_terraform,
-            "terraform-terragrunt": self._validate_terraform,
-            "terragrunt": self._validate_terraform,
             "cloudformation": self._validate_cloudformation,
             "sam": self._validate_sam,
             "cdkv2": self._validate_cdk,
         }
 
-        handler = dispatch.get(project_type, self._validate_terraform)
+        handler = dispatch.get(project_type)
         try:
-            return handler(directory)
+            if handler is None:
+                return self._validate_terraform(directory, workspace, timings)
+            start = time.perf_counter()
+            try:
+                return handler(directory)
+            finally:
+                if timings is not None:
+                    timings["validate"] = time.perf_counter() - start
         except Exception as e:
             logger.warning(f"Framework validation ({project_type}) failed: {e}")
             return []
 
-    def _validate_terraform(self, directory: str) -> List[Violation]:
-        """Run terraform init -backend=false && terraform validate."""
+    def _validate_terraform(
+        self,
+        directory: str,
+        workspace: Optional[ValidationWorkspace] = None,
+        timings: Optional[Dict[str, float]] = None,
+    ) -> List[Violation]:
+        """Run terraform init -backend=false && terraform validate.
+
+        ``init`` is skipped for a reused workspace whose providers and modules
+        are already installed; if ``validate`` then reports missing plugins
+        or modules, init runs once and validation is retried.
+        """
         violations = []
+        timings = timings if timings is not None else {}
 
         # Detect tool: prefer tofu, fall back to terraform
         tf_cmd = self._find_tool(["tofu", "terraform"])
@@ -188,30 +399,67 @@ class GenerationValidator:
             logger.info("No terraform/tofu binary found — skipping validate")
             return []
 
-        # Init (no backend, no providers download to keep it fast)
-        init_result = subprocess.run(
-            [tf_cmd, "init", "-backend=false", "-input=false"],
-            capture_output=True,
-            text=True,
-            timeout=60,
-            cwd=directory,
-        )
+        env = plugin_cache_env()
 
-        if init_result.returncode != 0:
-            # Parse init errors (usually provider/module issues)
-            violations.extend(
-                self._parse_terraform_errors(init_result.stderr, "terraform init")
+        def _init() -> subprocess.CompletedProcess:
+            # No backend; providers come from the shared plugin cache
+            start = time.perf_counter()
+            result = subprocess.run(
+                [tf_cmd, "init", "-backend=false", "-input=false"],
+                capture_output=True,
+                text=True,
+                timeout=60,
+                cwd=directory,
+                env=env,
             )
-            return violations
+            timings["init"] = timings.get("init", 0.0) + time.perf_counter() - start
+            if result.returncode == 0 and workspace is not None:
+                workspace.initialized = True
+            return result
+
+        def _validate() -> subprocess.CompletedProcess:
+            start = time.perf_counter()
+            result = subprocess.run(
+                [tf_cmd, "validate", "-json"],
+                capture_output=True,
+                text=True,
+                timeout=30,
+                cwd=directory,
+                env=env,
+            )
+            timings["validate"] = (
+                timings.get("validate", 0.0) + time.perf_counter() - start
+            )
+            return result
 
-        # Validate
-        validate_result = subprocess.run(
-            [tf_cmd, "validate", "-json"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=directory,
-        )
+        if workspace is None or not workspace.initialized:
+            init_result = _init()
+            if init_result.returncode != 0:
+                # Parse init errors (usually provider/module issues)
+                violations.extend(
+                    self._parse_terraform_errors(init_result.stderr, "terraform init")
+                )
+                return violations
+        else:
+            timings.setdefault("init", 0.0)
+
+        validate_result = _validate()
+
+        if (
+            validate_result.returncode != 0
+            and workspace is not None
+            and workspace.reused
+            and _NEEDS_INIT.search(validate_result.stdout + validate_result.stderr)
+        ):
+            logger.debug("Warm workspace needs init — re-initializing")
+            workspace.initialized = False
+            init_result = _init()
+            if init_result.returncode != 0:
+                violations.extend(
+                    self._parse_terraform_errors(init_result.stderr, "terraform init")
+                )
+                return violations
+            validate_result = _validate()
 
         if validate_result.returncode != 0:
             violations.extend(
@@ -566,21 +814,15 @@ class GenerationValidator:
     # ------------------------------------------------------------------
 
     def _create_temp_workspace(self, files: List[GeneratedFile]) -> str:
-        """Write generated files to a temp directory, preserving relative paths."""
+        """Write generated files to a new, unpooled temp directory.
+
+        Relative paths are preserved. ``validate`` uses the workspace pool
+        instead; this is for one-off workspaces removed with ``_cleanup_temp``.
+        """
         temp_dir = tempfile.mkdtemp(prefix="thothctl_validate_")
         os.chmod(temp_dir, 0o700)  # S8: restrict permissions
         logger.debug(f"Created temp workspace: {temp_dir}")
-
-        temp_root = Path(temp_dir).resolve()
-        for f in files:
-            # Security: validate path stays within temp directory
-            file_path = (temp_root / f.path).resolve()
-            if not str(file_path).startswith(str(temp_root)):
-                logger.warning(f"Path traversal blocked in temp workspace: {f.path}")
-                continue
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(f.content, encoding="utf-8")
-
+        ValidationWorkspacePool._write(temp_dir, files)
         return temp_dir
 
     def _cleanup_temp(self, temp_dir: str) -> None:
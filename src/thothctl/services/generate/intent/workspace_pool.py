@@ -0,0 +1,191 @@
+"""Pool of warm validation workspaces for generated IaC.
+
+The generate → validate → repair loop validates a new version of the same
+code on every iteration. Instead of a fresh temp directory (and a full
+``terraform init``) per iteration, workspaces are kept per provider-lock
+signature: when the providers and modules the code needs are unchanged, the
+previous workspace — with its ``.terraform`` directory and lock file — is
+reused and only the generated files are swapped.
+
+Every init points at a shared ``TF_PLUGIN_CACHE_DIR`` so even a cold
+workspace links providers from disk instead of downloading them.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .models import GeneratedFile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PLUGIN_CACHE_DIR = Path.home() / ".thothctl" / "plugin-cache"
+
+# Idle workspaces kept for reuse; the oldest is removed beyond this
+MAX_IDLE_WORKSPACES = 4
+
+# Files and directories produced by `init` that survive a file swap
+INIT_ARTIFACTS = {".terraform", ".terraform.lock.hcl"}
+
+# Lines that decide what `init` installs: provider requirements, module
+# sources/versions and the resource/data types (their implicit providers)
+_INIT_LINE = re.compile(
+    r"^\s*(?:source|version|required_version)\s*=.*$"
+    r'|^\s*(?:provider|module)\s+"[^"]+"'
+    r'|^\s*(?:resource|data)\s+"([a-z0-9]+)_',
+    re.MULTILINE,
+)
+
+
+def lock_signature(files: List[GeneratedFile]) -> str:
+    """Hash everything in the generated files that affects ``terraform init``."""
+    tokens = set()
+    for f in files:
+        if f.path.endswith(".terraform.lock.hcl"):
+            tokens.add(f"lock:{f.path}:{f.content}")
+            continue
+        if not f.path.endswith((".tf", ".tf.json")):
+            continue
+        directory = os.path.dirname(f.path)
+        for match in _INIT_LINE.finditer(f.content):
+            # Resource/data blocks only contribute their provider prefix
+            token = match.group(1) or " ".join(match.group(0).split())
+            tokens.add(f"{directory}:{token}")
+    return hashlib.sha256("\n".join(sorted(tokens)).encode("utf-8")).hexdigest()
+
+
+def plugin_cache_env(plugin_cache_dir: Optional[Path] = None) -> Dict[str, str]:
+    """Environment for terraform/tofu using the shared provider plugin cache.
+
+    An existing ``TF_PLUGIN_CACHE_DIR`` from the user's environment wins.
+    """
+    env = dict(os.environ)
+    cache_dir = env.get("TF_PLUGIN_CACHE_DIR") or str(
+        plugin_cache_dir or DEFAULT_PLUGIN_CACHE_DIR
+    )
+    os.makedirs(cache_dir, exist_ok=True)
+    env["TF_PLUGIN_CACHE_DIR"] = cache_dir
+    # Generated code has no lock file with checksums; without this the cache
+    # is ignored and providers are downloaded again
+    env.setdefault("TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE", "true")
+    return env
+
+
+@dataclass
+class ValidationWorkspace:
+    """A temp directory holding one version of the generated files."""
+
+    path: str
+    signature: str
+    initialized: bool = False
+    reused: bool = False
+    files: List[str] = field(default_factory=list)
+
+
+class ValidationWorkspacePool:
+    """Hands out validation workspaces, reusing initialized ones when possible."""
+
+    def __init__(self, max_idle: int = MAX_IDLE_WORKSPACES):
+        self.max_idle = max_idle
+        self._idle: List[ValidationWorkspace] = []
+        self._lock = threading.Lock()
+        # Registered only while idle workspaces are held, so a closed or
+        # unused pool is not kept alive until exit
+        self._exit_hook = False
+
+    def acquire(self, files: List[GeneratedFile]) -> ValidationWorkspace:
+        """Return a workspace containing exactly ``files``.
+
+        An idle workspace with the same lock signature is reused (keeping its
+        ``init`` artifacts); otherwise a new one is created.
+        """
+        signature = lock_signature(files)
+        workspace = None
+        with self._lock:
+            for candidate in reversed(self._idle):
+                if candidate.signature == signature:
+                    self._idle.remove(candidate)
+                    workspace = candidate
+                    break
+
+        if workspace is None:
+            path = tempfile.mkdtemp(prefix="thothctl_validate_")
+            os.chmod(path, 0o700)  # S8: restrict permissions
+            workspace = ValidationWorkspace(path=path, signature=signature)
+            logger.debug(f"Created validation workspace: {path}")
+        else:
+            workspace.reused = True
+            self._clear(workspace)
+            logger.debug(f"Reusing initialized workspace: {workspace.path}")
+
+        workspace.files = self._write(workspace.path, files)
+        return workspace
+
+    def release(self, workspace: ValidationWorkspace) -> None:
+        """Return a workspace for reuse, or remove it if it never initialized."""
+        if not workspace.initialized:
+            _remove(workspace.path)
+            return
+        with self._lock:
+            self._idle.append(workspace)
+            if not self._exit_hook:
+                atexit.register(self.close)
+                self._exit_hook = True
+            evicted = self._idle[: max(0, len(self._idle) - self.max_idle)]
+            del self._idle[: len(evicted)]
+        for old in evicted:
+            _remove(old.path)
+
+    def close(self) -> None:
+        """Remove every idle workspace."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            if self._exit_hook:
+                atexit.unregister(self.close)
+                self._exit_hook = False
+        for workspace in idle:
+            _remove(workspace.path)
+
+    @staticmethod
+    def _write(path: str, files: List[GeneratedFile]) -> List[str]:
+        root = Path(path).resolve()
+        written = []
+        for f in files:
+            # Security: validate path stays within the workspace
+            file_path = (root / f.path).resolve()
+            if not str(file_path).startswith(str(root)):
+                logger.warning(f"Path traversal blocked in temp workspace: {f.path}")
+                continue
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(f.content, encoding="utf-8")
+            written.append(f.path)
+        return written
+
+    @staticmethod
+    def _clear(workspace: ValidationWorkspace) -> None:
+        """Remove everything from a previous iteration except init artifacts."""
+        for entry in Path(workspace.path).iterdir():
+            if entry.name in INIT_ARTIFACTS:
+                continue
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry, ignore_errors=True)
+            else:
+                entry.unlink(missing_ok=True)
+
+
+def _remove(path: str) -> None:
+    try:
+        shutil.rmtree(path)
+        logger.debug(f"Cleaned up temp workspace: {path}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to clean up {path}: {e}")
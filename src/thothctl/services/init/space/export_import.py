@@ -9,6 +9,7 @@ from typing import Optional
 
 import toml
 
+from ....common.registry import atomic_write_toml
 from ....version import __version__
 
 logger = logging.getLogger(__name__)
@@ -139,8 +140,7 @@ def import_space(source: str, space_name: Optional[str] = None) -> str:
 
     # Write to spaces.toml
     config["spaces"][name] = space_config
-    with open(config_path, mode="wt", encoding="utf-8") as fp:
-        toml.dump(config, fp)
+    atomic_write_toml(config_path, config)
 
     # Create directory structure
     space_dir = Path.home() / ".thothcf" / "spaces" / name
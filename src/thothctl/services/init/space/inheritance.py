@@ -6,6 +6,8 @@ from typing import Dict, List, Optional
 
 import toml
 
+from ....common.registry import atomic_write_toml
+
 logger = logging.getLogger(__name__)
 
 MAX_INHERITANCE_DEPTH = 5
@@ -58,8 +60,7 @@ def set_parent_space(space_name: str, parent_name: str) -> None:
 
     config["spaces"][space_name]["parent"] = parent_name
 
-    with open(spaces_path, mode="wt", encoding="utf-8") as fp:
-        toml.dump(config, fp)
+    atomic_write_toml(spaces_path, config)
 
     logger.info(f"Set parent of '{space_name}' to '{parent_name}'")
 
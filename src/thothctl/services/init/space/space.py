@@ -8,6 +8,7 @@ from typing import Optional
 
 import toml
 
+from ....common.registry import atomic_write_toml
 from ....core.cli_ui import CliUI
 from ....utils.crypto import save_credentials
 
@@ -172,8 +173,7 @@ class SpaceService:
         }
 
         # Save config
-        with open(config_path, mode="wt", encoding="utf-8") as fp:
-            toml.dump(config, fp)
+        atomic_write_toml(config_path, config)
 
         self.ui.print_success(f"🔧 Space '{space_name}' configuration created")
 
@@ -1,63 +1,29 @@
-import gzip
 import json
 import logging
-import os
 import time
 from collections import defaultdict
-from datetime import datetime
 from typing import Dict, Optional
 
 import requests
 
+from ....utils.modules_ops.module_metadata_store import ModuleMetadataStore
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 class TerraformModuleVersions:
-    def __init__(self, cache_dir="~/.terraform-cache"):
+    def __init__(self, store: Optional[ModuleMetadataStore] = None):
         self.base_url = "https://registry.terraform.io/v1"
-        self.cache_dir = os.path.expanduser(cache_dir)
         self.cache_expiry_days = 1
-
-    def get_cache_filename(
-        self, namespace: str, type: str = "module", name: str = "", provider: str = ""
-    ) -> str:
-        """Generate cache filename based on type and module info"""
-        if type == "namespace":
-            return os.path.join(self.cache_dir, f"namespace_{namespace}.json.gz")
-        else:
-            module_id = f"{namespace}_{name}_{provider}"
-            return os.path.join(self.cache_dir, f"module_{module_id}.json.gz")
-
-    def get_metadata_filename(
-        self, namespace: str, type: str = "module", name: str = "", provider: str = ""
-    ) -> str:
-        """Generate metadata filename based on type and module info"""
-        if type == "namespace":
-            return os.path.join(self.cache_dir, f"metadata_namespace_{namespace}.json")
-        else:
-            module_id = f"{namespace}_{name}_{provider}"
-            return os.path.join(self.cache_dir, f"metadata_{module_id}.json")
-
-    def ensure_cache_dir(self):
-        os.makedirs(self.cache_dir, exist_ok=True)
+        self.store = store or ModuleMetadataStore(ttl_hours=self.cache_expiry_days * 24)
+        # Namespace search below is restricted to AWS modules
+        self.search_provider = "aws"
 
     def is_cache_valid(
         self, namespace: str, type: str = "module", name: str = "", provider: str = ""
     ) -> bool:
-        try:
-            metadata_file = self.get_metadata_filename(namespace, type, name, provider)
-            if not os.path.exists(metadata_file):
-                return False
-
-            with open(metadata_file, "r") as f:
-                metadata = json.load(f)
-                last_updated = datetime.fromisoformat(metadata["last_updated"])
-                age = (datetime.now() - last_updated).days
-                return age < self.cache_expiry_days
-        except Exception as e:
-            logger.error(f"Error checking cache validity: {e}")
-            return False
+        return self.load_from_cache(namespace, type, name, provider) is not None
 
     def save_to_cache(
         self,
@@ -68,35 +34,12 @@ class TerraformModuleVersions:
         provider: str = "",
     ):
         try:
-            self.ensure_cache_dir()
-
-            cache_file = self.get_cache_filename(namespace, type, name, provider)
-            with gzip.open(cache_file, "wt") as f:
-                json.dump(data, f)
-
-            metadata = {
-                "last_updated": datetime.now().isoformat(),
-                "namespace": namespace,
-                "type": type,
-            }
-
-            if type == "module":
-                metadata.update(
-                    {
-                        "name": name,
-                        "provider": provider,
-                        "version_count": len(data["modules"][0]["versions"])
-                        if data.get("modules")
-                        else 0,
-                    }
+            if type == "namespace":
+                self.store.put_namespace(
+                    namespace, self.search_provider, data.get("modules", [])
                 )
             else:
-                metadata["module_count"] = len(data.get("modules", []))
-
-            metadata_file = self.get_metadata_filename(namespace, type, name, provider)
-            with open(metadata_file, "w") as f:
-                json.dump(metadata, f)
-
+                self.store.put_versions(namespace, name, provider, data)
             logger.info(f"Cache saved successfully for {type}: {namespace}")
         except Exception as e:
             logger.error(f"Error saving cache: {e}")
@@ -105,9 +48,10 @@ class TerraformModuleVersions:
         self, namespace: str, type: str = "module", name: str = "", provider: str = ""
     ) -> Optional[Dict]:
         try:
-            cache_file = self.get_cache_filename(namespace, type, name, provider)
-            with gzip.open(cache_file, "rt") as f:
-                return json.load(f)
+            if type == "namespace":
+                modules = self.store.get_namespace(namespace, self.search_provider)
+                return None if modules is None else {"modules": modules}
+            return self.store.get_versions(namespace, name, provider)
         except Exception as e:
             logger.error(f"Error loading cache: {e}")
             return None
@@ -187,10 +131,10 @@ class TerraformModuleVersions:
         self, namespace: str, force_refresh: bool = False
     ) -> Optional[Dict]:
         """Get all modules for a namespace from cache or fetch if needed"""
-        if not force_refresh and self.is_cache_valid(namespace, "namespace"):
-            logger.info(f"Loading namespace {namespace} from cache...")
+        if not force_refresh:
             data = self.load_from_cache(namespace, "namespace")
             if data:
+                logger.info(f"Loaded namespace {namespace} from cache")
                 return data
 
         logger.info(f"Fetching fresh data for namespace {namespace}...")
@@ -208,12 +152,10 @@ class TerraformModuleVersions:
         limit: int = 3,
     ) -> Optional[Dict]:
         """Get module versions from cache or fetch if needed"""
-        if not force_refresh and self.is_cache_valid(
-            namespace, "module", name, provider
-        ):
-            logger.info(f"Loading {namespace}/{name}/{provider} from cache...")
+        if not force_refresh:
             data = self.load_from_cache(namespace, "module", name, provider)
             if data:
+                logger.info(f"Loaded {namespace}/{name}/{provider} from cache")
                 return data
 
         logger.info(f"Fetching fresh data for {namespace}/{name}/{provider}...")
@@ -222,6 +164,29 @@ class TerraformModuleVersions:
             self.save_to_cache(data, namespace, "module", name, provider)
         return data
 
+    def prefetch_namespace(
+        self, namespace: str, limit: int = 3, force_refresh: bool = False
+    ) -> int:
+        """Warm the version cache for every module an organisation publishes.
+
+        Returns the number of modules whose versions were fetched.
+        """
+        listing = self.get_namespace_modules(namespace, force_refresh)
+        if not listing:
+            return 0
+        keys = [
+            (m.get("namespace", namespace), m["name"], m["provider"])
+            for m in listing.get("modules", [])
+            if m.get("name") and m.get("provider")
+        ]
+        return self.store.prefetch(
+            keys,
+            lambda ns, name, provider: self.fetch_module_versions(
+                ns, name, provider, limit
+            ),
+            force=force_refresh,
+        )
+
 
 def print_namespace_summary(namespace_data: Dict):
     """Print a summary of namespace modules"""
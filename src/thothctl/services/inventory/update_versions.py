@@ -3,10 +3,11 @@
 import json
 import logging
 import re
+import time
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import inquirer
 from colorama import Fore, init
@@ -16,6 +17,10 @@ from rich.table import Table
 # Initialize colorama for cross-platform color support
 init(autoreset=True)
 
+# Formatters to try, in order of preference
+FORMAT_TOOLS = ("tofu", "terraform")
+FMT_TIMEOUT = 30
+
 
 @dataclass
 class VersionUpdate:
@@ -100,14 +105,21 @@ class VersionManager:
 
         if auto_apply_all:
             # Process all updates
-            for update in updates:
-                self._process_single_update(update, True, action)
+            selected = updates
         else:
             # Let user select specific modules
             selected_modules = self._select_modules(updates)
-            for update in updates:
-                if update["name"] in selected_modules:
-                    self._process_single_update(update, False, action)
+            selected = [u for u in updates if u["name"] in selected_modules]
+
+        # Confirm everything first, then touch each file once
+        pending: Dict[Path, List[Tuple[str, str]]] = {}
+        for update in selected:
+            edit = self._process_single_update(update, auto_apply_all, action)
+            if edit is not None:
+                file_path, search, replace = edit
+                pending.setdefault(file_path, []).append((search, replace))
+
+        self._apply_pending_updates(pending)
 
     def _select_modules(self, updates: List[dict]) -> List[str]:
         """Allow user to select specific modules to update."""
@@ -145,44 +157,74 @@ class VersionManager:
 
         return answers["selected_modules"]
 
-    def _apply_version_update(self, file_path: Path, search: str, replace: str) -> None:
-        """Apply version update to file."""
+    def _replace_version(
+        self, content: str, file_path: Path, search: str, replace: str
+    ) -> str:
+        """Return ``content`` with one version update applied."""
+        # Handle terragrunt.hcl files differently
+        if self.project_type == "terragrunt" and file_path.name == "terragrunt.hcl":
+            # For terragrunt, we need to update the version in the source attribute
+            if "tfr:///" in content:
+                # Handle tfr:/// format
+                return re.sub(
+                    r'source = "tfr:///[^"]+"',
+                    lambda m: m.group(0).replace(search, replace),
+                    content,
+                )
+            # Handle other formats
+            return content.replace(search, replace)
+        # Standard terraform file update
+        return content.replace(search, replace)
+
+    def _apply_version_updates(
+        self, file_path: Path, edits: List[Tuple[str, str]]
+    ) -> bool:
+        """Apply all of a file's version updates in one read and one write.
+
+        Returns True if the file changed.
+        """
         try:
             content = file_path.read_text()
-
-            # Handle terragrunt.hcl files differently
-            if self.project_type == "terragrunt" and file_path.name == "terragrunt.hcl":
-                # For terragrunt, we need to update the version in the source attribute
-                if "tfr:///" in content:
-                    # Handle tfr:/// format
-                    updated_content = re.sub(
-                        r'source = "tfr:///[^"]+"',
-                        lambda m: m.group(0).replace(search, replace),
-                        content,
-                    )
-                else:
-                    # Handle other formats
-                    updated_content = content.replace(search, replace)
-            else:
-                # Standard terraform file update
-                updated_content = content.replace(search, replace)
-
+            updated_content = content
+            for search, replace in edits:
+                updated_content = self._replace_version(
+                    updated_content, file_path, search, replace
+                )
+                logging.debug(f"Version {search} changed to {replace} in {file_path}")
+
+            if updated_content == content:
+                return False
             file_path.write_text(updated_content)
-
-            logging.debug(f"Version {search} changed to {replace} in {file_path}")
-
-            # Format the file if it's a terraform file
-            if file_path.suffix == ".tf":
-                self._format_terraform_file(file_path)
-
-            print(
-                f"{Fore.GREEN}✔️ Version changed successfully. "
-                f"Run plan and apply for checking changes.{Fore.RESET}\n"
-            )
+            return True
         except IOError as e:
             logging.error(f"Failed to update file {file_path}: {e}")
             raise
 
+    def _apply_pending_updates(
+        self, pending: Dict[Path, List[Tuple[str, str]]]
+    ) -> None:
+        """Write the grouped updates, then format each touched directory once."""
+        if not pending:
+            return
+
+        started = time.perf_counter()
+        changed = [
+            file_path
+            for file_path, edits in pending.items()
+            if self._apply_version_updates(file_path, edits)
+        ]
+        directories = {p.parent for p in changed if p.suffix == ".tf"}
+        self._format_terraform_directories(directories)
+        elapsed = time.perf_counter() - started
+
+        edit_count = sum(len(pending[p]) for p in changed)
+        touched_dirs = {p.parent for p in changed}
+        print(
+            f"{Fore.GREEN}✔️ Applied {edit_count} version update(s) to "
+            f"{len(changed)} file(s) in {len(touched_dirs)} director(ies) "
+            f"in {elapsed:.2f}s. Run plan and apply for checking changes.{Fore.RESET}\n"
+        )
+
     def _confirm_update(self) -> bool:
         """Confirm update action with user."""
         questions = [
@@ -226,8 +268,8 @@ class VersionManager:
 
     def _process_single_update(
         self, update: dict, auto_apply: bool, action: str
-    ) -> None:
-        """Process a single version update."""
+    ) -> Optional[Tuple[Path, str, str]]:
+        """Confirm a single version update; returns the edit to apply, if any."""
         file_path = Path(update["file"])
         search, replace = self._get_version_strings(update, action)
 
@@ -239,59 +281,65 @@ class VersionManager:
                 f"\n{Fore.CYAN}Processing module: {module_name} ({current_version} → {new_version}){Fore.RESET}"
             )
             if not self._confirm_single_update(search, replace, file_path):
-                return
+                return None
 
         print(f"{Fore.GREEN}Applying update for {update['name']}...{Fore.RESET}")
-        self._apply_version_update(file_path, search, replace)
+        return file_path, search, replace
 
     @staticmethod
-    def _format_terraform_file(file_path: Path) -> None:
+    def _format_terraform_directories(directories: Iterable[Path]) -> None:
         """
-        Format terraform file using available tools.
+        Format terraform directories using available tools.
 
-        Tries to use tofu or terraform fmt, whichever is available.
-        If neither is available, logs a warning but doesn't fail.
+        Runs one ``fmt`` per directory with tofu or terraform, whichever is
+        available and works. If neither is available, logs a warning but
+        doesn't fail.
         """
         import shutil
         import subprocess
 
-        # List of tools to try, in order of preference
-        format_tools = ["tofu", "terraform"]
+        directories = sorted(set(directories))
+        if not directories:
+            return
+
+        tools = [tool for tool in FORMAT_TOOLS if shutil.which(tool)]
+        if not tools:
+            logging.warning(
+                "Could not format updated files: neither 'tofu' nor 'terraform' "
+                "is available. Files were updated but not formatted."
+            )
+            return
 
-        for tool in format_tools:
-            # Check if the tool is available
-            if shutil.which(tool):
+        failed: Set[Path] = set()
+        for directory in directories:
+            for tool in tools:
                 try:
-                    logging.debug(f"Formatting {file_path} using {tool} fmt")
+                    logging.debug(f"Formatting {directory} using {tool} fmt")
                     subprocess.run(
-                        [tool, "fmt", str(file_path)],
+                        [tool, "fmt", str(directory)],
                         check=True,
                         capture_output=True,
                         text=True,
-                        timeout=30,  # Add timeout to prevent hanging
+                        timeout=FMT_TIMEOUT,  # Prevent hanging
                     )
-                    logging.debug(f"Successfully formatted {file_path} with {tool}")
-                    return
+                    break
                 except subprocess.CalledProcessError as e:
-                    logging.warning(f"Failed to format {file_path} with {tool}: {e}")
-                    # Try the next tool
-                    continue
+                    logging.warning(f"Failed to format {directory} with {tool}: {e}")
                 except subprocess.TimeoutExpired:
-                    logging.warning(f"Timeout formatting {file_path} with {tool}")
-                    # Try the next tool
-                    continue
+                    logging.warning(f"Timeout formatting {directory} with {tool}")
                 except Exception as e:
                     logging.warning(
-                        f"Unexpected error formatting {file_path} with {tool}: {e}"
+                        f"Unexpected error formatting {directory} with {tool}: {e}"
                     )
-                    # Try the next tool
-                    continue
+            else:
+                failed.add(directory)
 
-        # If we get here, no tool worked
-        logging.warning(
-            f"Could not format {file_path}: neither 'tofu' nor 'terraform' is available or working. "
-            f"File was updated but not formatted."
-        )
+        if failed:
+            logging.warning(
+                f"Could not format {len(failed)} director(ies): "
+                f"{', '.join(str(d) for d in sorted(failed))}. "
+                f"Files were updated but not formatted."
+            )
 
     def _get_version_strings(self, file_details: dict, action: str) -> Tuple[str, str]:
         """Get version strings for update or restore."""
@@ -0,0 +1,315 @@
+"""Concurrent command execution and background jobs for the MCP servers.
+
+Long-running tools (``scan iac``, ``workflow devsecops``...) are executed with
+``asyncio.create_subprocess_exec`` so the event loop keeps serving other
+requests, and a shared semaphore bounds how many of them run at once.
+Callers that do not want to hold a request open can start a job instead and
+poll (or stream) its output by job ID.
+"""
+
+import asyncio
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("thothctl-mcp-jobs")
+
+# Maximum number of long operations (thothctl subprocesses) running at once
+DEFAULT_MAX_CONCURRENT = int(os.environ.get("THOTHCTL_MCP_MAX_CONCURRENT", "4"))
+
+# Finished jobs kept in memory for polling
+MAX_FINISHED_JOBS = 100
+
+# Bytes read from a subprocess stream at a time; lines may be any length
+READ_CHUNK_SIZE = 64 * 1024
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_TIMED_OUT = "timed_out"
+JOB_CANCELLED = "cancelled"
+
+FINAL_STATES = {JOB_SUCCEEDED, JOB_FAILED, JOB_TIMED_OUT, JOB_CANCELLED}
+
+
+@dataclass
+class CommandResult:
+    """Outcome of a single thothctl subprocess."""
+
+    returncode: Optional[int]
+    stdout: str = ""
+    stderr: str = ""
+    timed_out: bool = False
+
+    def to_text(self, cmd: List[str]) -> str:
+        """Render the result the way the MCP tools report it."""
+        if self.timed_out:
+            return f"Command timed out: {' '.join(cmd)}"
+        if self.returncode == 0:
+            return self.stdout.strip()
+        error_output = self.stderr.strip() or self.stdout.strip()
+        return f"Error (exit {self.returncode}): {error_output}"
+
+
+@dataclass
+class Job:
+    """A background thothctl command tracked by ID."""
+
+    job_id: str
+    command: List[str]
+    timeout: Optional[float] = None
+    cwd: Optional[str] = None
+    status: str = JOB_QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    exit_code: Optional[int] = None
+    output: List[str] = field(default_factory=list)
+    stderr: str = ""
+    task: Optional["asyncio.Task"] = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINAL_STATES
+
+    def to_dict(self, offset: int = 0) -> Dict[str, Any]:
+        """Serialize the job, returning only output lines from ``offset`` on.
+
+        Clients poll with the returned ``next_offset`` to stream output
+        incrementally.
+        """
+        offset = max(0, offset)
+        lines = self.output[offset:]
+        end = self.finished_at or time.time()
+        return {
+            "job_id": self.job_id,
+            "command": " ".join(self.command),
+            "status": self.status,
+            "exit_code": self.exit_code,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration_seconds": (
+                round(end - self.started_at, 3) if self.started_at else None
+            ),
+            "output": lines,
+            "next_offset": offset + len(lines),
+            "stderr": self.stderr if self.done else "",
+        }
+
+
+async def _pump(
+    stream: Optional[asyncio.StreamReader], sink: Callable[[str], None]
+) -> None:
+    """Forward lines from a subprocess stream to ``sink`` as they arrive.
+
+    The stream is read in chunks and split here rather than with
+    ``readline()``, whose buffer limit would fail on long lines such as
+    single-line JSON reports.
+    """
+    if stream is None:
+        return
+    pending = b""
+    while True:
+        chunk = await stream.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            sink(line.decode("utf-8", errors="replace"))
+    if pending:
+        sink(pending.decode("utf-8", errors="replace"))
+
+
+async def run_command(
+    cmd: List[str],
+    timeout: Optional[float] = None,
+    cwd: Optional[str] = None,
+    on_output: Optional[Callable[[str], None]] = None,
+) -> CommandResult:
+    """Run a command without blocking the event loop.
+
+    The process is killed if ``timeout`` expires or the calling task is
+    cancelled (e.g. the MCP client disconnects), so no orphan scans are left
+    behind.
+
+    Args:
+        cmd: Command and arguments.
+        timeout: Seconds before the process is killed, ``None`` for no limit.
+        cwd: Working directory for the command.
+        on_output: Optional callback receiving each stdout line as it arrives.
+
+    Returns:
+        CommandResult with the captured output.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+    )
+    stdout_lines: List[str] = []
+    stderr_lines: List[str] = []
+
+    def _collect_stdout(line: str) -> None:
+        stdout_lines.append(line)
+        if on_output:
+            on_output(line)
+
+    async def _communicate() -> int:
+        await asyncio.gather(
+            _pump(process.stdout, _collect_stdout),
+            _pump(process.stderr, stderr_lines.append),
+        )
+        return await process.wait()
+
+    try:
+        returncode = await asyncio.wait_for(_communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        await _kill(process)
+        return CommandResult(
+            returncode=None,
+            stdout="\n".join(stdout_lines),
+            stderr="\n".join(stderr_lines),
+            timed_out=True,
+        )
+    except asyncio.CancelledError:
+        await _kill(process)
+        raise
+
+    return CommandResult(
+        returncode=returncode,
+        stdout="\n".join(stdout_lines),
+        stderr="\n".join(stderr_lines),
+    )
+
+
+async def _kill(process: "asyncio.subprocess.Process") -> None:
+    """Terminate a subprocess and reap it."""
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+    await process.wait()
+
+
+class JobManager:
+    """Bounded executor for thothctl subprocesses with a job-ID API.
+
+    A single instance is shared by a server so inline tool calls and
+    background jobs draw from the same pool of ``max_concurrent`` slots.
+    Lightweight requests (version, tool listing, job polling) never take a
+    slot and are always served immediately.
+    """
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT):
+        self.max_concurrent = max(1, max_concurrent)
+        self._jobs: Dict[str, Job] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _slots(self) -> asyncio.Semaphore:
+        # Created lazily so the semaphore belongs to the running loop
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._loop = loop
+        return self._semaphore
+
+    async def run(
+        self,
+        cmd: List[str],
+        timeout: Optional[float] = None,
+        cwd: Optional[str] = None,
+    ) -> CommandResult:
+        """Run a command inline, waiting for a free slot first."""
+        async with self._slots():
+            return await run_command(cmd, timeout=timeout, cwd=cwd)
+
+    def start(
+        self,
+        cmd: List[str],
+        timeout: Optional[float] = None,
+        cwd: Optional[str] = None,
+    ) -> Job:
+        """Start a command in the background and return its job.
+
+        Must be called from a running event loop.
+        """
+        job = Job(
+            job_id=uuid.uuid4().hex[:12], command=list(cmd), timeout=timeout, cwd=cwd
+        )
+        self._jobs[job.job_id] = job
+        job.task = asyncio.get_running_loop().create_task(self._run_job(job))
+        job.task.add_done_callback(lambda _task: self._finalize(job))
+        self._prune()
+        logger.info(f"Started job {job.job_id}: {' '.join(cmd)}")
+        return job
+
+    async def _run_job(self, job: Job) -> None:
+        try:
+            async with self._slots():
+                job.status = JOB_RUNNING
+                job.started_at = time.time()
+                result = await run_command(
+                    job.command,
+                    timeout=job.timeout,
+                    cwd=job.cwd,
+                    on_output=job.output.append,
+                )
+            job.exit_code = result.returncode
+            job.stderr = result.stderr
+            if result.timed_out:
+                job.status = JOB_TIMED_OUT
+            elif result.returncode == 0:
+                job.status = JOB_SUCCEEDED
+            else:
+                job.status = JOB_FAILED
+        except asyncio.CancelledError:
+            job.status = JOB_CANCELLED
+        except Exception as e:
+            logger.error(f"Job {job.job_id} failed to run: {e}")
+            job.stderr = str(e)
+            job.status = JOB_FAILED
+        finally:
+            job.finished_at = time.time()
+
+    @staticmethod
+    def _finalize(job: Job) -> None:
+        # A job cancelled while still queued never enters _run_job
+        if not job.done:
+            job.status = JOB_CANCELLED
+            job.finished_at = time.time()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by ID, or ``None`` if unknown or pruned."""
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[Job]:
+        """Return all tracked jobs, newest first."""
+        return sorted(self._jobs.values(), key=lambda j: j.created_at, reverse=True)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job, killing its process.
+
+        Returns:
+            True if the job was still active and has been cancelled.
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.done or job.task is None:
+            return False
+        job.task.cancel()
+        return True
+
+    def _prune(self) -> None:
+        finished = [j for j in self._jobs.values() if j.done]
+        if len(finished) <= MAX_FINISHED_JOBS:
+            return
+        finished.sort(key=lambda j: j.finished_at or 0)
+        for job in finished[: len(finished) - MAX_FINISHED_JOBS]:
+            del self._jobs[job.job_id]
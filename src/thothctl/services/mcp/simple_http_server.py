@@ -1,19 +1,23 @@
 """Simplified HTTP MCP server for ThothCTL."""
 
+import asyncio
 import atexit
+import json
 import logging
 import os
-from typing import Any, Dict
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
 import uvicorn
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, StreamingResponse
 from starlette.routing import Route
 
 from ...core.cli_ui import CliUI
 from ...version import __version__
+from .jobs import DEFAULT_MAX_CONCURRENT, JobManager
 
 # Initialize CLI UI
 ui = CliUI()
@@ -25,10 +29,19 @@ logger = logging.getLogger("thothctl-mcp-http")
 class SimpleHTTPMCPServer:
     """Simplified HTTP MCP server for ThothCTL."""
 
-    def __init__(self, host: str = "localhost", port: int = 8080):
+    # Seconds before a thothctl subprocess is killed
+    COMMAND_TIMEOUT = 300
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 8080,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    ):
         self.host = host
         self.port = port
         self.tools = self._get_available_tools()
+        self.jobs = JobManager(max_concurrent=max_concurrent)
 
     def _get_available_tools(self) -> list:
         """Get list of available tools."""
@@ -527,12 +540,132 @@ class SimpleHTTPMCPServer:
             logger.error(f"Error executing tool: {e}")
             return JSONResponse({"error": str(e), "status": "error"}, status_code=500)
 
+    async def start_job(self, request):
+        """Start a tool as a background job endpoint."""
+        try:
+            body = await request.json()
+            tool_name = body.get("tool")
+            arguments = body.get("arguments", {})
+
+            if not tool_name:
+                return JSONResponse(
+                    {"error": "Missing 'tool' parameter"}, status_code=400
+                )
+
+            cmd, error = self._build_command(tool_name, arguments)
+            if error:
+                return JSONResponse({"error": error}, status_code=400)
+
+            job = self.jobs.start(
+                cmd, timeout=self.COMMAND_TIMEOUT, cwd=self._resolve_cwd(arguments)
+            )
+            return JSONResponse(job.to_dict(), status_code=202)
+
+        except Exception as e:
+            logger.error(f"Error starting job: {e}")
+            return JSONResponse({"error": str(e), "status": "error"}, status_code=500)
+
+    async def list_jobs(self, request):
+        """List background jobs endpoint."""
+        return JSONResponse(
+            {
+                "jobs": [
+                    {k: v for k, v in job.to_dict().items() if k != "output"}
+                    for job in self.jobs.list_jobs()
+                ],
+                "max_concurrent": self.jobs.max_concurrent,
+            }
+        )
+
+    async def get_job(self, request):
+        """Poll a background job endpoint.
+
+        Pass ``?offset=N`` (the previous ``next_offset``) to receive only new
+        output lines.
+        """
+        job = self.jobs.get(request.path_params["job_id"])
+        if job is None:
+            return JSONResponse({"error": "Job not found"}, status_code=404)
+        try:
+            offset = int(request.query_params.get("offset", 0))
+        except ValueError:
+            offset = 0
+        return JSONResponse(job.to_dict(offset))
+
+    async def stream_job(self, request):
+        """Stream a background job's output as newline-delimited JSON."""
+        job = self.jobs.get(request.path_params["job_id"])
+        if job is None:
+            return JSONResponse({"error": "Job not found"}, status_code=404)
+
+        async def events():
+            offset = 0
+            while True:
+                done = job.done
+                lines = job.output[offset:]
+                for line in lines:
+                    yield json.dumps({"line": line}) + "\n"
+                offset += len(lines)
+                if done:
+                    break
+                await asyncio.sleep(0.5)
+            yield json.dumps({"status": job.status, "exit_code": job.exit_code}) + "\n"
+
+        return StreamingResponse(events(), media_type="application/x-ndjson")
+
+    async def cancel_job(self, request):
+        """Cancel a background job endpoint."""
+        job_id = request.path_params["job_id"]
+        if self.jobs.get(job_id) is None:
+            return JSONResponse({"error": "Job not found"}, status_code=404)
+        cancelled = self.jobs.cancel(job_id)
+        return JSONResponse({"job_id": job_id, "cancelled": cancelled})
+
+    @staticmethod
+    def _resolve_cwd(arguments: Dict[str, Any]) -> Optional[str]:
+        directory = arguments.get("directory", ".")
+        return directory if directory != "." else None
+
     async def _execute_thothctl_command(
         self, name: str, arguments: Dict[str, Any]
     ) -> str:
         """Execute a ThothCTL command."""
-        import subprocess
+        if name == "thothctl_version":
+            # Answered in-process so it never waits behind running scans
+            return f"thothctl version {__version__}"
+
+        cmd, error = self._build_command(name, arguments)
+        if error:
+            return error
 
+        # Execute the command without blocking the event loop
+        try:
+            result = await self.jobs.run(
+                cmd, timeout=self.COMMAND_TIMEOUT, cwd=self._resolve_cwd(arguments)
+            )
+
+            if result.timed_out:
+                return f"Command timed out after 5 minutes: {' '.join(cmd)}"
+            if result.returncode == 0:
+                output = result.stdout.strip()
+                if not output and result.stderr.strip():
+                    output = result.stderr.strip()
+                return output or f"Command executed successfully: {' '.join(cmd)}"
+            else:
+                error_output = result.stderr.strip() or result.stdout.strip()
+                return f"Command failed (exit code {result.returncode}): {error_output}"
+
+        except Exception as e:
+            return f"Error executing command: {str(e)}"
+
+    def _build_command(
+        self, name: str, arguments: Dict[str, Any]
+    ) -> Tuple[Optional[List[str]], Optional[str]]:
+        """Build the thothctl command line for a tool.
+
+        Returns:
+            Tuple of (command, error message); exactly one is set.
+        """
         # Build the command (same logic as Amazon Q server)
         cmd = ["thothctl"]
 
@@ -616,8 +749,6 @@ class SimpleHTTPMCPServer:
             cmd.extend(["generate", "component", "--template", arguments["template"]])
         elif name == "thothctl_generate_iac":
             # Security: MCP always dry-run, intent sanitized
-            import re
-
             intent = arguments.get("intent", "")
             intent = re.sub(
                 r"(?i)(ignore|forget|disregard).*(?:previous|above|system)", "", intent
@@ -625,7 +756,7 @@ class SimpleHTTPMCPServer:
             intent = re.sub(r"(?i)you are now|act as|pretend to be", "", intent)
             intent = intent[:2000]
             if not intent.strip():
-                return "Error: intent is required"
+                return None, "Error: intent is required"
 
             cmd.extend(["generate", "iac", "--intent", intent, "--dry-run"])
             if arguments.get("project_type", "auto") != "auto":
@@ -671,32 +802,9 @@ class SimpleHTTPMCPServer:
                 for tool in arguments["tools"]:
                     cmd.extend(["-t", tool])
         else:
-            return f"Unknown tool: {name}"
+            return None, f"Unknown tool: {name}"
 
-        # Execute the command
-        try:
-            directory = arguments.get("directory", ".")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-                cwd=directory if directory != "." else None,
-            )
-
-            if result.returncode == 0:
-                output = result.stdout.strip()
-                if not output and result.stderr.strip():
-                    output = result.stderr.strip()
-                return output or f"Command executed successfully: {' '.join(cmd)}"
-            else:
-                error_output = result.stderr.strip() or result.stdout.strip()
-                return f"Command failed (exit code {result.returncode}): {error_output}"
-
-        except subprocess.TimeoutExpired:
-            return f"Command timed out after 5 minutes: {' '.join(cmd)}"
-        except Exception as e:
-            return f"Error executing command: {str(e)}"
+        return cmd, None
 
     def create_app(self):
         """Create the Starlette application."""
@@ -706,6 +814,11 @@ class SimpleHTTPMCPServer:
             Route("/execute", self.execute_tool, methods=["POST"]),
             Route("/mcp/v1/tools", self.list_tools, methods=["GET"]),
             Route("/mcp/v1/execute", self.execute_tool, methods=["POST"]),
+            Route("/jobs", self.start_job, methods=["POST"]),
+            Route("/jobs", self.list_jobs, methods=["GET"]),
+            Route("/jobs/{job_id}", self.get_job, methods=["GET"]),
+            Route("/jobs/{job_id}", self.cancel_job, methods=["DELETE"]),
+            Route("/jobs/{job_id}/stream", self.stream_job, methods=["GET"]),
         ]
 
         middleware = [
@@ -749,6 +862,10 @@ class SimpleHTTPMCPServer:
             )
             ui.print_info(f"Tools endpoint: http://{self.host}:{self.port}/tools")
             ui.print_info(f"Execute endpoint: http://{self.host}:{self.port}/execute")
+            ui.print_info(
+                f"Jobs endpoint: http://{self.host}:{self.port}/jobs "
+                f"(max {self.jobs.max_concurrent} concurrent operations)"
+            )
 
             uvicorn.run(app, host=self.host, port=self.port, log_level="info")
 
@@ -758,7 +875,11 @@ class SimpleHTTPMCPServer:
             raise
 
 
-def run_simple_http_server(host: str = "localhost", port: int = 8080):
+def run_simple_http_server(
+    host: str = "localhost",
+    port: int = 8080,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+):
     """Run the simplified HTTP MCP server."""
-    server = SimpleHTTPMCPServer(host, port)
+    server = SimpleHTTPMCPServer(host, port, max_concurrent=max_concurrent)
     server.run()
@@ -1,18 +1,21 @@
 """ThothCTL MCP Server — MCP SDK v2.0+ compatible (MCPServer API)."""
 
 import asyncio
-import subprocess
+import json
 from typing import Optional
 
 from mcp.server import MCPServer
 
+from ...version import __version__
+from .jobs import DEFAULT_MAX_CONCURRENT, JobManager
 
-def _run_cmd(cmd: list, timeout: int = 180) -> str:
-    """Execute a thothctl command and return output."""
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-    if result.returncode == 0:
-        return result.stdout.strip()
-    return f"Error (exit {result.returncode}): {result.stderr.strip() or result.stdout.strip()}"
+jobs = JobManager()
+
+
+async def _run_cmd(cmd: list, timeout: int = 180) -> str:
+    """Execute a thothctl command without blocking the event loop."""
+    result = await jobs.run(cmd, timeout=timeout)
+    return result.to_text(cmd)
 
 
 server = MCPServer("thothctl")
@@ -23,7 +26,8 @@ server = MCPServer("thothctl")
 
 @server.tool(name="thothctl_version", description="Get ThothCTL version information")
 async def thothctl_version() -> str:
-    return _run_cmd(["thothctl", "--version"])
+    # Answered in-process so it never waits behind running scans
+    return f"thothctl version {__version__}"
 
 
 # --- Check commands ---
@@ -34,7 +38,7 @@ async def thothctl_version() -> str:
     description="Check if development environment tools are installed",
 )
 async def thothctl_check_environment() -> str:
-    return _run_cmd(["thothctl", "check", "environment"])
+    return await _run_cmd(["thothctl", "check", "environment"])
 
 
 @server.tool(
@@ -42,7 +46,7 @@ async def thothctl_check_environment() -> str:
     description="Check Infrastructure as Code artifacts like tfplan",
 )
 async def thothctl_check_iac() -> str:
-    return _run_cmd(["thothctl", "check", "iac"])
+    return await _run_cmd(["thothctl", "check", "iac"])
 
 
 @server.tool(
@@ -50,7 +54,7 @@ async def thothctl_check_iac() -> str:
     description="Check project structure and configuration",
 )
 async def thothctl_check_project() -> str:
-    return _run_cmd(["thothctl", "check", "project"])
+    return await _run_cmd(["thothctl", "check", "project"])
 
 
 # --- Document commands ---
@@ -61,7 +65,7 @@ async def thothctl_check_project() -> str:
     description="Generate documentation for Infrastructure as Code",
 )
 async def thothctl_document_iac() -> str:
-    return _run_cmd(["thothctl", "document", "iac"])
+    return await _run_cmd(["thothctl", "document", "iac"])
 
 
 # --- Generate commands ---
@@ -72,7 +76,7 @@ async def thothctl_document_iac() -> str:
     description="Generate infrastructure stacks from YAML configuration",
 )
 async def thothctl_generate_stacks() -> str:
-    return _run_cmd(["thothctl", "generate", "stacks"])
+    return await _run_cmd(["thothctl", "generate", "stacks"])
 
 
 @server.tool(
@@ -142,7 +146,7 @@ async def thothctl_generate_iac(
     if plan_validation != "disabled":
         cmd.extend(["--plan-validation", plan_validation])
 
-    return _run_cmd(cmd, timeout=600)
+    return await _run_cmd(cmd, timeout=600)
 
 
 # --- Init commands ---
@@ -153,7 +157,7 @@ async def thothctl_generate_iac(
     description="Initialize development environment with required tools",
 )
 async def thothctl_init_env() -> str:
-    return _run_cmd(["thothctl", "init", "env"])
+    return await _run_cmd(["thothctl", "init", "env"])
 
 
 @server.tool(
@@ -176,7 +180,7 @@ async def thothctl_init_project(
     ]
     if space:
         cmd.extend(["--space", space])
-    return _run_cmd(cmd)
+    return await _run_cmd(cmd)
 
 
 @server.tool(
@@ -184,7 +188,7 @@ async def thothctl_init_project(
     description="Initialize a new infrastructure space for multi-tenancy",
 )
 async def thothctl_init_space(space_name: str) -> str:
-    return _run_cmd(["thothctl", "init", "space", "--space-name", space_name])
+    return await _run_cmd(["thothctl", "init", "space", "--space-name", space_name])
 
 
 # --- Inventory commands ---
@@ -203,7 +207,7 @@ async def thothctl_inventory_iac(
         cmd.append("--check-versions")
     if project_name:
         cmd.extend(["--project-name", project_name])
-    return _run_cmd(cmd, timeout=300)
+    return await _run_cmd(cmd, timeout=300)
 
 
 # --- List commands ---
@@ -213,12 +217,12 @@ async def thothctl_inventory_iac(
     name="thothctl_list_projects", description="List all IaC projects in current space"
 )
 async def thothctl_list_projects() -> str:
-    return _run_cmd(["thothctl", "list", "projects"])
+    return await _run_cmd(["thothctl", "list", "projects"])
 
 
 @server.tool(name="thothctl_list_spaces", description="List all infrastructure spaces")
 async def thothctl_list_spaces() -> str:
-    return _run_cmd(["thothctl", "list", "spaces"])
+    return await _run_cmd(["thothctl", "list", "spaces"])
 
 
 @server.tool(
@@ -226,7 +230,7 @@ async def thothctl_list_spaces() -> str:
     description="List available project templates from VCS",
 )
 async def thothctl_list_templates() -> str:
-    return _run_cmd(["thothctl", "list", "templates"])
+    return await _run_cmd(["thothctl", "list", "templates"])
 
 
 # --- Project commands ---
@@ -237,7 +241,7 @@ async def thothctl_list_templates() -> str:
     description="Clean up project cache and temporary files",
 )
 async def thothctl_project_cleanup() -> str:
-    return _run_cmd(["thothctl", "project", "cleanup"])
+    return await _run_cmd(["thothctl", "project", "cleanup"])
 
 
 @server.tool(
@@ -248,7 +252,7 @@ async def thothctl_project_convert(target_type: Optional[str] = None) -> str:
     cmd = ["thothctl", "project", "convert"]
     if target_type:
         cmd.extend(["--target-type", target_type])
-    return _run_cmd(cmd)
+    return await _run_cmd(cmd)
 
 
 # --- Remove commands ---
@@ -259,12 +263,14 @@ async def thothctl_project_convert(target_type: Optional[str] = None) -> str:
     description="Remove a project from the current space",
 )
 async def thothctl_remove_project(project_name: str) -> str:
-    return _run_cmd(["thothctl", "remove", "project", "--project-name", project_name])
+    return await _run_cmd(
+        ["thothctl", "remove", "project", "--project-name", project_name]
+    )
 
 
 @server.tool(name="thothctl_remove_space", description="Remove an infrastructure space")
 async def thothctl_remove_space(space_name: str) -> str:
-    return _run_cmd(["thothctl", "remove", "space", "--space-name", space_name])
+    return await _run_cmd(["thothctl", "remove", "space", "--space-name", space_name])
 
 
 # --- Scan commands ---
@@ -283,7 +289,7 @@ async def thothctl_scan_iac(
         cmd.extend(["--tools", tool])
     if enforcement:
         cmd.extend(["--enforcement", enforcement])
-    return _run_cmd(cmd, timeout=300)
+    return await _run_cmd(cmd, timeout=300)
 
 
 # --- Cost analysis ---
@@ -297,7 +303,7 @@ async def thothctl_cost_analysis(recursive: bool = False) -> str:
     cmd = ["thothctl", "check", "iac", "-type", "cost-analysis"]
     if recursive:
         cmd.append("--recursive")
-    return _run_cmd(cmd, timeout=120)
+    return await _run_cmd(cmd, timeout=120)
 
 
 # --- Drift detection ---
@@ -325,7 +331,7 @@ async def thothctl_drift_detection(
         cmd.extend(["--ai-provider", ai_provider])
     if ai_model:
         cmd.extend(["--ai-model", ai_model])
-    return _run_cmd(cmd, timeout=300)
+    return await _run_cmd(cmd, timeout=300)
 
 
 # --- AI Review ---
@@ -349,7 +355,7 @@ async def thothctl_ai_review(
     if mode == "orchestrate" and agents:
         for agent in agents:
             cmd.extend(["-a", agent])
-    return _run_cmd(cmd, timeout=300)
+    return await _run_cmd(cmd, timeout=300)
 
 
 # --- Upgrade ---
@@ -362,7 +368,7 @@ async def thothctl_upgrade(check_only: bool = False) -> str:
     cmd = ["thothctl", "upgrade"]
     if check_only:
         cmd.append("--check-only")
-    return _run_cmd(cmd)
+    return await _run_cmd(cmd)
 
 
 # --- Workflow ---
@@ -386,7 +392,7 @@ async def thothctl_workflow_devsecops(
     if tools:
         for tool in tools:
             cmd.extend(["-t", tool])
-    return _run_cmd(cmd, timeout=300)
+    return await _run_cmd(cmd, timeout=300)
 
 
 @server.tool(
@@ -400,7 +406,61 @@ async def thothctl_workflow_run(
     cmd = ["thothctl", "workflow", "run", "-f", file]
     if dry_run:
         cmd.append("--dry-run")
-    return _run_cmd(cmd, timeout=300)
+    return await _run_cmd(cmd, timeout=300)
+
+
+# --- Background jobs ---
+
+
+@server.tool(
+    name="thothctl_scan_iac_start",
+    description=(
+        "Start a security scan in the background and return a job ID. "
+        "Poll progress with thothctl_job_status."
+    ),
+)
+async def thothctl_scan_iac_start(
+    tools: Optional[list] = None,
+    enforcement: Optional[str] = None,
+) -> str:
+    cmd = ["thothctl", "scan", "iac"]
+    for tool in tools or ["checkov"]:
+        cmd.extend(["--tools", tool])
+    if enforcement:
+        cmd.extend(["--enforcement", enforcement])
+    job = jobs.start(cmd, timeout=1800)
+    return json.dumps(job.to_dict())
+
+
+@server.tool(
+    name="thothctl_job_status",
+    description=(
+        "Get status and new output lines of a background job. "
+        "Pass the previous next_offset to receive only new output."
+    ),
+)
+async def thothctl_job_status(job_id: str, offset: int = 0) -> str:
+    job = jobs.get(job_id)
+    if job is None:
+        return f"Error: unknown job {job_id}"
+    return json.dumps(job.to_dict(offset))
+
+
+@server.tool(name="thothctl_job_list", description="List background jobs")
+async def thothctl_job_list() -> str:
+    return json.dumps(
+        [
+            {k: v for k, v in job.to_dict().items() if k != "output"}
+            for job in jobs.list_jobs()
+        ]
+    )
+
+
+@server.tool(name="thothctl_job_cancel", description="Cancel a background job")
+async def thothctl_job_cancel(job_id: str) -> str:
+    if jobs.get(job_id) is None:
+        return f"Error: unknown job {job_id}"
+    return json.dumps({"job_id": job_id, "cancelled": jobs.cancel(job_id)})
 
 
 @server.tool(
@@ -408,14 +468,19 @@ async def thothctl_workflow_run(
     description="Interactive guided onboarding for new projects",
 )
 async def thothctl_quickstart() -> str:
-    return _run_cmd(["thothctl", "quickstart"])
+    return await _run_cmd(["thothctl", "quickstart"])
 
 
 # --- Entry point ---
 
 
-async def serve_amazon_q():
-    """Run the MCP server in stdio mode."""
+async def serve_amazon_q(max_concurrent: int = DEFAULT_MAX_CONCURRENT):
+    """Run the MCP server in stdio mode.
+
+    Args:
+        max_concurrent: Maximum number of thothctl commands running at once.
+    """
+    jobs.max_concurrent = max(1, max_concurrent)
     await server.run_stdio_async()
 
 
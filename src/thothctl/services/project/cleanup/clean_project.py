@@ -1,25 +1,138 @@
 """Clean up files and folders into a project."""
 
+import fnmatch
+import logging
 import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable, List, Tuple
 
 import inquirer
 from colorama import Fore
 
 from ....common.common import dump_iac_conf, load_iac_conf
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLEANUP_FOLDERS = (".terraform", ".terragrunt-cache")
+DEFAULT_CLEANUP_FILES = ("*tfplan*",)
+DEFAULT_CLEANUP_WORKERS = 8
+
+
+@dataclass
+class CleanupStats:
+    """What a cleanup removed (or, in a dry run, would remove)."""
+
+    folders: int = 0
+    files: int = 0
+    bytes: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+
+
+def _matches(name: str, patterns: Iterable[str]) -> bool:
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+
+
+def find_cleanup_targets(
+    directory, folder_patterns: Iterable[str], file_patterns: Iterable[str]
+) -> Tuple[List[str], List[str]]:
+    """Folders and files to remove, found in one walk.
+
+    Matched folders are pruned from the walk, so nothing inside a folder that
+    is going to be deleted is ever visited.
+    """
+    folder_patterns = list(folder_patterns)
+    file_patterns = list(file_patterns)
+    folders, files = [], []
+    for dirpath, dirnames, filenames in os.walk(directory):
+        keep = []
+        for name in dirnames:
+            if _matches(name, folder_patterns):
+                folders.append(os.path.join(dirpath, name))
+            else:
+                keep.append(name)
+        dirnames[:] = keep
+        files.extend(
+            os.path.join(dirpath, name)
+            for name in filenames
+            if _matches(name, file_patterns)
+        )
+    return folders, files
+
+
+def _purge(path: str, dry_run: bool) -> Tuple[int, int]:
+    """Remove ``path`` recursively; returns (files, bytes).
+
+    Sizes are counted while deleting, so the tree is only traversed once.
+    Symlinks are removed, never followed.
+    """
+    if not os.path.isdir(path) or os.path.islink(path):
+        size = os.lstat(path).st_size
+        if not dry_run:
+            os.unlink(path)
+        return 1, size
+
+    files = size = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                sub_files, sub_size = _purge(entry.path, dry_run)
+                files += sub_files
+                size += sub_size
+                continue
+            files += 1
+            size += entry.stat(follow_symlinks=False).st_size
+            if not dry_run:
+                os.unlink(entry.path)
+    if not dry_run:
+        os.rmdir(path)
+    return files, size
+
+
+def _purge_logged(path: str, dry_run: bool) -> Tuple[int, int, bool]:
+    try:
+        return (*_purge(path, dry_run), True)
+    except OSError as e:
+        if dry_run:
+            logger.warning(f"Could not measure {path}: {e}")
+            return 0, 0, False
+        # e.g. read-only files on Windows; let shutil deal with what's left
+        logger.debug(f"Falling back to shutil.rmtree for {path}: {e}")
+        shutil.rmtree(path, ignore_errors=True)
+        ok = not os.path.lexists(path)
+        if not ok:
+            logger.warning(f"Could not remove {path}: {e}")
+        return 0, 0, ok
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} B"
+        size /= 1024
+    return f"{size:.1f} TiB"
+
 
 def cleanup_project(
-    directory, additional_files: str = None, additional_folders: str = None
-):
+    directory,
+    additional_files: str = None,
+    additional_folders: str = None,
+    dry_run: bool = False,
+    workers: int = DEFAULT_CLEANUP_WORKERS,
+) -> CleanupStats:
     """
     Clean up files and folders into a project.
 
     :param directory:
-    :param additional_files:
-    :param additional_folders:
-    :return:
+    :param additional_files: Comma-separated file names or glob patterns
+    :param additional_folders: Comma-separated folder names or glob patterns
+    :param dry_run: Only report what would be removed and how much space it frees
+    :param workers: Number of folders/files deleted in parallel
+    :return: Removal statistics
     """
     additional_files = (
         additional_files.split(",") if additional_files is not None else []
@@ -27,25 +140,62 @@ def cleanup_project(
     additional_folders = (
         additional_folders.split(",") if additional_folders is not None else []
     )
+    folder_patterns = [*DEFAULT_CLEANUP_FOLDERS, *filter(None, additional_folders)]
+    file_patterns = [*DEFAULT_CLEANUP_FILES, *filter(None, additional_files)]
 
+    verb = "Would clean" if dry_run else "Clean"
     print(f"{Fore.LIGHTBLUE_EX}👾 Cleaning project files ... {Fore.RESET}")
-    for dirpath, dirnames, filenames in os.walk(directory):
-        if any(ext in dirpath for ext in [".terraform", ".terragrunt-cache"]):
-            print(f"{Fore.LIGHTBLUE_EX}👾 Clean folder {dirpath} {Fore.RESET}")
-            shutil.rmtree(dirpath)
-
-        for f in filenames:
-            if any(cond for cond in ["tfplan" in f, f in additional_files]):
-                print(f"{Fore.LIGHTBLUE_EX}👾 Clean file {f} {Fore.RESET}")
-
-                file = Path(dirpath).joinpath(f)
-                os.remove(file)
-
-        if additional_folders is not None:
-            for d in additional_folders:
-                if d in dirpath:
-                    print(f"{Fore.LIGHTBLUE_EX}👾 Clean folder {dirpath} {Fore.RESET}")
-                    shutil.rmtree(dirpath)
+    started = time.perf_counter()
+    folders, files = find_cleanup_targets(directory, folder_patterns, file_patterns)
+    targets = [(path, "folder") for path in folders] + [
+        (path, "file") for path in files
+    ]
+
+    stats = CleanupStats()
+    if targets:
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(targets))),
+            thread_name_prefix="cleanup",
+        ) as pool:
+            results = pool.map(lambda t: _purge_logged(t[0], dry_run), targets)
+            for (path, kind), (count, size, ok) in zip(targets, results):
+                if not ok:
+                    stats.errors += 1
+                    continue
+                if kind == "folder":
+                    stats.folders += 1
+                print(
+                    f"{Fore.LIGHTBLUE_EX}👾 {verb} {kind} {path} "
+                    f"({_format_bytes(size)}) {Fore.RESET}"
+                )
+                stats.files += count
+                stats.bytes += size
+    stats.seconds = time.perf_counter() - started
+
+    _print_cleanup_summary(stats, dry_run)
+    return stats
+
+
+def _print_cleanup_summary(stats: CleanupStats, dry_run: bool) -> None:
+    if dry_run:
+        print(
+            f"{Fore.YELLOW}🔍 Dry run: {_format_bytes(stats.bytes)} reclaimable in "
+            f"{stats.files} file(s), including {stats.folders} folder(s). "
+            f"Nothing was removed.{Fore.RESET}"
+        )
+        return
+    elapsed = max(stats.seconds, 1e-6)
+    print(
+        f"{Fore.GREEN}🧹 Removed {stats.folders} folder(s) and {stats.files} file(s), "
+        f"{_format_bytes(stats.bytes)} in {stats.seconds:.2f}s "
+        f"({stats.files / elapsed:.0f} files/s, "
+        f"{_format_bytes(stats.bytes / elapsed)}/s){Fore.RESET}"
+    )
+    if stats.errors:
+        print(
+            f"{Fore.RED}💥 {stats.errors} item(s) could not be removed; "
+            f"run with --debug for details.{Fore.RESET}"
+        )
 
 
 def remove_projects(project_name: str):
@@ -7,6 +7,7 @@ import inquirer
 from colorama import Fore
 
 from ....common.common import dump_iac_conf, load_iac_conf
+from ....common.registry import atomic_write_toml
 
 
 def get_projects_in_space(space_name: str):
@@ -132,8 +133,7 @@ def remove_space(space_name: str, remove_projects: bool = False):
         )
 
         # Save updated spaces configuration
-        with open(spaces_config_path, mode="wt", encoding="utf-8") as fp:
-            toml.dump(spaces_config, fp)
+        atomic_write_toml(spaces_config_path, spaces_config)
 
     # Save updated main configuration (for project associations)
     dump_iac_conf(content=conf)
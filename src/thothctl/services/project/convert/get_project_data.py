@@ -12,6 +12,7 @@ from colorama import Fore
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ....common.common import load_iac_conf
+from .placeholder_engine import PlaceholderEngine, collect_files, rewrite_files
 
 logger = logging.getLogger(__name__)
 
@@ -101,191 +102,34 @@ def replace_template_placeholders(
 
     print(f"{Fore.LIGHTBLUE_EX}👷 Replacing template placeholders... {Fore.RESET}")
 
-    # Count total files to process
-    total_files = 0
-    for dirpath, dirnames, filenames in os.walk(directory):
-        if any(x in dirpath for x in not_allowed_folders):
-            continue
-        for f in filenames:
-            if (
-                f.split(".")[-1] not in excluded_extensions
-                and f not in excluded_extensions
-            ):
-                total_files += 1
+    if action == "make_template":
+        # Convert values to placeholders; project properties win over the
+        # mapping when both name a parameter or share a value
+        all_params = list(project_properties.items())
+        for param, value in parameter_mapping.items():
+            if param not in project_properties:
+                all_params.append((param, value))
+        engine = PlaceholderEngine.to_placeholders(all_params)
+    else:
+        # Replace #{parameter}# placeholders with values
+        engine = PlaceholderEngine.to_values(
+            {**parameter_mapping, **project_properties}
+        )
+
+    files = collect_files(directory, not_allowed_folders, excluded_extensions)
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=True,
     ) as progress:
-        task = progress.add_task(
-            f"Processing {total_files} files...", total=total_files
-        )
+        task = progress.add_task(f"Processing {len(files)} files...", total=len(files))
+        changed = rewrite_files(files, engine, on_done=lambda _: progress.advance(task))
 
-        for dirpath, dirnames, filenames in os.walk(directory):
-            # Skip not allowed folders
-            if any(x in dirpath for x in not_allowed_folders):
-                continue
-
-            for f in filenames:
-                # Skip files with binary extensions
-                if f.split(".")[-1] in excluded_extensions or f in excluded_extensions:
-                    continue
-
-                file_path = os.path.join(dirpath, f)
-                try:
-                    # Try to detect if file is binary
-                    is_binary = False
-                    try:
-                        with open(file_path, "r", encoding="utf-8") as test_file:
-                            test_file.read(1024)  # Try to read a small chunk
-                    except UnicodeDecodeError:
-                        is_binary = True
-
-                    if is_binary:
-                        progress.advance(task)
-                        continue
-
-                    # Read file content
-                    with open(file_path, "r", encoding="utf-8") as file:
-                        data = file.read()
-
-                    # Track if any replacements were made
-                    replaced = False
-
-                    if action == "make_template":
-                        # Convert values to placeholders
-                        logger.debug(
-                            f"Converting values to template parameters in {os.path.relpath(file_path, directory)}"
-                        )
-
-                        # Values that are language keywords or too generic to safely replace globally
-                        reserved_words = {
-                            "default",
-                            "true",
-                            "false",
-                            "null",
-                            "none",
-                            "string",
-                            "number",
-                            "bool",
-                            "list",
-                            "map",
-                            "object",
-                            "any",
-                            "type",
-                            "variable",
-                            "resource",
-                            "module",
-                            "output",
-                            "locals",
-                            "data",
-                            "provider",
-                            "terraform",
-                            "required_providers",
-                            "backend",
-                            "source",
-                            "version",
-                        }
-
-                        # Sort parameters by value length (longest first) to avoid
-                        # partial replacements (e.g., replacing "us-east-1" before
-                        # "us-east-1-tfstate" would corrupt the longer value)
-                        all_params = list(project_properties.items())
-                        for param, value in parameter_mapping.items():
-                            if param not in project_properties:
-                                all_params.append((param, value))
-                        all_params.sort(
-                            key=lambda x: len(str(x[1])) if x[1] else 0, reverse=True
-                        )
-
-                        for param, value in all_params:
-                            if not value:
-                                continue
-                            str_value = str(value)
-
-                            # Skip values that are language keywords
-                            if str_value.lower() in reserved_words:
-                                logger.debug(
-                                    f"  • Skipping reserved word: {param}={str_value}"
-                                )
-                                continue
-
-                            # Skip very short values (<=3 chars like "dev", "aws", "qa")
-                            # unless they appear in a clear assignment context
-                            if len(str_value) <= 3:
-                                # Only replace short values in assignment patterns:
-                                # key = "value", key = 'value', key: "value"
-                                # Match: ="value" | = "value" | :"value" | : "value"
-                                pattern = re.compile(
-                                    r'([=:]\s*)"' + re.escape(str_value) + r'"'
-                                    r"|([=:]\s*)"
-                                    + re.escape(str_value)
-                                    + r"(?=\s*$|\s*[,}\]])",
-                                    re.MULTILINE,
-                                )
-                                placeholder = f"#{{{param}}}#"
-                                new_data = pattern.sub(
-                                    lambda m: m.group(0).replace(
-                                        str_value, placeholder
-                                    ),
-                                    data,
-                                )
-                            else:
-                                # For longer values, use word-boundary matching to avoid
-                                # replacing substrings (e.g., "dev" inside "developer")
-                                pattern = re.compile(
-                                    r"(?<![a-zA-Z0-9_\-/])"
-                                    + re.escape(str_value)
-                                    + r"(?![a-zA-Z0-9_\-/])"
-                                )
-                                placeholder = f"#{{{param}}}#"
-                                new_data = pattern.sub(placeholder, data)
-
-                            if new_data != data:
-                                data = new_data
-                                replaced = True
-                                logger.debug(f"  • {param}: {value} → {placeholder}")
-
-                    else:
-                        # Original logic: Replace placeholders with values
-                        # Find all placeholders in the format #{parameter}#
-                        placeholders = re.findall(r"#\{([^}]+)\}#", data)
-
-                        # Replace each found placeholder
-                        for param in placeholders:
-                            placeholder = f"#{{{param}}}#"
-
-                            # First check if the parameter exists in project_properties
-                            if param in project_properties:
-                                value = project_properties[param]
-                                data = data.replace(placeholder, str(value))
-                                replaced = True
-                                logger.debug(
-                                    f"Replaced {placeholder} with {value} in {os.path.relpath(file_path, directory)}"
-                                )
-                            # Then check if it's in our mapping
-                            elif param in parameter_mapping:
-                                value = parameter_mapping[param]
-                                data = data.replace(placeholder, str(value))
-                                replaced = True
-                                logger.debug(
-                                    f"Replaced {placeholder} with {value} in {os.path.relpath(file_path, directory)}"
-                                )
-
-                    # Write updated content back to file if replacements were made
-                    if replaced:
-                        with open(file_path, "w", encoding="utf-8") as file:
-                            file.write(data)
-
-                    progress.advance(task)
-
-                except Exception as e:
-                    # Log errors but continue processing
-                    logger.debug(
-                        f"Error processing {os.path.relpath(file_path, directory)}: {str(e)}"
-                    )
-                    progress.advance(task)
+    for file_path in changed:
+        logger.debug(
+            f"Replaced template parameters in {os.path.relpath(file_path, directory)}"
+        )
 
     print(f"{Fore.GREEN}✅ Template placeholders replaced successfully!{Fore.RESET}")
 
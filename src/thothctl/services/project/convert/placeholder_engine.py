@@ -0,0 +1,233 @@
+"""Single-pass placeholder substitution for project conversion.
+
+All parameters are compiled into one alternation regex, longest alternative
+first. Each file is then scanned once however many parameters there are, and
+a value is never replaced inside a longer one. The tree is walked once, and
+files are rewritten in a thread pool, only when their content changes.
+"""
+
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+)
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER_PATTERN = re.compile(r"#\{([^}]+)\}#")
+BINARY_SNIFF_BYTES = 8192
+DEFAULT_WORKERS = 8
+
+# Values up to this length ("dev", "aws", "qa") are only replaced in an
+# assignment context: key = "value", key: value
+SHORT_VALUE_MAX_LENGTH = 3
+_WORD_CHARS = r"a-zA-Z0-9_\-/"
+
+# Values that are language keywords or too generic to safely replace globally
+RESERVED_WORDS = frozenset(
+    {
+        "default",
+        "true",
+        "false",
+        "null",
+        "none",
+        "string",
+        "number",
+        "bool",
+        "list",
+        "map",
+        "object",
+        "any",
+        "type",
+        "variable",
+        "resource",
+        "module",
+        "output",
+        "locals",
+        "data",
+        "provider",
+        "terraform",
+        "required_providers",
+        "backend",
+        "source",
+        "version",
+    }
+)
+
+
+def placeholder(param: str) -> str:
+    return f"#{{{param}}}#"
+
+
+def _alternation(values: Iterable[str]) -> str:
+    return "|".join(re.escape(v) for v in sorted(values, key=len, reverse=True))
+
+
+class PlaceholderEngine:
+    """A compiled matcher plus the function that rewrites each match."""
+
+    def __init__(
+        self, pattern: Optional[Pattern], replace: Callable[[Match], str]
+    ) -> None:
+        self.pattern = pattern
+        self._replace = replace
+
+    def apply(self, text: str) -> str:
+        if self.pattern is None:
+            return text
+        return self.pattern.sub(self._replace, text)
+
+    @classmethod
+    def to_values(cls, values: Dict[str, Any]) -> "PlaceholderEngine":
+        """Replace ``#{param}#`` with its value; unknown placeholders are kept."""
+
+        def replace(match: Match) -> str:
+            param = match.group(1)
+            return str(values[param]) if param in values else match.group(0)
+
+        return cls(PLACEHOLDER_PATTERN, replace)
+
+    @classmethod
+    def to_placeholders(cls, params: Sequence[Tuple[str, Any]]) -> "PlaceholderEngine":
+        """Replace parameter values with ``#{param}#``.
+
+        Longer values must stand on their own, not be part of a larger word or
+        path. Short values are only replaced where they are assigned. Empty and
+        reserved values are ignored. When several parameters share a value,
+        the first one wins.
+        """
+        long_values: Dict[str, str] = {}
+        short_values: Dict[str, str] = {}
+        for param, value in params:
+            if not value:
+                continue
+            text = str(value)
+            if text.lower() in RESERVED_WORDS:
+                logger.debug(f"  • Skipping reserved word: {param}={text}")
+                continue
+            target = (
+                short_values if len(text) <= SHORT_VALUE_MAX_LENGTH else long_values
+            )
+            target.setdefault(text, placeholder(param))
+
+        alternatives = []
+        if long_values:
+            alternatives.append(
+                rf"(?<![{_WORD_CHARS}])(?P<long>{_alternation(long_values)})"
+                rf"(?![{_WORD_CHARS}])"
+            )
+        if short_values:
+            short = _alternation(short_values)
+            alternatives.append(
+                rf'(?P<prefix>[=:]\s*)(?:"(?P<quoted>{short})"'
+                rf"|(?P<bare>{short})(?=\s*$|\s*[,}}\]]))"
+            )
+        if not alternatives:
+            return cls(None, lambda match: match.group(0))
+
+        def replace(match: Match) -> str:
+            if match.group("long") is not None:
+                return long_values[match.group("long")]
+            prefix = match.group("prefix")
+            if match.group("quoted") is not None:
+                return f'{prefix}"{short_values[match.group("quoted")]}"'
+            return prefix + short_values[match.group("bare")]
+
+        return cls(re.compile("|".join(alternatives), re.MULTILINE), replace)
+
+    @classmethod
+    def literals(cls, replacements: Dict[str, str]) -> "PlaceholderEngine":
+        """Plain string replacement of every key, longest key first."""
+        replacements = {k: v for k, v in replacements.items() if k}
+        if not replacements:
+            return cls(None, lambda match: match.group(0))
+        return cls(
+            re.compile(_alternation(replacements)),
+            lambda match: replacements[match.group(0)],
+        )
+
+
+def collect_files(
+    directory, skip_dirs: Iterable[str], skip_names: Iterable[str]
+) -> List[str]:
+    """Files under ``directory`` in one walk, pruning ``skip_dirs``.
+
+    A file is skipped when its name or its last extension is in ``skip_names``.
+    """
+    skip_dirs = set(skip_dirs)
+    skip_names = set(skip_names)
+    files = []
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames[:] = [d for d in dirnames if d not in skip_dirs]
+        for name in filenames:
+            if name in skip_names or name.split(".")[-1] in skip_names:
+                continue
+            files.append(os.path.join(dirpath, name))
+    return files
+
+
+def rewrite_file(path: str, engine: PlaceholderEngine) -> bool:
+    """Apply ``engine`` to a text file; True if the file was rewritten.
+
+    Files with a NUL byte in the first buffer, or that are not UTF-8, are left
+    alone. Line endings are preserved.
+    """
+    with open(path, "rb") as file:
+        head = file.read(BINARY_SNIFF_BYTES)
+        if b"\0" in head:
+            return False
+        raw = head + file.read()
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return False
+
+    updated = engine.apply(text)
+    if updated == text:
+        return False
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        file.write(updated)
+    return True
+
+
+def _rewrite_logged(path: str, engine: PlaceholderEngine) -> bool:
+    try:
+        return rewrite_file(path, engine)
+    except OSError as e:
+        # Log errors but continue processing
+        logger.debug(f"Error processing {path}: {e}")
+        return False
+
+
+def rewrite_files(
+    files: Sequence[str],
+    engine: PlaceholderEngine,
+    workers: int = DEFAULT_WORKERS,
+    on_done: Optional[Callable[[str], None]] = None,
+) -> List[str]:
+    """Rewrite ``files`` concurrently; returns the ones that changed."""
+    changed = []
+    if not files:
+        return changed
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(workers, len(files))),
+        thread_name_prefix="placeholders",
+    ) as pool:
+        results = pool.map(lambda path: _rewrite_logged(path, engine), files)
+        for path, was_changed in zip(files, results):
+            if was_changed:
+                changed.append(path)
+            if on_done is not None:
+                on_done(path)
+    return changed
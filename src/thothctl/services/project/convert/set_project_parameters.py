@@ -13,6 +13,7 @@ from colorama import Fore
 from git import Repo
 
 from .get_project_data import check_template_properties, get_project_props
+from .placeholder_engine import PlaceholderEngine, rewrite_file
 from .project_defaults import (
     g_catalog_spec,
     g_catalog_tags,
@@ -31,32 +32,19 @@ def inv_parse_project(
     :param project_properties_parse:
     :return:
     """
-    # creating a variable and storing the text that we want to search
     if project_properties != {}:
         if project_properties_parse is None:
             project_properties_parse = g_project_properties_parse
-        for prop in project_properties_parse.keys():
-            replace = f'"{project_properties_parse[prop]}"'
-            search = f'"{project_properties.get(prop, None)}"'
-
-            if search != "None":
-                # Opening our text file in read only
-                # mode using the open() function
-                with open(file_name, "r") as file:
-                    # Reading the content of the file
-                    # using the read() function and storing
-                    # them in a new variable
-                    data = file.read()
-
-                    # Searching and replacing the text
-                    # using the replace() function
-                    data = data.replace(search, replace)
-
-                with open(file_name, "w") as file:
-                    file.write(data)
-
-                # Log replacement at debug level
-                logging.debug(f"Text {search} replaced in {file_name} by {replace}")
+        replacements = {}
+        for prop, template_value in project_properties_parse.items():
+            if project_properties.get(prop) is not None:
+                # As with sequential replaces, the first property claims a value
+                replacements.setdefault(
+                    f'"{project_properties[prop]}"', f'"{template_value}"'
+                )
+        # One read and at most one write, whatever the number of properties
+        if rewrite_file(str(file_name), PlaceholderEngine.literals(replacements)):
+            logging.debug(f"Project properties replaced in {file_name}")
     else:
         print(f"{Fore.RED}No project properties found. {Fore.RESET} ")
 
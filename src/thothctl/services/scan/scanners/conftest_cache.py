@@ -0,0 +1,153 @@
+"""Helpers for sharded, cached conftest runs.
+
+Conftest results are cached per input file under
+``.thothctl/conftest-cache/<bundle key>.json``. The bundle key hashes every
+``.rego`` file of the policy directory, the ``--data`` files and the conftest
+options, so editing a policy or its parameters starts a fresh cache; inside a
+bundle, entries are keyed by the SHA-256 of each input file. A repeat scan
+therefore only sends changed files to conftest.
+
+JUnit XML for the HTML pipeline is rendered from the JSON results, so each
+file is evaluated once.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = ".thothctl/conftest-cache"
+# Files per conftest process; keeps command lines well under ARG_MAX
+DEFAULT_SHARD_SIZE = 200
+
+# Bump when the entry layout changes so old entries are never reused
+CACHE_FORMAT_VERSION = 1
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _files_below(path: Path, pattern: str) -> List[Path]:
+    if path.is_file():
+        return [path]
+    return sorted(p for p in path.rglob(pattern) if p.is_file())
+
+
+def bundle_key(
+    policy_dir: str, data_paths: Iterable[str], options: Dict[str, str]
+) -> str:
+    """Hash of the policy bundle, the data files and the conftest options."""
+    digest = hashlib.sha256()
+    header = {"version": CACHE_FORMAT_VERSION, "options": options}
+    digest.update(json.dumps(header, sort_keys=True).encode("utf-8"))
+    policy = Path(policy_dir)
+    for label, paths in (
+        ("policy", _files_below(policy, "*.rego")),
+        ("data", [f for p in data_paths for f in _files_below(Path(p), "*")]),
+    ):
+        for path in paths:
+            name = path.relative_to(policy) if policy in path.parents else path
+            digest.update(f"\0{label}\0{name.as_posix()}\0".encode("utf-8"))
+            digest.update(hash_file(str(path)).encode("ascii"))
+    return digest.hexdigest()
+
+
+def shard(files: List[str], workers: int, shard_size: int) -> List[List[str]]:
+    """Split ``files`` into at least ``workers`` contiguous shards.
+
+    Each shard holds at most ``shard_size`` files.
+    """
+    if not files:
+        return []
+    count = max(workers, -(-len(files) // max(1, shard_size)))
+    size = -(-len(files) // count)
+    return [files[i : i + size] for i in range(0, len(files), size)]
+
+
+class ConftestResultCache:
+    """Conftest results per input file for one policy bundle."""
+
+    def __init__(self, cache_dir: Path, key: str):
+        self.path = Path(cache_dir) / f"{key}.json"
+        self._entries: Dict[str, List[Dict]] = {}
+        self._used: Dict[str, List[Dict]] = {}
+        try:
+            self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+
+    def get(self, file_hash: str) -> Optional[List[Dict]]:
+        results = self._entries.get(file_hash)
+        if results is not None:
+            self._used[file_hash] = results
+        return results
+
+    def put(self, file_hash: str, results: List[Dict]) -> None:
+        stored = [{k: v for k, v in r.items() if k != "filename"} for r in results]
+        self._entries[file_hash] = self._used[file_hash] = stored
+
+    def save(self) -> None:
+        """Write the entries of the files seen in this run (older ones drop out)."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self._used), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.debug(f"Failed to write conftest cache {self.path}: {e}")
+
+
+def results_to_junit(results: List[Dict], suite_name: str = "conftest") -> str:
+    """Render conftest JSON results as JUnit XML.
+
+    Every success, failure, warning and exception becomes a testcase named
+    ``<file> - <namespace> - <message>``; warnings pass and exceptions are
+    reported as skipped, matching how the JSON report counts them.
+    """
+    cases = []
+    failures = skipped = 0
+    for result in results:
+        filename = result.get("filename", "unknown")
+        namespace = result.get("namespace", "")
+        prefix = f"{filename} - {namespace}"
+        for _ in range(result.get("successes", 0)):
+            cases.append(
+                f"<testcase classname={quoteattr(filename)} "
+                f"name={quoteattr(prefix)}></testcase>"
+            )
+        for kind in ("failures", "warnings", "exceptions"):
+            for entry in result.get(kind, []):
+                msg = entry.get("msg", "")
+                attrs = (
+                    f"classname={quoteattr(filename)} "
+                    f"name={quoteattr(f'{prefix} - {msg}')}"
+                )
+                if kind == "failures":
+                    failures += 1
+                    body = f"<failure message={quoteattr(msg)}></failure>"
+                elif kind == "exceptions":
+                    skipped += 1
+                    body = f"<skipped message={quoteattr(msg)}></skipped>"
+                else:
+                    body = f"<system-out>{escape(msg)}</system-out>"
+                cases.append(f"<testcase {attrs}>{body}</testcase>")
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        "<testsuites>",
+        f'<testsuite tests="{len(cases)}" failures="{failures}" errors="0" '
+        f'skipped="{skipped}" time="0.000" name={quoteattr(suite_name)}>',
+        *cases,
+        "</testsuite>",
+        "</testsuites>",
+    ]
+    return "\n".join(lines) + "\n"
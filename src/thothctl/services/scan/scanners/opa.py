@@ -15,13 +15,26 @@ import json
 import logging
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ....core.cli_ui import ScannerUI
 from ....utils.platform_utils import find_executable
+from .conftest_cache import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_SHARD_SIZE,
+    ConftestResultCache,
+    bundle_key,
+    hash_file,
+    results_to_junit,
+    shard,
+)
 from .scanners import ScannerPort
 
+CONFTEST_TIMEOUT = 300
+DEFAULT_CONFTEST_WORKERS = min(4, os.cpu_count() or 1)
+
 
 class OPAScanner(ScannerPort):
     """OPA/Conftest scanner supporting both static HCL and plan-based evaluation."""
@@ -165,7 +178,7 @@ class OPAScanner(ScannerPort):
         json_report = os.path.join(report_dir, "conftest_results.json")
         junit_report = os.path.join(report_dir, "results_junitxml.xml")
 
-        # Run conftest with JSON output for parsing
+        # conftest options shared by every shard
         cmd_json = [
             conftest,
             "test",
@@ -173,84 +186,65 @@ class OPAScanner(ScannerPort):
             abs_policy,
             "--output",
             "json",
-            "--all-namespaces",
         ]
         # Add namespace if specified
         if options.get("namespace"):
-            cmd_json = [
-                conftest,
-                "test",
-                "--policy",
-                abs_policy,
-                "--output",
-                "json",
-                "--namespace",
-                options["namespace"],
-            ]
+            cmd_json.extend(["--namespace", options["namespace"]])
+        else:
+            cmd_json.append("--all-namespaces")
         # Add data files if specified
+        data_paths = []
         if options.get("data_dir"):
-            cmd_json.extend(["--data", options["data_dir"]])
+            data_paths.append(options["data_dir"])
 
         # Auto-detect JSON data files in the policy directory and pass via --data
         # conftest requires explicit --data to load JSON into the data namespace
         # (the --policy flag only loads .rego files)
-        for data_file in sorted(Path(abs_policy).glob("*.json")):
-            cmd_json.extend(["--data", str(data_file)])
+        data_paths.extend(str(f) for f in sorted(Path(abs_policy).glob("*.json")))
+        for data_path in data_paths:
+            cmd_json.extend(["--data", data_path])
 
-        cmd_json.extend(scan_files)
+        cache = None
+        if str(options.get("cache", "true")).lower() not in ("false", "0", "no"):
+            key = bundle_key(
+                abs_policy,
+                [os.path.join(abs_dir, p) for p in data_paths],
+                {"namespace": options.get("namespace", "")},
+            )
+            cache = ConftestResultCache(Path(abs_dir) / DEFAULT_CACHE_DIR, key)
 
         self.ui.start_scan_message(abs_dir)
         self.logger.info(f"Running conftest: {' '.join(cmd_json)}")
 
         try:
-            result_json = subprocess.run(
+            results, returncode, stderr = self._run_conftest(
                 cmd_json,
-                capture_output=True,
-                text=True,
-                timeout=300,
-                cwd=abs_dir,
+                sorted(scan_files),
+                abs_dir,
+                cache,
+                workers=int(options.get("workers", DEFAULT_CONFTEST_WORKERS)),
+                shard_size=int(options.get("shard_size", DEFAULT_SHARD_SIZE)),
             )
 
             # Save raw JSON report
             with open(json_report, "w") as f:
-                f.write(result_json.stdout or "[]")
+                json.dump(results, f, indent=2)
 
-            # Run again with JUnit output for the HTML report pipeline
-            cmd_junit = cmd_json.copy()
-            cmd_junit[cmd_junit.index("json")] = "junit"
-
-            result_junit = subprocess.run(
-                cmd_junit,
-                capture_output=True,
-                text=True,
-                timeout=300,
-                cwd=abs_dir,
-            )
-
-            # Write valid JUnit XML even when conftest returns empty output
-            # (e.g. policy dir has no .rego files matching the input)
-            empty_junit = (
-                '<?xml version="1.0" encoding="UTF-8"?>\n'
-                '<testsuites><testsuite tests="0" failures="0" '
-                'time="0.000" name="conftest"></testsuite></testsuites>\n'
-            )
+            # JUnit for the HTML report pipeline, rendered from the same results
             with open(junit_report, "w") as f:
-                f.write(
-                    result_junit.stdout if result_junit.stdout.strip() else empty_junit
-                )
+                f.write(results_to_junit(results))
 
-            # Parse JSON results
-            report_data, findings = self._parse_conftest_json(result_json.stdout)
+            report_data, findings = self._summarize_conftest_results(results)
 
             # Generate HTML report (unified style)
             self._generate_html_report(report_dir, report_data, findings, "Conftest")
 
             # conftest exit codes: 0=pass, 1=failure/violation, 2=error
-            if result_json.returncode == 2:
-                self.ui.show_error(f"Conftest error: {result_json.stderr}")
+            if returncode == 2:
+                self.ui.show_error(f"Conftest error: {stderr}")
                 return {
                     "status": "FAIL",
-                    "error": result_json.stderr,
+                    "error": stderr,
                     "report_path": report_dir,
                     "report_data": report_data,
                     "findings": findings,
@@ -266,13 +260,110 @@ class OPAScanner(ScannerPort):
             }
 
         except subprocess.TimeoutExpired:
-            self.ui.show_error("Conftest scan timed out after 300 seconds")
+            self.ui.show_error(
+                f"Conftest scan timed out after {CONFTEST_TIMEOUT} seconds"
+            )
             return {"status": "TIMEOUT", "error": "Scan timed out"}
         except Exception as e:
             self.logger.error(f"Conftest scan failed: {e}", exc_info=True)
             self.ui.show_error(f"Conftest scan failed: {e}")
             return {"status": "FAIL", "error": str(e)}
 
+    def _run_conftest(
+        self,
+        cmd: List[str],
+        scan_files: List[str],
+        cwd: str,
+        cache: Optional[ConftestResultCache],
+        workers: int = DEFAULT_CONFTEST_WORKERS,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+    ) -> Tuple[List[Dict], int, str]:
+        """Evaluate ``scan_files``, reusing cached results for unchanged files.
+
+        Files without a cached result are split into shards run as parallel
+        conftest processes. Results are merged in ``scan_files`` order, so the
+        output does not depend on shard timing.
+
+        Returns:
+            Tuple of (conftest JSON results, highest exit code, stderr)
+        """
+        hashes = {f: hash_file(f) for f in scan_files} if cache else {}
+        by_file: Dict[str, List[Dict]] = {}
+        pending = []
+        for path in scan_files:
+            cached = cache.get(hashes[path]) if cache else None
+            if cached is None:
+                pending.append(path)
+            else:
+                by_file[path] = [dict(r, filename=path) for r in cached]
+
+        shards = shard(pending, max(1, workers), shard_size)
+        self.logger.info(
+            f"Conftest: {len(scan_files) - len(pending)} cached, "
+            f"{len(pending)} to evaluate in {len(shards)} shard(s)"
+        )
+
+        def run(files: List[str]) -> subprocess.CompletedProcess:
+            return subprocess.run(
+                cmd + files,
+                capture_output=True,
+                text=True,
+                timeout=CONFTEST_TIMEOUT,
+                cwd=cwd,
+            )
+
+        outcomes = []
+        if shards:
+            with ThreadPoolExecutor(
+                max_workers=min(len(shards), max(1, workers)),
+                thread_name_prefix="conftest",
+            ) as executor:
+                outcomes = list(executor.map(run, shards))
+
+        returncode = 0
+        errors = []
+        extra: List[Dict] = []
+        for files, outcome in zip(shards, outcomes):
+            returncode = max(returncode, outcome.returncode)
+            if outcome.stderr.strip():
+                errors.append(outcome.stderr.strip())
+            try:
+                shard_results = json.loads(outcome.stdout)
+                parsed = isinstance(shard_results, list)
+            except json.JSONDecodeError:
+                parsed = False
+            if not parsed:
+                # Parse and config errors exit 1 without JSON: nothing was
+                # evaluated, so report an error instead of passing the files
+                shard_results = []
+                returncode = max(returncode, 2)
+                errors.append(
+                    f"conftest produced no JSON results for {len(files)} "
+                    f"file(s): {', '.join(files)}"
+                )
+            grouped: Dict[str, List[Dict]] = {}
+            for result in shard_results:
+                grouped.setdefault(result.get("filename", ""), []).append(result)
+            # Only a shard that parsed, did not error and reported every file
+            # is complete enough to cache
+            cacheable = (
+                cache is not None
+                and parsed
+                and outcome.returncode != 2
+                and all(path in grouped for path in files)
+            )
+            for path in files:
+                by_file[path] = grouped.pop(path, [])
+                if cacheable:
+                    cache.put(hashes[path], by_file[path])
+            for results in grouped.values():
+                extra.extend(results)
+
+        if cache:
+            cache.save()
+        merged = [r for path in scan_files for r in by_file.get(path, [])]
+        return merged + extra, returncode, "\n".join(errors)
+
     # ── OPA exec mode ──────────────────────────────────────────────────
 
     def _scan_with_opa(
@@ -394,7 +485,10 @@ class OPAScanner(ScannerPort):
             results = json.loads(stdout) if stdout else []
         except json.JSONDecodeError:
             return self._empty_report_data(), []
+        return self._summarize_conftest_results(results)
 
+    def _summarize_conftest_results(self, results: List[Dict]) -> tuple:
+        """Build report_data and findings from parsed conftest JSON results."""
         passed = sum(r.get("successes", 0) for r in results)
         failed = sum(len(r.get("failures", [])) for r in results)
         warnings = sum(len(r.get("warnings", [])) for r in results)
@@ -0,0 +1,118 @@
+"""State shared by the SDLC phases of a single workflow run."""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .models import Phase, PhaseResult
+
+logger = logging.getLogger(__name__)
+
+PLAN_FILE_NAME = "tfplan.json"
+
+
+class ProjectIndex:
+    """File index of a project, walked once and shared between phases.
+
+    Hidden directories and ``Reports`` output are skipped, matching what the
+    phases used to filter in their own ``os.walk``. Parsed ``tfplan.json``
+    files are cached by path and mtime so concurrent phases reading the same
+    plans only parse them once.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._files: Optional[List[str]] = None
+        self._plans: Dict[str, Any] = {}
+        self._plan_summary: Optional[Dict[str, int]] = None
+        self._lock = threading.Lock()
+
+    def files(self) -> List[str]:
+        """All indexed file paths, built on first use."""
+        with self._lock:
+            if self._files is None:
+                self._files = self._walk()
+            return self._files
+
+    def _walk(self) -> List[str]:
+        files = []
+        for root, dirs, names in os.walk(self.directory):
+            if any(part.startswith(".") for part in Path(root).parts):
+                continue
+            if "Reports" in root:
+                continue
+            files.extend(os.path.join(root, name) for name in names)
+        logger.debug(f"Indexed {len(files)} files under {self.directory}")
+        return files
+
+    def find(self, file_name: str) -> List[str]:
+        """Indexed paths whose base name is ``file_name``."""
+        return [f for f in self.files() if os.path.basename(f) == file_name]
+
+    def plan_files(self) -> List[str]:
+        return self.find(PLAN_FILE_NAME)
+
+    def load_plan(self, path: str) -> Optional[Dict[str, Any]]:
+        """Parsed plan JSON, or ``None`` if it cannot be read."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._plans.get(path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+        try:
+            with open(path, encoding="utf-8") as fp:
+                plan = json.load(fp)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not parse plan {path}: {e}")
+            plan = None
+        with self._lock:
+            self._plans[path] = (mtime, plan)
+        return plan
+
+    def plan_summary(self) -> Dict[str, int]:
+        """Number of plans and of resource changes other than no-op.
+
+        Computed on first use and shared by every reader in the run; the
+        phases themselves never parse plans for it.
+        """
+        if self._plan_summary is None:
+            self._plan_summary = self._summarize_plans()
+        return self._plan_summary
+
+    def _summarize_plans(self) -> Dict[str, int]:
+        plans = self.plan_files()
+        changes = 0
+        for path in plans:
+            plan = self.load_plan(path) or {}
+            for change in plan.get("resource_changes", []):
+                actions = change.get("change", {}).get("actions", [])
+                if actions and actions != ["no-op"]:
+                    changes += 1
+        return {"plans": len(plans), "resource_changes": changes}
+
+
+@dataclass
+class WorkflowContext:
+    """Shared index and finished phase results, passed as ``options["context"]``."""
+
+    directory: str
+    index: ProjectIndex = field(init=False)
+    results: Dict[Phase, PhaseResult] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.index = ProjectIndex(self.directory)
+
+    @classmethod
+    def from_options(cls, directory: str, options: Optional[Dict]) -> "WorkflowContext":
+        """Context of the current run, or a fresh one for standalone executors."""
+        context = (options or {}).get("context")
+        if isinstance(context, cls):
+            return context
+        return cls(directory)
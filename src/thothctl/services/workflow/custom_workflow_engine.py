@@ -1,9 +1,12 @@
 """Composable YAML workflow engine — custom DAG pipelines for ThothCTL commands."""
 
+import heapq
 import logging
 import subprocess
+import threading
 import time
 from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -11,9 +14,12 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 
+from .stage_cache import StageCache
+
 logger = logging.getLogger(__name__)
 console = Console()
 
@@ -33,6 +39,9 @@ class FailureAction(Enum):
     SKIP = "skip"
 
 
+STAGE_TIMEOUT_SECONDS = 300
+
+
 @dataclass
 class StageResult:
     name: str
@@ -40,6 +49,11 @@ class StageResult:
     duration_seconds: float = 0.0
     output: str = ""
     error: str = ""
+    # Offsets in seconds from the start of the workflow run
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    # True when the result was replayed from the stage cache
+    cached: bool = False
 
 
 @dataclass
@@ -50,6 +64,12 @@ class CustomStage:
     depends_on: List[str] = field(default_factory=list)
     on_failure: FailureAction = FailureAction.BLOCK
     condition: Optional[str] = None
+    # None inherits the workflow-level setting
+    continue_on_error: Optional[bool] = None
+    # Glob patterns whose contents key the stage cache; no inputs, no caching
+    inputs: List[str] = field(default_factory=list)
+    # Files or directories restored from the cache on a hit
+    outputs: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -59,6 +79,23 @@ class CustomWorkflow:
     trigger: str = "manual"
     variables: Dict[str, str] = field(default_factory=dict)
     stages: List[CustomStage] = field(default_factory=list)
+    max_parallel: int = 1
+    # When true, a blocking failure only skips the failed stage's dependents
+    # instead of stopping independent branches too
+    continue_on_error: bool = False
+
+
+@dataclass
+class WorkflowRunSummary:
+    wall_seconds: float
+    total_stage_seconds: float
+    critical_path: List[str]
+    critical_path_seconds: float
+
+    @property
+    def time_saved_seconds(self) -> float:
+        """Time gained by running independent stages in parallel."""
+        return max(0.0, self.total_stage_seconds - self.wall_seconds)
 
 
 class WorkflowValidationError(Exception):
@@ -68,8 +105,20 @@ class WorkflowValidationError(Exception):
 class CustomWorkflowEngine:
     """Parse, validate, and execute custom YAML workflows."""
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True, cache: Optional[StageCache] = None):
         self.variable_resolver = VariableResolver()
+        self.last_summary: Optional[WorkflowRunSummary] = None
+        self.use_cache = use_cache
+        self._cache = cache
+
+    @property
+    def cache(self) -> Optional[StageCache]:
+        """Stage result cache, or ``None`` when caching is disabled."""
+        if not self.use_cache:
+            return None
+        if self._cache is None:
+            self._cache = StageCache()
+        return self._cache
 
     def load(self, path: Path) -> CustomWorkflow:
         """Load and validate a workflow from YAML file."""
@@ -89,10 +138,25 @@ class CustomWorkflowEngine:
         return workflow
 
     def execute(self, workflow: CustomWorkflow) -> List[StageResult]:
-        """Execute workflow stages in topological order."""
+        """Execute workflow stages as a DAG.
+
+        Each stage starts as soon as all of its ``depends_on`` stages have
+        finished successfully, with at most ``workflow.max_parallel`` stages
+        running at once. Results are returned in topological order.
+        """
         order = self._topological_sort(workflow.stages)
+        stages = {s.name: s for s in workflow.stages}
+        position = {name: i for i, name in enumerate(order)}
+        dependents: Dict[str, List[str]] = {name: [] for name in order}
+        pending_deps = {name: len(stages[name].depends_on) for name in order}
+        for stage in workflow.stages:
+            for dep in stage.depends_on:
+                dependents[dep].append(stage.name)
+
         results: Dict[str, StageResult] = {}
+        ready: List[Any] = []
         blocked = False
+        max_parallel = max(1, workflow.max_parallel)
 
         console.print(
             Panel(
@@ -101,54 +165,108 @@ class CustomWorkflowEngine:
                 border_style="green",
             )
         )
-
-        for stage_name in order:
-            stage = next(s for s in workflow.stages if s.name == stage_name)
-
-            # Check if blocked by previous failure
-            if blocked:
-                results[stage_name] = StageResult(
-                    name=stage_name, status=StageStatus.SKIPPED
-                )
-                continue
-
-            # Check dependencies succeeded
-            deps_ok = all(
-                results.get(
-                    dep, StageResult(name=dep, status=StageStatus.FAILED)
-                ).status
-                in (StageStatus.SUCCESS, StageStatus.WARNED)
-                for dep in stage.depends_on
+        if max_parallel > 1:
+            console.print(f"[dim]Running up to {max_parallel} stages in parallel[/dim]")
+
+        def release(stage_name: str) -> None:
+            for child in dependents[stage_name]:
+                pending_deps[child] -= 1
+                if pending_deps[child] == 0:
+                    heapq.heappush(ready, (position[child], child))
+
+        for name in order:
+            if pending_deps[name] == 0:
+                heapq.heappush(ready, (position[name], name))
+
+        run_start = time.time()
+        with ThreadPoolExecutor(
+            max_workers=max_parallel, thread_name_prefix="workflow-stage"
+        ) as pool:
+            running: Dict[Any, str] = {}
+
+            while ready or running:
+                # Launch every ready stage while there are free slots
+                while ready and not blocked and len(running) < max_parallel:
+                    _, stage_name = heapq.heappop(ready)
+                    stage = stages[stage_name]
+
+                    deps_ok = all(
+                        results[dep].status in (StageStatus.SUCCESS, StageStatus.WARNED)
+                        for dep in stage.depends_on
+                    )
+                    if not deps_ok:
+                        results[stage_name] = StageResult(
+                            name=stage_name, status=StageStatus.SKIPPED
+                        )
+                        release(stage_name)
+                        continue
+
+                    console.print(
+                        f"\n[bold cyan]▶ {stage_name}[/bold cyan]: {stage.command}"
+                    )
+                    future = pool.submit(
+                        self._run_stage, stage, workflow.variables, run_start
+                    )
+                    running[future] = stage_name
+
+                if not running:
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: position[running[f]]):
+                    stage_name = running.pop(future)
+                    result = future.result()
+                    results[stage_name] = result
+                    if self._handle_stage_result(stages[stage_name], result, workflow):
+                        blocked = True
+                    release(stage_name)
+
+        # Stages never started because the pipeline was blocked
+        for name in order:
+            if name not in results:
+                results[name] = StageResult(name=name, status=StageStatus.SKIPPED)
+
+        ordered = [results[name] for name in order]
+        self.last_summary = self._summarize(workflow, ordered, time.time() - run_start)
+        self._render_summary(ordered, self.last_summary)
+        return ordered
+
+    def _handle_stage_result(
+        self, stage: CustomStage, result: StageResult, workflow: CustomWorkflow
+    ) -> bool:
+        """Apply the stage's failure policy.
+
+        Returns:
+            True if the whole pipeline must stop launching new stages.
+        """
+        if result.status != StageStatus.FAILED:
+            timing = "cached" if result.cached else f"{result.duration_seconds:.1f}s"
+            console.print(f"  [green]✔ {stage.name}[/green] ({timing})")
+            return False
+
+        if stage.on_failure == FailureAction.WARN:
+            result.status = StageStatus.WARNED
+            console.print(f"  [yellow]⚠ {stage.name} WARNING[/yellow] — continuing")
+            return False
+        if stage.on_failure == FailureAction.SKIP:
+            result.status = StageStatus.SKIPPED
+            console.print(f"  [dim]⏭ {stage.name} SKIPPED[/dim]")
+            return False
+
+        continue_on_error = (
+            stage.continue_on_error
+            if stage.continue_on_error is not None
+            else workflow.continue_on_error
+        )
+        if continue_on_error:
+            console.print(
+                f"  [red]✘ {stage.name} FAILED[/red] — dependent stages skipped, "
+                "other branches continue"
             )
-            if not deps_ok:
-                results[stage_name] = StageResult(
-                    name=stage_name, status=StageStatus.SKIPPED
-                )
-                continue
-
-            # Execute stage
-            console.print(f"\n[bold cyan]▶ {stage_name}[/bold cyan]: {stage.command}")
-            result = self._run_stage(stage, workflow.variables)
-            results[stage_name] = result
-
-            # Handle failure
-            if result.status == StageStatus.FAILED:
-                if stage.on_failure == FailureAction.BLOCK:
-                    console.print("  [red]✘ BLOCKED[/red] — pipeline stopped")
-                    blocked = True
-                elif stage.on_failure == FailureAction.WARN:
-                    result.status = StageStatus.WARNED
-                    console.print("  [yellow]⚠ WARNING[/yellow] — continuing")
-                elif stage.on_failure == FailureAction.SKIP:
-                    result.status = StageStatus.SKIPPED
-                    console.print("  [dim]⏭ SKIPPED[/dim]")
-            else:
-                console.print(
-                    f"  [green]✔ SUCCESS[/green] ({result.duration_seconds:.1f}s)"
-                )
+            return False
 
-        self._render_summary(list(results.values()))
-        return list(results.values())
+        console.print(f"  [red]✘ {stage.name} BLOCKED[/red] — pipeline stopped")
+        return True
 
     def show_plan(self, workflow: CustomWorkflow) -> None:
         """Show execution plan without running (dry-run)."""
@@ -162,20 +280,36 @@ class CustomWorkflowEngine:
             )
         )
 
+        stages = {s.name: s for s in workflow.stages}
+        waves: Dict[str, int] = {}
+
         table = Table(show_header=True, header_style="bold")
         table.add_column("#", width=3)
+        table.add_column("Wave", width=4)
         table.add_column("Stage")
         table.add_column("Command")
         table.add_column("Depends On")
         table.add_column("On Failure")
 
         for i, stage_name in enumerate(order, 1):
-            stage = next(s for s in workflow.stages if s.name == stage_name)
+            stage = stages[stage_name]
+            # Stages in the same wave have no dependency on each other
+            waves[stage_name] = 1 + max(
+                (waves[dep] for dep in stage.depends_on), default=0
+            )
             cmd_str = self._build_command_string(stage)
             deps = ", ".join(stage.depends_on) if stage.depends_on else "—"
-            table.add_row(str(i), stage.name, cmd_str, deps, stage.on_failure.value)
+            table.add_row(
+                str(i),
+                str(waves[stage_name]),
+                stage.name,
+                cmd_str,
+                deps,
+                stage.on_failure.value,
+            )
 
         console.print(table)
+        console.print(f"[dim]max_parallel: {max(1, workflow.max_parallel)}[/dim]")
 
     def _parse_workflow(self, data: Dict) -> CustomWorkflow:
         """Parse raw YAML dict into CustomWorkflow model."""
@@ -195,17 +329,39 @@ class CustomWorkflowEngine:
                     depends_on=stage_data.get("depends_on", []),
                     on_failure=on_failure,
                     condition=stage_data.get("condition"),
+                    continue_on_error=stage_data.get("continue_on_error"),
+                    inputs=self._as_list(stage_data.get("inputs"), "inputs"),
+                    outputs=self._as_list(stage_data.get("outputs"), "outputs"),
                 )
             )
 
+        max_parallel = data.get("max_parallel", 1)
+        if not isinstance(max_parallel, int) or isinstance(max_parallel, bool):
+            raise WorkflowValidationError("max_parallel must be an integer")
+        if max_parallel < 1:
+            raise WorkflowValidationError("max_parallel must be at least 1")
+
         return CustomWorkflow(
             name=data.get("name", "Unnamed Workflow"),
             description=data.get("description", ""),
             trigger=data.get("trigger", "manual"),
             variables=data.get("variables", {}),
             stages=stages,
+            max_parallel=max_parallel,
+            continue_on_error=bool(data.get("continue_on_error", False)),
         )
 
+    @staticmethod
+    def _as_list(value: Any, key: str) -> List[str]:
+        """Accept a single path/glob or a list of them."""
+        if value is None:
+            return []
+        if isinstance(value, str):
+            return [value]
+        if isinstance(value, list) and all(isinstance(v, str) for v in value):
+            return list(value)
+        raise WorkflowValidationError(f"{key} must be a string or a list of strings")
+
     def _validate_workflow(self, workflow: CustomWorkflow) -> None:
         """Validate workflow structure."""
         stage_names = {s.name for s in workflow.stages}
@@ -253,51 +409,121 @@ class CustomWorkflowEngine:
 
         return order
 
-    def _run_stage(self, stage: CustomStage, variables: Dict[str, str]) -> StageResult:
-        """Execute a single stage by invoking thothctl as subprocess."""
+    def _run_stage(
+        self,
+        stage: CustomStage,
+        variables: Dict[str, str],
+        run_start: Optional[float] = None,
+    ) -> StageResult:
+        """Execute a single stage by invoking thothctl as subprocess.
+
+        Output lines are streamed to the console prefixed with the stage
+        name so interleaved output of parallel stages stays readable.
+        Stages that declare ``inputs`` are looked up in the stage cache
+        first and recorded there after a successful run.
+        """
         cmd_str = self._build_command_string(stage)
         resolved_cmd = self.variable_resolver.resolve_string(cmd_str, variables)
 
         start = time.time()
+        run_start = run_start if run_start is not None else start
+        timed_out = threading.Event()
+
+        def _result(status: StageStatus, **kwargs) -> StageResult:
+            end = time.time()
+            return StageResult(
+                name=stage.name,
+                status=status,
+                duration_seconds=end - start,
+                started_at=start - run_start,
+                finished_at=end - run_start,
+                **kwargs,
+            )
+
+        cache = self.cache if stage.inputs else None
+        cache_key = None
+        if cache is not None:
+            try:
+                cache_key = cache.compute_key(resolved_cmd, variables, stage.inputs)
+                hit = cache.lookup(cache_key)
+            except OSError as e:
+                logger.warning(f"Stage cache unavailable for {stage.name}: {e}")
+                cache, hit = None, None
+            if hit is not None:
+                console.print(
+                    f"[dim]\\[{escape(stage.name)}][/dim] cache hit "
+                    f"({hit.key[:12]}), restored {len(hit.outputs)} output(s)",
+                    highlight=False,
+                )
+                status = (
+                    StageStatus.SUCCESS if hit.returncode == 0 else StageStatus.FAILED
+                )
+                return _result(status, output=hit.stdout, error=hit.stderr, cached=True)
+
         try:
-            result = subprocess.run(
+            process = subprocess.Popen(
                 resolved_cmd,
                 shell=True,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=300,
             )
-            duration = time.time() - start
 
-            if result.returncode == 0:
-                return StageResult(
-                    name=stage.name,
-                    status=StageStatus.SUCCESS,
-                    duration_seconds=duration,
-                    output=result.stdout,
+            def _kill() -> None:
+                timed_out.set()
+                process.kill()
+
+            timer = threading.Timer(STAGE_TIMEOUT_SECONDS, _kill)
+            timer.start()
+            stderr_chunks: List[str] = []
+            stderr_reader = threading.Thread(
+                target=lambda: stderr_chunks.append(process.stderr.read()),
+                daemon=True,
+            )
+            stderr_reader.start()
+            stdout_lines: List[str] = []
+            try:
+                for line in process.stdout:
+                    stdout_lines.append(line)
+                    console.print(
+                        f"[dim]\\[{escape(stage.name)}][/dim] {escape(line.rstrip())}",
+                        highlight=False,
+                    )
+                process.wait()
+                stderr_reader.join()
+            finally:
+                timer.cancel()
+
+            if timed_out.is_set():
+                return _result(
+                    StageStatus.FAILED,
+                    output="".join(stdout_lines),
+                    error=f"Stage timed out ({STAGE_TIMEOUT_SECONDS}s limit)",
                 )
+
+            if process.returncode == 0:
+                result = _result(StageStatus.SUCCESS, output="".join(stdout_lines))
+                if cache is not None and cache_key is not None:
+                    try:
+                        cache.store(
+                            cache_key,
+                            returncode=0,
+                            stdout=result.output,
+                            stderr="".join(stderr_chunks),
+                            outputs=stage.outputs,
+                            duration_seconds=result.duration_seconds,
+                        )
+                    except OSError as e:
+                        logger.warning(f"Could not cache stage {stage.name}: {e}")
+                return result
             else:
-                return StageResult(
-                    name=stage.name,
-                    status=StageStatus.FAILED,
-                    duration_seconds=duration,
-                    output=result.stdout,
-                    error=result.stderr,
+                return _result(
+                    StageStatus.FAILED,
+                    output="".join(stdout_lines),
+                    error="".join(stderr_chunks),
                 )
-        except subprocess.TimeoutExpired:
-            return StageResult(
-                name=stage.name,
-                status=StageStatus.FAILED,
-                duration_seconds=300.0,
-                error="Stage timed out (300s limit)",
-            )
         except Exception as e:
-            return StageResult(
-                name=stage.name,
-                status=StageStatus.FAILED,
-                duration_seconds=time.time() - start,
-                error=str(e),
-            )
+            return _result(StageStatus.FAILED, error=str(e))
 
     def _build_command_string(self, stage: CustomStage) -> str:
         """Build the thothctl command string from stage definition."""
@@ -314,7 +540,56 @@ class CustomWorkflowEngine:
                 parts.extend([flag, str(value)])
         return " ".join(parts)
 
-    def _render_summary(self, results: List[StageResult]) -> None:
+    def _summarize(
+        self,
+        workflow: CustomWorkflow,
+        results: List[StageResult],
+        wall_seconds: float,
+    ) -> WorkflowRunSummary:
+        """Compute the critical path and parallel savings of a run.
+
+        The critical path is the chain of dependent stages with the largest
+        total duration; it bounds the run time no matter how many stages
+        run in parallel.
+        """
+        by_name = {r.name: r for r in results}
+        stages = {s.name: s for s in workflow.stages}
+        path_time: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+
+        # results are in topological order, so dependencies come first
+        for result in results:
+            best_dep, best_time = None, 0.0
+            for dep in stages[result.name].depends_on:
+                if path_time.get(dep, 0.0) > best_time:
+                    best_dep, best_time = dep, path_time[dep]
+            path_time[result.name] = best_time + result.duration_seconds
+            previous[result.name] = best_dep
+
+        critical_path: List[str] = []
+        if path_time:
+            node: Optional[str] = max(path_time, key=lambda n: path_time[n])
+            critical_seconds = path_time[node]
+            while node is not None:
+                if by_name[node].duration_seconds > 0:
+                    critical_path.append(node)
+                node = previous[node]
+            critical_path.reverse()
+        else:
+            critical_seconds = 0.0
+
+        return WorkflowRunSummary(
+            wall_seconds=wall_seconds,
+            total_stage_seconds=sum(r.duration_seconds for r in results),
+            critical_path=critical_path,
+            critical_path_seconds=critical_seconds,
+        )
+
+    def _render_summary(
+        self,
+        results: List[StageResult],
+        summary: Optional[WorkflowRunSummary] = None,
+    ) -> None:
         """Render execution summary table."""
         console.print()
         table = Table(
@@ -322,6 +597,7 @@ class CustomWorkflowEngine:
         )
         table.add_column("Stage")
         table.add_column("Status")
+        table.add_column("Start")
         table.add_column("Duration")
 
         status_icons = {
@@ -332,14 +608,32 @@ class CustomWorkflowEngine:
         }
 
         for r in results:
+            if r.cached:
+                duration = "cached"
+            elif r.duration_seconds > 0:
+                duration = f"{r.duration_seconds:.1f}s"
+            else:
+                duration = "—"
             table.add_row(
                 r.name,
                 status_icons.get(r.status, str(r.status)),
-                f"{r.duration_seconds:.1f}s" if r.duration_seconds > 0 else "—",
+                f"+{r.started_at:.1f}s" if r.started_at is not None else "—",
+                duration,
             )
 
         console.print(table)
 
+        if summary and summary.critical_path:
+            console.print(
+                f"\n[bold]Critical path:[/bold] {' → '.join(summary.critical_path)} "
+                f"({summary.critical_path_seconds:.1f}s)"
+            )
+            console.print(
+                f"[bold]Wall time:[/bold] {summary.wall_seconds:.1f}s "
+                f"(stages total {summary.total_stage_seconds:.1f}s, "
+                f"saved {summary.time_saved_seconds:.1f}s by running in parallel)"
+            )
+
         # Overall status
         failed = sum(1 for r in results if r.status == StageStatus.FAILED)
         if failed:
@@ -48,6 +48,9 @@ class PhaseResult:
     steps: List[StepResult] = field(default_factory=list)
     passed: bool = True
     gate_blocked: bool = False
+    # Offsets in seconds from the start of the workflow run
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
 
     @property
     def total_findings(self) -> int:
@@ -57,6 +60,13 @@ class PhaseResult:
     def duration_seconds(self) -> float:
         return sum(s.duration_seconds for s in self.steps)
 
+    @property
+    def elapsed_seconds(self) -> float:
+        """Wall-clock time of the phase (steps may overlap other phases)."""
+        if self.started_at is None or self.finished_at is None:
+            return self.duration_seconds
+        return self.finished_at - self.started_at
+
 
 @dataclass
 class WorkflowResult:
@@ -65,6 +75,7 @@ class WorkflowResult:
     phases: List[PhaseResult] = field(default_factory=list)
     enforcement: str = "soft"
     stopped_at: Optional[Phase] = None
+    wall_seconds: float = 0.0
 
     @property
     def passed(self) -> bool:
@@ -1,7 +1,7 @@
 """Abstract base for phase executors."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from ..models import Phase, PhaseResult
 
@@ -25,6 +25,14 @@ class PhaseExecutor(ABC):
         """Run all steps in this phase. Returns PhaseResult."""
         ...
 
+    @property
+    def depends_on(self) -> Tuple[Phase, ...]:
+        """Phases that must finish first when they are part of the same run.
+
+        Phases without dependencies between them may run concurrently.
+        """
+        return ()
+
     @property
     def description(self) -> str:
         """Human-readable phase description for UI."""
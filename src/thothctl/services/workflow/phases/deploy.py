@@ -2,8 +2,9 @@
 
 import logging
 import time
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
+from ..context import WorkflowContext
 from ..models import Phase, PhaseResult, StepResult, StepStatus
 from .base import PhaseExecutor
 
@@ -17,6 +18,10 @@ class DeployPhaseExecutor(PhaseExecutor):
     def phase(self) -> Phase:
         return Phase.DEPLOY
 
+    @property
+    def depends_on(self) -> Tuple[Phase, ...]:
+        return (Phase.TEST, Phase.SECURE)
+
     @property
     def description(self) -> str:
         return "\U0001f680 Deploy — Pre-deployment validation, enforcement gates"
@@ -32,16 +37,24 @@ class DeployPhaseExecutor(PhaseExecutor):
         enforcement = options.get("enforcement", "soft")
 
         # Step 1: Run security scan with hard enforcement
-        # This reuses the secure phase but forces hard enforcement
+        # This reuses the secure phase but forces hard enforcement. When the
+        # secure phase already ran in this workflow its findings are reused.
         from .secure import SecurePhaseExecutor
 
-        secure_executor = SecurePhaseExecutor()
-        deploy_options = dict(options)
-        deploy_options["enforcement"] = "hard"
+        context = WorkflowContext.from_options(directory, options)
+        secure_result = context.results.get(Phase.SECURE)
+        if secure_result is not None:
+            duration = 0.0
+        else:
+            secure_executor = SecurePhaseExecutor()
+            deploy_options = dict(options)
+            deploy_options["enforcement"] = "hard"
 
-        start = time.perf_counter()
-        secure_result = secure_executor.execute(directory, reports_dir, deploy_options)
-        duration = time.perf_counter() - start
+            start = time.perf_counter()
+            secure_result = secure_executor.execute(
+                directory, reports_dir, deploy_options
+            )
+            duration = time.perf_counter() - start
 
         # Translate secure results into deploy gate
         total_failures = secure_result.total_findings
@@ -3,7 +3,7 @@
 import logging
 import subprocess
 import time
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from ..models import Phase, PhaseResult, StepResult, StepStatus
 from .base import PhaseExecutor
@@ -18,6 +18,10 @@ class MonitorPhaseExecutor(PhaseExecutor):
     def phase(self) -> Phase:
         return Phase.MONITOR
 
+    @property
+    def depends_on(self) -> Tuple[Phase, ...]:
+        return (Phase.DEPLOY,)
+
     @property
     def description(self) -> str:
         return "\U0001f4ca Monitor — Drift detection, continuous monitoring"
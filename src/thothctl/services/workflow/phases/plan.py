@@ -1,12 +1,11 @@
 """Plan phase: cost estimation, blast radius, risk assessment."""
 
 import logging
-import os
 import subprocess
 import time
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 
+from ..context import WorkflowContext
 from ..models import Phase, PhaseResult, StepResult, StepStatus
 from .base import PhaseExecutor
 
@@ -33,8 +32,9 @@ class PlanPhaseExecutor(PhaseExecutor):
         options = options or {}
         result = PhaseResult(phase=self.phase)
 
-        # Find tfplan files
-        plan_files = self._find_plan_files(directory)
+        # Find tfplan files (shared index, walked once per run)
+        context = WorkflowContext.from_options(directory, options)
+        plan_files = context.index.plan_files()
 
         if not plan_files:
             result.steps.append(
@@ -62,20 +62,6 @@ class PlanPhaseExecutor(PhaseExecutor):
         result.passed = not any(s.status == StepStatus.FAILED for s in result.steps)
         return result
 
-    def _find_plan_files(self, directory: str) -> List[str]:
-        """Find tfplan.json files in the project."""
-        plans = []
-        for root, _, files in os.walk(directory):
-            # Skip hidden dirs and Reports
-            if any(part.startswith(".") for part in Path(root).parts):
-                continue
-            if "Reports" in root:
-                continue
-            for f in files:
-                if f == "tfplan.json":
-                    plans.append(os.path.join(root, f))
-        return plans
-
     def _run_cost_analysis(self, directory: str) -> StepResult:
         """Run thothctl check iac -type cost-analysis."""
         start = time.perf_counter()
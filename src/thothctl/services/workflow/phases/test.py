@@ -1,12 +1,11 @@
 """Test phase: plan validation, change impact analysis."""
 
 import logging
-import os
 import subprocess
 import time
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 
+from ..context import WorkflowContext
 from ..models import Phase, PhaseResult, StepResult, StepStatus
 from .base import PhaseExecutor
 
@@ -33,8 +32,9 @@ class TestPhaseExecutor(PhaseExecutor):
         options = options or {}
         result = PhaseResult(phase=self.phase)
 
-        # Check if tfplan exists
-        plan_files = self._find_plan_files(directory)
+        # Check if tfplan exists (shared index, walked once per run)
+        context = WorkflowContext.from_options(directory, options)
+        plan_files = context.index.plan_files()
 
         if not plan_files:
             result.steps.append(
@@ -59,19 +59,6 @@ class TestPhaseExecutor(PhaseExecutor):
         result.passed = not any(s.status == StepStatus.FAILED for s in result.steps)
         return result
 
-    def _find_plan_files(self, directory: str) -> List[str]:
-        """Find tfplan.json files in the project."""
-        plans = []
-        for root, _, files in os.walk(directory):
-            if any(part.startswith(".") for part in Path(root).parts):
-                continue
-            if "Reports" in root:
-                continue
-            for f in files:
-                if f == "tfplan.json":
-                    plans.append(os.path.join(root, f))
-        return plans
-
     def _validate_tfplan(self, directory: str) -> StepResult:
         """Run thothctl check iac -type tfplan."""
         start = time.perf_counter()
@@ -0,0 +1,246 @@
+"""Content-addressed result cache for custom workflow stages.
+
+A stage that declares ``inputs`` (glob patterns) is keyed by a hash of its
+resolved command, the workflow variables and the contents of every matched
+input file. When a later run produces the same key, the recorded exit status
+and stdout are replayed and the declared ``outputs`` are copied back into the
+working tree instead of executing the stage again.
+
+Entries live under ``.thothctl/workflow-cache/<key>/`` and are evicted least
+recently used first once the entry count or total size exceeds the limits.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = ".thothctl/workflow-cache"
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Bump when the key or entry layout changes so old entries are never reused
+CACHE_FORMAT_VERSION = 1
+
+META_FILE = "meta.json"
+OUTPUTS_DIR = "outputs"
+
+
+@dataclass
+class CachedStageResult:
+    """A stage run replayed from the cache."""
+
+    key: str
+    returncode: int
+    stdout: str = ""
+    stderr: str = ""
+    outputs: List[str] = field(default_factory=list)
+    duration_seconds: float = 0.0
+
+
+def _hash_file(path: Path, digest: "hashlib._Hash") -> None:
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+            digest.update(chunk)
+
+
+def _tree_size(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+class StageCache:
+    """Local, size-bounded store of stage results keyed by content hash."""
+
+    def __init__(
+        self,
+        cache_dir: Path = Path(DEFAULT_CACHE_DIR),
+        base_dir: Optional[Path] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.base_dir = Path(base_dir) if base_dir else Path.cwd()
+        cache_dir = Path(cache_dir)
+        self.cache_dir = (
+            cache_dir if cache_dir.is_absolute() else self.base_dir / cache_dir
+        )
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    # -- keys ---------------------------------------------------------------
+
+    def input_files(self, patterns: Iterable[str]) -> List[Path]:
+        """Files matched by the ``inputs`` globs, sorted and de-duplicated.
+
+        Directories matched by a pattern contribute every file below them.
+        The cache directory itself is never treated as an input.
+        """
+        files = set()
+        for pattern in patterns:
+            for match in self.base_dir.glob(pattern):
+                candidates = match.rglob("*") if match.is_dir() else [match]
+                for candidate in candidates:
+                    if candidate.is_file() and self.cache_dir not in candidate.parents:
+                        files.add(candidate)
+        return sorted(files)
+
+    def compute_key(
+        self,
+        command: str,
+        variables: Dict[str, str],
+        inputs: Iterable[str],
+    ) -> str:
+        """Hash the resolved command, variables and input file contents."""
+        digest = hashlib.sha256()
+        header = {
+            "version": CACHE_FORMAT_VERSION,
+            "command": command,
+            "variables": {k: str(v) for k, v in variables.items()},
+            "inputs": sorted(inputs),
+        }
+        digest.update(json.dumps(header, sort_keys=True).encode("utf-8"))
+        for path in self.input_files(inputs):
+            digest.update(b"\0" + path.relative_to(self.base_dir).as_posix().encode())
+            digest.update(b"\0")
+            _hash_file(path, digest)
+        return digest.hexdigest()
+
+    # -- lookup / restore ---------------------------------------------------
+
+    def lookup(self, key: str) -> Optional[CachedStageResult]:
+        """Return the cached result for ``key`` and restore its outputs.
+
+        Returns ``None`` on a miss or if the entry is unreadable, in which
+        case the stage simply runs again.
+        """
+        entry = self.cache_dir / key
+        meta_path = entry / META_FILE
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        try:
+            for output in meta.get("outputs", []):
+                source = entry / OUTPUTS_DIR / output
+                target = self.base_dir / output
+                if source.is_dir():
+                    shutil.copytree(source, target, dirs_exist_ok=True)
+                else:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(source, target)
+            # mtime of the metadata file is the LRU clock
+            os.utime(meta_path)
+        except OSError as e:
+            logger.warning(f"Ignoring unusable workflow cache entry {key}: {e}")
+            return None
+
+        return CachedStageResult(
+            key=key,
+            returncode=meta["returncode"],
+            stdout=meta.get("stdout", ""),
+            stderr=meta.get("stderr", ""),
+            outputs=meta.get("outputs", []),
+            duration_seconds=meta.get("duration_seconds", 0.0),
+        )
+
+    # -- store --------------------------------------------------------------
+
+    def store(
+        self,
+        key: str,
+        returncode: int,
+        stdout: str,
+        stderr: str,
+        outputs: Iterable[str],
+        duration_seconds: float = 0.0,
+    ) -> bool:
+        """Record a stage run together with copies of its declared outputs.
+
+        Returns:
+            False if an output is missing, in which case nothing is cached.
+        """
+        outputs = list(outputs)
+        missing = [o for o in outputs if not (self.base_dir / o).exists()]
+        if missing:
+            logger.debug(f"Not caching {key}: missing outputs {missing}")
+            return False
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_entry = Path(tempfile.mkdtemp(prefix=f".{key[:12]}.", dir=self.cache_dir))
+        try:
+            size = 0
+            for output in outputs:
+                source = self.base_dir / output
+                target = tmp_entry / OUTPUTS_DIR / output
+                if source.is_dir():
+                    shutil.copytree(source, target)
+                else:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(source, target)
+                size += _tree_size(target)
+
+            meta = {
+                "returncode": returncode,
+                "stdout": stdout,
+                "stderr": stderr,
+                "outputs": outputs,
+                "duration_seconds": duration_seconds,
+                "created_at": time.time(),
+            }
+            meta["size"] = size + len(json.dumps(meta))
+            (tmp_entry / META_FILE).write_text(json.dumps(meta), encoding="utf-8")
+
+            with self._lock:
+                try:
+                    os.replace(tmp_entry, self.cache_dir / key)
+                except OSError:
+                    # Another stage stored the same key first; keep that one
+                    shutil.rmtree(tmp_entry, ignore_errors=True)
+                self._evict()
+        except BaseException:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+            raise
+        return True
+
+    # -- eviction -----------------------------------------------------------
+
+    def _entries(self) -> List[Dict]:
+        entries = []
+        if not self.cache_dir.is_dir():
+            return entries
+        for entry in self.cache_dir.iterdir():
+            meta_path = entry / META_FILE
+            if entry.name.startswith(".") or not meta_path.is_file():
+                continue
+            try:
+                size = json.loads(meta_path.read_text(encoding="utf-8"))["size"]
+                last_used = meta_path.stat().st_mtime
+            except (OSError, ValueError, KeyError):
+                size, last_used = _tree_size(entry), 0.0
+            entries.append({"path": entry, "size": size, "last_used": last_used})
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda e: e["last_used"])
+        total = sum(e["size"] for e in entries)
+        while entries and (len(entries) > self.max_entries or total > self.max_bytes):
+            oldest = entries.pop(0)
+            total -= oldest["size"]
+            shutil.rmtree(oldest["path"], ignore_errors=True)
+            logger.debug(f"Evicted workflow cache entry {oldest['path'].name}")
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
@@ -1,9 +1,13 @@
-"""Workflow orchestrator — executes SDLC phases in sequence."""
+"""Workflow orchestrator — executes SDLC phases as a dependency graph."""
 
 import logging
-from typing import Dict, List, Optional
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
 
-from .models import Phase, WorkflowResult
+from .context import WorkflowContext
+from .models import Phase, PhaseResult, WorkflowResult
 from .phases.base import PhaseExecutor
 from .phases.build import BuildPhaseExecutor
 from .phases.deploy import DeployPhaseExecutor
@@ -27,6 +31,9 @@ PHASE_ORDER = [
     Phase.MONITOR,
 ]
 
+# Phases run concurrently when they do not depend on each other
+DEFAULT_MAX_WORKERS = int(os.environ.get("THOTHCTL_WORKFLOW_MAX_WORKERS", "4"))
+
 # Composite phase mappings
 COMPOSITE_PHASES = {
     Phase.PRE_DEPLOY: [Phase.TEST, Phase.SECURE],
@@ -48,20 +55,8 @@ class WorkflowService:
             Phase.MONITOR: MonitorPhaseExecutor(),
         }
 
-    def execute(
-        self,
-        phases: List[Phase],
-        directory: str,
-        reports_dir: str,
-        options: Optional[Dict] = None,
-        enforcement: str = "soft",
-    ) -> WorkflowResult:
-        """Execute one or more SDLC phases in order."""
-        options = options or {}
-        options["enforcement"] = enforcement
-        result = WorkflowResult(enforcement=enforcement)
-
-        # Resolve composite phases
+    def resolve_phases(self, phases: List[Phase]) -> List[Phase]:
+        """Expand composite phases, dedupe and keep phases with an executor."""
         resolved = []
         for phase in phases:
             if phase in COMPOSITE_PHASES:
@@ -73,25 +68,99 @@ class WorkflowService:
         seen = set()
         ordered = []
         for p in resolved:
-            if p not in seen:
-                seen.add(p)
-                ordered.append(p)
-
-        # Execute phases in sequence
-        for phase in ordered:
-            executor = self._executors.get(phase)
-            if not executor:
-                logger.info(f"No executor for phase: {phase.value} — skipping")
+            if p in seen:
+                continue
+            seen.add(p)
+            if p not in self._executors:
+                logger.info(f"No executor for phase: {p.value} — skipping")
                 continue
+            ordered.append(p)
+        return ordered
 
-            logger.info(f"Executing: {executor.description}")
-            phase_result = executor.execute(directory, reports_dir, options)
-            result.phases.append(phase_result)
+    def execute(
+        self,
+        phases: List[Phase],
+        directory: str,
+        reports_dir: str,
+        options: Optional[Dict] = None,
+        enforcement: str = "soft",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_phase_start: Optional[Callable[[Phase], None]] = None,
+        on_phase_complete: Optional[Callable[[PhaseResult], None]] = None,
+    ) -> WorkflowResult:
+        """Execute one or more SDLC phases.
+
+        A phase starts once the phases it ``depends_on`` (among the selected
+        ones) have finished; independent phases run concurrently on up to
+        ``max_workers`` threads and share one ``WorkflowContext`` (file index,
+        parsed plans, finished results). With hard enforcement a blocked gate
+        stops new phases from starting; phases already running finish.
+        Callbacks are invoked from the calling thread.
+        """
+        options = options or {}
+        options["enforcement"] = enforcement
+        context = WorkflowContext(directory)
+        options["context"] = context
+        result = WorkflowResult(enforcement=enforcement)
 
-            # Stop on hard enforcement failure
-            if enforcement == "hard" and phase_result.gate_blocked:
-                result.stopped_at = phase
-                logger.warning(f"Pipeline blocked at phase: {phase.value}")
-                break
+        ordered = self.resolve_phases(phases)
+        selected = set(ordered)
+        pending = {
+            phase: {d for d in self._executors[phase].depends_on if d in selected}
+            for phase in ordered
+        }
+        finished: Dict[Phase, PhaseResult] = {}
+        max_workers = max(1, max_workers)
+        run_start = time.perf_counter()
 
+        def run_phase(phase: Phase) -> PhaseResult:
+            executor = self._executors[phase]
+            logger.info(f"Executing: {executor.description}")
+            started = time.perf_counter() - run_start
+            phase_result = executor.execute(directory, reports_dir, options)
+            phase_result.started_at = started
+            phase_result.finished_at = time.perf_counter() - run_start
+            return phase_result
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="workflow-phase"
+        ) as pool:
+            running = {}
+            while True:
+                # Launch ready phases in SDLC order while there are free workers
+                if result.stopped_at is None:
+                    for phase in ordered:
+                        if len(running) >= max_workers:
+                            break
+                        if phase in finished or phase in running.values():
+                            continue
+                        if pending[phase] - finished.keys():
+                            continue
+                        if on_phase_start:
+                            on_phase_start(phase)
+                        running[pool.submit(run_phase, phase)] = phase
+
+                if not running:
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: ordered.index(running[f])):
+                    phase = running.pop(future)
+                    phase_result = future.result()
+                    finished[phase] = phase_result
+                    context.results[phase] = phase_result
+                    if on_phase_complete:
+                        on_phase_complete(phase_result)
+
+                    # Stop on hard enforcement failure
+                    if (
+                        enforcement == "hard"
+                        and phase_result.gate_blocked
+                        and result.stopped_at is None
+                    ):
+                        result.stopped_at = phase
+                        logger.warning(f"Pipeline blocked at phase: {phase.value}")
+
+        result.phases = [finished[p] for p in ordered if p in finished]
+        result.wall_seconds = time.perf_counter() - run_start
         return result
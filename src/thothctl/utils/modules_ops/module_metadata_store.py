@@ -0,0 +1,317 @@
+"""Module metadata store — SQLite-backed cache of Terraform registry data.
+
+One database holds both kinds of registry data the module tools use:
+
+* namespace listings (the modules an organisation publishes for a provider),
+* version lists per module, keyed by ``(namespace, name, provider)``.
+
+Every row carries its own expiry. Lookups go through the table's primary
+key instead of scanning cache files, so they stay fast as the cache grows.
+``prefetch`` warms the versions of an organisation's whole module list in
+one pass.
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DB_PATH = Path.home() / ".thothcf" / "module_registry.db"
+
+DEFAULT_TTL_HOURS = 24
+DEFAULT_PREFETCH_WORKERS = 8
+
+ModuleKey = Tuple[str, str, str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS namespaces (
+    namespace TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    modules TEXT NOT NULL,
+    PRIMARY KEY (namespace, provider)
+);
+
+CREATE TABLE IF NOT EXISTS modules (
+    namespace TEXT NOT NULL,
+    name TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    summary TEXT NOT NULL,
+    PRIMARY KEY (namespace, name, provider)
+);
+
+CREATE TABLE IF NOT EXISTS module_versions (
+    namespace TEXT NOT NULL,
+    name TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (namespace, name, provider)
+);
+"""
+
+_TABLES = ("namespaces", "modules", "module_versions")
+
+
+class ModuleMetadataStore:
+    """Registry metadata with per-entry expiry, looked up by primary key."""
+
+    def __init__(self, db_path: Path = DB_PATH, ttl_hours: float = DEFAULT_TTL_HOURS):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_hours * 3600
+
+    def _get_conn(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _expiry(self, now: float, ttl_hours: Optional[float]) -> float:
+        return now + (self.ttl_seconds if ttl_hours is None else ttl_hours * 3600)
+
+    @staticmethod
+    def _fresh(
+        row: Optional[Tuple[float, float, str]], max_age_hours: Optional[float]
+    ) -> Optional[Any]:
+        """Decoded payload of a ``(fetched_at, expires_at, json)`` row if usable."""
+        if not row:
+            return None
+        now = time.time()
+        if now >= row[1]:
+            return None
+        if max_age_hours is not None and now - row[0] > max_age_hours * 3600:
+            return None
+        return json.loads(row[2])
+
+    # -- namespace listings -------------------------------------------------
+
+    def get_namespace(
+        self, namespace: str, provider: str, max_age_hours: Optional[float] = None
+    ) -> Optional[List[Dict]]:
+        """Modules listed for ``namespace``/``provider``, or ``None`` if stale."""
+        conn = self._get_conn()
+        try:
+            row = conn.execute(
+                "SELECT fetched_at, expires_at, modules FROM namespaces "
+                "WHERE namespace = ? AND provider = ?",
+                (namespace, provider),
+            ).fetchone()
+        finally:
+            conn.close()
+        return self._fresh(row, max_age_hours)
+
+    def put_namespace(
+        self,
+        namespace: str,
+        provider: str,
+        modules: List[Dict],
+        ttl_hours: Optional[float] = None,
+    ) -> None:
+        """Store a namespace listing and index each module's summary."""
+        now = time.time()
+        expires = self._expiry(now, ttl_hours)
+        summaries = [
+            (
+                module.get("namespace", namespace),
+                module["name"],
+                module.get("provider", provider),
+                now,
+                expires,
+                json.dumps(module, default=str),
+            )
+            for module in modules
+            if module.get("name")
+        ]
+        conn = self._get_conn()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO namespaces "
+                    "(namespace, provider, fetched_at, expires_at, modules) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        namespace,
+                        provider,
+                        now,
+                        expires,
+                        json.dumps(modules, default=str),
+                    ),
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO modules "
+                    "(namespace, name, provider, fetched_at, expires_at, summary) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    summaries,
+                )
+        finally:
+            conn.close()
+
+    def get_module(self, namespace: str, name: str, provider: str) -> Optional[Dict]:
+        """Registry summary (latest version, downloads, ...) of one module."""
+        conn = self._get_conn()
+        try:
+            row = conn.execute(
+                "SELECT fetched_at, expires_at, summary FROM modules "
+                "WHERE namespace = ? AND name = ? AND provider = ?",
+                (namespace, name, provider),
+            ).fetchone()
+        finally:
+            conn.close()
+        return self._fresh(row, None)
+
+    # -- module versions ----------------------------------------------------
+
+    def get_versions(
+        self,
+        namespace: str,
+        name: str,
+        provider: str,
+        max_age_hours: Optional[float] = None,
+    ) -> Optional[Dict]:
+        """Cached ``/versions`` response for a module, or ``None`` if stale."""
+        conn = self._get_conn()
+        try:
+            row = conn.execute(
+                "SELECT fetched_at, expires_at, data FROM module_versions "
+                "WHERE namespace = ? AND name = ? AND provider = ?",
+                (namespace, name, provider),
+            ).fetchone()
+        finally:
+            conn.close()
+        return self._fresh(row, max_age_hours)
+
+    def put_versions(
+        self,
+        namespace: str,
+        name: str,
+        provider: str,
+        data: Dict,
+        ttl_hours: Optional[float] = None,
+    ) -> None:
+        self.put_many_versions({(namespace, name, provider): data}, ttl_hours)
+
+    def put_many_versions(
+        self, entries: Dict[ModuleKey, Dict], ttl_hours: Optional[float] = None
+    ) -> None:
+        """Store several version lists in one transaction."""
+        if not entries:
+            return
+        now = time.time()
+        expires = self._expiry(now, ttl_hours)
+        conn = self._get_conn()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO module_versions "
+                    "(namespace, name, provider, fetched_at, expires_at, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (*key, now, expires, json.dumps(data, default=str))
+                        for key, data in entries.items()
+                    ],
+                )
+        finally:
+            conn.close()
+
+    def fresh_version_keys(self, keys: Iterable[ModuleKey]) -> List[ModuleKey]:
+        """The subset of ``keys`` whose version lists have not expired."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return []
+        conn = self._get_conn()
+        try:
+            now = time.time()
+            return [
+                key
+                for key in keys
+                if conn.execute(
+                    "SELECT 1 FROM module_versions WHERE namespace = ? AND name = ? "
+                    "AND provider = ? AND expires_at > ?",
+                    (*key, now),
+                ).fetchone()
+            ]
+        finally:
+            conn.close()
+
+    def prefetch(
+        self,
+        keys: Iterable[ModuleKey],
+        fetch: Callable[[str, str, str], Optional[Dict]],
+        workers: int = DEFAULT_PREFETCH_WORKERS,
+        force: bool = False,
+    ) -> int:
+        """Fetch version lists for every key that is missing or expired.
+
+        ``fetch(namespace, name, provider)`` is called concurrently; results
+        are written in one transaction. Returns the number of modules fetched.
+        """
+        keys = list(dict.fromkeys(keys))
+        if not force:
+            fresh = set(self.fresh_version_keys(keys))
+            keys = [key for key in keys if key not in fresh]
+        if not keys:
+            return 0
+
+        def fetch_one(key: ModuleKey) -> Optional[Dict]:
+            try:
+                return fetch(*key)
+            except Exception as e:
+                logger.warning(f"Failed to fetch versions for {'/'.join(key)}: {e}")
+                return None
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(keys))),
+            thread_name_prefix="module-prefetch",
+        ) as pool:
+            results = dict(zip(keys, pool.map(fetch_one, keys)))
+
+        fetched = {key: data for key, data in results.items() if data}
+        self.put_many_versions(fetched)
+        return len(fetched)
+
+    # -- maintenance --------------------------------------------------------
+
+    def purge_expired(self) -> int:
+        """Delete expired entries. Returns the number removed."""
+        conn = self._get_conn()
+        try:
+            now = time.time()
+            removed = 0
+            with conn:
+                for table in _TABLES:
+                    cur = conn.execute(
+                        f"DELETE FROM {table} WHERE expires_at <= ?", (now,)
+                    )
+                    removed += cur.rowcount
+            return removed
+        finally:
+            conn.close()
+
+    def clear(self) -> None:
+        conn = self._get_conn()
+        try:
+            with conn:
+                for table in _TABLES:
+                    conn.execute(f"DELETE FROM {table}")
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Row count per table, for display."""
+        conn = self._get_conn()
+        try:
+            return {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in _TABLES
+            }
+        finally:
+            conn.close()
@@ -1,32 +1,20 @@
-import hashlib
 import json
-import os
-from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union
 
 import requests
 
+from .module_metadata_store import ModuleMetadataStore
 
-class TerraformModulesCache:
-    def __init__(self, cache_dir: str = ".registry_cache"):
-        self.cache_dir = cache_dir
-        self._ensure_cache_dir()
 
-    def _ensure_cache_dir(self):
-        if not os.path.exists(self.cache_dir):
-            os.makedirs(self.cache_dir)
+class TerraformModulesCache:
+    """Namespace listings, backed by the shared :class:`ModuleMetadataStore`.
 
-    def _generate_cache_key(
-        self, namespaces: Union[str, List[str]], provider: str
-    ) -> str:
-        if isinstance(namespaces, str):
-            namespaces = [namespaces]
-        key_string = f"{'-'.join(sorted(namespaces))}_{provider}"
-        print(f"Generated key string: {key_string}")
-        return hashlib.md5(key_string.encode()).hexdigest()
+    Each namespace is stored on its own, so a listing saved for several
+    namespaces also answers a lookup for any one of them.
+    """
 
-    def _get_cache_path(self, cache_key: str) -> str:
-        return os.path.join(self.cache_dir, f"{cache_key}.json")
+    def __init__(self, store: Optional[ModuleMetadataStore] = None):
+        self.store = store or ModuleMetadataStore()
 
     def save(
         self, modules: List[Dict], namespaces: Union[str, List[str]], provider: str
@@ -35,114 +23,52 @@ class TerraformModulesCache:
         if isinstance(namespaces, str):
             namespaces = [namespaces]
 
-        cache_data = {
-            "timestamp": datetime.now().isoformat(),
-            "modules": modules,
-            "namespaces": namespaces,
-            "provider": provider,
-        }
-
-        cache_key = self._generate_cache_key(namespaces, provider)
-        cache_path = self._get_cache_path(cache_key)
-
-        print(f"Saving cache to: {cache_path}")
-        with open(cache_path, "w") as f:
-            json.dump(cache_data, f, indent=2)
+        for namespace in namespaces:
+            self.store.put_namespace(
+                namespace,
+                provider,
+                [m for m in modules if m.get("namespace", namespace) == namespace],
+            )
 
     def get(
         self, namespaces: Union[str, List[str]], provider: str, max_age_hours: int = 24
     ) -> Optional[List[Dict]]:
         """
-        Get modules from cache with debug information.
-        """
-        cache_key = self._generate_cache_key(namespaces, provider)
-        cache_path = self._get_cache_path(cache_key)
-
-        print(f"Looking for cache file: {cache_path}")
-
-        # List all files in cache directory for debugging
-        print("Available files in cache directory:")
-        for f in os.listdir(self.cache_dir):
-            print(f"- {f}")
-
-        if not os.path.exists(cache_path):
-            print(f"Cache file not found at: {cache_path}")
-            # Try to find a matching file
-            for filename in os.listdir(self.cache_dir):
-                filepath = os.path.join(self.cache_dir, filename)
-                try:
-                    with open(filepath, "r") as f:
-                        data = json.load(f)
-                        cached_namespaces = data.get("namespaces", [])
-                        cached_provider = data.get("provider")
-
-                        # Check if this cache file contains our target namespace
-                        if (
-                            isinstance(namespaces, str)
-                            and namespaces in cached_namespaces
-                        ) or (
-                            isinstance(namespaces, list)
-                            and any(ns in cached_namespaces for ns in namespaces)
-                        ):
-                            if cached_provider == provider:
-                                print(f"Found matching cache file: {filename}")
-                                modules = data.get("modules", [])
-                                # Filter for specific namespace
-                                if isinstance(namespaces, str):
-                                    modules = [
-                                        m
-                                        for m in modules
-                                        if m.get("namespace") == namespaces
-                                    ]
-                                return modules
-                except Exception as e:
-                    print(f"Error reading {filename}: {e}")
-            return None
+        Get modules from cache; ``None`` unless every namespace is cached and fresh.
 
-        try:
-            with open(cache_path, "r") as f:
-                cache_data = json.load(f)
+        Listings are stored complete; callers apply their own limits.
+        """
+        if isinstance(namespaces, str):
+            namespaces = [namespaces]
 
-            print("Cache file found and loaded")
-            cache_time = datetime.fromisoformat(cache_data["timestamp"])
-            if datetime.now() - cache_time > timedelta(hours=max_age_hours):
-                print(f"Cache expired (older than {max_age_hours} hours)")
+        modules = []
+        for namespace in namespaces:
+            cached = self.store.get_namespace(namespace, provider, max_age_hours)
+            if cached is None:
                 return None
+            modules.extend(cached)
 
-            modules = cache_data.get("modules", [])
-
-            # Filter modules for specific namespace
-            if isinstance(namespaces, str):
-                modules = [m for m in modules if m.get("namespace") == namespaces]
-
-            return modules
-
-        except Exception as e:
-            print(f"Error reading cache: {e}")
-            return None
+        if len(namespaces) > 1:
+            # Same order as a fresh fetch: most popular first
+            modules.sort(key=lambda x: x.get("downloads", 0), reverse=True)
+        return modules
 
     def list_cache_files(self):
-        """List all cache files and their contents summary."""
-        print("\nAvailable cache files:")
-        for filename in os.listdir(self.cache_dir):
-            if filename.endswith(".json"):
-                filepath = os.path.join(self.cache_dir, filename)
-                try:
-                    with open(filepath, "r") as f:
-                        data = json.load(f)
-                        print(f"\nFile: {filename}")
-                        print(f"Namespaces: {data.get('namespaces')}")
-                        print(f"Provider: {data.get('provider')}")
-                        print(f"Timestamp: {data.get('timestamp')}")
-                        print(f"Module count: {len(data.get('modules', []))}")
-                except Exception as e:
-                    print(f"Error reading {filename}: {e}")
+        """Print a summary of the cached registry data."""
+        print("\nModule registry cache:")
+        print(f"Database: {self.store.db_path}")
+        for table, count in self.store.stats().items():
+            print(f"{table}: {count}")
 
 
 class TerraformModulesFetcher:
-    def __init__(self, base_url: str = "https://registry.terraform.io/v1/modules"):
+    def __init__(
+        self,
+        base_url: str = "https://registry.terraform.io/v1/modules",
+        cache: Optional[TerraformModulesCache] = None,
+    ):
         self.base_url = base_url
-        self.cache = TerraformModulesCache()
+        self.cache = cache or TerraformModulesCache()
 
     def fetch_modules(
         self,
@@ -154,53 +80,64 @@ class TerraformModulesFetcher:
     ) -> List[Dict]:
         """
         Fetch Terraform modules from multiple namespaces with caching support.
+
+        The cache holds each namespace's complete listing, shared with the
+        space module tools; the per-namespace share, popularity order and
+        ``max_modules`` cut are applied here, on every read.
         """
         if isinstance(namespaces, str):
             namespaces = [namespaces]
 
-        # Try to get from cache first
-        if use_cache:
-            cached_modules = self.cache.get(namespaces, provider)
-            if cached_modules is not None:
-                # Add provider filter for cached results as well
-                filtered_cached = [
-                    module
-                    for module in cached_modules
-                    if module.get("provider") == provider
-                ]
-                print(f"Using cached data for namespaces: {', '.join(namespaces)}")
-                return filtered_cached[:max_modules]
-
-        # If no cache or cache expired, fetch from API
-        all_modules = []
-        modules_per_namespace = max_modules // len(namespaces)
-
+        listings = {}
+        cached_namespaces = []
         for namespace in namespaces:
+            cached = self.cache.get(namespace, provider) if use_cache else None
+            if cached is not None:
+                cached_namespaces.append(namespace)
+                listings[namespace] = cached
+                continue
+
+            # If no cache or cache expired, fetch from API
             modules = self._fetch_namespace_modules(
-                namespace=namespace,
-                provider=provider,
-                limit=limit,
-                max_modules=modules_per_namespace,
+                namespace=namespace, provider=provider, limit=limit
             )
-            all_modules.extend(modules)
+            if modules:
+                self.cache.save(modules, namespace, provider)
+            listings[namespace] = modules
 
-        # Sort modules by downloads (most popular first)
-        all_modules.sort(key=lambda x: x.get("downloads", 0), reverse=True)
+        if cached_namespaces:
+            print(f"Using cached data for namespaces: {', '.join(cached_namespaces)}")
 
-        # Save to cache
-        if all_modules:
-            self.cache.save(all_modules, namespaces, provider)
+        return self._select_modules(listings, provider, max_modules)
 
-        return all_modules[:max_modules]
+    @staticmethod
+    def _select_modules(
+        listings: Dict[str, List[Dict]], provider: str, max_modules: int
+    ) -> List[Dict]:
+        """Most downloaded modules, at most ``max_modules`` split across namespaces."""
+        modules_per_namespace = max_modules // max(1, len(listings))
+        selected = []
+        for modules in listings.values():
+            matching = [m for m in modules if m.get("provider") == provider]
+            matching.sort(key=lambda x: x.get("downloads", 0), reverse=True)
+            selected.extend(matching[:modules_per_namespace])
+
+        # Sort modules by downloads (most popular first)
+        selected.sort(key=lambda x: x.get("downloads", 0), reverse=True)
+        return selected[:max_modules]
 
     def _fetch_namespace_modules(
-        self, namespace: str, provider: str, limit: int, max_modules: int
+        self,
+        namespace: str,
+        provider: str,
+        limit: int,
+        max_modules: Optional[int] = None,
     ) -> List[Dict]:
-        """Fetch modules for a single namespace."""
+        """Fetch modules for a single namespace, all of them unless capped."""
         modules = []
         offset = 0
 
-        while len(modules) < max_modules:
+        while max_modules is None or len(modules) < max_modules:
             page_modules, next_offset = self._fetch_page(
                 namespace=namespace, provider=provider, limit=limit, offset=offset
             )
@@ -220,7 +157,7 @@ class TerraformModulesFetcher:
 
             offset = next_offset
 
-        return modules[:max_modules]
+        return modules if max_modules is None else modules[:max_modules]
 
     def _fetch_page(
         self, namespace: str, provider: str, limit: int, offset: int
@@ -280,7 +217,7 @@ if __name__ == "__main__":
     # Create a cache instance
     cache = TerraformModulesCache()
 
-    # List all available cache files first
+    # Show what the cache holds
     cache.list_cache_files()
 
     # Get cached modules with debug information
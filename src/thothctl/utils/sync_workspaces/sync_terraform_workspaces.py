@@ -4,69 +4,133 @@ import json
 import logging
 import os
 import subprocess
-from pathlib import Path, PurePath
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from colorama import Fore
 
+from thothctl.services.document.terragrunt_dag import TerragruntDagBuilder
+
 from ..process_hcl.graph_manager import graph_dependencies_to_json
 
 terragrun_file = "terragrunt.hcl"
 terraform_path = ".terraform"
 terragrunt_path = ".terragrunt-cache"
+# Workspace lookups may run ``terragrunt init``, so keep the pool modest
+DEFAULT_MAX_WORKERS = 8
 
 
-def r_sync_workspaces(directory):
+def r_sync_workspaces(directory, max_workers=DEFAULT_MAX_WORKERS):
     """
     Sync terraform workspaces in all directories.
 
+    The dependency graph of the whole tree is built once; workspaces are then
+    resolved in parallel and each dependency is synchronized with its unit.
+
     :param directory:
+    :param max_workers: Parallel workspace lookups.
     :return:
     """
+    started = time.perf_counter()
     d_name = Path(directory).resolve().name
     print(
         f"{Fore.LIGHTBLUE_EX}👾 Searching terragrunt files in {d_name}... {Fore.RESET}"
     )
-    for dirpath, dirnames, filenames in os.walk(directory):
-        for d in dirnames:
-            if ".terraform" != d and ".terragrunt-cache" != d and ".git" != d:
-                logging.info(f"{Fore.LIGHTBLUE_EX}👾 Folder {dirpath} {Fore.RESET}")
-                logging.info(
-                    f"{Fore.LIGHTBLUE_EX}👾 FileNames {filenames} {Fore.RESET}"
-                )
-                logging.info(f"{Fore.LIGHTBLUE_EX}👾 DirNames {d} {Fore.RESET}")
+    index = dependency_index(directory)
+    if not index:
+        logging.info(f" No terragrunt file in: {directory}")
+    workspaces = resolve_workspaces(index, show_workspace, max_workers)
+    sync_index(index, workspaces, select_workspace)
+    print(
+        f"{Fore.LIGHTBLUE_EX}⏱️ Synchronized {len(index)} unit(s) in "
+        f"{time.perf_counter() - started:.2f}s {Fore.RESET}"
+    )
 
-                if os.path.exists(PurePath(f"{d}/{terragrun_file}")):
-                    p = PurePath(f"{d}/{terragrun_file}")
 
-                    print(
-                        f"{Fore.LIGHTBLUE_EX}👾 Find terragrunt file in {p}"
-                        f"\n❇️ Synchronize Workspace  ... {Fore.RESET}"
-                    )
+def dependency_index(directory):
+    """
+    Map every terragrunt unit under ``directory`` to its direct dependencies.
 
-                    print(p)
-                    graph = json.loads(
-                        graph_dependencies_to_json(os.path.join(os.getcwd()))
-                    )
+    :param directory:
+    :return: {unit path: [dependency paths]}, absolute paths.
+    """
+    builder = TerragruntDagBuilder()
+    index = {}
+    for unit in builder.scan(Path(directory)):
+        deps = builder.dependencies(unit)
+        if deps is None:
+            # Paths built from locals or run_cmd need terragrunt itself
+            deps = _terragrunt_dependencies(unit)
+        index[str(unit)] = [str(d) for d in deps]
+    return index
+
+
+def _terragrunt_dependencies(unit):
+    """Direct dependencies of ``unit`` from ``terragrunt dag graph``."""
+    graph = json.loads(graph_dependencies_to_json(unit))
+    names = {
+        o["_gvid"]: Path(os.path.normpath(unit / o["name"])) for o in graph["objects"]
+    }
+    return list(
+        dict.fromkeys(
+            names[e["head"]] for e in graph.get("edges", []) if names[e["tail"]] == unit
+        )
+    )
 
-                    sync_workspaces(json_graph=graph)
-                else:
-                    logging.info(f" No terragrunt file in: {d}")
 
-    # Synchronize local
-    print(directory)
+def resolve_workspaces(index, show, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Look up the workspace of every unit and dependency in parallel.
 
-    if (
-        os.path.exists(PurePath(f"{directory}/{terragrun_file}"))
-        and terraform_path not in directory
-        and terragrunt_path not in directory
-    ):
-        print(
-            f"⚠️ {Fore.LIGHTBLUE_EX}   Find terragrunt.hcl files in {d} ... {Fore.RESET}"
-            f"\n❇️ {Fore.LIGHTBLUE_EX} Synchronize Workspace ...  {Fore.RESET}"
-        )
-        graph = json.loads(graph_dependencies_to_json(directory))
+    :param index: Output of :func:`dependency_index`.
+    :param show: Workspace lookup for a directory.
+    :param max_workers:
+    :return: {directory: workspace}
+    """
+    directories = list(dict.fromkeys([*index, *(d for v in index.values() for d in v)]))
+    if not directories:
+        return {}
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(directories))),
+        thread_name_prefix="workspace",
+    ) as executor:
+        return dict(zip(directories, executor.map(show, directories)))
 
-        sync_workspaces(json_graph=graph)
+
+def sync_index(index, workspaces, select):
+    """
+    Select each unit's workspace in its dependencies.
+
+    ``workspaces`` is updated as dependencies are switched, so units later in
+    the walk see the synchronized value.
+
+    :param index: Output of :func:`dependency_index`.
+    :param workspaces: Output of :func:`resolve_workspaces`.
+    :param select: Workspace selection for a directory.
+    :return: Number of dependencies switched.
+    """
+    switched = 0
+    for unit, deps in index.items():
+        for stack_name in deps:
+            logging.info(unit + " Depends of " + stack_name)
+            current_wk = workspaces[unit]
+            print(f"{Fore.MAGENTA}Workspace for main resource - {unit}: {current_wk} ")
+            depend_wk = workspaces[stack_name]
+            print(
+                f"{Fore.MAGENTA}Workspace for dependency  - {stack_name}: {depend_wk} {Fore.RESET}"
+            )
+
+            if current_wk == depend_wk:
+                print(f"✅ {Fore.MAGENTA} Workspace sync{Fore.RESET} \n")
+            else:
+                print(
+                    f"⚠️ {Fore.MAGENTA} Synchronizing workspace for {stack_name}. {Fore.RESET}\n"
+                )
+                select(directory=stack_name, workspace=current_wk)
+                workspaces[stack_name] = current_wk
+                switched += 1
+    return switched
 
 
 def recursive_sync_workspace_all(directory):
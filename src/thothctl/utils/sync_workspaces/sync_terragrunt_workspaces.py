@@ -1,16 +1,19 @@
 """Sync terragrunt workspaces."""
 
-import json
 import logging
 import os
+import time
 from pathlib import Path
 
 from colorama import Fore
 
 from .sync_terraform_workspaces import (
+    DEFAULT_MAX_WORKERS,
+    dependency_index,
     get_workspace,
-    graph_dependencies_to_json,
+    resolve_workspaces,
     select_workspace,
+    sync_index,
 )
 
 wk_file = ".terraform/environment"
@@ -92,31 +95,27 @@ def t_sync_workspaces(json_graph):
         logging.info(f"after= {after}")
 
 
-def grunt_sync_workspaces(directory):
+def grunt_sync_workspaces(directory, max_workers=DEFAULT_MAX_WORKERS):
     """
     Sync Workspace for terragrunt projects.
 
     :param directory:
+    :param max_workers: Parallel workspace lookups.
     :return:
     """
+    started = time.perf_counter()
     print(f"{Fore.LIGHTBLUE_EX}👾 Searching terragrunt files ... {Fore.RESET}")
-    for dirpath, dirnames, filenames in os.walk(directory):
-        if (
-            ".terraform" not in dirpath
-            and ".terragrunt-cache" not in dirpath
-            and ".git" not in dirpath
-        ):
-            r_p = Path(dirpath).resolve().absolute()
-            logging.info(r_p)
-            file = Path(f"{r_p}/{terragrun_file}").resolve()
-
-            if Path.exists(file):
-                logging.info(f"Find folder {file}")
-                set_t_wk(
-                    directory=directory, workspace=grunt_show_workspace(directory=r_p)
-                )
-                graph = json.loads(graph_dependencies_to_json(r_p))
-                t_sync_workspaces(graph)
+    index = dependency_index(directory)
+    for unit in index:
+        logging.info(f"Find folder {unit}")
+    workspaces = resolve_workspaces(index, grunt_show_workspace, max_workers)
+    if index:
+        set_t_wk(directory=directory, workspace=workspaces[list(index)[-1]])
+    sync_index(index, workspaces, select_workspace)
+    print(
+        f"{Fore.LIGHTBLUE_EX}⏱️ Synchronized {len(index)} unit(s) in "
+        f"{time.perf_counter() - started:.2f}s {Fore.RESET}"
+    )
 
 
 terragrunt_wk_file = ".environment.hcl"
@@ -4,4 +4,9 @@ Force-load thothctl from src/ to prevent the root __init__.py
 (project dir is named 'thothctl') from shadowing the real package.
 """
 
+import os
+
 import thothctl.services  # noqa: F401 - primes correct package resolution
+
+# CLI invocations in tests shouldn't start background PyPI lookups
+os.environ.setdefault("THOTHCTL_NO_VERSION_CHECK", "1")
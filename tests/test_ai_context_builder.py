@@ -0,0 +1,158 @@
+"""Tests for concurrent, cache-aware context collection in ContextBuilder."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from unittest.mock import patch
+
+from thothctl.services.ai_review.analyzers.context_builder import (
+    ContextBuilder,
+    IaCContext,
+)
+
+INVENTORY = {
+    "projectType": "terraform",
+    "components": [
+        {
+            "stack": "vpc",
+            "components": [{"name": "vpc", "version": "5.0.0", "source": "x/vpc"}],
+            "providers": [{"name": "aws", "version": "5.1.0", "source": "aws"}],
+        }
+    ],
+}
+
+
+def _project(tmp_path, report_age=None):
+    (tmp_path / "main.tf").write_text('resource "aws_s3_bucket" "b" {}')
+    if report_age is not None:
+        reports = tmp_path / "Reports" / "inventory"
+        reports.mkdir(parents=True)
+        report = reports / "InventoryIaC_20260101_000000.json"
+        report.write_text(json.dumps(INVENTORY))
+        mtime = os.stat(tmp_path / "main.tf").st_mtime + report_age
+        os.utime(report, (mtime, mtime))
+    return str(tmp_path)
+
+
+def _sleeper(seconds, marker=None):
+    def collect(self, ctx, *args):
+        time.sleep(seconds)
+        if marker:
+            ctx.errors.append(marker)
+
+    return collect
+
+
+QUIET = {
+    "_collect_scan_results": lambda self, ctx, *a: None,
+    "_collect_plan_files": lambda self, ctx, *a: None,
+    "_collect_blast_radius": lambda self, ctx: None,
+    "_collect_code": lambda self, ctx: None,
+    "_collect_changed_files": lambda self, ctx: None,
+}
+
+
+class TestInventoryReuse:
+    def test_fresh_report_skips_inventory_run(self, tmp_path):
+        directory = _project(tmp_path, report_age=60)
+        with patch.multiple(ContextBuilder, **QUIET), patch(
+            "thothctl.services.ai_review.analyzers.context_builder.asyncio.run"
+        ) as run:
+            ctx = ContextBuilder().build_context(directory)
+
+        run.assert_not_called()
+        assert ctx.errors == []
+        assert ctx.reused_artifacts == ["inventory"]
+        assert ctx.project_type == "terraform"
+        assert [m["name"] for m in ctx.modules] == ["vpc"]
+        assert [p["name"] for p in ctx.providers] == ["aws"]
+
+    def test_stale_report_is_ignored(self, tmp_path):
+        directory = _project(tmp_path, report_age=-60)
+        assert ContextBuilder._load_fresh_inventory(directory, time.time()) is None
+
+
+class TestConcurrentCollectors:
+    def test_collectors_overlap_and_record_timings(self, tmp_path):
+        slow = {
+            name: _sleeper(0.3)
+            for name in (
+                "_collect_inventory",
+                "_collect_scan_results",
+                "_collect_plan_files",
+                "_collect_blast_radius",
+                "_collect_code",
+                "_collect_changed_files",
+            )
+        }
+        start = time.perf_counter()
+        with patch.multiple(ContextBuilder, **slow):
+            ctx = ContextBuilder().build_context(str(tmp_path))
+
+        assert time.perf_counter() - start < 1.0
+        assert list(ctx.timings) == [
+            "inventory",
+            "scan_results",
+            "plan_files",
+            "blast_radius",
+            "code",
+            "changed_files",
+        ]
+        assert all(t >= 0.3 for t in ctx.timings.values())
+
+    def test_collector_over_budget_is_dropped(self, tmp_path):
+        with patch.multiple(
+            ContextBuilder,
+            _collect_inventory=_sleeper(2, marker="late"),
+            **QUIET,
+        ):
+            builder = ContextBuilder(budgets={"inventory": 0.2})
+            start = time.perf_counter()
+            ctx = builder.build_context(str(tmp_path))
+
+        assert time.perf_counter() - start < 1.5
+        assert "late" not in ctx.errors
+        assert any("inventory skipped" in e for e in ctx.errors)
+
+    def test_hung_collector_does_not_hold_up_exit(self, tmp_path):
+        script = f"""
+import time
+from thothctl.services.ai_review.analyzers.context_builder import ContextBuilder
+ContextBuilder._collect_inventory = lambda self, ctx, *a: time.sleep(60)
+ctx = ContextBuilder(budgets={{"inventory": 0.2}}).build_context({str(tmp_path)!r})
+print(ctx.errors[0])
+"""
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        )
+
+        assert "inventory skipped" in result.stdout
+        assert time.perf_counter() - start < 20
+
+    def test_plan_summaries_survive_code_collection(self, tmp_path):
+        def plans(self, ctx, *args):
+            ctx.code_files["[PLAN] tfplan.json (vpc)"] = "# plan"
+
+        def code(self, ctx):
+            ctx.code_files = {"main.tf": "resource {}"}
+
+        with patch.multiple(
+            ContextBuilder,
+            _collect_inventory=lambda self, ctx, *a: None,
+            _collect_scan_results=lambda self, ctx, *a: None,
+            _collect_blast_radius=lambda self, ctx: None,
+            _collect_changed_files=lambda self, ctx: None,
+            _collect_plan_files=plans,
+            _collect_code=code,
+        ):
+            ctx = ContextBuilder(max_workers=1).build_context(str(tmp_path))
+
+        assert set(ctx.code_files) == {"[PLAN] tfplan.json (vpc)", "main.tf"}
+        assert isinstance(ctx, IaCContext)
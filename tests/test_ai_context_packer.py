@@ -0,0 +1,123 @@
+"""Tests for token-budgeted context packing in AI review prompts."""
+
+from thothctl.services.ai_review.analyzers.code_reviewer import CodeReviewer
+from thothctl.services.ai_review.analyzers.context_builder import (
+    ContextBuilder,
+    IaCContext,
+)
+from thothctl.services.ai_review.analyzers.context_packer import (
+    MAX_CONTEXT_TOKENS,
+    ContextPacker,
+    context_budget,
+    estimate_tokens,
+)
+from thothctl.services.ai_review.config.ai_settings import ProviderConfig
+
+
+def _context(findings=(), code=None, modules=0, changed=()):
+    ctx = IaCContext(directory="/repo", project_type="terraform")
+    ctx.scan_results = {
+        "total_findings": len(findings),
+        "tools": {
+            "checkov": {
+                "passed": 5,
+                "failed": len(findings),
+                "findings": [
+                    {
+                        "severity": severity,
+                        "check_id": check_id,
+                        "check_name": "check",
+                        "resource": "aws_s3_bucket.logs",
+                        "file": "main.tf",
+                    }
+                    for severity, check_id in findings
+                ],
+            }
+        },
+    }
+    ctx.modules = [
+        {"name": f"module-{i}", "version": "1.0", "latest_version": "1.0"}
+        for i in range(modules)
+    ]
+    ctx.code_files = dict(code or {})
+    ctx.changed_files = list(changed)
+    return ctx
+
+
+class TestContextPacker:
+    def test_fills_budget_by_priority(self):
+        packer = ContextPacker(budget_tokens=60)
+        packer.section("a", "## A")
+        packer.add("a", "low " * 60, priority=8)
+        packer.add("a", "critical finding", priority=0)
+        packed = packer.pack()
+
+        assert "critical finding" in packed.text
+        assert "low" not in packed.text
+        assert packed.sections["a"].dropped == 1
+        assert packed.used_tokens <= 60
+
+    def test_duplicates_are_folded(self):
+        packer = ContextPacker(budget_tokens=1000)
+        packer.add("code", "same content", priority=8, label="a.tf")
+        packer.add("code", "same   content", priority=2, label="b.tf")
+        packed = packer.pack()
+
+        assert packed.text.count("same content") == 1
+        assert "identical: b.tf" in packed.text
+        assert packed.sections["code"].duplicates == 1
+
+    def test_truncatable_item_is_cut_to_fit(self):
+        packer = ContextPacker(budget_tokens=400)
+        packer.add("code", "x" * 4000, priority=2, truncatable=True)
+        packed = packer.pack()
+
+        assert "[... truncated]" in packed.text
+        assert packed.used_tokens <= 400
+
+
+class TestContextBudget:
+    def test_derived_from_model_window(self):
+        small = context_budget(ProviderConfig(model="llama3", max_tokens=2000))
+        large = context_budget(ProviderConfig(model="gpt-4-turbo-preview"))
+        assert small == 8192 - 2000 - 2000
+        assert large == MAX_CONTEXT_TOKENS
+
+    def test_explicit_budget_wins(self):
+        assert (
+            context_budget(ProviderConfig(model="gpt-4", context_tokens=3000)) == 3000
+        )
+
+
+class TestFormatForAi:
+    def test_critical_findings_survive_large_inventory(self):
+        ctx = _context(findings=[("CRITICAL", "CKV_AWS_1")], modules=500)
+        builder = ContextBuilder()
+        text = builder.format_for_ai(ctx, budget_tokens=1000)
+
+        assert "[CRITICAL] checkov CKV_AWS_1" in text
+        assert estimate_tokens(text) <= 1000
+        assert builder.last_packing.sections["inventory"].dropped > 0
+
+    def test_changed_code_before_other_code(self):
+        code = {"changed.tf": "a" * 2000, "other.tf": "b" * 2000}
+        ctx = _context(code=code, changed=["changed.tf"])
+        text = ContextBuilder().format_for_ai(ctx, budget_tokens=700)
+
+        assert "--- changed.tf ---" in text
+        assert "--- other.tf ---" not in text
+        assert "[Truncated: 1 file(s) omitted]" in text
+
+    def test_duplicate_findings_are_reported_once(self):
+        ctx = _context(findings=[("HIGH", "CKV_AWS_2"), ("HIGH", "CKV_AWS_2")])
+        text = ContextBuilder().format_for_ai(ctx)
+        assert text.count("CKV_AWS_2") == 1
+
+    def test_code_reviewer_prioritizes_changed_files(self):
+        reviewer = CodeReviewer()
+        files = {"a.tf": "a" * 400, "b.tf": "b" * 400, "c.tf": "a" * 400}
+        text = reviewer.format_for_ai(files, budget_tokens=150, priority_files=["b.tf"])
+
+        assert "--- File: b.tf ---" in text
+        assert "Total files to review: 3" in text
+        assert reviewer.last_packing.sections["code"].duplicates == 1
@@ -0,0 +1,126 @@
+"""Tests for the local AI response cache."""
+
+import time
+from unittest.mock import patch
+
+from thothctl.services.ai_review.utils.cost_tracker import CostTracker
+from thothctl.services.ai_review.utils.response_cache import ResponseCache, make_key
+from thothctl.services.ai_review.utils.usage_ledger import UsageLedger
+
+
+class FakeProvider:
+    name = "ollama"
+    model = "qwen2.5"
+    temperature = 0.1
+
+    def __init__(self):
+        self.calls = 0
+
+    def analyze(self, system_prompt, user_content):
+        self.calls += 1
+        return {
+            "findings": [{"id": user_content}],
+            "_usage": {"input_tokens": 1200, "output_tokens": 300},
+        }
+
+
+class ReplyProvider(FakeProvider):
+    """Returns a fixed reply, whatever the schema."""
+
+    def __init__(self, reply):
+        super().__init__()
+        self.reply = reply
+
+    def analyze(self, system_prompt, user_content):
+        self.calls += 1
+        return dict(self.reply)
+
+
+def _cache(tmp_path, **kwargs):
+    return ResponseCache(db_path=tmp_path / "cache.db", **kwargs)
+
+
+class TestResponseCache:
+    def test_second_identical_call_is_served_from_cache(self, tmp_path):
+        cache, provider = _cache(tmp_path), FakeProvider()
+        first = cache.analyze(provider, "system", "context")
+        second = cache.analyze(provider, "system", "context")
+
+        assert provider.calls == 1
+        assert second["findings"] == first["findings"]
+        assert second["_usage"] == {
+            "input_tokens": 1200,
+            "output_tokens": 300,
+            "cached": True,
+        }
+        assert "cached" not in first["_usage"]
+
+    def test_key_covers_every_request_field(self):
+        base = ("ollama", "qwen2.5", 0.1, "system", "context")
+        keys = {make_key(*base)}
+        for i, value in enumerate(("openai", "llama3", 0.7, "other", "changed")):
+            changed = list(base)
+            changed[i] = value
+            keys.add(make_key(*changed))
+        assert len(keys) == 6
+
+    def test_expired_entries_are_not_served(self, tmp_path):
+        cache, provider = _cache(tmp_path, ttl_hours=1), FakeProvider()
+        cache.analyze(provider, "system", "context")
+        with patch(
+            "thothctl.services.ai_review.utils.response_cache.time.time",
+            return_value=time.time() + 7200,
+        ):
+            cache.analyze(provider, "system", "context")
+            assert cache.purge_expired() == 0
+        assert provider.calls == 2
+
+    def test_disabled_cache_always_calls_provider(self, tmp_path):
+        cache, provider = _cache(tmp_path, enabled=False), FakeProvider()
+        cache.analyze(provider, "system", "context")
+        cache.analyze(provider, "system", "context")
+        assert provider.calls == 2
+        assert not (tmp_path / "cache.db").exists()
+
+    def test_fallback_and_partial_replies_are_not_cached(self, tmp_path):
+        cache = _cache(tmp_path)
+        replies = [
+            # Ollama's wrapper for a reply that was not JSON
+            {"findings": [], "risk_score": 0, "_raw_text": "I think it's fine"},
+            {"findings": [{"id": "x"}], "_partial": True},
+        ]
+        for reply in replies:
+            provider = ReplyProvider(reply)
+            with patch.object(cache, "put") as put:
+                assert cache.analyze(provider, "system", str(reply)) == reply
+            put.assert_not_called()
+
+    def test_clean_reviews_and_other_schemas_are_cached(self, tmp_path):
+        cache = _cache(tmp_path)
+        replies = [
+            {"findings": [], "risk_score": 0},
+            {"issues": [{"line": 3, "message": "unused variable"}]},
+            {"fixes": [{"file": "main.tf", "patch": "..."}]},
+            {"risk_level": "LOW", "blast_radius": "none"},
+        ]
+        for reply in replies:
+            provider = ReplyProvider(reply)
+            first = cache.analyze(provider, "system", str(reply))
+            second = cache.analyze(provider, "system", str(reply))
+            assert provider.calls == 1
+            assert first == reply
+            assert {k: v for k, v in second.items() if k != "_usage"} == reply
+
+
+class TestCostTrackerCacheHits:
+    def test_hits_are_zero_cost_and_counted(self, tmp_path):
+        tracker = CostTracker(ledger=UsageLedger(tmp_path / "usage.db"))
+        paid = tracker.record_usage("openai", "gpt-4", 1000, 1000)
+        free = tracker.record_usage("openai", "gpt-4", 1000, 1000, cached=True)
+
+        report = tracker.get_cost_report("daily")
+        assert paid > 0 and free == 0.0
+        assert report["total_cost"] == paid
+        assert report["total_requests"] == 1
+        assert report["total_input_tokens"] == 1000
+        assert report["cache_hits"] == 1
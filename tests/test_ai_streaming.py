@@ -0,0 +1,144 @@
+"""Tests for streaming AI provider responses."""
+
+import json
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from thothctl.services.ai_review.orchestrator import (
+    AgentOrchestrator,
+    AgentRole,
+    AgentTask,
+    OrchestratorResult,
+)
+from thothctl.services.ai_review.providers.streaming import (
+    IncrementalJSONParser,
+    StreamCancelled,
+    stream_analyze,
+)
+from thothctl.services.ai_review.utils.response_cache import ResponseCache
+
+RESPONSE = json.dumps(
+    {
+        "summary": {"total_findings": 2},
+        "findings": [
+            {"id": "F1", "severity": "HIGH", "title": 'bucket "logs" {public}'},
+            {"id": "F2", "severity": "LOW", "nested": {"list": [1, [2]]}},
+        ],
+        "risk_score": 40,
+    }
+)
+
+
+class StreamingProvider:
+    name = "ollama"
+    model = "qwen2.5"
+    temperature = 0.1
+
+    def __init__(self, text=RESPONSE, chunk_size=7, hang_after=None):
+        self.text = text
+        self.chunk_size = chunk_size
+        self.hang_after = hang_after
+        self.release = threading.Event()
+
+    def stream(self, system_prompt, user_content):
+        for i in range(0, len(self.text), self.chunk_size):
+            if self.hang_after is not None and i >= self.hang_after:
+                self.release.wait(5)
+                return
+            yield self.text[i : i + self.chunk_size]
+        yield {"_usage": {"input_tokens": 100, "output_tokens": 50}}
+
+
+class TestIncrementalJSONParser:
+    def test_array_items_complete_as_they_close(self):
+        parser = IncrementalJSONParser()
+        completed = []
+        for i in range(0, len(RESPONSE), 3):
+            completed.extend(parser.feed(RESPONSE[i : i + 3]))
+
+        assert [key for key, _ in completed] == ["findings", "findings"]
+        assert completed[0][1]["title"] == 'bucket "logs" {public}'
+        assert completed[1][1]["nested"] == {"list": [1, [2]]}
+        assert parser.complete
+        assert json.loads(parser.document()) == json.loads(RESPONSE)
+
+    def test_skips_text_before_object(self):
+        parser = IncrementalJSONParser()
+        completed = parser.feed('Here you go:\n```json\n{"fixes": [{"a": 1}]}\n```')
+        assert completed == [("fixes", {"a": 1})]
+
+
+class TestStreamAnalyze:
+    def test_returns_result_and_usage(self):
+        items, tokens = [], []
+        result = stream_analyze(
+            StreamingProvider(),
+            "system",
+            "context",
+            on_token=tokens.append,
+            on_item=lambda key, item: items.append(item["id"]),
+        )
+
+        assert items == ["F1", "F2"]
+        assert "".join(tokens) == RESPONSE
+        assert result["risk_score"] == 40
+        assert result["_usage"] == {"input_tokens": 100, "output_tokens": 50}
+
+    def test_timeout_cancels_with_partial_items(self):
+        provider = StreamingProvider(hang_after=RESPONSE.index('{"id": "F2"'))
+        with pytest.raises(StreamCancelled) as exc:
+            stream_analyze(provider, "system", "context", timeout=0.2)
+        provider.release.set()
+
+        assert [f["id"] for f in exc.value.partial["findings"]] == ["F1"]
+        assert exc.value.partial["_partial"] is True
+
+    def test_provider_without_stream_uses_analyze(self):
+        provider = Mock(spec=["name", "analyze"])
+        provider.analyze.return_value = {"findings": []}
+        assert stream_analyze(provider, "system", "context") == {"findings": []}
+
+
+class TestOrchestratorStreaming:
+    def _orchestrator(self, provider, tmp_path, **kwargs):
+        orch = AgentOrchestrator.__new__(AgentOrchestrator)
+        orch.cost_tracker = Mock()
+        orch.response_cache = ResponseCache(db_path=tmp_path / "cache.db")
+        orch.max_parallel = 2
+        orch.streaming = True
+        orch.stream_timeout = kwargs.get("stream_timeout")
+        orch.on_stream_item = kwargs.get("on_stream_item")
+        orch._provider = provider
+        return orch
+
+    def test_items_reported_per_role(self, tmp_path):
+        seen = []
+        orch = self._orchestrator(
+            StreamingProvider(),
+            tmp_path,
+            on_stream_item=lambda role, key, item: seen.append((role, item["id"])),
+        )
+        result = OrchestratorResult()
+        orch._run_task(AgentTask(AgentRole.SECURITY, "system", "context"), result)
+
+        assert seen == [(AgentRole.SECURITY, "F1"), (AgentRole.SECURITY, "F2")]
+        assert result.security["risk_score"] == 40
+        assert result.errors == []
+
+    def test_cancelled_stream_keeps_partial_result(self, tmp_path):
+        provider = StreamingProvider(hang_after=RESPONSE.index('{"id": "F2"'))
+        orch = self._orchestrator(provider, tmp_path, stream_timeout=0.2)
+        result = OrchestratorResult()
+        tasks = [
+            AgentTask(AgentRole.SECURITY, "system", "security context"),
+            AgentTask(AgentRole.ARCHITECTURE, "system", "architecture context"),
+        ]
+        orch._execute_tasks(tasks, result)
+        provider.release.set()
+
+        assert result.security["_partial"] is True
+        assert [f["id"] for f in result.security["findings"]] == ["F1"]
+        assert len(result.errors) == 2
+        assert "partial result kept" in result.errors[0]
@@ -0,0 +1,108 @@
+"""Tests for the SQLite usage ledger behind the AI cost tracker."""
+
+import gc
+import json
+import sqlite3
+from datetime import date, timedelta
+
+from thothctl.services.ai_review.utils import usage_ledger
+from thothctl.services.ai_review.utils.cost_tracker import CostTracker
+from thothctl.services.ai_review.utils.usage_ledger import UsageLedger
+
+
+def _record(day, model="gpt-4", cost=1.0, cached=False, provider="openai"):
+    return {
+        "timestamp": f"{day}T10:00:00",
+        "provider": provider,
+        "model": model,
+        "input_tokens": 100,
+        "output_tokens": 50,
+        "cost": cost,
+        "cached": cached,
+    }
+
+
+def _rows(db_path, table):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestUsageLedger:
+    def test_writes_are_batched_and_pending_is_counted(self, tmp_path):
+        db = tmp_path / "usage.db"
+        ledger = UsageLedger(db, batch_size=3, flush_seconds=60)
+        ledger.add(_record("2026-01-05"))
+        ledger.add(_record("2026-01-05"))
+
+        assert not db.exists()
+        assert ledger.spend("2026-01-01") == 2.0
+
+        ledger.add(_record("2026-01-05"))
+        assert _rows(db, "usage") == 3
+        assert _rows(db, "daily_rollup") == 1
+        assert ledger.spend("2026-01-01") == 3.0
+
+    def test_rollups_by_day_and_model(self, tmp_path):
+        ledger = UsageLedger(tmp_path / "usage.db", batch_size=1)
+        ledger.add(_record("2026-01-04", cost=5.0))
+        ledger.add(_record("2026-01-05", model="gpt-3.5-turbo", cost=0.5))
+        ledger.add(_record("2026-01-05", cost=2.0))
+        ledger.add(_record("2026-01-05", cost=0.0, cached=True))
+
+        day = ledger.totals("2026-01-05", "2026-01-05")
+        assert day["total_cost"] == 2.5
+        assert day["total_requests"] == 2
+        assert day["total_input_tokens"] == 200
+        assert day["cache_hits"] == 1
+        assert day["by_model"] == {"gpt-3.5-turbo": 0.5, "gpt-4": 2.0}
+        assert ledger.spend("2026-01-01") == 7.5
+        assert [r["cached"] for r in ledger.recent(2)] == [False, True]
+
+    def test_legacy_jsonl_is_imported_once(self, tmp_path):
+        log_dir = tmp_path / "ai_costs"
+        log_dir.mkdir()
+        with open(log_dir / "2026-01-05.jsonl", "w") as f:
+            for record in (_record("2026-01-05"), _record("2026-01-05", cost=2.0)):
+                f.write(json.dumps(record) + "\n")
+
+        ledger = UsageLedger(log_dir / "usage.db")
+        assert ledger.import_jsonl(log_dir) == 2
+        assert ledger.import_jsonl(log_dir) == 0
+        assert ledger.spend("2026-01-01") == 3.0
+
+    def test_discarded_ledgers_are_flushed_and_released(self, tmp_path):
+        db = tmp_path / "usage.db"
+        ledger = UsageLedger(db, batch_size=10, flush_seconds=60)
+        ledger.add(_record("2026-01-05"))
+        assert ledger in usage_ledger._LEDGERS
+
+        del ledger
+        gc.collect()
+
+        assert _rows(db, "usage") == 1
+        assert not any(led.db_path == db for led in usage_ledger._LEDGERS)
+
+
+class TestCostTrackerLedger:
+    def test_budget_check_reads_rollups(self, tmp_path):
+        tracker = CostTracker(
+            daily_limit=1.0, ledger=UsageLedger(tmp_path / "usage.db")
+        )
+        assert tracker.check_budget()
+        tracker.record_usage("openai", "gpt-4", 20000, 10000)
+
+        assert tracker.get_daily_spend() > 1.0
+        assert not tracker.check_budget()
+
+    def test_weekly_report_covers_last_seven_days(self, tmp_path):
+        ledger = UsageLedger(tmp_path / "usage.db", batch_size=1)
+        today = date.today()
+        ledger.add(_record((today - timedelta(days=6)).isoformat()))
+        ledger.add(_record((today - timedelta(days=7)).isoformat()))
+
+        report = CostTracker(ledger=ledger).get_cost_report("weekly")
+        assert report["period"] == "weekly"
+        assert report["total_requests"] == 1
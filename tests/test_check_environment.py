@@ -0,0 +1,71 @@
+"""Tests for the concurrent, cached tool probes of the environment checker."""
+
+import os
+import stat
+import sys
+
+import pytest
+
+from thothctl.services.check.environment.check_environment import EnvironmentChecker
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="fake tools are shell scripts"
+)
+
+
+def _fake_tool(bin_dir, name, version, calls):
+    script = bin_dir / name
+    script.write_text(
+        f'#!/bin/sh\necho {name} >> "{calls}"\necho "{name} v{version}"\n'
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return script
+
+
+@pytest.fixture
+def checker(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    calls = tmp_path / "calls.log"
+    _fake_tool(bin_dir, "alpha", "1.2.3", calls)
+    _fake_tool(bin_dir, "beta", "0.4.0", calls)
+    monkeypatch.setenv("PATH", str(bin_dir))
+
+    checker = EnvironmentChecker(cache_file=tmp_path / "tool_versions.json")
+    checker.tools = [
+        {"name": "alpha", "version": "1.2.3"},
+        {"name": "beta", "version": "0.5.0", "command": "beta version"},
+        {"name": "gamma", "version": "2.0.0"},
+    ]
+    checker.calls = calls
+    checker.bin_dir = bin_dir
+    return checker
+
+
+def _calls(checker):
+    return sorted(checker.calls.read_text().split()) if checker.calls.exists() else []
+
+
+def test_probes_keep_tool_order_and_skip_missing_binaries(checker):
+    assert checker.probe_tools() == [(True, "1.2.3"), (True, "0.4.0"), (False, "")]
+    assert _calls(checker) == ["alpha", "beta"]
+
+
+def test_unchanged_binaries_are_not_executed_again(checker):
+    first = checker.probe_tools()
+    second = checker.probe_tools()
+
+    assert first == second
+    assert _calls(checker) == ["alpha", "beta"]
+
+
+def test_changed_binary_and_refresh_reprobe(checker):
+    checker.probe_tools()
+    _fake_tool(checker.bin_dir, "alpha", "1.3.0-rc1", checker.calls)
+    os.utime(checker.bin_dir / "alpha", ns=(0, 1))
+
+    assert checker.probe_tools()[0] == (True, "1.3.0")
+    assert _calls(checker) == ["alpha", "alpha", "beta"]
+
+    checker.probe_tools(refresh=True)
+    assert _calls(checker) == ["alpha", "alpha", "alpha", "beta", "beta"]
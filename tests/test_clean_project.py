@@ -0,0 +1,66 @@
+"""Tests for the pruned, parallel project cleanup."""
+
+import os
+
+import pytest
+
+from thothctl.services.project.cleanup.clean_project import (
+    cleanup_project,
+    find_cleanup_targets,
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    stack = tmp_path / "stacks" / "network"
+    cache = stack / ".terraform" / "providers" / "aws"
+    cache.mkdir(parents=True)
+    (cache / "provider-bin").write_bytes(b"x" * 1000)
+    (stack / ".terraform" / "nested.terraform").mkdir()
+    grunt = tmp_path / "stacks" / ".terragrunt-cache" / "abc"
+    grunt.mkdir(parents=True)
+    (grunt / "main.tf").write_bytes(b"y" * 24)
+    (stack / "main.tf").write_text("module {}\n")
+    (stack / "plan.tfplan").write_bytes(b"p" * 10)
+    (tmp_path / "debug.log").write_text("log")
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    return tmp_path
+
+
+def test_matched_folders_are_pruned_from_the_walk(project):
+    folders, files = find_cleanup_targets(
+        project, [".terraform", ".terragrunt-cache"], ["*tfplan*"]
+    )
+    assert sorted(os.path.relpath(f, project) for f in folders) == [
+        os.path.join("stacks", ".terragrunt-cache"),
+        os.path.join("stacks", "network", ".terraform"),
+    ]
+    assert [os.path.relpath(f, project) for f in files] == [
+        os.path.join("stacks", "network", "plan.tfplan")
+    ]
+
+
+def test_dry_run_reports_reclaimable_bytes_without_deleting(project, capsys):
+    stats = cleanup_project(str(project), dry_run=True)
+
+    assert (stats.folders, stats.files, stats.bytes) == (2, 3, 1034)
+    assert (project / "stacks" / "network" / ".terraform").exists()
+    assert (project / "stacks" / "network" / "plan.tfplan").exists()
+    assert "Nothing was removed" in capsys.readouterr().out
+
+
+def test_cleanup_removes_defaults_and_additional_patterns(project, capsys):
+    stats = cleanup_project(
+        str(project), additional_files="*.log", additional_folders="node_modules"
+    )
+
+    assert (stats.folders, stats.files, stats.errors) == (3, 4, 0)
+    assert stats.bytes == 1037
+    remaining = sorted(
+        os.path.relpath(os.path.join(d, f), project)
+        for d, _, names in os.walk(project)
+        for f in names
+    )
+    assert remaining == [os.path.join("stacks", "network", "main.tf")]
+    assert not (project / "node_modules").exists()
+    assert "files/s" in capsys.readouterr().out
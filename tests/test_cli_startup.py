@@ -0,0 +1,98 @@
+"""Tests for lazy command loading and the help manifest of the top-level CLI."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+
+import thothctl
+from thothctl.cli import cli
+from thothctl.core.command_manifest import (
+    COMMANDS_DIR,
+    MANIFEST_PATH,
+    build_manifest,
+    extract_help,
+    load_help,
+)
+from thothctl.core.startup_profile import parse_importtime, summarize
+
+
+def test_committed_manifest_is_current():
+    """Regenerate with: python -m thothctl.core.command_manifest"""
+    committed = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    assert committed == build_manifest(COMMANDS_DIR)
+
+
+def test_help_does_not_import_command_modules():
+    # Fresh interpreter, so modules imported by other tests don't interfere
+    script = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from thothctl.cli import cli\n"
+        "result = CliRunner().invoke(cli, ['--help'])\n"
+        "assert result.exit_code == 0, result.output\n"
+        "assert 'Upgrade thothctl to the latest version' in result.output\n"
+        "print([m for m in sys.modules if m.startswith('thothctl.commands.')])\n"
+    )
+    src = str(Path(thothctl.__file__).parent.parent)
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        env=dict(os.environ, PYTHONPATH=src),
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "[]"
+
+
+def test_get_command_is_memoized_through_sys_modules():
+    ctx = click.Context(cli)
+    first = cli.get_command(ctx, "upgrade")
+
+    assert first is cli.get_command(ctx, "upgrade")
+    assert sys.modules["thothctl.commands.upgrade.cli"].cli is first
+
+
+def test_extract_help_ignores_option_help():
+    source = (
+        "import click\n"
+        "@click.command(short_help='Short')\n"
+        "@click.option('--x', help='Option help')\n"
+        "def cli(x):\n"
+        "    '''Long help.'''\n"
+        "other = Cmd.as_click_command(help='nope')\n"
+    )
+    assert extract_help(source) == {
+        "help": "Long help.",
+        "short_help": "Short",
+        "hidden": False,
+    }
+
+
+def test_stale_entries_are_reread_from_source(tmp_path):
+    commands = tmp_path / "commands"
+    (commands / "demo").mkdir(parents=True)
+    cli_file = commands / "demo" / "cli.py"
+    cli_file.write_text("cli = DemoCommand.as_click_command(help='Old')(opt)\n")
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        '{"version": 1, "commands": {"demo": {"hash": "x", "help": "Stale",'
+        ' "short_help": null, "hidden": false}}}'
+    )
+
+    assert load_help(commands, manifest)["demo"]["help"] == "Old"
+
+
+def test_importtime_summary_groups_by_package():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       100 |        100 |   click.types\n"
+        "import time:       300 |        400 | click\n"
+        "import time:      2000 |       2000 |     thothctl.services.scan.x\n"
+        "import time:        50 |       2050 |   thothctl.services.scan\n"
+    )
+    rows = summarize(parse_importtime(stderr))
+    assert rows == [("thothctl.services.scan", 2050, 2), ("click", 400, 2)]
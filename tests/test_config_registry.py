@@ -0,0 +1,121 @@
+"""Tests for the cached project/space registry backing ~/.thothcf."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import toml
+
+from thothctl.common import common
+from thothctl.common.registry import ThothRegistry, atomic_write_toml
+
+
+def _write(path: Path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fp:
+        toml.dump(content, fp)
+
+
+def _seed(config_dir: Path, projects: int = 3):
+    _write(
+        config_dir / ".thothcf.toml",
+        {
+            f"proj-{i}": {"thothcf": {"project_id": f"proj-{i}", "space": "legacy"}}
+            for i in range(projects)
+        },
+    )
+    _write(
+        config_dir / "spaces.toml",
+        {
+            "spaces": {
+                "dev": {"description": "Dev", "projects": {"proj-0": {}}},
+                "legacy": {"description": "Old"},
+            }
+        },
+    )
+
+
+class TestThothRegistry:
+    def test_indexes_are_built_with_one_parse_per_file(self, tmp_path):
+        _seed(tmp_path, projects=1000)
+        registry = ThothRegistry(tmp_path)
+
+        projects = registry.list_projects()
+        spaces = [registry.get_project_space(p) for p in projects]
+
+        assert len(projects) == 1000
+        assert set(spaces) == {"legacy"}
+        assert registry.parse_count == 2
+
+    def test_namespaced_projects_win_over_legacy(self, tmp_path):
+        _seed(tmp_path)
+        registry = ThothRegistry(tmp_path)
+
+        assert registry.get_projects_in_space("dev") == ["proj-0"]
+        assert registry.get_projects_in_space("legacy") == [
+            "proj-0",
+            "proj-1",
+            "proj-2",
+        ]
+        assert registry.get_projects_in_space("missing") == []
+        assert registry.list_spaces() == ["dev", "legacy"]
+
+    def test_external_change_is_detected(self, tmp_path):
+        _seed(tmp_path)
+        registry = ThothRegistry(tmp_path)
+        assert registry.get_project_space("proj-1") == "legacy"
+
+        config = toml.load(tmp_path / ".thothcf.toml")
+        config["proj-1"]["thothcf"]["space"] = "dev"
+        atomic_write_toml(tmp_path / ".thothcf.toml", config)
+
+        assert registry.get_project_space("proj-1") == "dev"
+
+    def test_unchanged_files_are_not_reparsed(self, tmp_path):
+        _seed(tmp_path)
+        registry = ThothRegistry(tmp_path)
+        registry.list_projects()
+        registry.list_spaces()
+        registry.get_space_details()
+        assert registry.parse_count == 2
+
+    def test_save_updates_cache_and_disk(self, tmp_path):
+        _seed(tmp_path)
+        registry = ThothRegistry(tmp_path)
+        config = registry.projects_config()
+        config["new"] = {"thothcf": {"project_id": "new", "space": "dev"}}
+        registry.save_projects(config)
+
+        assert "new" in toml.load(tmp_path / ".thothcf.toml")
+        assert registry.get_project_space("new") == "dev"
+        assert not [f for f in os.listdir(tmp_path) if f.startswith(".thothcf.toml.")]
+
+    def test_returned_configs_are_copies(self, tmp_path):
+        _seed(tmp_path)
+        registry = ThothRegistry(tmp_path)
+        registry.projects_config()["proj-0"]["thothcf"]["space"] = "mutated"
+        registry.get_space_details()["dev"]["description"] = "mutated"
+
+        assert registry.get_project_space("proj-0") == "legacy"
+        assert registry.get_space_details()["dev"]["description"] == "Dev"
+
+    def test_missing_files(self, tmp_path):
+        registry = ThothRegistry(tmp_path)
+        assert registry.list_projects() is None
+        assert registry.list_spaces() == []
+        assert registry.get_project_space("x") is None
+
+
+class TestCommonHelpers:
+    def test_helpers_use_home_registry(self, tmp_path):
+        _seed(tmp_path / ".thothcf")
+        with patch.object(Path, "home", return_value=tmp_path):
+            assert common.list_projects() == ["proj-0", "proj-1", "proj-2"]
+            assert common.get_project_space("proj-2") == "legacy"
+            assert common.get_projects_in_space("dev") == ["proj-0"]
+
+            common.register_project_in_space("proj-1", "dev")
+            assert common.get_projects_in_space("dev") == ["proj-0", "proj-1"]
+
+            common.unregister_project_from_space("proj-0", "dev")
+            assert common.get_projects_in_space("dev") == ["proj-1"]
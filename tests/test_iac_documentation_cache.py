@@ -0,0 +1,124 @@
+"""Tests for the concurrent, cached terraform-docs generation."""
+
+import logging
+import os
+import re
+import threading
+
+from thothctl.services.document.iac_documentation import (
+    DOCS_CACHE_FILE,
+    TerraformDocsConfig,
+    TerraformDocsContentProvider,
+    TerraformDocsGenerator,
+)
+
+
+class FakeTerraformDocs:
+    """Renders the variable names of a module between the README markers."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.runs = []
+        self.lock = threading.Lock()
+
+    def execute(self, command, cwd, input_data=None):
+        if command[1] == "--version":
+            return "terraform-docs v0.19.0\n", "", 0
+        with self.lock:
+            self.runs.append(cwd.name)
+        if cwd.name in self.fail:
+            return "", "boom", 1
+        target = cwd / command[command.index("--output-file") + 1]
+        names = sorted(
+            re.findall(
+                r'variable "(\w+)"', "".join(p.read_text() for p in cwd.glob("*.tf"))
+            )
+        )
+        body = "\n".join(f"- {name}" for name in names)
+        target.write_text(
+            re.sub(
+                r"<!-- BEGIN_TF_DOCS -->.*<!-- END_TF_DOCS -->",
+                f"<!-- BEGIN_TF_DOCS -->\n{body}\n<!-- END_TF_DOCS -->",
+                target.read_text(),
+                flags=re.S,
+            )
+        )
+        return "", "", 0
+
+
+def _generate(root, executor, **kwargs):
+    generator = TerraformDocsGenerator(
+        executor=executor,
+        logger=logging.getLogger("test"),
+        content_provider=TerraformDocsContentProvider(),
+    )
+    generator.temp_config_path = root.parent / "terraform-docs.yml"
+    config = TerraformDocsConfig(
+        directory=root.resolve(), mood="modules", recursive=True, **kwargs
+    )
+    return generator.generate(config)
+
+
+def _library(tmp_path, count=3):
+    root = tmp_path / "library"
+    for i in range(count):
+        module = root / f"mod{i}"
+        module.mkdir(parents=True)
+        (module / "variables.tf").write_text(f'variable "input_{i}" {{}}\n')
+    return root
+
+
+def test_unchanged_modules_are_skipped_on_the_next_run(tmp_path):
+    root = _library(tmp_path)
+    executor = FakeTerraformDocs()
+
+    first = _generate(root, executor)
+    assert first.success and len(first.processed_dirs) == 3
+    assert sorted(executor.runs) == ["mod0", "mod1", "mod2"]
+    assert "- input_1" in (root / "mod1" / "README.md").read_text()
+    assert (root / DOCS_CACHE_FILE).is_file()
+
+    executor.runs.clear()
+    (root / "mod1" / "variables.tf").write_text('variable "renamed" {}\n')
+    second = _generate(root, executor)
+
+    assert executor.runs == ["mod1"]
+    assert len(second.unchanged_dirs) == 2
+    assert "- renamed" in (root / "mod1" / "README.md").read_text()
+
+    executor.runs.clear()
+    _generate(root, executor, use_cache=False)
+    assert sorted(executor.runs) == ["mod0", "mod1", "mod2"]
+
+
+def test_identical_output_is_not_rewritten(tmp_path):
+    root = _library(tmp_path, count=1)
+    _generate(root, FakeTerraformDocs())
+    readme = root / "mod0" / "README.md"
+    os.utime(readme, ns=(0, 0))
+
+    # A comment changes the module key but not the rendered documentation.
+    (root / "mod0" / "variables.tf").write_text('# comment\nvariable "input_0" {}\n')
+    executor = FakeTerraformDocs()
+    result = _generate(root, executor)
+
+    assert executor.runs == ["mod0"]
+    assert result.unchanged_dirs == result.processed_dirs
+    assert readme.stat().st_mtime_ns == 0
+    assert sorted(p.name for p in (root / "mod0").iterdir()) == [
+        "README.md",
+        "variables.tf",
+    ]
+
+
+def test_failed_and_hand_edited_modules_run_again(tmp_path):
+    root = _library(tmp_path, count=2)
+    _generate(root, FakeTerraformDocs(fail={"mod0"}))
+
+    readme = root / "mod1" / "README.md"
+    readme.write_text(readme.read_text().replace("- input_1", "- stale"))
+    executor = FakeTerraformDocs()
+    _generate(root, executor)
+
+    assert sorted(executor.runs) == ["mod0", "mod1"]
+    assert "- input_1" in readme.read_text()
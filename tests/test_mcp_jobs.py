@@ -0,0 +1,155 @@
+"""Tests for concurrent command execution and background jobs in the MCP servers."""
+
+import asyncio
+import sys
+import time
+
+from thothctl.services.mcp import stdio_server
+from thothctl.services.mcp.jobs import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_SUCCEEDED,
+    JobManager,
+    run_command,
+)
+from thothctl.services.mcp.simple_http_server import SimpleHTTPMCPServer
+from thothctl.version import __version__
+
+
+def _py(code):
+    return [sys.executable, "-c", code]
+
+
+class TestRunCommand:
+    def test_captures_output(self):
+        result = asyncio.run(run_command(_py("print('hello'); print('world')")))
+        assert result.returncode == 0
+        assert result.stdout == "hello\nworld"
+        assert not result.timed_out
+
+    def test_nonzero_exit(self):
+        result = asyncio.run(
+            run_command(_py("import sys; sys.stderr.write('boom'); sys.exit(3)"))
+        )
+        assert result.returncode == 3
+        assert result.to_text(["x"]) == "Error (exit 3): boom"
+
+    def test_timeout_kills_process(self):
+        start = time.monotonic()
+        result = asyncio.run(
+            run_command(_py("import time; time.sleep(30)"), timeout=0.5)
+        )
+        assert result.timed_out
+        assert time.monotonic() - start < 10
+
+    def test_lines_longer_than_the_stream_buffer(self):
+        result = asyncio.run(
+            run_command(_py("print('x' * 200000); print('tail', end='')"))
+        )
+        assert result.returncode == 0
+        assert result.stdout == "x" * 200000 + "\ntail"
+
+    def test_streams_lines(self):
+        seen = []
+        asyncio.run(run_command(_py("print('a'); print('b')"), on_output=seen.append))
+        assert seen == ["a", "b"]
+
+
+class TestJobManager:
+    def test_job_lifecycle_and_offset_polling(self):
+        async def scenario():
+            manager = JobManager(max_concurrent=2)
+            job = manager.start(_py("print('one'); print('two')"))
+            assert manager.get(job.job_id) is job
+            await job.task
+            first = job.to_dict()
+            second = job.to_dict(offset=first["next_offset"])
+            return job, first, second
+
+        job, first, second = asyncio.run(scenario())
+        assert job.status == JOB_SUCCEEDED
+        assert job.exit_code == 0
+        assert first["output"] == ["one", "two"]
+        assert first["next_offset"] == 2
+        assert second["output"] == []
+
+    def test_failed_job(self):
+        async def scenario():
+            manager = JobManager()
+            job = manager.start(_py("import sys; sys.exit(2)"))
+            await job.task
+            return job
+
+        job = asyncio.run(scenario())
+        assert job.status == JOB_FAILED
+        assert job.exit_code == 2
+
+    def test_cancel_running_job(self):
+        async def scenario():
+            manager = JobManager()
+            job = manager.start(_py("import time; time.sleep(30)"))
+            await asyncio.sleep(0.3)
+            assert manager.cancel(job.job_id)
+            try:
+                await job.task
+            except asyncio.CancelledError:
+                pass
+            return manager, job
+
+        manager, job = asyncio.run(scenario())
+        assert job.status == JOB_CANCELLED
+        assert not manager.cancel(job.job_id)
+
+    def test_cancel_queued_job(self):
+        async def scenario():
+            manager = JobManager(max_concurrent=1)
+            running = manager.start(_py("import time; time.sleep(30)"))
+            queued = manager.start(_py("print('never')"))
+            await asyncio.sleep(0.2)
+            manager.cancel(queued.job_id)
+            manager.cancel(running.job_id)
+            await asyncio.gather(running.task, queued.task, return_exceptions=True)
+            return queued
+
+        queued = asyncio.run(scenario())
+        assert queued.status == JOB_CANCELLED
+        assert queued.output == []
+
+    def test_limit_bounds_concurrent_commands(self):
+        async def scenario():
+            manager = JobManager(max_concurrent=1)
+            sleeper = _py("import time; time.sleep(0.4)")
+            start = time.monotonic()
+            await asyncio.gather(manager.run(sleeper), manager.run(sleeper))
+            return time.monotonic() - start
+
+        assert asyncio.run(scenario()) >= 0.8
+
+    def test_inline_runs_overlap_within_limit(self):
+        async def scenario():
+            manager = JobManager(max_concurrent=4)
+            sleeper = _py("import time; time.sleep(0.5)")
+            start = time.monotonic()
+            await asyncio.gather(*(manager.run(sleeper) for _ in range(4)))
+            return time.monotonic() - start
+
+        assert asyncio.run(scenario()) < 1.8
+
+    def test_version_is_served_while_every_slot_is_busy(self):
+        async def scenario():
+            server = SimpleHTTPMCPServer(max_concurrent=1)
+            sleeper = server.jobs.start(_py("import time; time.sleep(30)"))
+            await asyncio.sleep(0.2)
+            try:
+                return await asyncio.wait_for(
+                    asyncio.gather(
+                        server._execute_thothctl_command("thothctl_version", {}),
+                        stdio_server.thothctl_version(),
+                    ),
+                    timeout=2,
+                )
+            finally:
+                server.jobs.cancel(sleeper.job_id)
+                await asyncio.gather(sleeper.task, return_exceptions=True)
+
+        assert asyncio.run(scenario()) == [f"thothctl version {__version__}"] * 2
@@ -0,0 +1,113 @@
+"""Tests for the SQLite module metadata store and the caches built on it."""
+
+from unittest.mock import patch
+
+import pytest
+
+from thothctl.services.init.space.terraform_module_cache import (
+    TerraformModuleVersions,
+)
+from thothctl.utils.modules_ops.module_metadata_store import ModuleMetadataStore
+from thothctl.utils.modules_ops.terraform_modules_fetcher import (
+    TerraformModulesCache,
+    TerraformModulesFetcher,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ModuleMetadataStore(tmp_path / "modules.db", ttl_hours=1)
+
+
+def _module(namespace, name, downloads=0):
+    return {
+        "namespace": namespace,
+        "name": name,
+        "provider": "aws",
+        "version": "1.0.0",
+        "downloads": downloads,
+    }
+
+
+def test_entries_expire_individually(store):
+    store.put_versions("ns", "vpc", "aws", {"modules": [{"versions": []}]})
+    store.put_versions("ns", "eks", "aws", {"modules": []}, ttl_hours=-1)
+
+    assert store.get_versions("ns", "vpc", "aws") == {"modules": [{"versions": []}]}
+    assert store.get_versions("ns", "eks", "aws") is None
+    assert store.get_versions("ns", "vpc", "aws", max_age_hours=-1) is None
+    assert store.purge_expired() == 1
+
+
+def test_namespace_listing_indexes_each_module(store):
+    store.put_namespace("ns", "aws", [_module("ns", "vpc"), _module("ns", "s3")])
+
+    assert [m["name"] for m in store.get_namespace("ns", "aws")] == ["vpc", "s3"]
+    assert store.get_module("ns", "s3", "aws")["version"] == "1.0.0"
+    assert store.get_namespace("ns", "azurerm") is None
+
+
+def test_prefetch_only_fetches_missing_or_expired(store):
+    store.put_versions("ns", "vpc", "aws", {"modules": ["cached"]})
+    fetched = []
+
+    def fetch(namespace, name, provider):
+        fetched.append(name)
+        return None if name == "broken" else {"modules": [name]}
+
+    keys = [("ns", "vpc", "aws"), ("ns", "eks", "aws"), ("ns", "broken", "aws")]
+    assert store.prefetch(keys, fetch) == 1
+    assert sorted(fetched) == ["broken", "eks"]
+    assert store.get_versions("ns", "eks", "aws") == {"modules": ["eks"]}
+
+    fetched.clear()
+    assert store.prefetch(keys, fetch) == 0
+    assert fetched == ["broken"]
+
+
+def test_multi_namespace_save_answers_single_namespace_lookup(store):
+    cache = TerraformModulesCache(store)
+    cache.save([_module("a", "vpc", 5), _module("b", "sce-core", 9)], ["a", "b"], "aws")
+
+    assert [m["name"] for m in cache.get("b", "aws")] == ["sce-core"]
+    assert [m["name"] for m in cache.get(["a", "b"], "aws")] == ["sce-core", "vpc"]
+    assert cache.get(["a", "c"], "aws") is None
+
+
+def test_module_versions_are_served_from_the_store(store):
+    client = TerraformModuleVersions(store)
+    data = {"modules": [{"source": "ns/vpc/aws", "versions": [{"version": "5.0.0"}]}]}
+
+    with patch.object(client, "fetch_module_versions", return_value=data) as fetch:
+        assert client.get_module_versions("ns", "vpc", "aws") == data
+        assert client.get_module_versions("ns", "vpc", "aws") == data
+    fetch.assert_called_once()
+    assert client.is_cache_valid("ns", "module", "vpc", "aws")
+
+
+def test_listings_are_shared_complete_between_fetcher_and_space_tools(store):
+    versions = TerraformModuleVersions(store)
+    fetcher = TerraformModulesFetcher(cache=TerraformModulesCache(store))
+    listing = [
+        _module("ns", name, downloads)
+        for name, downloads in [("a", 1), ("b", 9), ("c", 5)]
+    ]
+
+    # Saved unsorted and complete by the space tools, limited by the fetcher
+    versions.save_to_cache({"modules": listing}, "ns", "namespace")
+    with patch.object(fetcher, "_fetch_page") as fetch_page:
+        top = fetcher.fetch_modules("ns", max_modules=2)
+    fetch_page.assert_not_called()
+    assert [m["name"] for m in top] == ["b", "c"]
+
+    # A capped fetch still caches the whole namespace for the space tools
+    store.clear()
+    pages = {0: (listing[:2], 2), 2: (listing[2:], None)}
+    with patch.object(
+        fetcher, "_fetch_page", side_effect=lambda **kw: pages[kw["offset"]]
+    ):
+        assert [m["name"] for m in fetcher.fetch_modules("ns", max_modules=1)] == ["b"]
+    with patch.object(versions, "fetch_namespace_modules") as fetch:
+        cached = versions.get_namespace_modules("ns")
+    fetch.assert_not_called()
+    assert [m["name"] for m in cached["modules"]] == ["a", "b", "c"]
@@ -0,0 +1,160 @@
+"""Unit tests for sharded, cached conftest runs in the OPA scanner."""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+from thothctl.services.scan.report_parser import parse_junit_xml
+from thothctl.services.scan.scanners.conftest_cache import (
+    ConftestResultCache,
+    bundle_key,
+    results_to_junit,
+    shard,
+)
+from thothctl.services.scan.scanners.opa import OPAScanner
+
+
+def _fake_conftest(calls):
+    """subprocess.run stand-in: one failure per file named *bad*."""
+
+    def run(cmd, **kwargs):
+        files = [a for a in cmd if a.endswith(".tf")]
+        calls.append(files)
+        results = [
+            {
+                "filename": f,
+                "namespace": "main",
+                "successes": 0 if "bad" in f else 1,
+                "failures": [{"msg": "encryption required"}] if "bad" in f else [],
+            }
+            for f in files
+        ]
+        failed = any("bad" in f for f in files)
+        return subprocess.CompletedProcess(cmd, int(failed), json.dumps(results), "")
+
+    return run
+
+
+def _project(tmp_path, count):
+    policy = tmp_path / "policy"
+    policy.mkdir()
+    (policy / "main.rego").write_text("package main\n")
+    files = []
+    for i in range(count):
+        path = tmp_path / f"{'bad' if i == 0 else 'ok'}{i}.tf"
+        path.write_text(f'resource "null_resource" "r{i}" {{}}\n')
+        files.append(path)
+    return policy, files
+
+
+def _scan(tmp_path, calls, **options):
+    scanner = OPAScanner()
+    opa = "thothctl.services.scan.scanners.opa"
+    with patch(f"{opa}.find_executable", return_value="conftest"), patch(
+        f"{opa}.subprocess.run", side_effect=_fake_conftest(calls)
+    ):
+        return scanner.scan(
+            str(tmp_path), str(tmp_path / "Reports"), dict(options, shard_size=2)
+        )
+
+
+class TestConftestRuns:
+    def test_single_pass_with_local_junit(self, tmp_path):
+        _project(tmp_path, 5)
+        calls = []
+
+        result = _scan(tmp_path, calls, cache="false")
+
+        # 5 files, 2 per shard: every file evaluated exactly once
+        assert sorted(len(c) for c in calls) == [1, 2, 2]
+        assert result["status"] == "COMPLETE"
+        assert result["report_data"]["failed_count"] == 1
+        assert result["report_data"]["passed_count"] == 4
+
+        opa_dir = tmp_path / "Reports" / "opa"
+        merged = json.loads((opa_dir / "conftest_results.json").read_text())
+        assert [r["filename"] for r in merged] == sorted(r["filename"] for r in merged)
+        counts = parse_junit_xml(str(opa_dir / "results_junitxml.xml"))
+        assert counts["passed"] == 4 and counts["failed"] == 1
+
+    def test_repeat_scan_only_evaluates_changed_files(self, tmp_path):
+        _, files = _project(tmp_path, 3)
+        _scan(tmp_path, [])
+
+        files[2].write_text('resource "null_resource" "changed" {}\n')
+        calls = []
+        result = _scan(tmp_path, calls)
+
+        assert calls == [[str(files[2])]]
+        assert result["report_data"]["failed_count"] == 1
+        assert result["report_data"]["passed_count"] == 2
+
+    def test_policy_change_invalidates_cache(self, tmp_path):
+        policy, _ = _project(tmp_path, 2)
+        _scan(tmp_path, [])
+
+        (policy / "main.rego").write_text("package main\n# changed\n")
+        calls = []
+        _scan(tmp_path, calls)
+
+        assert sum(len(c) for c in calls) == 2
+
+    def test_unparseable_shard_is_an_error_and_not_cached(self, tmp_path):
+        _project(tmp_path, 2)
+        opa = "thothctl.services.scan.scanners.opa"
+        broken = subprocess.CompletedProcess([], 1, "Error: parse error", "")
+        with patch(f"{opa}.find_executable", return_value="conftest"), patch(
+            f"{opa}.subprocess.run", return_value=broken
+        ):
+            result = OPAScanner().scan(
+                str(tmp_path), str(tmp_path / "Reports"), {"shard_size": 2}
+            )
+
+        assert result["status"] == "FAIL"
+        assert "no JSON results for 2 file(s)" in result["error"]
+
+        calls = []
+        _scan(tmp_path, calls)
+        assert sum(len(c) for c in calls) == 2
+
+
+class TestConftestCacheHelpers:
+    def test_shards_respect_workers_and_size(self):
+        files = [f"f{i}" for i in range(7)]
+        assert shard(files, workers=1, shard_size=3) == [
+            ["f0", "f1", "f2"],
+            ["f3", "f4", "f5"],
+            ["f6"],
+        ]
+        assert len(shard(files, workers=4, shard_size=100)) == 4
+        assert shard([], workers=4, shard_size=10) == []
+
+    def test_bundle_key_covers_data_files(self, tmp_path):
+        policy = tmp_path / "policy"
+        policy.mkdir()
+        (policy / "main.rego").write_text("package main\n")
+        data = tmp_path / "data.json"
+        data.write_text("{}")
+
+        before = bundle_key(str(policy), [str(data)], {})
+        data.write_text('{"limit": 1}')
+        assert bundle_key(str(policy), [str(data)], {}) != before
+
+    def test_cache_keeps_only_files_seen_in_the_run(self, tmp_path):
+        cache = ConftestResultCache(tmp_path, "k")
+        cache.put("a", [{"filename": "x.tf", "successes": 1}])
+        cache.put("b", [{"filename": "y.tf", "successes": 1}])
+        cache.save()
+
+        cache = ConftestResultCache(tmp_path, "k")
+        assert cache.get("a") == [{"successes": 1}]
+        cache.save()
+        assert ConftestResultCache(tmp_path, "k").get("b") is None
+
+    def test_junit_escapes_messages(self, tmp_path):
+        xml = results_to_junit(
+            [{"filename": "a.tf", "failures": [{"msg": 'bad <"tag"> & co'}]}]
+        )
+        path = tmp_path / "junit.xml"
+        path.write_text(xml)
+        assert parse_junit_xml(str(path))["failed"] == 1
@@ -0,0 +1,81 @@
+"""Tests for the single-pass placeholder engine used by project conversion."""
+
+import os
+
+from thothctl.services.project.convert.get_project_data import (
+    replace_template_placeholders,
+)
+from thothctl.services.project.convert.placeholder_engine import PlaceholderEngine
+from thothctl.services.project.convert.set_project_parameters import (
+    inv_parse_project,
+)
+
+
+def test_values_become_placeholders_longest_first():
+    engine = PlaceholderEngine.to_placeholders(
+        [
+            ("region", "us-east-1"),
+            ("backend_bucket", "us-east-1-tfstate"),
+            ("environment", "dev"),
+            ("type", "string"),
+        ]
+    )
+    text = (
+        'bucket = "us-east-1-tfstate"\n'
+        'region = "us-east-1"\n'
+        'environment = "dev"\n'
+        "env: dev\n"
+        'team = "developers"\n'
+        "path = a/us-east-1/b\n"
+        'type = "string"\n'
+    )
+    assert engine.apply(text) == (
+        'bucket = "#{backend_bucket}#"\n'
+        'region = "#{region}#"\n'
+        'environment = "#{environment}#"\n'
+        "env: #{environment}#\n"
+        'team = "developers"\n'
+        "path = a/us-east-1/b\n"
+        'type = "string"\n'
+    )
+
+
+def test_placeholders_become_values_and_unknown_ones_are_kept():
+    engine = PlaceholderEngine.to_values({"project": "lab", "region": "eu-west-1"})
+    assert engine.apply("#{project}#-#{region}# #{other}#") == "lab-eu-west-1 #{other}#"
+
+
+def test_replace_in_tree_skips_binary_and_excluded_and_keeps_line_endings(tmp_path):
+    (tmp_path / "main.tf").write_bytes(b'name = "#{project}#"\r\nx = 1\r\n')
+    (tmp_path / "blob.dat").write_bytes(b"\0#{project}#")
+    (tmp_path / ".terraform").mkdir()
+    (tmp_path / ".terraform" / "cached.tf").write_text("#{project}#")
+    untouched = tmp_path / "README.md"
+    untouched.write_text("nothing to replace\n")
+    os.utime(untouched, ns=(0, 0))
+
+    replace_template_placeholders(
+        directory=str(tmp_path),
+        project_properties={"project": "lab"},
+        project_name="lab",
+    )
+
+    assert (tmp_path / "main.tf").read_bytes() == b'name = "lab"\r\nx = 1\r\n'
+    assert (tmp_path / "blob.dat").read_bytes() == b"\0#{project}#"
+    assert (tmp_path / ".terraform" / "cached.tf").read_text() == "#{project}#"
+    assert untouched.stat().st_mtime_ns == 0
+
+
+def test_inv_parse_project_rewrites_all_properties_at_once(tmp_path):
+    target = tmp_path / "terragrunt.hcl"
+    target.write_text('owner = "me"\nclient = "me"\nproject = "lab"\nenv = "dev"\n')
+
+    inv_parse_project(
+        {"owner": "me", "client": "me", "project": "lab"},
+        target,
+        {"owner": "team", "client": "org", "project": "#{project}#"},
+    )
+
+    assert target.read_text() == (
+        'owner = "team"\nclient = "team"\nproject = "#{project}#"\nenv = "dev"\n'
+    )
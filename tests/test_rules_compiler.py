@@ -5,11 +5,13 @@ Rego policy files that conftest/OPA can consume.
 """
 
 import os
+import tarfile
 import tempfile
 import textwrap
 import unittest
+from unittest.mock import patch
 
-from thothctl.services.check.rules_compiler import RulesCompiler
+from thothctl.services.check.rules_compiler import BUNDLE_FILE, RulesCompiler
 
 
 class TestRulesCompilerNaming(unittest.TestCase):
@@ -278,5 +280,89 @@ class TestRulesCompilerFull(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestRulesCompilerBundleCache(unittest.TestCase):
+    """Test reuse of the compiled-policy bundle."""
+
+    TOML = textwrap.dedent(
+        """\
+        [project]
+        name = "test-infra"
+
+        [[rules.naming]]
+        name = "resource_naming"
+        [rules.naming.config]
+        pattern = "^(dev|stg|prd)_.*"
+
+        [[rules.tagging]]
+        name = "required_tags"
+        [rules.tagging.config]
+        required_tags = ["Environment"]
+    """
+    )
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.tmpdir, "compiled")
+        self.config_path = os.path.join(self.tmpdir, ".thothcf.toml")
+        self._write_config(self.TOML)
+
+    def _write_config(self, content):
+        with open(self.config_path, "w") as f:
+            f.write(content)
+
+    def _compile(self):
+        return RulesCompiler(output_dir=self.output_dir).compile(self.tmpdir)
+
+    def test_bundle_written_with_policies(self):
+        self._compile()
+        with tarfile.open(os.path.join(self.output_dir, BUNDLE_FILE)) as tar:
+            names = tar.getnames()
+        self.assertEqual(names, [".manifest", "naming.rego", "tagging.rego"])
+
+    def test_unchanged_config_is_not_recompiled(self):
+        self._compile()
+        with patch.object(RulesCompiler, "_compile_naming_rules") as naming:
+            with patch.object(RulesCompiler, "_load_toml") as load:
+                result = self._compile()
+        self.assertEqual(result, self.output_dir)
+        load.assert_not_called()
+        naming.assert_not_called()
+
+    def test_unrelated_sections_do_not_invalidate(self):
+        self._compile()
+        self._write_config(self.TOML.replace("test-infra", "renamed"))
+        with patch.object(RulesCompiler, "_compile_naming_rules") as naming:
+            self.assertEqual(self._compile(), self.output_dir)
+        naming.assert_not_called()
+
+    def test_rule_change_rewrites_only_changed_files(self):
+        self._compile()
+        naming = os.path.join(self.output_dir, "naming.rego")
+        tagging = os.path.join(self.output_dir, "tagging.rego")
+        os.utime(naming, (0, 0))
+        os.utime(tagging, (0, 0))
+
+        self._write_config(self.TOML.replace('"Environment"', '"Owner"'))
+        self._compile()
+
+        self.assertEqual(os.stat(naming).st_mtime, 0)
+        self.assertNotEqual(os.stat(tagging).st_mtime, 0)
+        self.assertIn('"Owner"', open(tagging).read())
+
+    def test_removed_rule_type_is_dropped(self):
+        self._compile()
+        self._write_config(self.TOML.split("[[rules.tagging]]")[0])
+        self._compile()
+        self.assertFalse(os.path.exists(os.path.join(self.output_dir, "tagging.rego")))
+
+    def test_edited_output_is_recompiled(self):
+        self._compile()
+        naming = os.path.join(self.output_dir, "naming.rego")
+        with open(naming, "w") as f:
+            f.write("package main\n")
+        self._compile()
+        self.assertIn("regex.match", open(naming).read())
+
+
 if __name__ == "__main__":
     unittest.main()
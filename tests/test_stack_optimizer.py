@@ -192,3 +192,61 @@ class TestStackOptimizer:
 
         assert "Network/**" in result["optimized_filters"]
         assert "Compute/EC2/EC2_Bastion_Private" in result["optimized_filters"]
+
+
+class TestUnitIndex:
+    """Test glob resolution and closures of the bitset unit index."""
+
+    def test_glob_matches_fnmatch(self, project_dir):
+        """Trie-narrowed globs resolve exactly like fnmatch over all units."""
+        import fnmatch
+
+        optimizer = StackOptimizer(base_path=project_dir, stacks_base="resources")
+        optimizer.optimize([])
+        units = optimizer._all_unit_paths
+
+        for pattern in [
+            "Network/*",
+            "Network/Security*/**",
+            "*/RDS*",
+            "Database/[OR]*",
+            "Missing/**",
+            "Network/VPC",
+        ]:
+            expected = {u for u in units if fnmatch.fnmatch(u, pattern)}
+            assert optimizer._resolve_stack_direct(pattern) == expected, pattern
+
+    def test_dependency_cycle_closure(self, project_dir):
+        """Units in a dependency cycle share one closure."""
+        resources = project_dir / "resources"
+        _create_unit(resources / "Cycle/A", deps=["Cycle/B"])
+        _create_unit(resources / "Cycle/B", deps=["Cycle/C"])
+        _create_unit(resources / "Cycle/C", deps=["Cycle/A", "Network/VPC"])
+
+        optimizer = StackOptimizer(base_path=project_dir, stacks_base="resources")
+        result = optimizer.optimize(["Cycle/A", "Cycle/C"])
+
+        expected = {"Cycle/A", "Cycle/B", "Cycle/C", "Network/VPC"}
+        assert optimizer._resolve_stack_with_deps("Cycle/A") == expected
+        assert optimizer._resolve_stack_with_deps("Cycle/C") == expected
+        # Equal sets: neither is a strict subset, both kept
+        assert result["removed_redundant"] == []
+
+    def test_redundancy_matches_pairwise_check(self, project_dir):
+        """Subsumption via the unit index agrees with comparing every pair."""
+        stacks = [
+            "Network/VPC",
+            "Network/SecurityGroups/**",
+            "Network/SecurityGroups/RDS_Main",
+            "Database/**",
+            "Database/RDS",
+            "Compute/**",
+            "Missing/**",
+        ]
+        optimizer = StackOptimizer(base_path=project_dir, stacks_base="resources")
+        result = optimizer.optimize(stacks)
+
+        resolved = {s: optimizer._resolve_stack_with_deps(s) for s in stacks}
+        expected = [a for a in stacks if any(resolved[a] < resolved[b] for b in stacks)]
+        assert result["removed_redundant"] == expected
+        assert result["details"]["Database/**"]["with_deps"] == 5
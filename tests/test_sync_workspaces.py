@@ -0,0 +1,51 @@
+"""Tests for workspace sync over a prebuilt dependency index."""
+
+from unittest.mock import Mock, patch
+
+from thothctl.utils.sync_workspaces import sync_terraform_workspaces as sync
+
+
+def _unit(path, body=""):
+    path.mkdir(parents=True)
+    (path / "terragrunt.hcl").write_text(body)
+    return str(path.resolve())
+
+
+def test_dependency_index_is_built_without_terragrunt(tmp_path):
+    vpc = _unit(tmp_path / "vpc")
+    app = _unit(tmp_path / "app", 'dependency "vpc" {\n  config_path = "../vpc"\n}\n')
+
+    with patch.object(sync, "graph_dependencies_to_json") as graph:
+        index = sync.dependency_index(tmp_path)
+
+    graph.assert_not_called()
+    assert index == {app: [vpc], vpc: []}
+
+
+def test_dynamic_units_fall_back_to_terragrunt(tmp_path):
+    vpc = _unit(tmp_path / "vpc")
+    app = _unit(tmp_path / "app", 'dependency "vpc" {\n  config_path = local.vpc\n}\n')
+    graph_json = (
+        '{"objects": [{"_gvid": 0, "name": "."}, {"_gvid": 1, "name": "../vpc"}],'
+        ' "edges": [{"_gvid": 0, "tail": 0, "head": 1}]}'
+    )
+
+    with patch.object(sync, "graph_dependencies_to_json", return_value=graph_json):
+        index = sync.dependency_index(tmp_path)
+
+    assert index[app] == [vpc]
+
+
+def test_each_workspace_is_resolved_once_and_synced():
+    index = {"/app": ["/vpc", "/db"], "/db": ["/vpc"]}
+    show = Mock(side_effect=lambda d: {"/app": "prod"}.get(d, "default"))
+    select = Mock()
+
+    workspaces = sync.resolve_workspaces(index, show, max_workers=4)
+    switched = sync.sync_index(index, workspaces, select)
+
+    assert show.call_count == 3
+    assert switched == 2
+    select.assert_any_call(directory="/vpc", workspace="prod")
+    select.assert_any_call(directory="/db", workspace="prod")
+    assert workspaces == {"/app": "prod", "/vpc": "prod", "/db": "prod"}
@@ -0,0 +1,130 @@
+"""Tests for the in-process Terragrunt dependency graph builder."""
+
+import logging
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from thothctl.services.document.iac_grunt_graph import DependencyGraphGenerator
+from thothctl.services.document.terragrunt_dag import (
+    TerragruntDagBuilder,
+    parse_config,
+)
+
+
+def _unit(path: Path, body: str = "") -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "terragrunt.hcl").write_text(
+        'include "root" {\n  path = find_in_parent_folders("root.hcl")\n}\n' + body
+    )
+    return path
+
+
+@pytest.fixture
+def live(tmp_path):
+    """A live repo: network/vpc <- network/sg <- compute/app (plus dynamic)."""
+    (tmp_path / ".git").mkdir()
+    resources = tmp_path / "resources"
+    resources.mkdir()
+    (resources / "root.hcl").write_text("locals {}\n")
+    _unit(resources / "network/vpc")
+    _unit(
+        resources / "network/sg",
+        'dependency "vpc" {\n'
+        '  config_path = "${get_parent_terragrunt_dir("root")}/network/vpc"\n'
+        '  mock_outputs = { path = "ignored" }\n'
+        "}\n",
+    )
+    _unit(
+        resources / "compute/app",
+        'dependency "sg" {\n  config_path = "../../network/sg"\n}\n'
+        'dependencies {\n  paths = ["${get_repo_root()}/resources/network/vpc"]\n}\n',
+    )
+    return resources
+
+
+class TestParseConfig:
+    def test_ignores_comments_strings_and_heredocs(self):
+        parsed = parse_config(
+            '# dependency "commented" { config_path = "../x" }\n'
+            'inputs = {\n  policy = <<EOF\ndependency "fake" {\n'
+            '  config_path = "../fake"\n}\nEOF\n  note = "dependency { }"\n}\n'
+            'dependency "real" {\n  config_path = "../real" // trailing\n}\n'
+        )
+        assert parsed.dependency_paths == ['"../real"']
+
+    def test_dependencies_list_and_include(self):
+        parsed = parse_config(
+            "include {\n  path = find_in_parent_folders()\n}\n"
+            'dependencies {\n  paths = [\n    "../a",\n    "../b",\n  ]\n}\n'
+        )
+        assert parsed.includes == {"": "find_in_parent_folders()"}
+        assert parsed.dependency_paths == ['"../a"', '"../b"']
+
+
+class TestTerragruntDagBuilder:
+    def test_resolves_config_paths(self, live):
+        builder = TerragruntDagBuilder()
+        app = (live / "compute/app").resolve()
+
+        assert builder.dependencies(app) == [
+            (live / "network/sg").resolve(),
+            (live / "network/vpc").resolve(),
+        ]
+
+    def test_dot_matches_terragrunt_format(self, live):
+        dot = TerragruntDagBuilder().dot(live / "compute/app")
+        assert dot == (
+            "digraph {\n"
+            '\t"." ;\n'
+            '\t"." -> "../../network/sg";\n'
+            '\t"." -> "../../network/vpc";\n'
+            '\t"../../network/sg" ;\n'
+            '\t"../../network/sg" -> "../../network/vpc";\n'
+            '\t"../../network/vpc" ;\n'
+            "}\n"
+        )
+
+    def test_isolated_unit_graph(self, live):
+        dot = TerragruntDagBuilder().dot(live / "network/vpc")
+        assert dot.strip() == 'digraph {\n\t"." ;\n}'
+
+    def test_dot_json_shape(self, live):
+        builder = TerragruntDagBuilder()
+        builder.scan(live)
+        graph = builder.dot_json(live)
+
+        names = [o["name"] for o in graph["objects"]]
+        assert names == ["compute/app", "network/sg", "network/vpc"]
+        edges = {(names[e["tail"]], names[e["head"]]) for e in graph["edges"]}
+        assert ("network/sg", "network/vpc") in edges
+        assert len(edges) == 3
+
+    def test_dynamic_dependency_is_reported(self, live):
+        _unit(
+            live / "compute/dynamic",
+            'dependency "x" {\n  config_path = local.vpc_path\n}\n',
+        )
+        builder = TerragruntDagBuilder()
+        assert builder.dot(live / "compute/dynamic") is None
+        assert builder.dot(live / "network") is not None
+
+
+class TestGeneratorFallback:
+    def test_terragrunt_only_runs_for_dynamic_units(self, live):
+        _unit(
+            live / "compute/dynamic",
+            'dependency "x" {\n  config_path = local.vpc_path\n}\n',
+        )
+        executor = Mock()
+        executor.execute.return_value = ('digraph {\n\t"." ;\n}\n', "", 0)
+        generator = DependencyGraphGenerator(executor, logging.getLogger("test"))
+
+        stdout, _, code = generator._dag_graph((live / "compute/app").resolve())
+        assert code == 0 and '"." -> "../../network/sg";' in stdout
+        executor.execute.assert_not_called()
+
+        generator._dag_graph((live / "compute/dynamic").resolve())
+        executor.execute.assert_called_once()
+        assert executor.execute.call_args[0][0][:3] == ["terragrunt", "dag", "graph"]
@@ -0,0 +1,75 @@
+"""Tests for batched module version updates."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from thothctl.services.inventory.update_versions import VersionManager
+
+
+def _update(name, file_path, current, latest):
+    return {
+        "name": name,
+        "version": [current],
+        "latest_version": latest,
+        "source": [f"terraform-aws-modules/{name}/aws"],
+        "file": str(file_path),
+    }
+
+
+def _manager(tmp_path):
+    manager = VersionManager(tmp_path / "inventory.json")
+    manager._confirm_apply_all = lambda: True
+    return manager
+
+
+def test_updates_are_grouped_per_file_and_formatted_once_per_directory(
+    tmp_path, capsys
+):
+    stack = tmp_path / "stack"
+    stack.mkdir()
+    main_tf = stack / "main.tf"
+    main_tf.write_text(
+        'module "vpc" { version = "5.0.0" }\nmodule "eks" { version = "19.1.0" }\n'
+    )
+    other_tf = stack / "other.tf"
+    other_tf.write_text('module "s3" { version = "3.0.0" }\n')
+    updates = [
+        _update("vpc", main_tf, "5.0.0", "5.1.2"),
+        _update("eks", main_tf, "19.1.0", "20.0.0"),
+        _update("s3", other_tf, "3.0.0", "4.1.0"),
+    ]
+
+    manager = _manager(tmp_path)
+    with patch(
+        "pathlib.Path.write_text", autospec=True, side_effect=Path.write_text
+    ) as write, patch(
+        "shutil.which", side_effect=lambda tool: f"/usr/bin/{tool}"
+    ), patch("subprocess.run") as run:
+        manager.process_updates(updates, auto_approve=True)
+
+    assert main_tf.read_text() == (
+        'module "vpc" { version = "5.1.2" }\nmodule "eks" { version = "20.0.0" }\n'
+    )
+    assert other_tf.read_text() == 'module "s3" { version = "4.1.0" }\n'
+    assert write.call_count == 2
+    run.assert_called_once()
+    assert run.call_args.args[0] == ["tofu", "fmt", str(stack)]
+    assert (
+        "3 version update(s) to 2 file(s) in 1 director(ies)" in capsys.readouterr().out
+    )
+
+
+def test_restore_and_missing_formatter(tmp_path):
+    main_tf = tmp_path / "main.tf"
+    main_tf.write_text('module "vpc" { version = "5.1.2" }\n')
+
+    manager = _manager(tmp_path)
+    with patch("shutil.which", return_value=None), patch("subprocess.run") as run:
+        manager.process_updates(
+            [_update("vpc", main_tf, "5.0.0", "5.1.2")],
+            auto_approve=True,
+            action="restore",
+        )
+
+    assert main_tf.read_text() == 'module "vpc" { version = "5.0.0" }\n'
+    run.assert_not_called()
@@ -0,0 +1,130 @@
+"""Tests for concurrent validation steps in GenerationValidator."""
+
+import sys
+import time
+from unittest.mock import patch
+
+from thothctl.services.generate.intent.models import GeneratedFile, Violation
+from thothctl.services.generate.intent.validation_steps import (
+    STATUS_CANCELLED,
+    STATUS_FAILED,
+    STATUS_OK,
+    STATUS_TIMED_OUT,
+    StepOutcome,
+    ValidationStep,
+    main,
+    merge_violations,
+    run_steps,
+)
+from thothctl.services.generate.intent.validator import GenerationValidator
+
+# Writes one violation of the given severity to the --output file after a delay
+WRITER = """
+import json, sys, time
+time.sleep(float(sys.argv[1]))
+violations = [{"check_id": sys.argv[2], "severity": sys.argv[3],
+               "resource": "r", "message": "m", "tool": "checkov"}]
+with open(sys.argv[-1], "w") as fp:
+    json.dump({"violations": violations}, fp)
+"""
+
+
+def _step(name, delay=0.0, severity="LOW", timeout=10):
+    command = [sys.executable, "-c", WRITER, str(delay), name, severity]
+    return ValidationStep(name=name, command=command, timeout=timeout)
+
+
+def _blocking(violation):
+    return violation.severity in ("CRITICAL", "HIGH")
+
+
+class TestRunSteps:
+    def test_steps_overlap_and_merge_in_step_order(self):
+        start = time.perf_counter()
+        outcomes = run_steps([_step("rules", 0.4), _step("checkov", 0.4)])
+        assert time.perf_counter() - start < 0.75
+
+        assert {o.status for o in outcomes.values()} == {STATUS_OK}
+        ids = [v.check_id for v in merge_violations(outcomes)]
+        assert ids == ["checkov", "rules"]
+
+    def test_timeout_kills_step(self):
+        outcomes = run_steps([_step("opa", delay=30, timeout=0.3)])
+        assert outcomes["opa"].status == STATUS_TIMED_OUT
+        assert outcomes["opa"].duration_seconds < 5
+
+    def test_fail_fast_cancels_remaining_steps(self):
+        start = time.perf_counter()
+        outcomes = run_steps(
+            [_step("checkov", 0.0, "HIGH"), _step("opa", delay=30)],
+            fail_fast=True,
+            is_blocking=_blocking,
+        )
+        assert time.perf_counter() - start < 5
+        assert outcomes["checkov"].status == STATUS_OK
+        assert outcomes["opa"].status == STATUS_CANCELLED
+
+    def test_low_severity_does_not_cancel(self):
+        outcomes = run_steps(
+            [_step("checkov", 0.0, "LOW"), _step("opa", 0.2)],
+            fail_fast=True,
+            is_blocking=_blocking,
+        )
+        assert outcomes["opa"].status == STATUS_OK
+
+    def test_crashed_step_reports_failure(self):
+        step = ValidationStep("rules", [sys.executable, "-c", "raise SystemExit(3)"], 5)
+        assert run_steps([step])["rules"].status == STATUS_FAILED
+
+
+class TestWorker:
+    def test_writes_violations(self, tmp_path):
+        output = tmp_path / "out.json"
+        found = [Violation("CKV_1", "HIGH", "aws_s3_bucket.b", "public")]
+        with patch.object(GenerationValidator, "_run_checkov", return_value=found):
+            main(["checkov", "--directory", str(tmp_path), "--output", str(output)])
+        assert '"CKV_1"' in output.read_text()
+
+
+class TestConcurrentValidator:
+    def test_skipped_steps_and_blocking_result(self, tmp_path):
+        validator = GenerationValidator(concurrent=True, fail_fast=True)
+        checkov = _step("checkov", 0.0, "CRITICAL")
+        opa = _step("opa", delay=30)
+        try:
+            with patch.object(GenerationValidator, "_step", side_effect=[checkov, opa]):
+                result = validator.validate(
+                    [GeneratedFile("main.tf", "")],
+                    skip_framework_validate=True,
+                    org_policy_dir=str(tmp_path),
+                )
+        finally:
+            validator.close()
+
+        assert not result.passed
+        assert [v.check_id for v in result.violations] == ["checkov"]
+        assert result.skipped_steps == ["opa"]
+        assert "policy" in result.timings
+
+    def test_policy_timing_excludes_framework_step(self):
+        outcomes = {
+            "framework": StepOutcome(
+                "framework",
+                STATUS_OK,
+                duration_seconds=5.0,
+                payload={"timings": {"init": 1.0, "validate": 4.0}},
+            ),
+            "checkov": StepOutcome("checkov", STATUS_OK, duration_seconds=2.0),
+            "opa": StepOutcome("opa", STATUS_OK, duration_seconds=3.0),
+        }
+        validator = GenerationValidator(concurrent=True)
+        try:
+            with patch(
+                "thothctl.services.generate.intent.validator.run_steps",
+                return_value=outcomes,
+            ):
+                result = validator.validate([GeneratedFile("main.tf", "")])
+        finally:
+            validator.close()
+
+        assert result.timings == {"init": 1.0, "validate": 4.0, "policy": 3.0}
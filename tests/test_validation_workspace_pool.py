@@ -0,0 +1,169 @@
+"""Tests for warm validation workspaces and the shared plugin cache."""
+
+import gc
+import os
+import stat
+import weakref
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from thothctl.services.generate.intent.models import GeneratedFile
+from thothctl.services.generate.intent.validator import GenerationValidator
+from thothctl.services.generate.intent.workspace_pool import (
+    ValidationWorkspacePool,
+    lock_signature,
+)
+
+FAKE_TOFU = """#!/bin/sh
+echo "$1 $TF_PLUGIN_CACHE_DIR" >> "$TOFU_LOG"
+if [ "$1" = "init" ]; then
+  mkdir -p .terraform && touch .terraform.lock.hcl
+  exit 0
+fi
+if [ ! -d .terraform ]; then
+  echo '{"valid": false, "diagnostics": [{"severity": "error", "summary": "Module not installed"}]}'
+  exit 1
+fi
+echo '{"valid": true, "diagnostics": []}'
+"""
+
+
+def _files(provider="aws", bucket="logs"):
+    return [
+        GeneratedFile(
+            "main.tf",
+            f'resource "{provider}_s3_bucket" "{bucket}" {{\n  bucket = "{bucket}"\n}}',
+        )
+    ]
+
+
+@pytest.fixture
+def fake_tofu(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tofu = bin_dir / "tofu"
+    tofu.write_text(FAKE_TOFU)
+    tofu.chmod(tofu.stat().st_mode | stat.S_IEXEC)
+    log = tmp_path / "tofu.log"
+    log.touch()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("TOFU_LOG", str(log))
+    monkeypatch.setenv("TF_PLUGIN_CACHE_DIR", str(tmp_path / "plugins"))
+    return log
+
+
+def _calls(log):
+    return [line.split()[0] for line in log.read_text().splitlines()]
+
+
+def _validate(validator, files):
+    with patch.object(GenerationValidator, "_run_checkov", return_value=[]):
+        return validator.validate(files, project_type="terraform")
+
+
+class TestLockSignature:
+    def test_ignores_attribute_changes(self):
+        assert lock_signature(_files(bucket="a")) == lock_signature(_files(bucket="b"))
+
+    def test_provider_change_changes_signature(self):
+        assert lock_signature(_files("aws")) != lock_signature(_files("google"))
+
+    def test_module_version_changes_signature(self):
+        module = 'module "vpc" {{\n  source = "x/vpc/aws"\n  version = "{}"\n}}'
+        v1 = [GeneratedFile("main.tf", module.format("1.0"))]
+        v2 = [GeneratedFile("main.tf", module.format("2.0"))]
+        assert lock_signature(v1) != lock_signature(v2)
+
+
+class TestWorkspacePool:
+    def test_reuses_initialized_workspace_and_swaps_files(self):
+        pool = ValidationWorkspacePool()
+        first = pool.acquire(_files(bucket="a") + [GeneratedFile("old.tf", "")])
+        Path(first.path, ".terraform").mkdir()
+        first.initialized = True
+        pool.release(first)
+
+        second = pool.acquire(_files(bucket="b"))
+        try:
+            assert second.path == first.path and second.reused
+            assert Path(second.path, ".terraform").is_dir()
+            assert not Path(second.path, "old.tf").exists()
+            assert 'bucket = "b"' in Path(second.path, "main.tf").read_text()
+        finally:
+            pool.release(second)
+            pool.close()
+        assert not os.path.exists(second.path)
+
+    def test_uninitialized_workspace_is_removed(self):
+        pool = ValidationWorkspacePool()
+        workspace = pool.acquire(_files())
+        pool.release(workspace)
+        assert not os.path.exists(workspace.path)
+
+    def test_idle_limit(self):
+        pool = ValidationWorkspacePool(max_idle=1)
+        a, b = pool.acquire(_files("aws")), pool.acquire(_files("google"))
+        a.initialized = b.initialized = True
+        pool.release(a)
+        pool.release(b)
+        assert not os.path.exists(a.path)
+        pool.close()
+
+    def test_closed_pool_is_not_kept_alive_until_exit(self):
+        pool = ValidationWorkspacePool()
+        workspace = pool.acquire(_files())
+        workspace.initialized = True
+        pool.release(workspace)
+        pool.close()
+
+        ref = weakref.ref(pool)
+        del pool
+        gc.collect()
+        assert ref() is None
+        assert not os.path.exists(workspace.path)
+
+
+class TestValidatorUsesPool:
+    def test_init_runs_once_across_iterations(self, fake_tofu, tmp_path):
+        validator = GenerationValidator()
+        try:
+            first = _validate(validator, _files(bucket="a"))
+            second = _validate(validator, _files(bucket="b"))
+        finally:
+            validator.close()
+
+        assert _calls(fake_tofu) == ["init", "validate", "validate"]
+        assert first.passed and second.passed
+        assert not first.workspace_reused and second.workspace_reused
+        assert first.timings["init"] > 0
+        assert second.timings["init"] == 0.0
+        assert {"init", "validate", "policy"} <= set(second.timings)
+        assert str(tmp_path / "plugins") in fake_tofu.read_text()
+
+    def test_new_provider_gets_fresh_init(self, fake_tofu):
+        validator = GenerationValidator()
+        try:
+            _validate(validator, _files("aws"))
+            _validate(validator, _files("google"))
+        finally:
+            validator.close()
+        assert _calls(fake_tofu) == ["init", "validate", "init", "validate"]
+
+    def test_reinit_when_reused_workspace_is_stale(self, fake_tofu):
+        validator = GenerationValidator()
+        try:
+            _validate(validator, _files(bucket="a"))
+            workspace = validator._workspace_pool._idle[0]
+            # Simulate a corrupted/missing provider install
+            os.rename(
+                os.path.join(workspace.path, ".terraform"),
+                os.path.join(workspace.path, "gone"),
+            )
+            result = _validate(validator, _files(bucket="b"))
+        finally:
+            validator.close()
+
+        assert result.passed
+        assert _calls(fake_tofu) == ["init", "validate", "validate", "init", "validate"]
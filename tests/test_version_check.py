@@ -0,0 +1,88 @@
+"""Tests for the background version freshness check."""
+
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from thothctl.core import version_check
+from thothctl.core.version_check import (
+    CACHE_TTL,
+    NEGATIVE_CACHE_TTL,
+    check_version_freshness,
+    is_ci,
+    refresh_cache,
+)
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    monkeypatch.delenv(version_check.DISABLE_ENV, raising=False)
+    for name in version_check.CI_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(version_check, "__version__", "1.0.0")
+    return tmp_path / ".version_check"
+
+
+def test_fresh_cache_shows_hint_without_network_or_refresh(cache_file, capsys):
+    cache_file.write_text(json.dumps({"latest": "1.2.0", "timestamp": time.time()}))
+
+    with patch.object(version_check, "spawn_refresher") as spawn, patch(
+        "requests.get"
+    ) as get:
+        check_version_freshness(cache_file)
+
+    assert "1.2.0 available" in capsys.readouterr().err
+    spawn.assert_not_called()
+    get.assert_not_called()
+
+
+def test_stale_cache_spawns_one_refresher(cache_file, capsys):
+    stale = time.time() - CACHE_TTL - 1
+    cache_file.write_text(json.dumps({"latest": "1.0.0", "timestamp": stale}))
+
+    with patch.object(version_check, "spawn_refresher") as spawn, patch(
+        "requests.get"
+    ) as get:
+        check_version_freshness(cache_file)
+        check_version_freshness(cache_file)
+
+    spawn.assert_called_once()
+    get.assert_not_called()
+    assert capsys.readouterr().err == ""
+    assert "refresh_started" in json.loads(cache_file.read_text())
+
+
+def test_ci_and_opt_out_skip_the_check(cache_file, monkeypatch):
+    assert is_ci({"GITHUB_ACTIONS": "true"})
+    assert not is_ci({"CI": "false"})
+
+    monkeypatch.setenv("CI", "true")
+    with patch.object(version_check, "spawn_refresher") as spawn:
+        check_version_freshness(cache_file)
+        monkeypatch.delenv("CI")
+        monkeypatch.setenv(version_check.DISABLE_ENV, "1")
+        check_version_freshness(cache_file)
+
+    spawn.assert_not_called()
+    assert not cache_file.exists()
+
+
+def test_failed_lookup_is_cached_as_negative(cache_file):
+    with patch("requests.get", side_effect=OSError("offline")):
+        assert refresh_cache(cache_file) is None
+
+    cache = json.loads(cache_file.read_text())
+    assert cache["latest"] is None
+
+    # Within the negative TTL the check neither retries nor shows a hint
+    with patch.object(version_check, "spawn_refresher") as spawn:
+        check_version_freshness(cache_file)
+    spawn.assert_not_called()
+
+    cache["timestamp"] -= NEGATIVE_CACHE_TTL + 1
+    cache_file.write_text(json.dumps(cache))
+    with patch.object(version_check, "spawn_refresher") as spawn:
+        check_version_freshness(cache_file)
+    spawn.assert_called_once()
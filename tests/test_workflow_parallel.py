@@ -0,0 +1,142 @@
+"""Tests for parallel DAG execution in the custom workflow engine."""
+
+import sys
+import time
+
+import pytest
+import yaml
+
+from thothctl.services.workflow.custom_workflow_engine import (
+    CustomWorkflowEngine,
+    StageStatus,
+    WorkflowValidationError,
+)
+
+SLEEP = f'"{sys.executable}" -c "import time; time.sleep(0.6)"'
+FAIL = f'"{sys.executable}" -c "import sys; sys.exit(1)"'
+ECHO = f'"{sys.executable}" -c "print(\'hello from stage\')"'
+
+
+@pytest.fixture
+def engine():
+    """Engine whose stages run the raw command instead of `thothctl <command>`."""
+    engine = CustomWorkflowEngine()
+    engine._build_command_string = lambda stage: stage.command
+    return engine
+
+
+def _load(engine, tmp_path, workflow):
+    path = tmp_path / "workflow.yaml"
+    path.write_text(yaml.dump(workflow))
+    return engine.load(path)
+
+
+def _diamond(max_parallel, **extra):
+    return {
+        "name": "diamond",
+        "max_parallel": max_parallel,
+        "stages": [
+            {"name": "plan", "command": ECHO},
+            {"name": "scan", "command": SLEEP, "depends_on": ["plan"]},
+            {"name": "cost", "command": SLEEP, "depends_on": ["plan"]},
+            {"name": "report", "command": ECHO, "depends_on": ["scan", "cost"]},
+        ],
+        **extra,
+    }
+
+
+class TestParallelExecution:
+    def test_independent_branches_overlap(self, engine, tmp_path):
+        wf = _load(engine, tmp_path, _diamond(max_parallel=2))
+        start = time.monotonic()
+        results = engine.execute(wf)
+        elapsed = time.monotonic() - start
+
+        assert [r.name for r in results] == ["plan", "scan", "cost", "report"]
+        assert all(r.status == StageStatus.SUCCESS for r in results)
+        assert elapsed < 1.1
+        scan, cost = results[1], results[2]
+        assert scan.started_at < cost.finished_at and cost.started_at < scan.finished_at
+        assert engine.last_summary.time_saved_seconds > 0.3
+
+    def test_max_parallel_one_is_sequential(self, engine, tmp_path):
+        wf = _load(engine, tmp_path, _diamond(max_parallel=1))
+        results = engine.execute(wf)
+        scan, cost = results[1], results[2]
+        assert cost.started_at >= scan.finished_at
+
+    def test_critical_path(self, engine, tmp_path):
+        wf = _load(engine, tmp_path, _diamond(max_parallel=2))
+        engine.execute(wf)
+        path = engine.last_summary.critical_path
+        assert path[0] == "plan" and path[-1] == "report"
+        assert path[1] in ("scan", "cost")
+
+    def test_output_is_captured(self, engine, tmp_path):
+        wf = _load(engine, tmp_path, _diamond(max_parallel=2))
+        results = engine.execute(wf)
+        assert "hello from stage" in results[0].output
+
+
+class TestFailureHandling:
+    def _workflow(self, **extra):
+        return {
+            "name": "branches",
+            "max_parallel": 2,
+            "stages": [
+                {"name": "bad", "command": FAIL},
+                {"name": "bad-child", "command": ECHO, "depends_on": ["bad"]},
+                {"name": "good", "command": SLEEP},
+                {"name": "good-child", "command": ECHO, "depends_on": ["good"]},
+            ],
+            **extra,
+        }
+
+    def test_block_stops_pipeline(self, engine, tmp_path):
+        results = {
+            r.name: r.status
+            for r in engine.execute(_load(engine, tmp_path, self._workflow()))
+        }
+        assert results["bad"] == StageStatus.FAILED
+        assert results["bad-child"] == StageStatus.SKIPPED
+        # Already running when the failure happened, so it finishes
+        assert results["good"] == StageStatus.SUCCESS
+        assert results["good-child"] == StageStatus.SKIPPED
+
+    def test_continue_on_error_only_skips_branch(self, engine, tmp_path):
+        wf = _load(engine, tmp_path, self._workflow(continue_on_error=True))
+        results = {r.name: r.status for r in engine.execute(wf)}
+        assert results["bad"] == StageStatus.FAILED
+        assert results["bad-child"] == StageStatus.SKIPPED
+        assert results["good-child"] == StageStatus.SUCCESS
+
+    def test_stage_level_continue_on_error(self, engine, tmp_path):
+        workflow = self._workflow()
+        workflow["stages"][0]["continue_on_error"] = True
+        results = {
+            r.name: r.status for r in engine.execute(_load(engine, tmp_path, workflow))
+        }
+        assert results["good-child"] == StageStatus.SUCCESS
+
+    def test_warn_runs_dependents(self, engine, tmp_path):
+        workflow = self._workflow()
+        workflow["stages"][0]["on_failure"] = "warn"
+        results = {
+            r.name: r.status for r in engine.execute(_load(engine, tmp_path, workflow))
+        }
+        assert results["bad"] == StageStatus.WARNED
+        assert results["bad-child"] == StageStatus.SUCCESS
+
+
+class TestValidation:
+    @pytest.mark.parametrize("value", [0, -1, "two"])
+    def test_invalid_max_parallel(self, engine, tmp_path, value):
+        with pytest.raises(WorkflowValidationError, match="max_parallel"):
+            _load(engine, tmp_path, _diamond(max_parallel=value))
+
+    def test_defaults(self, engine, tmp_path):
+        workflow = _diamond(max_parallel=1)
+        del workflow["max_parallel"]
+        wf = _load(engine, tmp_path, workflow)
+        assert wf.max_parallel == 1
+        assert wf.continue_on_error is False
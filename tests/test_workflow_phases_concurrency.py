@@ -0,0 +1,186 @@
+"""Tests for concurrent SDLC phase execution in WorkflowService."""
+
+import json
+import time
+from unittest.mock import patch
+
+from thothctl.services.workflow.context import ProjectIndex, WorkflowContext
+from thothctl.services.workflow.models import (
+    Phase,
+    PhaseResult,
+    StepResult,
+    StepStatus,
+)
+from thothctl.services.workflow.phases import plan as plan_phase
+from thothctl.services.workflow.phases import test as test_phase
+from thothctl.services.workflow.phases.base import PhaseExecutor
+from thothctl.services.workflow.phases.deploy import DeployPhaseExecutor
+from thothctl.services.workflow.workflow_service import WorkflowService
+
+
+class FakeExecutor(PhaseExecutor):
+    def __init__(self, phase, depends_on=(), seconds=0.3, blocked=False):
+        self._phase = phase
+        self._depends_on = tuple(depends_on)
+        self.seconds = seconds
+        self.blocked = blocked
+        self.contexts = []
+
+    @property
+    def phase(self):
+        return self._phase
+
+    @property
+    def depends_on(self):
+        return self._depends_on
+
+    def execute(self, directory, reports_dir, options=None):
+        self.contexts.append(options["context"])
+        time.sleep(self.seconds)
+        result = PhaseResult(phase=self.phase)
+        result.steps.append(
+            StepResult(
+                name=self.phase.value,
+                status=StepStatus.FAILED if self.blocked else StepStatus.PASSED,
+                command="fake",
+                duration_seconds=self.seconds,
+                findings_count=1 if self.blocked else 0,
+            )
+        )
+        result.passed = not self.blocked
+        result.gate_blocked = self.blocked
+        return result
+
+
+def _service(*executors):
+    service = WorkflowService()
+    service._executors = {e.phase: e for e in executors}
+    return service
+
+
+class TestConcurrentPhases:
+    def test_independent_phases_overlap(self, tmp_path):
+        service = _service(
+            FakeExecutor(Phase.PLAN),
+            FakeExecutor(Phase.BUILD),
+            FakeExecutor(Phase.SECURE),
+        )
+        result = service.execute([Phase.ALL], str(tmp_path), "Reports", max_workers=3)
+
+        assert [p.phase for p in result.phases] == [
+            Phase.PLAN,
+            Phase.BUILD,
+            Phase.SECURE,
+        ]
+        assert result.wall_seconds < 0.8
+        assert all(p.started_at < 0.2 for p in result.phases)
+        assert all(p.finished_at >= p.started_at for p in result.phases)
+
+    def test_dependencies_run_after_their_phases(self, tmp_path):
+        service = _service(
+            FakeExecutor(Phase.TEST),
+            FakeExecutor(Phase.SECURE),
+            FakeExecutor(Phase.DEPLOY, depends_on=(Phase.TEST, Phase.SECURE)),
+        )
+        result = service.execute([Phase.ALL], str(tmp_path), "Reports", max_workers=3)
+        by_phase = {p.phase: p for p in result.phases}
+
+        deploy = by_phase[Phase.DEPLOY]
+        assert deploy.started_at >= by_phase[Phase.TEST].finished_at
+        assert deploy.started_at >= by_phase[Phase.SECURE].finished_at
+
+    def test_single_worker_keeps_sdlc_order(self, tmp_path):
+        service = _service(
+            FakeExecutor(Phase.SECURE, seconds=0.05),
+            FakeExecutor(Phase.PLAN, seconds=0.05),
+        )
+        started = []
+        service.execute(
+            [Phase.ALL],
+            str(tmp_path),
+            "Reports",
+            max_workers=1,
+            on_phase_start=started.append,
+        )
+        assert started == [Phase.PLAN, Phase.SECURE]
+
+    def test_hard_gate_stops_new_phases(self, tmp_path):
+        service = _service(
+            FakeExecutor(Phase.SECURE, seconds=0.05, blocked=True),
+            FakeExecutor(Phase.DEPLOY, depends_on=(Phase.SECURE,)),
+        )
+        result = service.execute(
+            [Phase.ALL], str(tmp_path), "Reports", enforcement="hard"
+        )
+        assert result.stopped_at == Phase.SECURE
+        assert [p.phase for p in result.phases] == [Phase.SECURE]
+
+    def test_phases_share_one_context(self, tmp_path):
+        plan, build = FakeExecutor(Phase.PLAN), FakeExecutor(Phase.BUILD)
+        _service(plan, build).execute([Phase.ALL], str(tmp_path), "Reports")
+        assert plan.contexts[0] is build.contexts[0]
+        assert set(plan.contexts[0].results) == {Phase.PLAN, Phase.BUILD}
+
+
+class TestWorkflowContext:
+    def test_index_skips_hidden_and_reports(self, tmp_path):
+        for rel in ("stack/tfplan.json", ".terraform/tfplan.json", "Reports/x.json"):
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text("{}")
+
+        index = WorkflowContext(str(tmp_path)).index
+        assert index.plan_files() == [str(tmp_path / "stack" / "tfplan.json")]
+        assert index.files() is index.files()
+
+    def test_plan_summary_counts_changes(self, tmp_path):
+        plan = {
+            "resource_changes": [
+                {"change": {"actions": ["create"]}},
+                {"change": {"actions": ["no-op"]}},
+                {"change": {"actions": ["delete", "create"]}},
+            ]
+        }
+        (tmp_path / "tfplan.json").write_text(json.dumps(plan))
+        index = WorkflowContext(str(tmp_path)).index
+        assert index.plan_summary() == {"plans": 1, "resource_changes": 2}
+
+        (tmp_path / "tfplan.json").write_text('{"resource_changes": []}')
+        assert index.plan_summary()["resource_changes"] == 2
+
+    def test_plan_and_test_phases_do_not_parse_plans(self, tmp_path):
+        (tmp_path / "tfplan.json").write_text("{}")
+        context = WorkflowContext(str(tmp_path))
+        step = StepResult(name="step", status=StepStatus.PASSED, command="x")
+        plan = plan_phase.PlanPhaseExecutor
+        test = test_phase.TestPhaseExecutor
+        with patch.object(ProjectIndex, "load_plan") as load_plan, patch.object(
+            plan, "_run_cost_analysis", return_value=step
+        ), patch.object(plan, "_run_blast_radius", return_value=step), patch.object(
+            test, "_validate_tfplan", return_value=step
+        ):
+            for executor in (plan(), test()):
+                result = executor.execute(
+                    str(tmp_path), "Reports", {"context": context}
+                )
+                assert result.passed
+        load_plan.assert_not_called()
+
+    def test_deploy_reuses_secure_result(self, tmp_path):
+        context = WorkflowContext(str(tmp_path))
+        secure = PhaseResult(phase=Phase.SECURE)
+        secure.steps.append(
+            StepResult(
+                name="scan-checkov",
+                status=StepStatus.FAILED,
+                command="thothctl scan iac -t checkov",
+                findings_count=2,
+            )
+        )
+        context.results[Phase.SECURE] = secure
+
+        result = DeployPhaseExecutor().execute(
+            str(tmp_path), "Reports", {"context": context}
+        )
+        assert result.steps[0].name == "deploy-gate"
+        assert result.steps[0].findings_count == 2
+        assert not result.passed
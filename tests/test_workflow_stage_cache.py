@@ -0,0 +1,152 @@
+"""Tests for the content-addressed stage result cache of custom workflows."""
+
+import sys
+
+import pytest
+import yaml
+
+from thothctl.services.workflow.custom_workflow_engine import (
+    CustomWorkflowEngine,
+    StageStatus,
+    WorkflowValidationError,
+)
+from thothctl.services.workflow.stage_cache import StageCache
+
+# Appends to runs.log (to count executions) and writes out/result.txt
+BUILD = (
+    f'"{sys.executable}" -c "'
+    "import pathlib; "
+    "open('runs.log', 'a').write('x'); "
+    "pathlib.Path('out').mkdir(exist_ok=True); "
+    "pathlib.Path('out/result.txt').write_text(open('src/main.tf').read().upper()); "
+    "print('built')\""
+)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.tf").write_text("resource")
+    return tmp_path
+
+
+def _engine(project, **kwargs):
+    cache = StageCache(project / ".thothctl" / "workflow-cache", base_dir=project)
+    engine = CustomWorkflowEngine(cache=cache, **kwargs)
+    engine._build_command_string = lambda stage: stage.command
+    return engine
+
+
+def _load(engine, project, **stage):
+    workflow = {
+        "name": "cached",
+        "variables": {"env": "dev"},
+        "stages": [
+            {
+                "name": "build",
+                "command": BUILD,
+                "inputs": ["src/**/*.tf"],
+                "outputs": ["out"],
+                **stage,
+            }
+        ],
+    }
+    path = project / "workflow.yaml"
+    path.write_text(yaml.dump(workflow))
+    return engine.load(path)
+
+
+def _runs(project):
+    return len((project / "runs.log").read_text())
+
+
+class TestStageCache:
+    def test_unchanged_inputs_hit_cache_and_restore_outputs(self, project):
+        engine = _engine(project)
+        first = engine.execute(_load(engine, project))[0]
+        (project / "out" / "result.txt").unlink()
+
+        second = engine.execute(_load(engine, project))[0]
+
+        assert _runs(project) == 1
+        assert not first.cached and second.cached
+        assert second.status == StageStatus.SUCCESS
+        assert "built" in second.output
+        assert (project / "out" / "result.txt").read_text() == "RESOURCE"
+
+    def test_changed_input_reruns(self, project):
+        engine = _engine(project)
+        engine.execute(_load(engine, project))
+        (project / "src" / "main.tf").write_text("module")
+
+        result = engine.execute(_load(engine, project))[0]
+
+        assert _runs(project) == 2
+        assert not result.cached
+        assert (project / "out" / "result.txt").read_text() == "MODULE"
+
+    def test_new_input_file_changes_key(self, project):
+        engine = _engine(project)
+        engine.execute(_load(engine, project))
+        (project / "src" / "extra.tf").write_text("")
+        engine.execute(_load(engine, project))
+        assert _runs(project) == 2
+
+    def test_no_cache_always_runs(self, project):
+        engine = _engine(project, use_cache=False)
+        engine.execute(_load(engine, project))
+        engine.execute(_load(engine, project))
+        assert _runs(project) == 2
+        assert not (project / ".thothctl" / "workflow-cache").exists()
+
+    def test_stage_without_inputs_is_not_cached(self, project):
+        engine = _engine(project)
+        engine.execute(_load(engine, project, inputs=None))
+        engine.execute(_load(engine, project, inputs=None))
+        assert _runs(project) == 2
+
+    def test_failed_stage_is_not_cached(self, project):
+        engine = _engine(project)
+        fail = f"\"{sys.executable}\" -c \"open('runs.log', 'a').write('x'); exit(1)\""
+        engine.execute(_load(engine, project, command=fail, outputs=[]))
+        engine.execute(_load(engine, project, command=fail, outputs=[]))
+        assert _runs(project) == 2
+
+    def test_invalid_inputs(self, project):
+        engine = _engine(project)
+        with pytest.raises(WorkflowValidationError, match="inputs"):
+            _load(engine, project, inputs={"bad": 1})
+
+
+class TestStageCacheStore:
+    def test_key_depends_on_command_and_variables(self, project):
+        cache = StageCache(base_dir=project)
+        base = cache.compute_key("cmd", {"env": "dev"}, ["src/*.tf"])
+        assert base == cache.compute_key("cmd", {"env": "dev"}, ["src/*.tf"])
+        assert base != cache.compute_key("cmd2", {"env": "dev"}, ["src/*.tf"])
+        assert base != cache.compute_key("cmd", {"env": "prod"}, ["src/*.tf"])
+
+    def test_lru_eviction_by_entry_count(self, project):
+        cache = StageCache(project / "cache", base_dir=project, max_entries=2)
+        for key in ("a", "b"):
+            cache.store(key, 0, key, "", [])
+        cache.lookup("a")  # "b" is now least recently used
+        cache.store("c", 0, "c", "", [])
+
+        assert cache.lookup("a") is not None
+        assert cache.lookup("b") is None
+        assert cache.lookup("c") is not None
+
+    def test_eviction_by_size(self, project):
+        (project / "big.bin").write_bytes(b"0" * 4096)
+        cache = StageCache(project / "cache", base_dir=project, max_bytes=6000)
+        cache.store("one", 0, "", "", ["big.bin"])
+        cache.store("two", 0, "", "", ["big.bin"])
+        assert cache.lookup("one") is None
+        assert cache.lookup("two") is not None
+
+    def test_missing_output_is_not_cached(self, project):
+        cache = StageCache(project / "cache", base_dir=project)
+        assert not cache.store("k", 0, "", "", ["does-not-exist"])
+        assert cache.lookup("k") is None